@@ -14,15 +14,35 @@ The playbook package is organized into focused modules with clear separation of
 Most modules are internal implementation details and should be imported directly
 when needed (e.g., ``from playbook.trace_writer import TraceOptions``).
 
-The main entry point for file processing is the ``Processor`` class.
+The main entry point for file processing is the ``Processor`` class. It is
+imported on first access so that ``import playbook`` (and CLI commands that
+never process files) do not load the whole pipeline.
 """
 
-from .processor import Processor
-from .trace_writer import TraceOptions
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
 from .version import __version__
 
+if TYPE_CHECKING:
+    from .processor import Processor
+    from .trace_writer import TraceOptions
+
 __all__ = [
     "__version__",
     "Processor",
     "TraceOptions",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name == "Processor":
+        from .processor import Processor
+
+        return Processor
+    if name == "TraceOptions":
+        from .trace_writer import TraceOptions
+
+        return TraceOptions
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -9,20 +9,23 @@ import os
 import sys
 import traceback
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from rich.console import Console
-from rich.logging import RichHandler
 
 from .banner import build_banner_info, print_startup_banner
 from .command_help import get_command_help
 from .config import AppConfig, load_config
 from .help_formatter import RichHelpFormatter, render_extended_examples
 from .kometa_trigger import build_kometa_trigger
-from .processor import Processor, TraceOptions
 from .utils import load_yaml_file
-from .validation import ValidationIssue, validate_config_data
-from .validation_output import ValidationFormatter
-from .watcher import FileWatcherLoop, WatchdogUnavailableError
+
+if TYPE_CHECKING:
+    from .processor import Processor
+
+# The processing pipeline, the watcher and the config validator pull in heavy
+# dependencies (httpx, pydantic, watchdog, jsonschema); they are imported by
+# the commands that use them so other commands start without them.
 
 LOGGER = logging.getLogger(__name__)
 CONSOLE = Console()
@@ -164,6 +167,11 @@ def _add_run_subparser(subparsers) -> None:
         action="store_true",
         help="Show comprehensive cookbook-style examples and exit",
     )
+    run_parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Report how long Playbook's imports take at startup and exit",
+    )
     run_parser.add_argument(
         "--config",
         type=Path,
@@ -200,6 +208,11 @@ def _add_run_subparser(subparsers) -> None:
         action="store_true",
         help="Clear the processed-file cache before running",
     )
+    run_parser.add_argument(
+        "--retry-unmatched",
+        action="store_true",
+        help="Match previously unmatched files again even if they did not change",
+    )
     run_parser.add_argument(
         "--force-reprocess",
         action="store_true",
@@ -380,6 +393,8 @@ def configure_logging(log_level_name: str, log_file: Path, console_level_name: s
         use_rich_console = CONSOLE.is_terminal
 
     if use_rich_console:
+        from rich.logging import RichHandler
+
         console_handler = RichHandler(console=CONSOLE, rich_tracebacks=True, markup=True)
     else:
         console_handler = logging.StreamHandler()
@@ -514,6 +529,8 @@ def _execute_run(args: argparse.Namespace) -> int:
     if env_clear_cache is not None:
         clear_processed_cache = env_clear_cache
 
+    from .processor import Processor, TraceOptions
+
     trace_enabled = bool(args.trace_matches or args.trace_output)
     trace_options = TraceOptions(enabled=True, output_dir=args.trace_output) if trace_enabled else None
 
@@ -529,13 +546,30 @@ def _execute_run(args: argparse.Namespace) -> int:
             LOGGER.info("Notifications disabled for this run because the processed cache was cleared")
         processor.clear_processed_cache()
 
+    retry_unmatched = args.retry_unmatched
+    env_retry_unmatched = _env_bool("RETRY_UNMATCHED")
+    if env_retry_unmatched is not None:
+        retry_unmatched = env_retry_unmatched
+    if retry_unmatched:
+        processor.retry_unmatched()
+
     banner_info = build_banner_info(config, verbose=verbose, trace_matches=trace_enabled)
     print_startup_banner(banner_info, CONSOLE)
 
     LOGGER.info("Starting Playbook%s", " (dry-run)" if config.settings.dry_run else "")
 
+    try:
+        return _run_processor(processor, config)
+    finally:
+        processor.close()
+
+
+def _run_processor(processor: Processor, config: AppConfig) -> int:
+    """Run the watcher loop, or a single processing pass when it is disabled."""
     watcher_settings = config.settings.file_watcher
     if watcher_settings.enabled:
+        from .watcher import FileWatcherLoop, WatchdogUnavailableError
+
         try:
             FileWatcherLoop(
                 processor,
@@ -665,6 +699,9 @@ def run_kometa_trigger(args: argparse.Namespace) -> int:
 
 
 def run_validate_config(args: argparse.Namespace) -> int:
+    from .validation import ValidationIssue, validate_config_data
+    from .validation_output import ValidationFormatter
+
     config_path: Path = args.config
     if not config_path.exists():
         CONSOLE.print(f"[bold red]Configuration file not found: {config_path}[/bold red]")
@@ -769,6 +806,12 @@ def main(argv: tuple[str, ...] | None = None) -> int:
         render_extended_examples(command_name, help_content.extended_examples, CONSOLE)
         return 0
 
+    if getattr(args, "profile_startup", False):
+        from .startup_profile import print_startup_profile
+
+        print_startup_profile(CONSOLE)
+        return 0
+
     if getattr(args, "command", "run") == "validate-config":
         return run_validate_config(args)
     if getattr(args, "command", "run") == "kometa-trigger":
@@ -142,6 +142,7 @@ RUN_COMMAND_HELP = CommandHelp(
         ("GUI_HOST", "Host to bind web GUI (default: 0.0.0.0)"),
         ("WATCH_MODE", "Enable filesystem watcher mode to continuously process new files (true/false/1/0)"),
         ("CLEAR_PROCESSED_CACHE", "Clear processed file cache before running (true/false/1/0)"),
+        ("RETRY_UNMATCHED", "Match previously unmatched files again even if unchanged (true/false/1/0)"),
         ("PLAIN_CONSOLE_LOGS", "Force plain text console output without Rich formatting (true/false/1/0)"),
         ("RICH_CONSOLE_LOGS", "Force Rich console output even in non-TTY environments (true/false/1/0)"),
     ],
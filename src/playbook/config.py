@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from .globs import PathFilter, SourceGlobMatcher, compile_path_filter, compile_source_globs
 from .pattern_templates import (
     expand_regex_with_tokens,
     get_default_source_globs,
@@ -44,6 +45,7 @@ class TVSportsDBConfig:
     base_url: str = "http://localhost:8000"
     ttl_hours: int = 2
     timeout: float = 30.0
+    serve_stale: bool = False  # Answer from expired cache entries and revalidate them in the background
 
 
 @dataclass
@@ -310,12 +312,19 @@ class QualityProfile:
     min_score: int | None = None
 
 
+_NOTIFICATION_PRIORITIES = ("high", "normal")
+_NOTIFICATION_OVERFLOW = ("block", "drop", "spill")
+
+
 @dataclass
 class NotificationSettings:
     targets: list[dict[str, Any]] = field(default_factory=list)
     throttle: dict[str, int] = field(default_factory=dict)
     mentions: dict[str, str] = field(default_factory=dict)
     scan_summary: bool = True  # Send a summary notification after each scan
+    queue_size: int = 100  # Events buffered per target for background delivery; 0 sends inline
+    overflow: str = "spill"  # Full queue: block | drop | spill (to disk); infrastructure targets default to block
+    drain_timeout: float = 60.0  # Seconds the end of a run waits for queued notifications
 
 
 @dataclass
@@ -326,6 +335,19 @@ class WatcherSettings:
     reconcile_interval: int = 900
 
 
+@dataclass
+class ProcessingSettings:
+    """Tuning for the per-file processing pipeline."""
+
+    workers: int = 1  # Match workers; 1 keeps matching inline on the processing thread
+    reconcile_budget: int = 5000  # Processed records checked for a missing destination per full run; 0 = all
+    write_batch: int = 256  # Database mutations committed per transaction; 0 commits each write immediately
+    write_delay: float = 0.5  # Seconds a queued database write may wait for its commit
+    discovery_workers: int = 1  # Threads walking the top-level source subdirectories
+    discovery_cache: bool = True  # Reuse listings of source directories whose mtime is unchanged
+    unmatched_recheck_hours: float = 24.0  # Unchanged unmatched files are matched again after this long; 0 = every run
+
+
 @dataclass
 class KometaTriggerSettings:
     enabled: bool = False
@@ -387,6 +409,11 @@ class SportConfig:
             return self.show_slug
         return None
 
+    @property
+    def glob_matcher(self) -> SourceGlobMatcher:
+        """Compiled ``source_globs`` / ``source_path_globs``, shared by configs with the same globs."""
+        return compile_source_globs(self.source_globs or (), self.source_path_globs or ())
+
 
 @dataclass
 class Settings:
@@ -400,6 +427,7 @@ class Settings:
     link_mode: str = "hardlink"
     notifications: NotificationSettings = field(default_factory=NotificationSettings)
     file_watcher: WatcherSettings = field(default_factory=WatcherSettings)
+    processing: ProcessingSettings = field(default_factory=ProcessingSettings)
     kometa_trigger: KometaTriggerSettings = field(default_factory=KometaTriggerSettings)
     plex_sync: PlexSyncSettings = field(default_factory=PlexSyncSettings)  # Legacy, use integrations.plex
     integrations: IntegrationsSettings = field(default_factory=IntegrationsSettings)  # New unified integrations
@@ -411,6 +439,11 @@ class Settings:
     use_default_sports: bool = True  # Whether to auto-include default sports
     force_reprocess: bool = False  # Bypass database check for processed files
 
+    @property
+    def path_filter(self) -> PathFilter:
+        """Compiled ``include_patterns`` / ``ignore_patterns``, shared by the pipeline and the watcher."""
+        return compile_path_filter(self.include_patterns, self.ignore_patterns)
+
 
 @dataclass
 class AppConfig:
@@ -748,6 +781,65 @@ def _build_watcher_settings(data: dict[str, Any]) -> tuple[WatcherSettings, list
     return settings, migrated_include, migrated_ignore
 
 
+def _build_processing_settings(data: dict[str, Any]) -> ProcessingSettings:
+    if not data:
+        return ProcessingSettings()
+    if not isinstance(data, dict):
+        raise ValueError("'processing' must be provided as a mapping when specified")
+
+    try:
+        workers = int(data.get("workers", 1))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'processing.workers' must be an integer") from exc
+    if workers < 1:
+        raise ValueError("'processing.workers' must be greater than or equal to 1")
+
+    try:
+        reconcile_budget = int(data.get("reconcile_budget", 5000))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'processing.reconcile_budget' must be an integer") from exc
+    if reconcile_budget < 0:
+        raise ValueError("'processing.reconcile_budget' must be greater than or equal to 0")
+
+    try:
+        write_batch = int(data.get("write_batch", 256))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'processing.write_batch' must be an integer") from exc
+    if write_batch < 0:
+        raise ValueError("'processing.write_batch' must be greater than or equal to 0")
+
+    try:
+        write_delay = float(data.get("write_delay", 0.5))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'processing.write_delay' must be a number") from exc
+    if write_delay < 0:
+        raise ValueError("'processing.write_delay' must be greater than or equal to 0")
+
+    try:
+        discovery_workers = int(data.get("discovery_workers", 1))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'processing.discovery_workers' must be an integer") from exc
+    if discovery_workers < 1:
+        raise ValueError("'processing.discovery_workers' must be greater than or equal to 1")
+
+    try:
+        unmatched_recheck_hours = float(data.get("unmatched_recheck_hours", 24.0))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'processing.unmatched_recheck_hours' must be a number") from exc
+    if unmatched_recheck_hours < 0:
+        raise ValueError("'processing.unmatched_recheck_hours' must be greater than or equal to 0")
+
+    return ProcessingSettings(
+        workers=workers,
+        reconcile_budget=reconcile_budget,
+        write_batch=write_batch,
+        write_delay=write_delay,
+        discovery_workers=discovery_workers,
+        discovery_cache=bool(data.get("discovery_cache", True)),
+        unmatched_recheck_hours=unmatched_recheck_hours,
+    )
+
+
 def _build_plex_sync_settings(data: dict[str, Any]) -> PlexSyncSettings:
     if not data:
         return PlexSyncSettings()
@@ -910,6 +1002,7 @@ def _build_tvsportsdb_config(data: dict[str, Any]) -> TVSportsDBConfig:
         base_url=base_url,
         ttl_hours=ttl_hours,
         timeout=timeout,
+        serve_stale=bool(data.get("serve_stale", False)),
     )
 
 
@@ -1311,6 +1404,12 @@ def _build_settings(data: dict[str, Any]) -> Settings:
             raise ValueError("Notification target entries must include a string 'type'")
         normalized_entry: dict[str, Any] = {str(k): v for k, v in entry.items()}
         normalized_entry["type"] = target_type.strip().lower()
+        for key, allowed in (("priority", _NOTIFICATION_PRIORITIES), ("overflow", _NOTIFICATION_OVERFLOW)):
+            if key in normalized_entry:
+                value = str(normalized_entry[key]).strip().lower()
+                if value not in allowed:
+                    raise ValueError(f"Notification target '{key}' must be one of: {', '.join(allowed)}")
+                normalized_entry[key] = value
         targets.append(normalized_entry)
 
     throttle_raw = notifications_raw.get("throttle", {}) or {}
@@ -1341,11 +1440,30 @@ def _build_settings(data: dict[str, Any]) -> Settings:
             mention = f"<@&{mention}>"
         mentions[key_str] = mention
 
+    try:
+        queue_size = int(notifications_raw.get("queue_size", 100))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'notifications.queue_size' must be an integer") from exc
+    if queue_size < 0:
+        raise ValueError("'notifications.queue_size' must be 0 or greater")
+    overflow = str(notifications_raw.get("overflow", "spill")).strip().lower()
+    if overflow not in _NOTIFICATION_OVERFLOW:
+        raise ValueError(f"'notifications.overflow' must be one of: {', '.join(_NOTIFICATION_OVERFLOW)}")
+    try:
+        drain_timeout = float(notifications_raw.get("drain_timeout", 60.0))
+    except (TypeError, ValueError) as exc:
+        raise ValueError("'notifications.drain_timeout' must be a number") from exc
+    if drain_timeout < 0:
+        raise ValueError("'notifications.drain_timeout' must be 0 or greater")
+
     notifications = NotificationSettings(
         targets=targets,
         throttle=throttle,
         mentions=mentions,
         scan_summary=bool(notifications_raw.get("scan_summary", True)),
+        queue_size=queue_size,
+        overflow=overflow,
+        drain_timeout=drain_timeout,
     )
 
     source_dir = Path(data.get("source_dir", "/data/source")).expanduser()
@@ -1357,6 +1475,7 @@ def _build_settings(data: dict[str, Any]) -> Settings:
     if theme not in {"swizzin", "catppuccin"}:
         theme = "swizzin"
     watcher_settings, migrated_include, migrated_ignore = _build_watcher_settings(data.get("file_watcher", {}) or {})
+    processing = _build_processing_settings(data.get("processing", {}) or {})
     kometa_trigger = _build_kometa_trigger_settings(data.get("kometa_trigger", {}) or {})
 
     # Parse legacy plex_metadata_sync (for backwards compatibility)
@@ -1402,6 +1521,7 @@ def _build_settings(data: dict[str, Any]) -> Settings:
         link_mode=data.get("link_mode", "hardlink"),
         notifications=notifications,
         file_watcher=watcher_settings,
+        processing=processing,
         kometa_trigger=kometa_trigger,
         plex_sync=plex_sync,
         integrations=integrations,
@@ -0,0 +1,237 @@
+"""Sport dispatch prefilter.
+
+Before a file is matched, every sport that accepts its extension used to be
+tried in turn: glob check, structured parsing, then each pattern regex. Year
+variants duplicate whole sports, so one file could be regex-tested hundreds
+of times against sports it can never match.
+
+SportDispatchIndex is built once per set of loaded runtimes and answers, in a
+single pass over the filename, which runtimes are worth trying:
+
+- runtimes are bucketed by accepted extension
+- each distinct glob configuration is compiled into one regex and evaluated
+  at most once per file, however many sport variants share it
+- each pattern contributes a literal keyword that any match must contain;
+  a sport whose patterns all miss their keyword, and which cannot match via
+  structured parsing, is skipped without running a single regex
+
+The prefilter is conservative: whenever a keyword cannot be derived safely the
+sport is kept, so matching results are unchanged.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .globs import SourceGlobMatcher
+from .parsers.structured_filename import parse_structured_filename
+
+try:  # Python 3.11+ moved the parser into the re package
+    import re._constants as _sre_constants
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover - older interpreters
+    _sre_constants = None  # type: ignore[assignment]
+    _sre_parse = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from .metadata_loader import SportRuntime
+
+# Shorter literals are too common in release names to filter anything useful
+MIN_KEYWORD_LENGTH = 3
+
+DISPATCH_CANDIDATE = "candidate"
+DISPATCH_GLOB_EXCLUDED = "glob-excluded"
+DISPATCH_PREFILTERED = "prefiltered"
+
+
+def required_keyword(regex: str) -> str | None:
+    """Return a lowercase literal that every match of *regex* must contain.
+
+    Walks the parsed expression and keeps the longest run of consecutive
+    literal characters that is not inside an optional or alternative
+    construct. Returns None when no such literal of at least
+    ``MIN_KEYWORD_LENGTH`` ASCII characters exists or the regex cannot be
+    analysed.
+
+    Args:
+        regex: Regular expression source
+
+    Returns:
+        Lowercase keyword, or None when the pattern cannot be prefiltered
+    """
+    if _sre_parse is None:  # pragma: no cover - older interpreters
+        return None
+    try:
+        parsed = _sre_parse.parse(regex)
+    except (re.error, TypeError, ValueError):
+        return None
+
+    runs: list[str] = []
+    _collect_literal_runs(list(parsed), runs)
+    best = max(runs, key=len, default="")
+    if len(best) < MIN_KEYWORD_LENGTH:
+        return None
+    return best.lower()
+
+
+def _collect_literal_runs(items: list, runs: list[str]) -> None:
+    constants = _sre_constants
+    repeat_ops = {constants.MAX_REPEAT, constants.MIN_REPEAT}
+    possessive = getattr(constants, "POSSESSIVE_REPEAT", None)
+    if possessive is not None:
+        repeat_ops.add(possessive)
+
+    current: list[str] = []
+
+    def flush() -> None:
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    for op, argument in items:
+        if op is constants.LITERAL and argument < 128:
+            current.append(chr(argument))
+            continue
+        flush()
+        if op is constants.SUBPATTERN:
+            _collect_literal_runs(list(argument[-1]), runs)
+        elif op in repeat_ops:
+            minimum, _maximum, body = argument
+            if minimum >= 1:
+                _collect_literal_runs(list(body), runs)
+        elif op is getattr(constants, "ATOMIC_GROUP", None):
+            _collect_literal_runs(list(argument), runs)
+    flush()
+
+
+@dataclass
+class DispatchResult:
+    """Dispatch decision for one file.
+
+    Attributes:
+        entries: ``(runtime, verdict)`` pairs for every runtime accepting the
+            file's extension, in runtime order
+        sports_skipped: Runtimes that will not be matched against the file
+        patterns_skipped: Patterns belonging to the skipped runtimes
+    """
+
+    entries: list[tuple[SportRuntime, str]] = field(default_factory=list)
+    sports_skipped: int = 0
+    patterns_skipped: int = 0
+
+
+@dataclass
+class _RuntimeEntry:
+    runtime: SportRuntime
+    glob_key: tuple[tuple[str, ...], tuple[str, ...]]
+    # (keyword, match_relative_path) per pattern; None when every pattern is unfiltered
+    keywords: list[tuple[str, bool]] | None
+    has_show: bool
+
+
+class SportDispatchIndex:
+    """Precompiled index selecting the plausible runtimes for a filename."""
+
+    def __init__(self, runtimes: Sequence[SportRuntime]) -> None:
+        self.runtimes = runtimes
+        self._by_extension: dict[str, list[_RuntimeEntry]] = {}
+        self._globs: dict[tuple[tuple[str, ...], tuple[str, ...]], SourceGlobMatcher] = {}
+
+        for runtime in runtimes:
+            sport = runtime.sport
+            glob_key = (tuple(sport.source_globs or ()), tuple(sport.source_path_globs or ()))
+            if glob_key not in self._globs:
+                self._globs[glob_key] = sport.glob_matcher
+            entry = _RuntimeEntry(
+                runtime=runtime,
+                glob_key=glob_key,
+                keywords=_pattern_keywords(runtime),
+                has_show=runtime.show is not None,
+            )
+            for extension in runtime.extensions:
+                self._by_extension.setdefault(extension, []).append(entry)
+
+    def dispatch(self, path: Path, *, source_dir: Path | None = None) -> DispatchResult:
+        """Classify every runtime accepting *path*'s extension.
+
+        Args:
+            path: Source file to dispatch
+            source_dir: Source root, used for path globs and relative-path patterns
+
+        Returns:
+            DispatchResult listing candidate, glob-excluded and prefiltered runtimes
+        """
+        result = DispatchResult()
+        entries = self._by_extension.get(path.suffix.lower())
+        if not entries:
+            return result
+
+        filename = path.name
+        relative_path: str | None = None
+        if source_dir is not None:
+            try:
+                relative_path = str(path.relative_to(source_dir))
+            except ValueError:
+                relative_path = None
+        # Non-ASCII names can match ASCII literals under re.IGNORECASE in ways
+        # that lowercasing does not reproduce, so they skip keyword filtering.
+        keyword_filtering = filename.isascii() and (relative_path is None or relative_path.isascii())
+        lowered_name = filename.lower()
+        lowered_relative = relative_path.lower() if relative_path else None
+
+        glob_results: dict[tuple[tuple[str, ...], tuple[str, ...]], bool] = {}
+        structured_possible: bool | None = None
+
+        for entry in entries:
+            glob_ok = glob_results.get(entry.glob_key)
+            if glob_ok is None:
+                glob_ok = self._globs[entry.glob_key].matches(path, source_dir)
+                glob_results[entry.glob_key] = glob_ok
+            if not glob_ok:
+                self._skip(result, entry, DISPATCH_GLOB_EXCLUDED)
+                continue
+
+            if not keyword_filtering or entry.keywords is None:
+                result.entries.append((entry.runtime, DISPATCH_CANDIDATE))
+                continue
+
+            if any(
+                keyword in (lowered_relative if use_relative and lowered_relative else lowered_name)
+                for keyword, use_relative in entry.keywords
+            ):
+                result.entries.append((entry.runtime, DISPATCH_CANDIDATE))
+                continue
+
+            if entry.has_show:
+                # Structured matching scores on teams parsed from the name and
+                # cannot reach its threshold without them.
+                if structured_possible is None:
+                    structured = parse_structured_filename(filename)
+                    structured_possible = bool(structured and structured.teams)
+                if structured_possible:
+                    result.entries.append((entry.runtime, DISPATCH_CANDIDATE))
+                    continue
+
+            self._skip(result, entry, DISPATCH_PREFILTERED)
+
+        return result
+
+    @staticmethod
+    def _skip(result: DispatchResult, entry: _RuntimeEntry, verdict: str) -> None:
+        result.entries.append((entry.runtime, verdict))
+        result.sports_skipped += 1
+        result.patterns_skipped += len(entry.runtime.patterns)
+
+
+def _pattern_keywords(runtime: SportRuntime) -> list[tuple[str, bool]] | None:
+    keywords: list[tuple[str, bool]] = []
+    for pattern in runtime.patterns:
+        keyword = required_keyword(pattern.config.regex)
+        if keyword is None:
+            return None
+        keywords.append((keyword, pattern.config.match_relative_path))
+    return keywords
@@ -9,14 +9,20 @@ be processed by which sports.
 from __future__ import annotations
 
 import logging
+import os
 import re
-from collections.abc import Iterable
-from fnmatch import fnmatch
+import sqlite3
+import time
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from .config import SportConfig
-from .logging_utils import render_fields_block
+from .globs import compile_path_filter, compile_source_globs
+from .logging_utils import LazyFieldsBlock
 from .models import ProcessingStats
+from .persistence import DirectoryListing, DirectoryListingStore
 
 LOGGER = logging.getLogger(__name__)
 
@@ -53,18 +59,7 @@ def matches_globs(path: Path, sport: SportConfig, *, source_dir: Path | None = N
     Returns:
         True if the file matches any glob pattern or if no patterns are defined
     """
-    if not sport.source_globs and not sport.source_path_globs:
-        return True
-    filename = path.name
-    if sport.source_globs and any(fnmatch(filename, pattern) for pattern in sport.source_globs):
-        return True
-    if sport.source_path_globs and source_dir is not None:
-        try:
-            relative = path.relative_to(source_dir)
-        except ValueError:
-            return False
-        return any(relative.match(pattern) for pattern in sport.source_path_globs)
-    return not sport.source_globs and not sport.source_path_globs
+    return compile_source_globs(sport.source_globs or (), sport.source_path_globs or ()).matches(path, source_dir)
 
 
 def should_suppress_sample_ignored(source_path: Path) -> bool:
@@ -84,6 +79,8 @@ def matches_include_ignore_patterns(path: Path, include: list[str], ignore: list
     """Check include/ignore pattern filters using watcher semantics.
 
     Pattern matching is applied to both filename and full path string.
+    Callers checking many files should keep :attr:`Settings.path_filter`
+    (or :func:`~playbook.globs.compile_path_filter`) instead.
 
     Args:
         path: Path to evaluate
@@ -93,25 +90,121 @@ def matches_include_ignore_patterns(path: Path, include: list[str], ignore: list
     Returns:
         True if the file passes filters and should be processed.
     """
-    filename = path.name
-    target = str(path)
-
-    if include and not any(fnmatch(filename, pattern) or fnmatch(target, pattern) for pattern in include):
-        return False
-    return not (ignore and any(fnmatch(filename, pattern) or fnmatch(target, pattern) for pattern in ignore))
-
-
-def gather_source_files(source_dir: Path, stats: ProcessingStats | None = None) -> Iterable[Path]:
+    return compile_path_filter(include, ignore).matches(path)
+
+
+# Directories modified this recently are read again on the next scan: a change
+# made within the filesystem's timestamp granularity could leave the mtime as is
+_RACY_MTIME_NS = 2_000_000_000
+
+
+@dataclass
+class _Walk:
+    """Files and directory listings collected by one walk."""
+
+    files: list[Path] = field(default_factory=list)
+    listings: dict[str, DirectoryListing] = field(default_factory=dict)
+    # Directories read during this walk whose mtime is too recent to trust next time
+    racy: set[str] = field(default_factory=set)
+    entries_scanned: int = 0
+    entries_skipped: int = 0
+
+    def merge(self, other: _Walk) -> None:
+        self.files.extend(other.files)
+        self.listings.update(other.listings)
+        self.racy.update(other.racy)
+        self.entries_scanned += other.entries_scanned
+        self.entries_skipped += other.entries_skipped
+
+
+def _read_directory(directory: str, mtime_ns: int, walk: _Walk) -> DirectoryListing | None:
+    """List *directory* with ``os.scandir``, classifying entries without extra stat calls."""
+    files: list[str] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                walk.entries_scanned += 1
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.name)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append(entry.name)
+                    elif entry.is_symlink() and entry.is_file():
+                        _log_skipped_source(Path(entry.path), "symlink")
+                except OSError:
+                    continue
+    except OSError as exc:
+        LOGGER.debug("Cannot list source directory %s: %s", directory, exc)
+        return None
+    return DirectoryListing(mtime_ns, tuple(files), tuple(subdirs))
+
+
+def _walk_tree(
+    top: str,
+    cached: Mapping[str, DirectoryListing],
+    scan_started_ns: int,
+    *,
+    recurse: bool = True,
+) -> _Walk:
+    """Collect the files under *top*, reusing cached listings of unchanged directories."""
+    walk = _Walk()
+    stack = [top]
+    while stack:
+        directory = stack.pop()
+        try:
+            mtime_ns = os.stat(directory).st_mtime_ns
+        except OSError as exc:
+            LOGGER.debug("Cannot stat source directory %s: %s", directory, exc)
+            continue
+        listing = cached.get(directory)
+        if listing is not None and listing.mtime_ns == mtime_ns:
+            walk.entries_skipped += len(listing.files) + len(listing.subdirs)
+        else:
+            listing = _read_directory(directory, mtime_ns, walk)
+            if listing is None:
+                continue
+            if scan_started_ns - mtime_ns < _RACY_MTIME_NS:
+                walk.racy.add(directory)
+        walk.listings[directory] = listing
+        for name in listing.files:
+            path = Path(directory, name)
+            skip_reason = skip_reason_for_source_file(path)
+            if skip_reason:
+                _log_skipped_source(path, skip_reason)
+            else:
+                walk.files.append(path)
+        if recurse:
+            stack.extend(os.path.join(directory, name) for name in reversed(listing.subdirs))
+    return walk
+
+
+def gather_source_files(
+    source_dir: Path,
+    stats: ProcessingStats | None = None,
+    *,
+    listing_store: DirectoryListingStore | None = None,
+    workers: int = 1,
+) -> Iterable[Path]:
     """Discover and yield source files for processing.
 
-    Iterates through the source directory recursively, filtering out:
+    Walks the source directory recursively with ``os.scandir``, filtering out:
     - Non-file entries (directories, etc.)
     - Symlinks
     - macOS resource forks (._ prefix)
 
+    With a *listing_store*, directories whose mtime is unchanged since the
+    previous scan are not read again; their stored listing is used instead.
+    Every directory is still stat'ed once, so changes anywhere in the tree
+    are picked up. With ``workers > 1`` the top-level subdirectories are
+    walked in parallel threads, which helps on high-latency network shares.
+
     Args:
         source_dir: Root directory to scan for source files
-        stats: Optional ProcessingStats object to register warnings
+        stats: Optional ProcessingStats object to register warnings and
+            the number of directory entries read vs. reused
+        listing_store: Optional store of directory listings from earlier scans
+        workers: Threads walking the top-level subdirectories
 
     Yields:
         Path objects for each valid source file found
@@ -121,7 +214,7 @@ def gather_source_files(source_dir: Path, stats: ProcessingStats | None = None)
     """
     if not source_dir.exists():
         LOGGER.warning(
-            render_fields_block(
+            LazyFieldsBlock(
                 "Source Directory Missing",
                 {"Path": source_dir},
                 pad_top=True,
@@ -131,35 +224,117 @@ def gather_source_files(source_dir: Path, stats: ProcessingStats | None = None)
             stats.register_warning(f"Source directory missing: {source_dir}")
         return []
 
-    for path in source_dir.rglob("*"):
-        if not path.is_file():
-            continue
+    root = str(source_dir)
+    cached = listing_store.load(root) if listing_store is not None else {}
+    scan_started_ns = time.time_ns()
+
+    walk = _walk_tree(root, cached, scan_started_ns, recurse=workers <= 1)
+    root_listing = walk.listings.get(root)
+    if workers > 1 and root_listing is not None:
+        subdirs = [os.path.join(root, name) for name in root_listing.subdirs]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="playbook-discovery") as executor:
+            for subtree in executor.map(lambda top: _walk_tree(top, cached, scan_started_ns), subdirs):
+                walk.merge(subtree)
+
+    if stats is not None:
+        stats.entries_scanned += walk.entries_scanned
+        stats.entries_skipped += walk.entries_skipped
+    if listing_store is not None:
+        _save_listings(listing_store, root, cached, walk)
+    yield from walk.files
+
+
+def _save_listings(
+    listing_store: DirectoryListingStore,
+    root: str,
+    cached: Mapping[str, DirectoryListing],
+    walk: _Walk,
+) -> None:
+    """Store listings that changed and forget directories that are gone or too recent to trust."""
+    changed = {
+        path: listing
+        for path, listing in walk.listings.items()
+        if path not in walk.racy and cached.get(path) != listing
+    }
+    removed = [path for path in cached if path not in walk.listings or path in walk.racy]
+    if not changed and not removed:
+        return
+    try:
+        listing_store.save_changes(root, changed, removed)
+    except sqlite3.Error as exc:
+        LOGGER.warning("Failed to store source directory listings: %s", exc)
+
+
+def _log_skipped_source(path: Path, reason: str) -> None:
+    LOGGER.debug(
+        LazyFieldsBlock(
+            "Skipping Source File",
+            {
+                "Source": path,
+                "Reason": reason,
+            },
+            pad_top=True,
+        )
+    )
 
-        if path.is_symlink():
-            LOGGER.debug(
-                render_fields_block(
-                    "Skipping Source File",
-                    {
-                        "Source": path,
-                        "Reason": "symlink",
-                    },
-                    pad_top=True,
-                )
-            )
-            continue
 
-        skip_reason = skip_reason_for_source_file(path)
-        if skip_reason:
+def _is_processable_source(path: Path) -> bool:
+    """Check a discovered regular file against the source-file skip rules.
+
+    Logs the skip reason at DEBUG level when the file is rejected.
+    """
+    if path.is_symlink():
+        _log_skipped_source(path, "symlink")
+        return False
+
+    skip_reason = skip_reason_for_source_file(path)
+    if skip_reason:
+        _log_skipped_source(path, skip_reason)
+        return False
+
+    return True
+
+
+def _is_within(path: Path, root: Path) -> bool:
+    if path.is_relative_to(root):
+        return True
+    try:
+        return path.resolve().is_relative_to(root.resolve())
+    except OSError:
+        return False
+
+
+def collect_changed_source_files(paths: Iterable[Path], source_dir: Path) -> list[Path]:
+    """Resolve a batch of changed paths into processable source files.
+
+    Applies the same rules as :func:`gather_source_files` to an explicit set
+    of paths (typically reported by the filesystem watcher) instead of walking
+    the whole source directory. Directories are expanded recursively; paths
+    that no longer exist or that live outside *source_dir* are dropped.
+
+    Args:
+        paths: Changed file or directory paths
+        source_dir: Root directory that source files must live under
+
+    Returns:
+        Sorted, de-duplicated list of source files to process
+    """
+    collected: set[Path] = set()
+    for path in paths:
+        if not _is_within(path, source_dir):
             LOGGER.debug(
-                render_fields_block(
-                    "Skipping Source File",
+                LazyFieldsBlock(
+                    "Skipping Changed Path",
                     {
                         "Source": path,
-                        "Reason": skip_reason,
+                        "Reason": "outside source_dir",
                     },
                     pad_top=True,
                 )
             )
             continue
-
-        yield path
+        if path.is_dir() and not path.is_symlink():
+            collected.update(gather_source_files(path))
+        elif path.is_file() and _is_processable_source(path):
+            collected.add(path)
+    return sorted(collected)
@@ -0,0 +1,110 @@
+"""Glob pattern lists compiled into single regular expressions.
+
+Include/ignore filters and sport ``source_globs`` hold many fnmatch-style
+patterns. Testing a file against each of them with ``fnmatch`` costs one
+call (and, for include/ignore, two) per pattern. Here every list is
+translated once into one alternation regex, so a name is scanned a single
+time however many patterns there are.
+
+Compiled matchers are memoized by pattern content: configs that share a
+pattern list (year variants of a sport, the processor and the watcher)
+share one matcher, and editing a list simply yields a new one.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from collections.abc import Iterable
+from dataclasses import dataclass
+from fnmatch import translate
+from functools import lru_cache
+from pathlib import Path
+
+
+def compile_glob_patterns(patterns: Iterable[str]) -> re.Pattern[str] | None:
+    """Compile fnmatch-style globs into one regex that matches any of them.
+
+    ``compiled.match(os.path.normcase(name))`` is equivalent to
+    ``any(fnmatch(name, pattern) for pattern in patterns)`` but scans the
+    name once instead of once per pattern.
+
+    Args:
+        patterns: Glob patterns to combine
+
+    Returns:
+        Compiled regex, or None when *patterns* is empty
+    """
+    translated = [translate(os.path.normcase(pattern)) for pattern in patterns]
+    if not translated:
+        return None
+    return re.compile("|".join(translated))
+
+
+@dataclass(frozen=True)
+class PathFilter:
+    """Compiled include/ignore filter.
+
+    A pattern applies when it matches either the filename or the full path.
+    An empty include list accepts everything.
+    """
+
+    include: re.Pattern[str] | None
+    ignore: re.Pattern[str] | None
+
+    def matches(self, path: Path) -> bool:
+        """Return True if *path* passes the include and ignore filters."""
+        if self.include is None and self.ignore is None:
+            return True
+        filename = os.path.normcase(path.name)
+        target = os.path.normcase(str(path))
+        if self.include is not None and not (self.include.match(filename) or self.include.match(target)):
+            return False
+        return not (self.ignore is not None and (self.ignore.match(filename) or self.ignore.match(target)))
+
+
+@lru_cache(maxsize=64)
+def _path_filter(include: tuple[str, ...], ignore: tuple[str, ...]) -> PathFilter:
+    return PathFilter(include=compile_glob_patterns(include), ignore=compile_glob_patterns(ignore))
+
+
+def compile_path_filter(include: Iterable[str], ignore: Iterable[str]) -> PathFilter:
+    """Return the compiled filter for *include* and *ignore* patterns."""
+    return _path_filter(tuple(include), tuple(ignore))
+
+
+@dataclass(frozen=True)
+class SourceGlobMatcher:
+    """Compiled ``source_globs`` / ``source_path_globs`` of a sport.
+
+    Filenames are tested against the combined ``source_globs`` regex; the
+    relative path from the source directory is tested against each
+    ``source_path_globs`` entry with :meth:`pathlib.PurePath.match`.
+    """
+
+    names: re.Pattern[str] | None
+    path_globs: tuple[str, ...]
+
+    def matches(self, path: Path, source_dir: Path | None = None) -> bool:
+        """Return True if *path* matches any glob, or if no globs are defined."""
+        if self.names is None and not self.path_globs:
+            return True
+        if self.names is not None and self.names.match(os.path.normcase(path.name)):
+            return True
+        if self.path_globs and source_dir is not None:
+            try:
+                relative = path.relative_to(source_dir)
+            except ValueError:
+                return False
+            return any(relative.match(pattern) for pattern in self.path_globs)
+        return False
+
+
+@lru_cache(maxsize=256)
+def _source_glob_matcher(source_globs: tuple[str, ...], source_path_globs: tuple[str, ...]) -> SourceGlobMatcher:
+    return SourceGlobMatcher(names=compile_glob_patterns(source_globs), path_globs=source_path_globs)
+
+
+def compile_source_globs(source_globs: Iterable[str], source_path_globs: Iterable[str] = ()) -> SourceGlobMatcher:
+    """Return the compiled matcher for a sport's source globs."""
+    return _source_glob_matcher(tuple(source_globs), tuple(source_path_globs))
@@ -250,6 +250,7 @@ def run_with_gui(
         from .log_handler import remove_gui_log_handler
 
         remove_gui_log_handler(log_handler)
+        processor.close()
 
     # Start file watcher in background if enabled
     if watch_mode and app_config.settings.file_watcher.enabled:
@@ -292,18 +293,19 @@ def _start_watcher_thread(processor: Processor, app_config: AppConfig) -> thread
             )
             gui_state.watcher = watcher
 
-            # Wrap process_all to update GUI state
-            original_process_all = processor.process_all
+            # Wrap the processing entry points to update GUI state
+            def track_processing(func):
+                def wrapped(*args, **kwargs):
+                    gui_state.set_processing(True)
+                    try:
+                        return func(*args, **kwargs)
+                    finally:
+                        gui_state.set_processing(False)
 
-            def wrapped_process_all():
-                gui_state.set_processing(True)
-                try:
-                    result = original_process_all()
-                    return result
-                finally:
-                    gui_state.set_processing(False)
+                return wrapped
 
-            processor.process_all = wrapped_process_all
+            processor.process_all = track_processing(processor.process_all)
+            processor.process_paths = track_processing(processor.process_paths)
 
             # Run watcher (blocks until stopped)
             watcher.run_forever()
@@ -300,15 +300,17 @@ def get_sports_overview() -> list[SportOverview]:
     # Group variants by (name, show_slug) to merge cross-year duplicates
     merged: dict[tuple[str, str], SportOverview] = {}
 
+    # Per-sport status counts from the store's counters table (one query, no records loaded)
+    counts_by_sport: dict[str, dict[str, int]] = {}
+    if gui_state.processed_store:
+        try:
+            counts_by_sport = gui_state.processed_store.count_by_sport()
+        except Exception as e:
+            LOGGER.warning("Failed to count processed records: %s", e)
+
     for sport in gui_state.config.sports:
-        # Get processed records count from local database only (fast)
-        matched_count = 0
-        if gui_state.processed_store:
-            try:
-                records = gui_state.processed_store.get_by_sport(sport.id)
-                matched_count = len([r for r in records if r.status != "error"])
-            except Exception as e:
-                LOGGER.warning("Failed to get processed records for %s: %s", sport.id, e)
+        status_counts = counts_by_sport.get(sport.id, {})
+        matched_count = sum(count for status, count in status_counts.items() if status != "error")
 
         display_slug = sport.show_slug or sport.show_slug_template or ""
         merge_key = (sport.name, display_slug)
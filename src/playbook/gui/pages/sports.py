@@ -898,10 +898,7 @@ def _recent_matches_card(sport_id: str) -> None:
                     sibling_ids = _get_sibling_sport_ids(sport)
                     break
 
-        records = []
-        for sid in sibling_ids:
-            records.extend(gui_state.processed_store.get_by_sport(sid))
-        recent = sorted(records, key=lambda r: r.processed_at, reverse=True)[:10]
+        recent = gui_state.processed_store.get_recent_by_sports(sibling_ids, limit=10)
     except Exception as e:
         LOGGER.warning("Failed to get recent matches: %s", e)
         recent = []
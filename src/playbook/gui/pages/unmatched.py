@@ -35,11 +35,14 @@ def unmatched_page() -> None:
         sport_filter: str = ""
         page: int = 0
         page_size: int = 50
+        # Keyset cursor (last_seen, source_path) that starts each visited page
+        page_cursors: list = None
         results_container: ui.column = None
         stats_container: ui.row = None
 
     state = State()
     state.categories = list(DEFAULT_CATEGORIES)
+    state.page_cursors = [None]
 
     def refresh_results():
         """Refresh the results after filter change."""
@@ -64,6 +67,13 @@ def unmatched_page() -> None:
         with ui.row().classes("w-full items-center justify-between"):
             ui.label("Unmatched Files").classes("text-3xl font-bold")
             with ui.row().classes("gap-2"):
+                app_button(
+                    "Retry All",
+                    icon="replay",
+                    on_click=lambda: _trigger_rescan(refresh_page, retry_unmatched=True),
+                    variant="outline",
+                    props="flat dense",
+                )
                 app_button(
                     "Rescan",
                     icon="refresh",
@@ -220,12 +230,14 @@ def _render_results_content(state, refresh_results, refresh_page) -> None:
         search = state.search_query if state.search_query else None
         sport = state.sport_filter if state.sport_filter else None
 
+        if state.page == 0:
+            state.page_cursors = [None]
         records = gui_state.unmatched_store.get_all(
             categories=categories,
             search_query=search,
             sport_filter=sport,
             limit=state.page_size,
-            offset=state.page * state.page_size,
+            after=state.page_cursors[state.page],
         )
         total_count = gui_state.unmatched_store.get_count(
             categories=categories,
@@ -254,7 +266,10 @@ def _render_results_content(state, refresh_results, refresh_page) -> None:
                         refresh_results()
 
                 def go_next():
-                    if (state.page + 1) * state.page_size < total_count:
+                    if (state.page + 1) * state.page_size < total_count and records:
+                        last = records[-1]
+                        del state.page_cursors[state.page + 1 :]
+                        state.page_cursors.append((last.last_seen, last.source_path))
                         state.page += 1
                         refresh_results()
 
@@ -407,8 +422,12 @@ def _format_relative_time(dt: datetime) -> str:
         return "Just now"
 
 
-async def _trigger_rescan(refresh_callback=None) -> None:
-    """Trigger a processing run to rescan files."""
+async def _trigger_rescan(refresh_callback=None, *, retry_unmatched: bool = False) -> None:
+    """Trigger a processing run to rescan files.
+
+    With ``retry_unmatched``, unmatched files are matched again even if they
+    did not change since their last attempt.
+    """
     import asyncio
 
     from nicegui import context
@@ -428,6 +447,8 @@ async def _trigger_rescan(refresh_callback=None) -> None:
     gui_state.set_processing(True)
 
     try:
+        if retry_unmatched:
+            await asyncio.get_event_loop().run_in_executor(None, gui_state.processor.retry_unmatched)
         # Run process_all in a separate thread
         await asyncio.get_event_loop().run_in_executor(None, gui_state.processor.process_all)
         # Skip UI updates if client disconnected during async operation
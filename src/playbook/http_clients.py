@@ -0,0 +1,179 @@
+"""Process-wide HTTP sessions for integrations and notification targets.
+
+Every caller gets a :class:`requests.Session` for its target name from the
+shared :class:`HttpClientRegistry`. All sessions share one connection pool
+per host, so connections are kept alive and reused across events and
+targets. Each session records latency, connection reuse and errors for its
+target.
+
+Only sessions requested with ``retry=True`` (the Plex clients) get the
+retry/backoff policy of :class:`~playbook.plex_client.PlexClient`. The others
+never retry at the transport level: a retried webhook POST that the server
+had already accepted would deliver the message twice, and targets such as
+Discord run their own rate-limit aware retries.
+"""
+
+from __future__ import annotations
+
+import atexit
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .plex_client import DEFAULT_BACKOFF_FACTOR, DEFAULT_RETRIES, RETRY_STATUS_CODES
+
+# Number of per-host pools kept, and connections kept alive per host
+DEFAULT_POOL_HOSTS = 16
+DEFAULT_POOL_SIZE = 10
+
+
+@dataclass
+class HttpTargetStats:
+    """Request metrics for one target."""
+
+    requests: int = 0
+    errors: int = 0
+    new_connections: int = 0
+    reused_connections: int = 0
+    total_seconds: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "avg_latency_ms": round(self.total_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+        }
+
+
+class MeteredSession(requests.Session):
+    """Session that records request metrics for its target."""
+
+    def __init__(self, target: str, stats: HttpTargetStats, lock: threading.Lock) -> None:
+        super().__init__()
+        self.target = target
+        self._stats = stats
+        self._stats_lock = lock
+
+    def _pool_connections(self, url: str) -> int | None:
+        """Return how many connections the pools for *url*'s host have opened so far."""
+        try:
+            host = urlsplit(url).hostname
+            pools = self.get_adapter(url).poolmanager.pools
+            # urllib3's pool container only supports iteration through keys()
+            keys = pools.keys()  # noqa: SIM118
+            return sum(pools[key].num_connections for key in keys if key.key_host == host)
+        except Exception:  # noqa: BLE001 - metrics must never break a request
+            return None
+
+    def request(self, method: str | bytes, url: str | bytes, *args: Any, **kwargs: Any) -> requests.Response:
+        url_str = url.decode() if isinstance(url, bytes) else str(url)
+        opened_before = self._pool_connections(url_str)
+        started = time.perf_counter()
+        failed = True
+        try:
+            response = super().request(method, url, *args, **kwargs)
+            failed = response.status_code >= 400
+            return response
+        finally:
+            elapsed = time.perf_counter() - started
+            opened_after = self._pool_connections(url_str)
+            with self._stats_lock:
+                stats = self._stats
+                stats.requests += 1
+                stats.total_seconds += elapsed
+                if failed:
+                    stats.errors += 1
+                if opened_before is not None and opened_after is not None:
+                    if opened_after > opened_before:
+                        stats.new_connections += opened_after - opened_before
+                    else:
+                        stats.reused_connections += 1
+
+
+class HttpClientRegistry:
+    """Hands out per-target sessions that share keep-alive pools and a retry policy."""
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = DEFAULT_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        pool_hosts: int = DEFAULT_POOL_HOSTS,
+        pool_size: int = DEFAULT_POOL_SIZE,
+    ) -> None:
+        retry_strategy = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=list(RETRY_STATUS_CODES),
+            allowed_methods=["GET", "PUT", "POST", "DELETE"],
+            raise_on_status=False,
+        )
+        self._adapter = HTTPAdapter(max_retries=0, pool_connections=pool_hosts, pool_maxsize=pool_size)
+        self._retry_adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=pool_hosts,
+            pool_maxsize=pool_size,
+        )
+        # Retries are applied per adapter, so both adapters can use the same pools
+        self._retry_adapter.poolmanager = self._adapter.poolmanager
+        self._sessions: dict[str, MeteredSession] = {}
+        self._stats: dict[str, HttpTargetStats] = {}
+        self._lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+
+    def session(self, target: str, *, retry: bool = False) -> requests.Session:
+        """Return the long-lived session for *target* (e.g. ``"discord"``).
+
+        Args:
+            target: Target name the session and its metrics are kept under
+            retry: Retry failed requests with the Plex retry/backoff policy;
+                only meant for idempotent Plex API calls. A target keeps the
+                policy of its first request.
+        """
+        with self._lock:
+            session = self._sessions.get(target)
+            if session is None:
+                stats = self._stats.setdefault(target, HttpTargetStats())
+                session = MeteredSession(target, stats, self._stats_lock)
+                adapter = self._retry_adapter if retry else self._adapter
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[target] = session
+            return session
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return request metrics per target."""
+        with self._stats_lock:
+            return {target: stats.to_dict() for target, stats in self._stats.items()}
+
+    def close(self) -> None:
+        """Close all pooled connections; sessions handed out stay usable and reconnect on demand."""
+        self._adapter.close()
+        self._retry_adapter.close()
+
+
+_REGISTRY: HttpClientRegistry | None = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_http_clients() -> HttpClientRegistry:
+    """Return the process-wide registry, creating it on first use."""
+    global _REGISTRY
+    with _REGISTRY_LOCK:
+        if _REGISTRY is None:
+            _REGISTRY = HttpClientRegistry()
+        return _REGISTRY
+
+
+@atexit.register
+def _close_registry() -> None:  # pragma: no cover - runs at interpreter exit
+    if _REGISTRY is not None:
+        _REGISTRY.close()
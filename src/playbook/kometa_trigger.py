@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import datetime as dt
+import functools
 import logging
 import os
 import re
@@ -10,19 +11,42 @@ import shlex
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from .config import KometaTriggerSettings
 
-try:  # pragma: no cover - exercised in production environments
-    from kubernetes import client, config
-    from kubernetes.client import ApiException
-except Exception:  # pragma: no cover - optional dependency guard
-    client = None  # type: ignore[assignment]
-    config = None  # type: ignore[assignment]
+if TYPE_CHECKING:
+    from kubernetes import client
 
-    class ApiException(Exception):  # type: ignore[no-redef]
-        """Fallback so callers can catch a consistent type."""
+
+class _MissingApiException(Exception):
+    """Fallback so callers can catch a consistent type."""
+
+
+@functools.cache
+def _load_kubernetes() -> tuple[Any, Any, type[Exception]] | None:
+    """Import the Kubernetes client on first use.
+
+    The client takes longer to import than the rest of Playbook together, and
+    only the kubernetes trigger mode needs it.
+    """
+    try:  # pragma: no cover - exercised in production environments
+        from kubernetes import client, config
+        from kubernetes.client import ApiException
+    except Exception:  # pragma: no cover - optional dependency guard
+        return None
+    return client, config, ApiException
+
+
+def __getattr__(name: str) -> Any:
+    # ``client``, ``config`` and ``ApiException`` stay importable from this module
+    index = {"client": 0, "config": 1, "ApiException": 2}.get(name)
+    if index is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    kubernetes = _load_kubernetes()
+    if kubernetes is None:
+        return _MissingApiException if name == "ApiException" else None
+    return kubernetes[index]
 
 
 LOGGER = logging.getLogger(__name__)
@@ -77,12 +101,14 @@ class KometaCronTrigger(_BaseKometaTrigger):
     ) -> bool:
         if not self.enabled:
             return False
-        if client is None or config is None:
+        kubernetes = _load_kubernetes()
+        if kubernetes is None:
             LOGGER.error("Kubernetes client library is not available; skipping Kometa trigger")
             return False
+        kube_client, kube_config, api_exception = kubernetes
 
         try:
-            api = self._ensure_client()
+            api = self._ensure_client(kube_client, kube_config)
         except Exception as exc:  # pragma: no cover - depends on runtime env
             LOGGER.error("Unable to initialize Kubernetes client: %s", exc)
             return False
@@ -93,7 +119,7 @@ class KometaCronTrigger(_BaseKometaTrigger):
 
         try:
             cronjob = api.read_namespaced_cron_job(name=cronjob_name, namespace=namespace)
-        except ApiException as exc:
+        except api_exception as exc:
             LOGGER.error("Failed to load CronJob %s/%s: %s", namespace, cronjob_name, exc)
             return False
 
@@ -110,7 +136,7 @@ class KometaCronTrigger(_BaseKometaTrigger):
 
         try:
             api.create_namespaced_job(namespace=namespace, body=job_body)
-        except ApiException as exc:
+        except api_exception as exc:
             if getattr(exc, "status", None) == 409:
                 LOGGER.debug("Kometa Job already exists; skipping duplicate trigger (%s/%s)", namespace, job_name)
             else:
@@ -125,14 +151,14 @@ class KometaCronTrigger(_BaseKometaTrigger):
         )
         return True
 
-    def _ensure_client(self) -> client.BatchV1Api:
+    def _ensure_client(self, kube_client: Any, kube_config: Any) -> client.BatchV1Api:
         if self._api is not None:
             return self._api
 
-        config.load_incluster_config()
-        api_client = client.ApiClient()
+        kube_config.load_incluster_config()
+        api_client = kube_client.ApiClient()
         self._api_client = api_client
-        self._api = client.BatchV1Api(api_client)
+        self._api = kube_client.BatchV1Api(api_client)
         return self._api
 
     def _build_job_name(self) -> str:
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, MutableSequence, Sequence
+from collections.abc import Callable, Iterable, Mapping, MutableSequence, Sequence
 from textwrap import wrap
 
 DEFAULT_WRAP_WIDTH = 110
@@ -118,6 +118,46 @@ def render_fields_block(title: str, fields: FieldMapping, *, pad_top: bool = Tru
     return builder.render()
 
 
+class LazyFieldsBlock:
+    """Fields block that is rendered only when a log handler emits it.
+
+    Pass it as the log message instead of the output of
+    :func:`render_fields_block`: ``logging`` drops records below the logger's
+    level before calling ``str()`` on the message, so a disabled DEBUG block
+    is never built or wrapped. The rendered text is cached because every
+    handler formats the record on its own.
+    """
+
+    __slots__ = ("_fields", "_pad_top", "_rendered", "_title")
+
+    def __init__(self, title: str, fields: FieldMapping, *, pad_top: bool = True) -> None:
+        self._title = title
+        self._fields = fields
+        self._pad_top = pad_top
+        self._rendered: str | None = None
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            self._rendered = render_fields_block(self._title, self._fields, pad_top=self._pad_top)
+        return self._rendered
+
+
+class LazyMessage:
+    """Log message computed by ``func(*args)`` only when a log handler emits it."""
+
+    __slots__ = ("_args", "_func", "_rendered")
+
+    def __init__(self, func: Callable[..., object], *args: object) -> None:
+        self._func = func
+        self._args = args
+        self._rendered: str | None = None
+
+    def __str__(self) -> str:
+        if self._rendered is None:
+            self._rendered = str(self._func(*self._args))
+        return self._rendered
+
+
 def render_section_block(
     title: str,
     sections: Sequence[tuple[str, Sequence[str]]],
@@ -13,6 +13,7 @@ import re
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .logging_utils import LazyFieldsBlock
 from .models import ProcessingStats, SportFileMatch
 from .notifications import NotificationEvent
 from .persistence import ProcessedFileRecord
@@ -353,10 +354,8 @@ def cleanup_old_destination(
         return
 
     if dry_run:
-        from .logging_utils import render_fields_block
-
         logger.debug(
-            render_fields_block(
+            LazyFieldsBlock(
                 "Dry-Run: Would Remove Obsolete Destination",
                 {
                     "Source": source_key,
@@ -373,10 +372,8 @@ def cleanup_old_destination(
         # Use missing_ok=True to handle race condition where file was deleted externally
         old_destination.unlink(missing_ok=True)
     except OSError as exc:
-        from .logging_utils import render_fields_block
-
         logger.warning(
-            render_fields_block(
+            LazyFieldsBlock(
                 "Failed To Remove Obsolete Destination",
                 {
                     "Source": source_key,
@@ -388,10 +385,8 @@ def cleanup_old_destination(
         )
         return  # Don't log success if we failed
     else:
-        from .logging_utils import render_fields_block
-
         logger.debug(
-            render_fields_block(
+            LazyFieldsBlock(
                 "Removed Obsolete Destination",
                 {
                     "Source": source_key,
@@ -520,8 +515,6 @@ def handle_match(
         - quality_info: Extracted quality info (None if quality profile disabled).
         - quality_score: Computed quality score (None if quality profile disabled).
     """
-    from .logging_utils import render_fields_block
-
     destination = match.destination_path
     source_key = str(match.source_path)
     old_destination = stale_destinations.get(source_key)
@@ -616,7 +609,7 @@ def handle_match(
             )
             if is_mismatch and mismatch_record is not None:
                 logger.info(
-                    render_fields_block(
+                    LazyFieldsBlock(
                         "Mismatch Detected — Correcting",
                         {
                             "Destination": destination,
@@ -657,7 +650,7 @@ def handle_match(
                     else:
                         replace_reason = "quality_upgrade"
                     logger.debug(
-                        render_fields_block(
+                        LazyFieldsBlock(
                             "Quality Upgrade",
                             {
                                 "Destination": destination,
@@ -675,7 +668,7 @@ def handle_match(
                             min_score = quality_profile.min_score
                             skip_message = f"Quality below minimum: {quality_score_obj.total} < {min_score}"
                             logger.debug(
-                                render_fields_block(
+                                LazyFieldsBlock(
                                     "Rejecting Low Quality File",
                                     {
                                         "Source": match.source_path,
@@ -692,7 +685,7 @@ def handle_match(
                             return event, False, match.sport.id, quality_info, quality_score_obj
 
                     logger.debug(
-                        render_fields_block(
+                        LazyFieldsBlock(
                             "Skipping (Quality Not Better)",
                             {
                                 "Destination": destination,
@@ -709,7 +702,7 @@ def handle_match(
 
             if not replace_existing:
                 logger.debug(
-                    render_fields_block(
+                    LazyFieldsBlock(
                         "Skipping Existing Destination",
                         {
                             "Destination": destination,
@@ -742,7 +735,7 @@ def handle_match(
     # Handle replace existing destination
     if replace_existing:
         logger.debug(
-            render_fields_block(
+            LazyFieldsBlock(
                 "Preparing To Replace Destination",
                 {"Destination": destination},
                 pad_top=True,
@@ -756,7 +749,7 @@ def handle_match(
             except OSError as exc:
                 # Only fail for real errors (permissions, etc.), not "file not found"
                 logger.error(
-                    render_fields_block(
+                    LazyFieldsBlock(
                         "Failed To Remove Destination",
                         {
                             "Destination": destination,
@@ -791,7 +784,7 @@ def handle_match(
     processed_fields.append(("Action", action_desc))
 
     logger.info(
-        render_fields_block(
+        LazyFieldsBlock(
             "Processing Details",
             processed_fields,
             pad_top=True,
@@ -10,7 +10,9 @@ This package provides the core matching logic for Playbook, including:
 Public API:
 - PatternRuntime: Runtime representation of a compiled pattern
 - compile_patterns: Compile pattern configs for a sport
+- PatternScreen: One-pass check of which compiled patterns could match a filename
 - match_file_to_episode: Match a filename to an episode
+- invalidate_session_lookups: Drop memoized session indexes after a metadata change
 
 Example:
     from playbook.matcher import compile_patterns, match_file_to_episode
@@ -25,16 +27,32 @@ Example:
 from .core import DEFAULT_GENERIC_SESSION_ALIASES, PatternRuntime
 from .date_utils import dates_within_proximity, parse_date_from_groups, parse_date_string
 from .orchestrator import compile_patterns, match_file_to_episode
-from .session_resolver import build_session_lookup, resolve_session_lookup
+from .pattern_screen import CompiledPatterns, PatternScreen
+from .session_resolver import (
+    build_session_lookup,
+    get_session_lookup,
+    invalidate_session_lookups,
+    resolve_session_lookup,
+)
 from .similarity import location_matches_title
 from .structured import score_structured_match
-from .team_resolver import build_team_alias_lookup, extract_teams_from_text, strip_team_noise
+from .team_resolver import (
+    TeamAliasLookupCache,
+    build_team_alias_lookup,
+    extract_teams_from_text,
+    strip_team_noise,
+)
 
 # Public API
 __all__ = [
+    "CompiledPatterns",
     "PatternRuntime",
+    "PatternScreen",
+    "TeamAliasLookupCache",
     "compile_patterns",
     "match_file_to_episode",
+    "get_session_lookup",
+    "invalidate_session_lookups",
 ]
 
 # Backwards compatibility aliases for internal functions used by tests
@@ -11,7 +11,6 @@ import re
 from dataclasses import dataclass
 
 from ..config import PatternConfig
-from ..session_index import SessionLookupIndex
 
 # Noise tokens to filter out during session matching
 NOISE_TOKENS = (
@@ -75,14 +74,12 @@ DEFAULT_GENERIC_SESSION_ALIASES: dict[str, list[str]] = {
 
 @dataclass
 class PatternRuntime:
-    """Runtime representation of a compiled pattern with session lookup index.
+    """Runtime representation of a compiled pattern.
 
     Attributes:
         config: The pattern configuration from YAML
         regex: The compiled regular expression
-        session_lookup: Pre-built session lookup index for this pattern/season
     """
 
     config: PatternConfig
     regex: re.Pattern[str]
-    session_lookup: SessionLookupIndex
@@ -0,0 +1,164 @@
+"""Precomputed per-season episode lookup structures.
+
+``select_episode`` used to scan every episode of a season for each lookup
+variant, re-normalizing titles and aliases on every pass. For seasons with
+1,000+ games that is the dominant matching cost. SeasonEpisodeIndex builds
+the normalized views once per season so lookups only touch the episodes that
+can possibly match:
+
+- exact normalized title/alias -> episode positions
+- sorted token list for prefix queries (``bisect`` over the sorted keys)
+- (first char, length) buckets for fuzzy ``tokens_close`` candidates
+- air-date and round-number buckets for the fallback strategies
+
+Results are always returned in season order so callers behave exactly like
+the linear scans they replace.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import threading
+import weakref
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Callable
+
+from ..models import Episode, Season
+from ..utils import normalize_token
+
+
+class SeasonEpisodeIndex:
+    """Normalized episode lookup tables for a single season."""
+
+    def __init__(self, season: Season) -> None:
+        self.episodes: tuple[Episode, ...] = tuple(season.episodes)
+        self._by_title: dict[str, list[int]] = defaultdict(list)
+        self._by_token: dict[str, list[int]] = defaultdict(list)
+        self._by_shape: dict[tuple[str, int], set[str]] = defaultdict(set)
+        self._by_date: dict[dt.date, list[int]] = defaultdict(list)
+        self._by_number: dict[int, list[int]] = defaultdict(list)
+
+        for position, episode in enumerate(self.episodes):
+            title_token = normalize_token(episode.title)
+            self._by_title[title_token].append(position)
+            for token in (title_token, *(normalize_token(alias) for alias in episode.aliases)):
+                if not token:
+                    continue
+                positions = self._by_token[token]
+                if not positions or positions[-1] != position:
+                    positions.append(position)
+                self._by_shape[(token[0], len(token))].add(token)
+            if episode.originally_available is not None:
+                self._by_date[episode.originally_available].append(position)
+            self._by_number[episode.index].append(position)
+            if episode.display_number is not None and episode.display_number != episode.index:
+                self._by_number[episode.display_number].append(position)
+
+        self._sorted_tokens: list[str] = sorted(self._by_token)
+
+    def first_with_title(self, token: str) -> Episode | None:
+        """Return the first episode whose normalized title equals *token*."""
+        positions = self._by_title.get(token)
+        return self.episodes[positions[0]] if positions else None
+
+    def find_matching(self, token: str, matches: Callable[[str, str], bool]) -> list[Episode]:
+        """Return episodes whose title or any alias satisfies ``matches(candidate, token)``.
+
+        Only tokens that can satisfy an exact, prefix or fuzzy comparison are
+        handed to *matches*: tokens starting with *token*, tokens that are a
+        prefix of *token*, and tokens sharing its first character with a
+        length within one.
+
+        Args:
+            token: Normalized lookup token
+            matches: Predicate called as ``matches(episode_token, token)``
+
+        Returns:
+            Matching episodes in season order
+        """
+        if not token:
+            return []
+
+        candidates: set[str] = set()
+        start = bisect_left(self._sorted_tokens, token)
+        for candidate in self._sorted_tokens[start:]:
+            if not candidate.startswith(token):
+                break
+            candidates.add(candidate)
+        for length in range(1, len(token)):
+            prefix = token[:length]
+            if prefix in self._by_token:
+                candidates.add(prefix)
+        for length in (len(token) - 1, len(token), len(token) + 1):
+            candidates.update(self._by_shape.get((token[0], length), ()))
+
+        positions: set[int] = set()
+        for candidate in candidates:
+            if matches(candidate, token):
+                positions.update(self._by_token[candidate])
+        return [self.episodes[position] for position in sorted(positions)]
+
+    def episodes_for_number(self, number: int) -> list[Episode]:
+        """Return episodes whose index or display number equals *number*, in season order."""
+        return [self.episodes[position] for position in self._by_number.get(number, ())]
+
+    def episodes_near(self, date: dt.date, tolerance_days: int = 2) -> list[tuple[Episode, int]]:
+        """Return ``(episode, delta_days)`` pairs aired within *tolerance_days* of *date*.
+
+        Pairs are ordered by season position; callers sort by delta with a
+        stable sort to keep the earliest episode on ties.
+        """
+        found: list[tuple[int, int]] = []
+        for delta in range(-tolerance_days, tolerance_days + 1):
+            for position in self._by_date.get(date + dt.timedelta(days=delta), ()):
+                found.append((position, abs(delta)))
+        found.sort()
+        return [(self.episodes[position], delta) for position, delta in found]
+
+
+class _EpisodeIndexCache:
+    """Season-identity keyed store of SeasonEpisodeIndex objects."""
+
+    def __init__(self) -> None:
+        self._entries: dict[int, tuple[weakref.ref[Season], SeasonEpisodeIndex]] = {}
+        # Re-entrant because the weakref callback may run during garbage
+        # collection triggered while this thread already holds the lock.
+        self._lock = threading.RLock()
+
+    def get(self, season: Season) -> SeasonEpisodeIndex:
+        key = id(season)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0]() is season and len(entry[1].episodes) == len(season.episodes):
+                return entry[1]
+
+        index = SeasonEpisodeIndex(season)
+        entries = self._entries
+
+        def _discard(_ref: weakref.ref[Season], key: int = key) -> None:
+            with self._lock:
+                current = entries.get(key)
+                if current is not None and current[0] is _ref:
+                    del entries[key]
+
+        with self._lock:
+            self._entries[key] = (weakref.ref(season, _discard), index)
+        return index
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_EPISODE_INDEXES = _EpisodeIndexCache()
+
+
+def get_episode_index(season: Season) -> SeasonEpisodeIndex:
+    """Return the precomputed episode index for *season*, building it on first use."""
+    return _EPISODE_INDEXES.get(season)
+
+
+def clear_episode_indexes() -> None:
+    """Drop all precomputed episode indexes."""
+    _EPISODE_INDEXES.clear()
@@ -17,7 +17,8 @@ from ..team_aliases import get_team_alias_map
 from ..utils import normalize_token
 from .core import NOISE_TOKENS
 from .date_utils import dates_within_proximity, parse_date_from_groups, parse_date_string
-from .session_resolver import build_session_lookup, resolve_session_lookup
+from .episode_index import get_episode_index
+from .session_resolver import get_session_lookup, resolve_session_lookup
 from .similarity import location_matches_title, tokens_close
 from .team_resolver import canonicalize_team, strip_team_noise
 
@@ -109,6 +110,7 @@ def select_episode(
         if raw_value is None:
             return None
 
+    episode_index = get_episode_index(season)
     normalized = _strip_noise(normalize_token(raw_value))
     normalized_without_part: str | None = None
     if "part" in normalized:
@@ -243,16 +245,8 @@ def select_episode(
     parsed_date = parse_date_from_groups(match_groups)
 
     def find_episode_for_token(token: str) -> Episode | None:
-        # First pass: find episodes that match the token
-        matching_episodes: list[Episode] = []
-        for episode in season.episodes:
-            episode_token = normalize_token(episode.title)
-            if _tokens_match(episode_token, token):
-                matching_episodes.append(episode)
-                continue
-            alias_tokens = [normalize_token(alias) for alias in episode.aliases]
-            if any(_tokens_match(alias_token, token) for alias_token in alias_tokens):
-                matching_episodes.append(episode)
+        # First pass: find episodes whose title or an alias matches the token
+        matching_episodes = episode_index.find_matching(token, _tokens_match)
 
         if not matching_episodes:
             return None
@@ -300,10 +294,7 @@ def select_episode(
             if not token:
                 continue
             if metadata_token and token == metadata_token:
-                episode = next(
-                    (item for item in season.episodes if normalize_token(item.title) == metadata_token),
-                    None,
-                )
+                episode = episode_index.first_with_title(metadata_token)
                 if episode:
                     if trace is not None:
                         trace["match"] = {
@@ -340,9 +331,7 @@ def select_episode(
             location_value = match_groups.get("location")
 
             # Find candidate episodes by round number (matching index or display_number)
-            round_episodes = [
-                ep for ep in season.episodes if ep.index == round_number or ep.display_number == round_number
-            ]
+            round_episodes = episode_index.episodes_for_number(round_number)
 
             if round_episodes:
                 # If location is available, prefer episodes where location appears in title
@@ -395,13 +384,7 @@ def select_episode(
 
     if fallback_date is not None:
         # Find episodes with dates within proximity of the fallback date
-        date_candidates: list[tuple[Episode, int]] = []
-        for episode in season.episodes:
-            if episode.originally_available is not None and dates_within_proximity(
-                fallback_date, episode.originally_available, tolerance_days=2
-            ):
-                delta = abs((fallback_date - episode.originally_available).days)
-                date_candidates.append((episode, delta))
+        date_candidates = episode_index.episodes_near(fallback_date, tolerance_days=2)
 
         if date_candidates:
             # Sort by closest date match and return the best
@@ -455,7 +438,7 @@ def find_episode_across_seasons(
         if exclude_season and candidate is exclude_season:
             continue
         candidate_groups = dict(match_groups)
-        session_lookup = build_session_lookup(pattern_config, candidate)
+        session_lookup = get_session_lookup(pattern_config, candidate, show.key)
         episode_trace: dict[str, Any] | None = {} if trace_enabled else None
         episode = select_episode(
             pattern_config,
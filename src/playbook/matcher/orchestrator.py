@@ -16,14 +16,16 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from ..config import SportConfig
+from ..logging_utils import LazyMessage
 from ..models import Episode, Season, Show
-from ..session_index import SessionLookupIndex
 from ..utils import normalize_token
 from .core import PatternRuntime
 from .episode_selector import find_episode_across_seasons, select_episode
+from .pattern_screen import CompiledPatterns, screen_for
 from .season_selector import select_season
-from .session_resolver import build_session_lookup
+from .session_resolver import get_session_lookup
 from .structured import structured_match
+from .team_resolver import TeamAliasLookupCache
 
 if TYPE_CHECKING:
     # Type alias for the dynamic metadata loader callback
@@ -36,8 +38,10 @@ LOGGER = logging.getLogger(__name__)
 def compile_patterns(sport: SportConfig) -> list[PatternRuntime]:
     """Compile pattern configurations into runtime objects.
 
-    Creates PatternRuntime objects with compiled regex patterns.
-    Session lookup indices are built lazily when needed for each season.
+    Creates PatternRuntime objects with compiled regex patterns, plus a
+    combined PatternScreen so matching can skip patterns whose required
+    literals are absent from a filename. Session lookup indices are built
+    lazily when needed for each season.
 
     Args:
         sport: Sport configuration containing pattern definitions
@@ -45,16 +49,13 @@ def compile_patterns(sport: SportConfig) -> list[PatternRuntime]:
     Returns:
         List of PatternRuntime objects ready for matching
     """
-    compiled: list[PatternRuntime] = []
-    for pattern in sport.patterns:
-        compiled.append(
-            PatternRuntime(
-                config=pattern,
-                regex=pattern.compiled_regex(),
-                session_lookup=SessionLookupIndex(),
-            )
+    return CompiledPatterns(
+        PatternRuntime(
+            config=pattern,
+            regex=pattern.compiled_regex(),
         )
-    return compiled
+        for pattern in sport.patterns
+    )
 
 
 def match_file_to_episode(
@@ -68,6 +69,8 @@ def match_file_to_episode(
     suppress_warnings: bool = False,
     metadata_loader: MetadataLoaderCallback | None = None,
     relative_path: str | None = None,
+    team_alias_cache: TeamAliasLookupCache | None = None,
+    show_fingerprint: str | None = None,
 ) -> dict[str, object] | None:
     """Match a filename to an episode in a show.
 
@@ -84,6 +87,8 @@ def match_file_to_episode(
         suppress_warnings: If True, suppress warning-level logs
         metadata_loader: Optional callback to load metadata for dynamic sports.
             Takes (sport, year) and returns Show or None.
+        team_alias_cache: Optional cache for the structured matcher's team alias lookup
+        show_fingerprint: Metadata fingerprint of *show*, lets the alias cache survive reloads
 
     Returns:
         Match dict with season, episode, pattern, groups - or None if no match
@@ -127,26 +132,35 @@ def match_file_to_episode(
             effective_show,
             diagnostics=diagnostics,
             trace=trace,
+            alias_cache=team_alias_cache,
+            show_fingerprint=show_fingerprint if effective_show is show else None,
         )
         if structured_result:
             return structured_result
 
-    # Pattern-based matching
-    for pattern_runtime in patterns:
-        descriptor = pattern_runtime.config.description or pattern_runtime.config.regex
-        match_target = relative_path if (pattern_runtime.config.match_relative_path and relative_path) else filename
-        match = pattern_runtime.regex.search(match_target)
+    # Pattern-based matching. The screen rules out, in one scan, patterns
+    # whose required literals are missing; they are recorded as regex misses.
+    screen = screen_for(patterns)
+    candidates = screen.candidates(filename, relative_path) if screen is not None else None
+    if candidates is not None and trace_attempts is None and not any(candidates):
+        patterns = []
+    for position, pattern_runtime in enumerate(patterns):
+        match = None
+        if candidates is None or candidates[position]:
+            use_relative = pattern_runtime.config.match_relative_path and relative_path
+            match = pattern_runtime.regex.search(relative_path if use_relative else filename)
         if not match:
             if trace_attempts is not None:
                 trace_attempts.append(
                     {
-                        "pattern": descriptor,
+                        "pattern": pattern_runtime.config.description or pattern_runtime.config.regex,
                         "regex": pattern_runtime.config.regex,
                         "status": "regex-no-match",
                     }
                 )
             continue
 
+        descriptor = pattern_runtime.config.description or pattern_runtime.config.regex
         matched_patterns += 1
         if trace is not None:
             trace["matched_patterns"] = matched_patterns
@@ -237,7 +251,7 @@ def match_file_to_episode(
                 trace_enabled=trace is not None,
             )
             if fallback:
-                season, episode, groups, pattern_runtime.session_lookup, episode_trace = fallback
+                season, episode, groups, _session_lookup, episode_trace = fallback
 
         if not season:
             selector = pattern_runtime.config.season_selector
@@ -271,12 +285,14 @@ def match_file_to_episode(
 
         # Episode selection
         if episode is None:
-            pattern_runtime.session_lookup = build_session_lookup(pattern_runtime.config, season)
+            # Memoized per (pattern, season) and kept local rather than stored
+            # on the shared PatternRuntime so concurrent workers never race.
+            session_lookup = get_session_lookup(pattern_runtime.config, season, effective_show.key)
             episode_trace = {}
             episode = select_episode(
                 pattern_runtime.config,
                 season,
-                pattern_runtime.session_lookup,
+                session_lookup,
                 groups,
                 trace=episode_trace,
             )
@@ -291,7 +307,7 @@ def match_file_to_episode(
                 trace_enabled=trace is not None,
             )
             if fallback:
-                season, episode, groups, pattern_runtime.session_lookup, episode_trace = fallback
+                season, episode, groups, _session_lookup, episode_trace = fallback
 
         if not episode:
             selector = pattern_runtime.config.episode_selector
@@ -390,7 +406,7 @@ def match_file_to_episode(
             filename,
             matched_patterns,
             "\n  - " if len(failed_resolutions) > 1 else " ",
-            "\n  - ".join(failed_resolutions) if len(failed_resolutions) > 1 else failed_resolutions[0],
+            LazyMessage("\n  - ".join, failed_resolutions),
         )
         message = f"Matched {matched_patterns} pattern(s) but could not resolve: {'; '.join(failed_resolutions)}"
         is_variant = sport.variant_year is not None
@@ -0,0 +1,189 @@
+"""Combined per-sport regex screening of compiled patterns.
+
+``match_file_to_episode`` tries every pattern of a sport in priority order and
+most attempts end without a regex match. PatternScreen joins the patterns of a
+sport into a single alternation, with named groups made non-capturing and an
+empty marker group closing each branch, so one search over the filename tells
+whether any pattern can match and which one matches first. Patterns ahead of
+that one which are anchored to the start of the name cannot match either, so
+only the remaining patterns run their full named-group regex.
+
+Patterns whose semantics the rewrite could change (back-references,
+conditionals, flags other than IGNORECASE) are left out of the alternation and
+always run.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Sequence
+
+from .core import PatternRuntime
+
+try:  # Python 3.11+ moved the parser into the re package
+    import re._constants as _sre_constants
+    import re._parser as _sre_parse
+except ImportError:  # pragma: no cover - older interpreters
+    _sre_constants = None  # type: ignore[assignment]
+    _sre_parse = None  # type: ignore[assignment]
+
+# Opening of a named group not preceded by an escaping backslash
+_NAMED_GROUP_RE = re.compile(r"(?<!\\)((?:\\\\)*)\(\?P<[A-Za-z_][A-Za-z0-9_]*>")
+# Back-references, conditionals and numeric escapes depend on group numbering
+_GROUP_NUMBERING_RE = re.compile(r"\\\d|\(\?P=|\(\?\(")
+_LEADING_FLAGS_RE = re.compile(r"^\(\?[iu]+\)")
+_SCREENABLE_FLAGS = re.IGNORECASE | re.UNICODE
+
+
+def combinable_source(pattern: PatternRuntime) -> str | None:
+    """Return *pattern*'s regex rewritten for use inside a combined alternation.
+
+    Named groups become non-capturing and a leading ``(?i)`` is dropped (the
+    combined expression is case-insensitive, like every pattern regex).
+
+    Args:
+        pattern: Compiled pattern
+
+    Returns:
+        Rewritten source, or None when the rewrite could change what matches
+    """
+    regex = pattern.regex
+    if regex.flags & ~_SCREENABLE_FLAGS:
+        return None
+    source = _LEADING_FLAGS_RE.sub("", pattern.config.regex)
+    if _GROUP_NUMBERING_RE.search(source):
+        return None
+    rewritten, replaced = _NAMED_GROUP_RE.subn(r"\1(?:", source)
+    if replaced != len(regex.groupindex):
+        return None
+    try:
+        compiled = re.compile(rewritten, re.IGNORECASE)
+    except re.error:
+        return None
+    if compiled.groups != regex.groups - len(regex.groupindex):
+        return None
+    return rewritten
+
+
+def is_start_anchored(regex: str) -> bool:
+    """Return True when *regex* can only match at the start of the string."""
+    if _sre_parse is None:  # pragma: no cover - older interpreters
+        return False
+    try:
+        parsed = _sre_parse.parse(regex)
+    except (re.error, TypeError, ValueError):
+        return False
+    if parsed.state.flags & re.MULTILINE or not len(parsed):
+        return False
+    op, argument = parsed[0]
+    return op is _sre_constants.AT and argument in (_sre_constants.AT_BEGINNING, _sre_constants.AT_BEGINNING_STRING)
+
+
+class _Alternation:
+    """One combined regex over the screenable patterns sharing a match target."""
+
+    def __init__(self, members: list[tuple[int, str]], anchored: list[bool]) -> None:
+        size = len(anchored)
+        parts: list[str] = []
+        self._marker_positions: dict[int, int] = {}
+        group_count = 0
+        for position, source in members:
+            group_count += re.compile(source, re.IGNORECASE).groups + 1
+            self._marker_positions[group_count] = position
+            parts.append(f"(?:{source})()")
+        self.regex = re.compile("|".join(parts), re.IGNORECASE)
+
+        # Flags are precomputed for every outcome so screening costs one search
+        members_at = {position for position, _source in members}
+        self.none_match = tuple(position not in members_at for position in range(size))
+        self.first_match: dict[int, tuple[bool, ...]] = {
+            first: tuple(
+                position not in members_at or position >= first or not anchored[position] for position in range(size)
+            )
+            for first in members_at
+        }
+
+    def flags(self, target: str) -> tuple[bool, ...]:
+        match = self.regex.search(target)
+        if match is None:
+            return self.none_match
+        return self.first_match[self._marker_positions[match.lastindex]]
+
+
+class PatternScreen:
+    """Combined matcher reporting which patterns of a sport could match a filename."""
+
+    def __init__(self, patterns: Sequence[PatternRuntime]) -> None:
+        self.size = len(patterns)
+        anchored = [is_start_anchored(pattern.config.regex) for pattern in patterns]
+        by_name: list[tuple[int, str]] = []
+        by_relative: list[tuple[int, str]] = []
+        for position, pattern in enumerate(patterns):
+            source = combinable_source(pattern)
+            if source is None:
+                continue
+            (by_relative if pattern.config.match_relative_path else by_name).append((position, source))
+
+        self.screened_patterns = len(by_name) + len(by_relative)
+        self._name: _Alternation | None = None
+        self._relative: _Alternation | None = None
+        self._either: _Alternation | None = None
+        try:
+            if by_name:
+                self._name = _Alternation(by_name, anchored)
+            if by_relative:
+                self._relative = _Alternation(by_relative, anchored)
+            if by_name and by_relative:
+                # Without a relative path every pattern matches against the filename
+                self._either = _Alternation(sorted(by_name + by_relative), anchored)
+        except (re.error, RecursionError, OverflowError):
+            # Too large for a single expression; every pattern runs on its own
+            self._name = self._relative = self._either = None
+            self.screened_patterns = 0
+
+    def candidates(self, filename: str, relative_path: str | None = None) -> tuple[bool, ...] | None:
+        """Return, per pattern, whether its full regex could match.
+
+        Patterns with ``match_relative_path`` are screened against
+        *relative_path* when it is given, mirroring ``match_file_to_episode``.
+
+        Args:
+            filename: Filename being matched
+            relative_path: Path relative to the source directory, if known
+
+        Returns:
+            One flag per pattern in priority order, or None when no pattern
+            could be screened and every pattern must be tried
+        """
+        if self._either is not None:
+            if not relative_path:
+                return self._either.flags(filename)
+            name_flags = self._name.flags(filename)
+            relative_flags = self._relative.flags(relative_path)
+            return tuple(name and relative for name, relative in zip(name_flags, relative_flags, strict=True))
+        if self._name is not None:
+            return self._name.flags(filename)
+        if self._relative is not None:
+            return self._relative.flags(relative_path or filename)
+        return None
+
+
+class CompiledPatterns(list[PatternRuntime]):
+    """Priority-ordered PatternRuntime list carrying its PatternScreen.
+
+    Behaves exactly like the plain list ``compile_patterns`` used to return;
+    the screen is only consulted while the list still holds the patterns it
+    was built from.
+    """
+
+    def __init__(self, patterns: Iterable[PatternRuntime] = ()) -> None:
+        super().__init__(patterns)
+        self.screen = PatternScreen(self)
+
+
+def screen_for(patterns: Sequence[PatternRuntime]) -> PatternScreen | None:
+    """Return the screen attached to *patterns*, if it still describes them."""
+    screen = getattr(patterns, "screen", None)
+    if isinstance(screen, PatternScreen) and screen.size == len(patterns):
+        return screen
+    return None
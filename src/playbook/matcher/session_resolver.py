@@ -1,11 +1,16 @@
 """Session lookup and resolution utilities.
 
 This module provides functions for resolving session names through the
-SessionLookupIndex, including fuzzy matching support.
+SessionLookupIndex, including fuzzy matching support, and a memoized store
+so each (pattern, season) index is only built once per metadata version.
 """
 
 from __future__ import annotations
 
+import threading
+import weakref
+from dataclasses import dataclass
+
 try:
     from rapidfuzz.distance import DamerauLevenshtein
 except ImportError:  # pragma: no cover - optional dependency
@@ -141,3 +146,110 @@ def build_session_lookup(pattern: PatternConfig, season: Season) -> SessionLooku
                 index.add(normalized_alias, canonical)
 
     return index
+
+
+@dataclass
+class _CachedSessionLookup:
+    pattern_ref: weakref.ref[PatternConfig]
+    season_ref: weakref.ref[Season]
+    index: SessionLookupIndex
+
+
+class SessionLookupCache:
+    """Memoized SessionLookupIndex store keyed by pattern, show and season.
+
+    Entries are tied to the exact PatternConfig and Season objects they were
+    built from, so replacing a show's metadata (new Season objects) or
+    reloading the configuration naturally misses, and an entry is discarded
+    as soon as either object is garbage collected. Both are unhashable
+    dataclasses, so entries are keyed by identity like the episode index
+    cache rather than held in a WeakKeyDictionary. Callers that detect a
+    metadata fingerprint change should also call :meth:`invalidate` for the
+    affected show so that stale indexes are dropped eagerly.
+
+    Safe to use from multiple match workers; concurrent misses for the same
+    key may build the index twice, but the result is identical.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[int, str, str], _CachedSessionLookup] = {}
+        # Re-entrant because the weakref callbacks may run during garbage
+        # collection triggered while this thread already holds the lock.
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, pattern: PatternConfig, season: Season, show_key: str | None = None) -> SessionLookupIndex:
+        """Return the session lookup for *pattern* and *season*, building it on first use.
+
+        Args:
+            pattern: The pattern configuration
+            season: The season to look up sessions in
+            show_key: Key of the show owning *season*, used for invalidation
+
+        Returns:
+            SessionLookupIndex for the pattern and season
+        """
+        key = (id(pattern), show_key or "", str(season.key))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.pattern_ref() is pattern and entry.season_ref() is season:
+                self.hits += 1
+                return entry.index
+            self.misses += 1
+
+        index = build_session_lookup(pattern, season)
+        entries = self._entries
+
+        def _discard(ref: weakref.ref, key: tuple[int, str, str] = key) -> None:
+            with self._lock:
+                current = entries.get(key)
+                if current is not None and (current.pattern_ref is ref or current.season_ref is ref):
+                    del entries[key]
+
+        with self._lock:
+            self._entries[key] = _CachedSessionLookup(
+                pattern_ref=weakref.ref(pattern, _discard),
+                season_ref=weakref.ref(season, _discard),
+                index=index,
+            )
+        return index
+
+    def invalidate(self, show_key: str | None = None) -> None:
+        """Drop cached indexes for *show_key*, or for every show when omitted."""
+        with self._lock:
+            if show_key is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[1] == show_key]:
+                del self._entries[key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+SESSION_LOOKUP_CACHE = SessionLookupCache()
+
+
+def get_session_lookup(pattern: PatternConfig, season: Season, show_key: str | None = None) -> SessionLookupIndex:
+    """Return the memoized session lookup for a pattern and season.
+
+    Args:
+        pattern: The pattern configuration
+        season: The season to build the index for
+        show_key: Key of the show owning the season
+
+    Returns:
+        SessionLookupIndex shared by every file matched against this season
+    """
+    return SESSION_LOOKUP_CACHE.get(pattern, season, show_key)
+
+
+def invalidate_session_lookups(show_key: str | None = None) -> None:
+    """Invalidate memoized session lookups after a metadata change.
+
+    Args:
+        show_key: Show whose indexes should be dropped; all shows when None
+    """
+    SESSION_LOOKUP_CACHE.invalidate(show_key)
@@ -13,13 +13,12 @@ from typing import Any
 from ..config import PatternConfig, SportConfig
 from ..models import Episode, Season, Show
 from ..parsers.structured_filename import StructuredName, build_canonical_filename, parse_structured_filename
-from ..session_index import SessionLookupIndex
 from ..team_aliases import get_team_alias_map
 from ..utils import normalize_token
 from .core import PatternRuntime
 from .date_utils import dates_within_proximity
 from .similarity import token_similarity
-from .team_resolver import build_team_alias_lookup, extract_teams_from_text
+from .team_resolver import TeamAliasLookupCache, build_team_alias_lookup, extract_teams_from_text
 
 
 def score_structured_match(
@@ -99,6 +98,9 @@ def structured_match(
     show: Show,
     diagnostics: list[tuple[str, str]] | None = None,
     trace: dict[str, Any] | None = None,
+    *,
+    alias_cache: TeamAliasLookupCache | None = None,
+    show_fingerprint: str | None = None,
 ) -> dict[str, object] | None:
     """Attempt to match a file using structured filename parsing.
 
@@ -111,12 +113,22 @@ def structured_match(
         show: Show to match against
         diagnostics: Optional list to collect diagnostic messages
         trace: Optional trace dict for debugging
+        alias_cache: Optional cache reusing the extended team alias lookup
+        show_fingerprint: Metadata fingerprint of *show* for cache reuse across runs
 
     Returns:
         Match dict with season, episode, pattern, groups - or None
     """
     configured_aliases = get_team_alias_map(sport.team_alias_map)
-    alias_lookup = build_team_alias_lookup(show, configured_aliases)
+    if alias_cache is not None:
+        alias_lookup = alias_cache.get(
+            show,
+            sport.team_alias_map,
+            configured_aliases,
+            fingerprint=show_fingerprint,
+        )
+    else:
+        alias_lookup = build_team_alias_lookup(show, configured_aliases)
 
     structured = parse_structured_filename(filename, alias_lookup)
     if not structured:
@@ -158,7 +170,6 @@ def structured_match(
         pattern = PatternRuntime(
             config=pattern_config,
             regex=re.compile("structured"),
-            session_lookup=SessionLookupIndex(),
         )
 
         if diagnostics is not None:
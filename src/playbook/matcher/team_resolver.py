@@ -7,9 +7,16 @@ and noise word stripping from team names in filenames.
 from __future__ import annotations
 
 import re
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from ..utils import normalize_token
 
+if TYPE_CHECKING:
+    from ..models import Show
+
 # Regex pattern to extract teams from matchup strings
 TEAM_PATTERN = re.compile(r"(?P<a>[A-Za-z0-9 .&'/-]+?)\s+(?:vs|v|at|@)\s+(?P<b>[A-Za-z0-9 .&'/-]+)", re.IGNORECASE)
 
@@ -100,6 +107,79 @@ def build_team_alias_lookup(show, base: dict[str, str]) -> dict[str, str]:
     return lookup
 
 
+@dataclass
+class _CachedTeamAliasLookup:
+    fingerprint: str | None
+    show_ref: weakref.ref[Show]
+    lookup: dict[str, str]
+
+
+class TeamAliasLookupCache:
+    """Reuses extended team alias lookups across files and runs.
+
+    Lookups are keyed by show key and alias map name. A cached lookup is
+    reused while it was built from the same Show object, or from a show with
+    the same metadata fingerprint. The fingerprint case lets runs that reload
+    unchanged metadata skip the rebuild.
+
+    Attributes:
+        hits: Number of lookups served from the cache
+        misses: Number of lookups that had to be built
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple[str, str], _CachedTeamAliasLookup] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(
+        self,
+        show: Show,
+        alias_map_name: str | None,
+        base: dict[str, str],
+        *,
+        fingerprint: str | None = None,
+    ) -> dict[str, str]:
+        """Return the extended alias lookup for *show*, building it on a miss.
+
+        Args:
+            show: Show containing seasons and episodes
+            alias_map_name: Name of the configured team alias map (cache key)
+            base: Base team alias map from configuration
+            fingerprint: Metadata fingerprint of *show*, when known
+
+        Returns:
+            Extended alias lookup dictionary (shared; callers must not mutate it)
+        """
+        key = (show.key, alias_map_name or "")
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.show_ref() is show:
+                    self.hits += 1
+                    return entry.lookup
+                if fingerprint is not None and entry.fingerprint == fingerprint:
+                    entry.show_ref = weakref.ref(show)
+                    self.hits += 1
+                    return entry.lookup
+            self.misses += 1
+
+        lookup = build_team_alias_lookup(show, base)
+        with self._lock:
+            self._entries[key] = _CachedTeamAliasLookup(
+                fingerprint=fingerprint,
+                show_ref=weakref.ref(show),
+                lookup=lookup,
+            )
+        return lookup
+
+    def snapshot(self) -> dict[str, int]:
+        """Return hit/miss counters and the number of cached lookups."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries)}
+
+
 def canonicalize_team(value: str | None, alias_lookup: dict[str, str]) -> str | None:
     """Canonicalize a team name through the alias lookup.
 
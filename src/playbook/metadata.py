@@ -9,8 +9,9 @@ from __future__ import annotations
 import datetime as dt
 import json
 import logging
+import sqlite3
 import threading
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -103,10 +104,10 @@ def _season_identifier(season: Season) -> str:
 def _episode_identifier(episode: Episode) -> str:
     """Generate a stable identifier for an episode."""
     metadata = episode.metadata if isinstance(episode.metadata, dict) else {}
-    for field in ("id", "guid", "episode_id", "uuid"):
-        value = metadata.get(field)
+    for name in ("id", "guid", "episode_id", "uuid"):
+        value = metadata.get(name)
         if value:
-            return f"{field}:{value}"
+            return f"{name}:{value}"
     if episode.display_number is not None:
         return f"display:{episode.display_number}"
     if episode.title:
@@ -142,6 +143,8 @@ class ShowFingerprint:
     season_hashes: dict[str, str]
     episode_hashes: dict[str, dict[str, str]]
     content_hash: str | None = None
+    # Season key -> source token of the cached payload its hashes were computed from
+    season_sources: dict[str, str] = field(default_factory=dict)
 
     def to_dict(self) -> dict[str, Any]:
         result = {
@@ -151,6 +154,8 @@ class ShowFingerprint:
         }
         if self.content_hash is not None:
             result["content_hash"] = self.content_hash
+        if self.season_sources:
+            result["sources"] = dict(self.season_sources)
         return result
 
     @classmethod
@@ -167,7 +172,15 @@ class ShowFingerprint:
             episode_hashes[str(season_key)] = {str(ep_key): str(ep_hash) for ep_key, ep_hash in mapping.items()}
         content_hash_raw = payload.get("content_hash")
         content_hash = str(content_hash_raw) if content_hash_raw is not None else None
-        return cls(digest=digest, season_hashes=season_hashes, episode_hashes=episode_hashes, content_hash=content_hash)
+        sources_raw = payload.get("sources") or {}
+        season_sources = {str(key): str(value) for key, value in sources_raw.items()}
+        return cls(
+            digest=digest,
+            season_hashes=season_hashes,
+            episode_hashes=episode_hashes,
+            content_hash=content_hash,
+            season_sources=season_sources,
+        )
 
 
 @dataclass
@@ -189,55 +202,234 @@ class MetadataFingerprintStore:
 
     Tracks a lightweight hash of each sport's metadata to detect updates
     and enable efficient cache invalidation.
+
+    Fingerprints are kept in ``state/metadata-fingerprints.db`` with one row
+    per show, season and episode. A show is read on first access, and
+    ``save`` only upserts or deletes the rows that changed since they were
+    read. Stores created with a different ``filename`` (the processor and
+    Plex sync) share the database under separate namespaces; the legacy JSON
+    file of that name is imported once when the namespace is first opened.
     """
 
+    DB_FILENAME = "metadata-fingerprints.db"
+
     def __init__(self, cache_dir: Path, filename: str = "metadata-digests.json") -> None:
         self.cache_dir = cache_dir
         self.filename = filename
-        self.path = self.cache_dir / "state" / self.filename
-        self._fingerprints: dict[str, ShowFingerprint] = {}
-        self._dirty = False
-        self._load()
-
-    def _load(self) -> None:
-        if not self.path.exists():
-            return
+        self.namespace = Path(filename).stem
+        self.legacy_path = self.cache_dir / "state" / self.filename
+        self.db_path = self.cache_dir / "state" / self.DB_FILENAME
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        # Fingerprints as last read from (or written to) the database; None = not stored
+        self._persisted: dict[str, ShowFingerprint | None] = {}
+        # Changes not saved yet; None = removal
+        self._pending: dict[str, ShowFingerprint | None] = {}
+        self._legacy: dict[str, ShowFingerprint] | None = None
+
+    def _connect(self, *, create: bool) -> sqlite3.Connection | None:
+        """Return this thread's connection; None when the database does not exist and *create* is False."""
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            return conn
+        if not create and not self.db_path.exists():
+            return None
+        ensure_directory(self.db_path.parent)
+        conn = sqlite3.connect(self.db_path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        self._init_schema(conn)
+        self._local.connection = conn
+        return conn
+
+    def _init_schema(self, conn: sqlite3.Connection) -> None:
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS fingerprint_shows (
+                namespace TEXT NOT NULL,
+                show_key TEXT NOT NULL,
+                digest TEXT NOT NULL,
+                content_hash TEXT,
+                PRIMARY KEY (namespace, show_key)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS fingerprint_seasons (
+                namespace TEXT NOT NULL,
+                show_key TEXT NOT NULL,
+                season_key TEXT NOT NULL,
+                hash TEXT,
+                has_episodes INTEGER NOT NULL DEFAULT 0,
+                source TEXT,
+                PRIMARY KEY (namespace, show_key, season_key)
+            ) WITHOUT ROWID
+        """)
+        season_columns = {row[1] for row in conn.execute("PRAGMA table_info(fingerprint_seasons)")}
+        if "source" not in season_columns:
+            conn.execute("ALTER TABLE fingerprint_seasons ADD COLUMN source TEXT")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS fingerprint_episodes (
+                namespace TEXT NOT NULL,
+                show_key TEXT NOT NULL,
+                season_key TEXT NOT NULL,
+                episode_key TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                PRIMARY KEY (namespace, show_key, season_key, episode_key)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE TABLE IF NOT EXISTS fingerprint_imports (namespace TEXT PRIMARY KEY)")
+        imported = conn.execute("SELECT 1 FROM fingerprint_imports WHERE namespace = ?", (self.namespace,)).fetchone()
+        if imported is None:
+            with conn:
+                for key, fingerprint in self._load_legacy().items():
+                    self._write_show(conn, key, None, fingerprint)
+                conn.execute("INSERT OR IGNORE INTO fingerprint_imports (namespace) VALUES (?)", (self.namespace,))
+        conn.commit()
+
+    def _load_legacy(self) -> dict[str, ShowFingerprint]:
+        """Read the JSON file used before fingerprints moved to SQLite."""
+        if self._legacy is not None:
+            return self._legacy
+        self._legacy = {}
+        if not self.legacy_path.exists():
+            return self._legacy
 
         try:
-            with self.path.open("r", encoding="utf-8") as handle:
+            with self.legacy_path.open("r", encoding="utf-8") as handle:
                 payload = json.load(handle)
         except Exception as exc:  # noqa: BLE001
-            LOGGER.warning("Failed to load metadata fingerprint cache %s: %s", self.path, exc)
-            return
+            LOGGER.warning("Failed to load metadata fingerprint cache %s: %s", self.legacy_path, exc)
+            return self._legacy
 
         if not isinstance(payload, dict):
-            LOGGER.warning("Ignoring malformed metadata fingerprint cache %s", self.path)
-            return
+            LOGGER.warning("Ignoring malformed metadata fingerprint cache %s", self.legacy_path)
+            return self._legacy
 
-        fingerprints: dict[str, ShowFingerprint] = {}
         for key, value in payload.items():
             if not isinstance(key, str):
                 continue
             if isinstance(value, str):
-                fingerprints[key] = ShowFingerprint(digest=value, season_hashes={}, episode_hashes={})
+                self._legacy[key] = ShowFingerprint(digest=value, season_hashes={}, episode_hashes={})
             elif isinstance(value, dict):
                 try:
-                    fingerprints[key] = ShowFingerprint.from_dict(value)
+                    self._legacy[key] = ShowFingerprint.from_dict(value)
                 except Exception:  # pragma: no cover - defensive
                     LOGGER.debug("Skipping malformed metadata fingerprint entry for %s", key)
             else:
                 LOGGER.debug("Skipping malformed metadata fingerprint entry for %s", key)
-        self._fingerprints = fingerprints
+        return self._legacy
+
+    def _read(self, key: str) -> ShowFingerprint | None:
+        conn = self._connect(create=False)
+        if conn is None:
+            # Nothing saved yet (e.g. dry runs); fall back to the legacy file
+            return self._load_legacy().get(key)
+        row = conn.execute(
+            "SELECT digest, content_hash FROM fingerprint_shows WHERE namespace = ? AND show_key = ?",
+            (self.namespace, key),
+        ).fetchone()
+        if row is None:
+            return None
+        season_hashes: dict[str, str] = {}
+        episode_hashes: dict[str, dict[str, str]] = {}
+        season_sources: dict[str, str] = {}
+        for season_key, season_hash, has_episodes, source in conn.execute(
+            "SELECT season_key, hash, has_episodes, source FROM fingerprint_seasons "
+            "WHERE namespace = ? AND show_key = ?",
+            (self.namespace, key),
+        ):
+            if season_hash is not None:
+                season_hashes[season_key] = season_hash
+            if has_episodes:
+                episode_hashes[season_key] = {}
+            if source is not None:
+                season_sources[season_key] = source
+        for season_key, episode_key, episode_hash in conn.execute(
+            "SELECT season_key, episode_key, hash FROM fingerprint_episodes WHERE namespace = ? AND show_key = ?",
+            (self.namespace, key),
+        ):
+            episode_hashes.setdefault(season_key, {})[episode_key] = episode_hash
+        return ShowFingerprint(
+            digest=row[0],
+            season_hashes=season_hashes,
+            episode_hashes=episode_hashes,
+            content_hash=row[1],
+            season_sources=season_sources,
+        )
+
+    def _write_show(
+        self,
+        conn: sqlite3.Connection,
+        key: str,
+        previous: ShowFingerprint | None,
+        fingerprint: ShowFingerprint | None,
+    ) -> None:
+        """Upsert the rows of *fingerprint* that differ from *previous* and delete the vanished ones."""
+        scope = (self.namespace, key)
+        if fingerprint is None:
+            for table in ("fingerprint_shows", "fingerprint_seasons", "fingerprint_episodes"):
+                conn.execute(f"DELETE FROM {table} WHERE namespace = ? AND show_key = ?", scope)
+            return
+        if (
+            previous is None
+            or previous.digest != fingerprint.digest
+            or previous.content_hash != fingerprint.content_hash
+        ):
+            conn.execute(
+                "INSERT OR REPLACE INTO fingerprint_shows (namespace, show_key, digest, content_hash) "
+                "VALUES (?, ?, ?, ?)",
+                (*scope, fingerprint.digest, fingerprint.content_hash),
+            )
+
+        old_seasons = _season_rows(previous)
+        new_seasons = _season_rows(fingerprint)
+        conn.executemany(
+            "INSERT OR REPLACE INTO fingerprint_seasons (namespace, show_key, season_key, hash, has_episodes, source) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [(*scope, season, *row) for season, row in new_seasons.items() if old_seasons.get(season) != row],
+        )
+        conn.executemany(
+            "DELETE FROM fingerprint_seasons WHERE namespace = ? AND show_key = ? AND season_key = ?",
+            [(*scope, season) for season in old_seasons.keys() - new_seasons.keys()],
+        )
+
+        old_episodes = previous.episode_hashes if previous is not None else {}
+        upserts = []
+        deletes = []
+        for season, episodes in fingerprint.episode_hashes.items():
+            old_map = old_episodes.get(season, {})
+            upserts.extend(
+                (*scope, season, episode, value) for episode, value in episodes.items() if old_map.get(episode) != value
+            )
+            deletes.extend((*scope, season, episode) for episode in old_map.keys() - episodes.keys())
+        for season in old_episodes.keys() - fingerprint.episode_hashes.keys():
+            deletes.extend((*scope, season, episode) for episode in old_episodes[season])
+        conn.executemany(
+            "INSERT OR REPLACE INTO fingerprint_episodes (namespace, show_key, season_key, episode_key, hash) "
+            "VALUES (?, ?, ?, ?, ?)",
+            upserts,
+        )
+        conn.executemany(
+            "DELETE FROM fingerprint_episodes "
+            "WHERE namespace = ? AND show_key = ? AND season_key = ? AND episode_key = ?",
+            deletes,
+        )
 
     def get(self, key: str) -> ShowFingerprint | None:
-        return self._fingerprints.get(key)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+            if key not in self._persisted:
+                self._persisted[key] = self._read(key)
+            return self._persisted[key]
 
     def update(self, key: str, fingerprint: ShowFingerprint) -> MetadataChangeResult:
         """Update fingerprint and return change result."""
-        existing = self._fingerprints.get(key)
+        with self._lock:
+            return self._update(key, fingerprint)
+
+    def _update(self, key: str, fingerprint: ShowFingerprint) -> MetadataChangeResult:
+        existing = self.get(key)
         if existing is None:
-            self._fingerprints[key] = fingerprint
-            self._dirty = True
+            self._pending[key] = fingerprint
             return MetadataChangeResult(
                 updated=True,
                 changed_seasons=set(),
@@ -249,9 +441,10 @@ class MetadataFingerprintStore:
             if (
                 existing.season_hashes != fingerprint.season_hashes
                 or existing.episode_hashes != fingerprint.episode_hashes
+                or existing.content_hash != fingerprint.content_hash
+                or existing.season_sources != fingerprint.season_sources
             ):
-                self._fingerprints[key] = fingerprint
-                self._dirty = True
+                self._pending[key] = fingerprint
             return MetadataChangeResult(
                 updated=False,
                 changed_seasons=set(),
@@ -262,8 +455,7 @@ class MetadataFingerprintStore:
         if (not existing.season_hashes and not existing.episode_hashes) or (
             not existing.episode_hashes and any(fingerprint.episode_hashes.values())
         ):
-            self._fingerprints[key] = fingerprint
-            self._dirty = True
+            self._pending[key] = fingerprint
             return MetadataChangeResult(
                 updated=True,
                 changed_seasons=set(),
@@ -301,8 +493,7 @@ class MetadataFingerprintStore:
             if episode_changes:
                 changed_episodes[season_key] = episode_changes
 
-        self._fingerprints[key] = fingerprint
-        self._dirty = True
+        self._pending[key] = fingerprint
         return MetadataChangeResult(
             updated=True,
             changed_seasons=changed_seasons,
@@ -312,25 +503,89 @@ class MetadataFingerprintStore:
 
     def keys_with_prefix(self, prefix: str) -> list[str]:
         """Return all stored fingerprint keys that start with the given prefix."""
-        return [k for k in self._fingerprints if k.startswith(prefix)]
+        with self._lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                keys = {key for key in self._load_legacy() if key.startswith(prefix)}
+            elif prefix:
+                # Range scan instead of LIKE so the primary key index is used
+                upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+                keys = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT show_key FROM fingerprint_shows WHERE namespace = ? AND show_key >= ? AND show_key < ?",
+                        (self.namespace, prefix, upper),
+                    )
+                }
+            else:
+                keys = {
+                    row[0]
+                    for row in conn.execute(
+                        "SELECT show_key FROM fingerprint_shows WHERE namespace = ?", (self.namespace,)
+                    )
+                }
+            for key, fingerprint in self._pending.items():
+                if not key.startswith(prefix):
+                    continue
+                if fingerprint is None:
+                    keys.discard(key)
+                else:
+                    keys.add(key)
+            return list(keys)
 
     def remove(self, key: str) -> None:
-        if key in self._fingerprints:
-            del self._fingerprints[key]
-            self._dirty = True
+        with self._lock:
+            if self.get(key) is not None:
+                self._pending[key] = None
 
     def save(self) -> None:
-        if not self._dirty:
-            return
+        with self._lock:
+            if not self._pending:
+                return
+
+            try:
+                conn = self._connect(create=True)
+                with conn:
+                    for key, fingerprint in self._pending.items():
+                        previous = self._persisted[key] if key in self._persisted else self._read(key)
+                        self._write_show(conn, key, previous, fingerprint)
+            except Exception as exc:  # noqa: BLE001
+                LOGGER.error("Failed to write metadata fingerprint cache %s: %s", self.db_path, exc)
+                return
+            self._persisted.update(self._pending)
+            self._pending.clear()
+
+    def close(self) -> None:
+        """Close the database connection for the current thread."""
+        conn = getattr(self._local, "connection", None)
+        if conn is not None:
+            conn.close()
+            self._local.connection = None
+
+
+def _season_rows(fingerprint: ShowFingerprint | None) -> dict[str, tuple[str | None, int, str | None]]:
+    """Map season key to its (hash, has_episodes, source) row."""
+    if fingerprint is None:
+        return {}
+    return {
+        season: (
+            fingerprint.season_hashes.get(season),
+            1 if season in fingerprint.episode_hashes else 0,
+            fingerprint.season_sources.get(season),
+        )
+        for season in fingerprint.season_hashes.keys() | fingerprint.episode_hashes.keys()
+    }
 
-        ensure_directory(self.path.parent)
-        serialised = {key: fp.to_dict() for key, fp in self._fingerprints.items()}
-        try:
-            with self.path.open("w", encoding="utf-8") as handle:
-                json.dump(serialised, handle, ensure_ascii=False, indent=2, sort_keys=True)
-            self._dirty = False
-        except Exception as exc:  # noqa: BLE001
-            LOGGER.error("Failed to write metadata fingerprint cache %s: %s", self.path, exc)
+
+def _season_source(season: Season) -> str | None:
+    """Identify the cached payload a season was built from, or None if unknown.
+
+    Besides the cache entry's content digest this covers the fields that are
+    set after adapting (index and season overrides).
+    """
+    if not season.content_digest:
+        return None
+    return f"{season.content_digest}:{season.index}:{season.display_number}:{season.round_number}"
 
 
 def _compute_content_hash(show: Show, show_slug: str) -> str:
@@ -339,13 +594,17 @@ def _compute_content_hash(show: Show, show_slug: str) -> str:
     This hash captures the inputs that affect the fingerprint:
     - show_slug (identifier for the show)
     - show.metadata (raw metadata content)
+    - the source of each season built from a cached payload, if any
 
     Returns a deterministic SHA1 hash string.
     """
-    content_payload = {
+    content_payload: dict[str, Any] = {
         "show_slug": show_slug,
         "metadata": show.metadata,
     }
+    sources = [_season_source(season) for season in show.seasons]
+    if any(sources):
+        content_payload["sources"] = sources
     serialized = json.dumps(
         content_payload,
         ensure_ascii=False,
@@ -364,7 +623,10 @@ def compute_show_fingerprint(
     """Compute a fingerprint representing the effective metadata for a show.
 
     If a cached fingerprint is provided and its content_hash matches,
-    returns the cached version to avoid recomputation.
+    returns the cached version to avoid recomputation. Otherwise seasons
+    built from the same cached payload as in the cached fingerprint reuse
+    its season and episode hashes; only the other seasons are serialized
+    and hashed.
 
     Args:
         show: The show to fingerprint
@@ -383,9 +645,22 @@ def compute_show_fingerprint(
     # Compute per-season and per-episode hashes first, then include in digest
     season_hashes: dict[str, str] = {}
     episode_hashes: dict[str, dict[str, str]] = {}
+    season_sources: dict[str, str] = {}
 
     for season in show.seasons:
         season_key = _season_identifier(season)
+        source = _season_source(season)
+        if source is not None:
+            season_sources[season_key] = source
+            if (
+                cached_fingerprint is not None
+                and cached_fingerprint.season_sources.get(season_key) == source
+                and season_key in cached_fingerprint.season_hashes
+            ):
+                season_hashes[season_key] = cached_fingerprint.season_hashes[season_key]
+                episode_hashes[season_key] = dict(cached_fingerprint.episode_hashes.get(season_key, {}))
+                continue
+
         season_payload = {
             "key": season_key,
             "title": season.title,
@@ -450,4 +725,5 @@ def compute_show_fingerprint(
         season_hashes=season_hashes,
         episode_hashes=episode_hashes,
         content_hash=content_hash,
+        season_sources=season_sources,
     )
@@ -7,19 +7,26 @@ for each sport.
 
 For sports with show_slug_template (dynamic year support), metadata is loaded
 on-demand when a file is matched and the year is captured from the filename.
+
+A SportRuntimeRegistry keeps loaded runtimes between runs. Within the metadata
+TTL they are reused without touching the API or the SQLite cache; after it,
+they are revalidated with conditional requests and rebuilt only when the
+show's fingerprint actually changed.
 """
 
 from __future__ import annotations
 
 import logging
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .logging_utils import render_fields_block
-from .matcher import compile_patterns
+from .matcher import TeamAliasLookupCache, compile_patterns, invalidate_session_lookups
 from .metadata import (
     MetadataChangeResult,
     MetadataFetchStatistics,
@@ -53,6 +60,158 @@ class SportRuntime:
     patterns: list[PatternRuntime]
     extensions: set[str]
     is_dynamic: bool = False  # True if this sport uses show_slug_template
+    show_fingerprint: str | None = None  # Metadata digest of show, when tracked
+    team_alias_cache: TeamAliasLookupCache = field(default_factory=TeamAliasLookupCache)
+
+
+@dataclass
+class _RegisteredRuntime:
+    """Registry entry for one static sport."""
+
+    sport: SportConfig
+    runtime: SportRuntime
+    validated_at: float  # time.monotonic() of the last load or revalidation
+    loaded_at: datetime  # When loading the show started; newer cache content means it changed
+
+
+class SportRuntimeRegistry:
+    """Long-lived store of static sport runtimes shared across processing runs.
+
+    Keeps one TVSportsDB client and the adapted Show objects with their
+    compiled patterns in memory, so a run only pays for metadata that is
+    stale or changed. Reused runtimes keep their identity, which also keeps
+    the session, episode and team alias caches keyed on them warm.
+    """
+
+    def __init__(self, settings: Settings, cache_dir: Path | None = None) -> None:
+        """Initialize the registry.
+
+        Args:
+            settings: Application settings (includes TVSportsDB config)
+            cache_dir: Optional cache directory override
+        """
+        self._settings = settings
+        self._cache_dir = cache_dir if cache_dir is not None else settings.cache_dir
+        self._ttl_seconds = settings.tvsportsdb.ttl_hours * 3600
+        self._entries: dict[str, _RegisteredRuntime] = {}
+        self._lock = threading.Lock()
+        self._client: TVSportsDBClient | None = None
+        self._client_lock = threading.Lock()
+
+    @property
+    def client(self) -> TVSportsDBClient:
+        """API client reused by every load (created on first use)."""
+        with self._client_lock:
+            if self._client is None:
+                self._client = TVSportsDBClient(
+                    cache_dir=self._cache_dir,
+                    ttl_hours=self._settings.tvsportsdb.ttl_hours,
+                    timeout=self._settings.tvsportsdb.timeout,
+                    serve_stale=self._settings.tvsportsdb.serve_stale,
+                )
+            return self._client
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, sport: SportConfig) -> SportRuntime | None:
+        """Return the registered runtime for *sport* if its configuration is unchanged."""
+        with self._lock:
+            entry = self._entries.get(sport.id)
+        if entry is None or entry.sport != sport:
+            return None
+        return entry.runtime
+
+    def revalidate(self, sport: SportConfig, stats: MetadataFetchStatistics) -> SportRuntime | None:
+        """Return the registered runtime for *sport* when it is still current.
+
+        Runtimes whose show received new content in the SQLite cache since
+        they were loaded (e.g. from the background refresher) are reloaded.
+        Otherwise entries younger than the metadata TTL are returned without
+        any network I/O. Older entries are revalidated with conditional
+        requests; when the API is unreachable the last known runtime keeps
+        being served.
+
+        Args:
+            sport: Sport configuration
+            stats: Statistics tracker
+
+        Returns:
+            Reusable runtime, or None when the show must be loaded again
+        """
+        with self._lock:
+            entry = self._entries.get(sport.id)
+        if entry is None or entry.sport != sport:
+            return None
+        fetched_at = self.client.cache.show_fetched_at(sport.show_slug)
+        if fetched_at is not None and fetched_at > entry.loaded_at:
+            return None
+        if time.monotonic() - entry.validated_at < self._ttl_seconds:
+            stats.record_cache_hit()
+            return entry.runtime
+
+        try:
+            changed = self.client.revalidate_show(sport.show_slug)
+        except TVSportsDBNotFoundError:
+            self.discard(sport.id)
+            return None
+        except TVSportsDBError as exc:
+            LOGGER.warning(
+                render_fields_block(
+                    "Metadata Revalidation Failed",
+                    {"Sport": sport.id, "Slug": sport.show_slug, "Error": exc, "Using": "previous metadata"},
+                    pad_top=True,
+                )
+            )
+            stats.record_stale_used()
+            return entry.runtime
+        if changed:
+            return None
+
+        stats.record_not_modified()
+        self.touch(sport.id)
+        return entry.runtime
+
+    def register(self, sport: SportConfig, runtime: SportRuntime, loaded_at: datetime) -> None:
+        """Store *runtime*, whose show was loaded from *loaded_at* on, for *sport*."""
+        with self._lock:
+            self._entries[sport.id] = _RegisteredRuntime(
+                sport=sport, runtime=runtime, validated_at=time.monotonic(), loaded_at=loaded_at
+            )
+
+    def touch(self, sport_id: str, loaded_at: datetime | None = None) -> None:
+        """Mark the runtime for *sport_id* as validated (and, if given, reloaded) now."""
+        with self._lock:
+            entry = self._entries.get(sport_id)
+            if entry is not None:
+                entry.validated_at = time.monotonic()
+                if loaded_at is not None:
+                    entry.loaded_at = loaded_at
+
+    def discard(self, sport_id: str) -> None:
+        """Forget the runtime for *sport_id*."""
+        with self._lock:
+            self._entries.pop(sport_id, None)
+
+    def retain(self, sport_ids: set[str]) -> None:
+        """Drop runtimes for sports that are no longer configured or enabled."""
+        with self._lock:
+            for sport_id in [key for key in self._entries if key not in sport_ids]:
+                del self._entries[sport_id]
+
+    def clear(self) -> None:
+        """Forget every runtime so the next load fetches all metadata again."""
+        with self._lock:
+            self._entries.clear()
+
+    def close(self) -> None:
+        """Close the API client and drop all runtimes."""
+        self.clear()
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
 
 
 class DynamicMetadataLoader:
@@ -78,7 +237,11 @@ class DynamicMetadataLoader:
         self._settings = settings
         self._cache_dir = cache_dir if cache_dir is not None else settings.cache_dir
         self._cache: dict[str, Show] = {}  # Keyed by show_slug
+        self._loaded_at: dict[str, float] = {}  # Slug -> time.monotonic() of last load or revalidation
+        self._load_started: dict[str, datetime] = {}  # Slug -> when the cached show started loading
+        self._ttl_seconds = settings.tvsportsdb.ttl_hours * 3600
         self._lock = threading.Lock()
+        self._fetch_lock = threading.Lock()  # Serializes API fetches so parallel matchers share one request
         self._client: TVSportsDBClient | None = None
         self._adapter = TVSportsDBAdapter()
         self._stats = MetadataFetchStatistics()
@@ -93,6 +256,7 @@ class DynamicMetadataLoader:
                 cache_dir=self._cache_dir,
                 ttl_hours=self._settings.tvsportsdb.ttl_hours,
                 timeout=self._settings.tvsportsdb.timeout,
+                serve_stale=self._settings.tvsportsdb.serve_stale,
             )
         return self._client
 
@@ -111,14 +275,53 @@ class DynamicMetadataLoader:
             Show model if successful, None if not found or error
         """
         # Check cache first (thread-safe)
+        cached, known = self._lookup_cached(show_slug)
+        if known:
+            return cached
+
+        with self._fetch_lock:
+            # Another worker may have fetched this slug while we waited
+            cached, known = self._lookup_cached(show_slug)
+            if known:
+                return cached
+            revalidated = self._revalidate(show_slug)
+            if revalidated is not None:
+                return revalidated
+            return self._fetch_show(show_slug, season_overrides)
+
+    def _lookup_cached(self, show_slug: str) -> tuple[Show | None, bool]:
+        """Return ``(show, known)`` where *known* means no fetch is needed."""
         with self._lock:
-            if show_slug in self._cache:
-                return self._cache[show_slug]
+            if show_slug in self._cache and time.monotonic() - self._loaded_at[show_slug] < self._ttl_seconds:
+                return self._cache[show_slug], True
             if show_slug in self._failed_slugs:
+                return None, True
+        return None, False
+
+    def _revalidate(self, show_slug: str) -> Show | None:
+        """Return the cached show when conditional requests report no change."""
+        with self._lock:
+            show = self._cache.get(show_slug)
+        if show is None:
+            return None
+        try:
+            if self._get_client().revalidate_show(show_slug):
                 return None
+        except TVSportsDBNotFoundError:
+            return None
+        except TVSportsDBError as exc:
+            LOGGER.warning("Failed to revalidate show from TVSportsDB: %s - %s", show_slug, exc)
+            self._stats.record_stale_used()
+        else:
+            self._stats.record_not_modified()
+        with self._lock:
+            self._loaded_at[show_slug] = time.monotonic()
+        return show
 
-        # Load from API
+    def _fetch_show(self, show_slug: str, season_overrides: dict | None) -> Show | None:
+        """Fetch, adapt and cache a show from TVSportsDB."""
         client = self._get_client()
+        started = datetime.now(UTC)
         try:
             response = client.get_show(show_slug, include_episodes=True)
             self._stats.record_network_request()
@@ -131,6 +334,8 @@ class DynamicMetadataLoader:
             # Cache the result
             with self._lock:
                 self._cache[show_slug] = show
+                self._loaded_at[show_slug] = time.monotonic()
+                self._load_started[show_slug] = started
 
             # Track fingerprint for change detection across runs
             if self._fingerprints is not None:
@@ -140,6 +345,7 @@ class DynamicMetadataLoader:
                     change = self._fingerprints.update(show_slug, fp)
                     if change.updated:
                         self._fingerprint_changes[show_slug] = change
+                        invalidate_session_lookups(show.key)
                 except Exception:  # pragma: no cover - defensive
                     LOGGER.debug("Failed to compute fingerprint for dynamic show %s", show_slug)
 
@@ -188,24 +394,37 @@ class DynamicMetadataLoader:
         return self.load_show(show_slug, sport.season_overrides)
 
     def clear_failed_slugs(self) -> None:
-        """Clear caches so previously-failed lookups are retried and fresh metadata is fetched.
+        """Clear failed lookups and change results so they are retried this run.
 
         Called at the start of each processing run to allow newly-added
         metadata on TVSportsDB to be discovered without a full cache
-        invalidation or pod restart.  Also clears the in-memory show cache
-        so that fingerprint comparison uses freshly-fetched data (the
-        TVSportsDB client's SQLite cache with TTL still applies).
+        invalidation or pod restart. Loaded shows stay in memory unless the
+        SQLite cache received newer content for them (e.g. from the
+        background refresher); once older than the metadata TTL they are
+        revalidated with conditional requests and only refetched (and
+        re-fingerprinted) when something changed.
         """
         with self._lock:
             self._failed_slugs.clear()
-            self._cache.clear()
             self._fingerprint_changes.clear()
+            loaded = dict(self._load_started)
+        if self._client is None:
+            return
+        for show_slug, started in loaded.items():
+            fetched_at = self._client.cache.show_fetched_at(show_slug)
+            if fetched_at is not None and fetched_at > started:
+                with self._lock:
+                    self._cache.pop(show_slug, None)
+                    self._load_started.pop(show_slug, None)
 
     def invalidate_cache(self) -> None:
         """Invalidate all cached metadata (in-memory and SQLite)."""
         with self._lock:
             self._cache.clear()
+            self._loaded_at.clear()
+            self._load_started.clear()
             self._failed_slugs.clear()
+        invalidate_session_lookups()
         # Ensure the client exists so we can clear the shared SQLite cache.
         # Static sports (like UFC variants) share the same cache DB file.
         client = self._get_client()
@@ -348,6 +567,8 @@ def load_sports(
     settings: Settings,
     metadata_fingerprints: MetadataFingerprintStore | None,
     cache_dir: Path | None = None,
+    *,
+    registry: SportRuntimeRegistry | None = None,
 ) -> MetadataLoadResult:
     """Load sports metadata in parallel with fingerprint tracking.
 
@@ -361,6 +582,8 @@ def load_sports(
         settings: Application settings (includes TVSportsDB config)
         metadata_fingerprints: Store for tracking metadata fingerprints
         cache_dir: Optional cache directory override (defaults to settings.cache_dir)
+        registry: Optional long-lived registry; its still-current runtimes are
+            reused instead of reloading and recompiling the sport
 
     Returns:
         MetadataLoadResult containing:
@@ -391,6 +614,9 @@ def load_sports(
     static_sports = [s for s in enabled_sports if s.show_slug]
     dynamic_sports = [s for s in enabled_sports if not s.show_slug and s.show_slug_template]
 
+    if registry is not None:
+        registry.retain({sport.id for sport in static_sports})
+
     if not enabled_sports:
         return MetadataLoadResult(
             runtimes=runtimes,
@@ -402,14 +628,37 @@ def load_sports(
     # Initialize API client for static sports
     effective_cache_dir = cache_dir if cache_dir is not None else settings.cache_dir
     shows: dict[str, Show] = {}
+    reused: dict[str, SportRuntime] = {}
+    load_started: dict[str, datetime] = {}
+
+    def resolve(
+        client: TVSportsDBClient, adapter: TVSportsDBAdapter, sport: SportConfig
+    ) -> tuple[SportRuntime | None, Show | None]:
+        if registry is not None:
+            runtime = registry.revalidate(sport, fetch_stats)
+            if runtime is not None:
+                return runtime, None
+            fetch_stats.record_cache_miss()
+        load_started[sport.id] = datetime.now(UTC)
+        show = _load_show_from_api(client, adapter, sport, fetch_stats)
+        if show is None and registry is not None:
+            # Keep serving the last good metadata rather than dropping the sport
+            previous = registry.get(sport)
+            if previous is not None:
+                fetch_stats.record_stale_used()
+                return previous, None
+        return None, show
 
     # Load metadata for static sports in parallel
     if static_sports:
-        client = TVSportsDBClient(
-            cache_dir=effective_cache_dir,
-            ttl_hours=settings.tvsportsdb.ttl_hours,
-            timeout=settings.tvsportsdb.timeout,
-        )
+        if registry is not None:
+            client = registry.client
+        else:
+            client = TVSportsDBClient(
+                cache_dir=effective_cache_dir,
+                ttl_hours=settings.tvsportsdb.ttl_hours,
+                timeout=settings.tvsportsdb.timeout,
+            )
         adapter = TVSportsDBAdapter()
         max_workers = min(8, max(1, len(static_sports)))
 
@@ -419,19 +668,13 @@ def load_sports(
                 for sport in static_sports:
                     fields = {"Sport": sport.name, "Slug": sport.show_slug}
                     LOGGER.debug(render_fields_block("Loading Metadata", fields, pad_top=True))
-                    future = executor.submit(
-                        _load_show_from_api,
-                        client,
-                        adapter,
-                        sport,
-                        fetch_stats,
-                    )
+                    future = executor.submit(resolve, client, adapter, sport)
                     future_map[future] = sport
 
                 for future in as_completed(future_map):
                     sport = future_map[future]
                     try:
-                        show = future.result()
+                        runtime, show = future.result()
                     except Exception as exc:  # pragma: no cover - defensive
                         LOGGER.error(
                             render_fields_block(
@@ -447,18 +690,23 @@ def load_sports(
                         )
                         continue
 
-                    if show is not None:
+                    if runtime is not None:
+                        reused[sport.id] = runtime
+                    elif show is not None:
                         shows[sport.id] = show
         finally:
-            client.close()
+            if registry is None:
+                client.close()
 
     # Build runtimes for static sports and track fingerprint changes
     for sport in static_sports:
+        if sport.id in reused:
+            runtimes.append(reused[sport.id])
+            continue
         show = shows.get(sport.id)
         if show is None:
             continue
-        patterns = compile_patterns(sport)
-        extensions = {ext.lower() for ext in sport.source_extensions}
+        show_fingerprint: str | None = None
 
         # Compute and track metadata fingerprint (skip if no store provided)
         if metadata_fingerprints is not None:
@@ -477,12 +725,33 @@ def load_sports(
                     )
                 )
             else:
+                show_fingerprint = fingerprint.digest
                 change = metadata_fingerprints.update(sport.id, fingerprint)
                 if change.updated:
                     changed_sports.append((sport.id, sport.name))
                     change_map[sport.id] = change
+                    invalidate_session_lookups(show.key)
+        elif registry is not None:
+            show_fingerprint = compute_show_fingerprint(show, sport.show_slug, None).digest
+
+        # Revalidation reported new data but the adapted show is identical:
+        # keep the registered runtime and everything cached against it
+        previous = registry.get(sport) if registry is not None else None
+        if previous is not None and show_fingerprint is not None and previous.show_fingerprint == show_fingerprint:
+            registry.touch(sport.id, load_started[sport.id])
+            runtimes.append(previous)
+            continue
 
-        runtimes.append(SportRuntime(sport=sport, show=show, patterns=patterns, extensions=extensions))
+        runtime = SportRuntime(
+            sport=sport,
+            show=show,
+            patterns=compile_patterns(sport),
+            extensions={ext.lower() for ext in sport.source_extensions},
+            show_fingerprint=show_fingerprint,
+        )
+        if registry is not None:
+            registry.register(sport, runtime, load_started[sport.id])
+        runtimes.append(runtime)
 
     # Build runtimes for dynamic sports (metadata loaded on-demand during matching)
     for sport in dynamic_sports:
@@ -505,6 +774,9 @@ def load_sports(
                 "Metadata API",
                 {
                     "Requests": snapshot["network_requests"],
+                    "Reused": snapshot["cache_hits"],
+                    "Revalidated": snapshot["not_modified"],
+                    "Stale Used": snapshot["stale_used"],
                     "Failures": snapshot["failures"],
                 },
                 pad_top=False,
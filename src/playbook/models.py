@@ -32,6 +32,7 @@ class Season:
     display_number: int | None = None
     round_number: int | None = None
     metadata: dict[str, Any] = field(default_factory=dict)
+    content_digest: str | None = None
 
 
 @dataclass
@@ -70,6 +71,13 @@ class ProcessingStats:
     warnings_by_sport: dict[str, int] = field(default_factory=dict)
     ignored_by_sport: dict[str, int] = field(default_factory=dict)
     processed_by_sport: dict[str, int] = field(default_factory=dict)
+    sports_skipped: int = 0  # Sport runtimes the dispatch prefilter did not try
+    patterns_skipped: int = 0  # Patterns belonging to those runtimes
+    reconcile_checked: int = 0  # Processed records whose destination was checked
+    reconcile_removed: int = 0  # Stale processed records removed by reconciliation
+    entries_scanned: int = 0  # Source directory entries read during discovery
+    entries_skipped: int = 0  # Entries reused from the listings of unchanged directories
+    unmatched_skipped: int = 0  # Unchanged unmatched files that were not matched again
     extra: dict[str, Any] = field(default_factory=dict)
 
     def register_processed(self, *, sport_id: str | None = None) -> None:
@@ -109,3 +117,37 @@ class ProcessingStats:
             self.ignored_by_sport["samples"] = self.ignored_by_sport.get("samples", 0) + 1
         elif sport_id:
             self.ignored_by_sport[sport_id] = self.ignored_by_sport.get(sport_id, 0) + 1
+
+    def merge(self, other: ProcessingStats) -> None:
+        """Fold counters and messages recorded in *other* into this instance.
+
+        Messages are appended in the order they were recorded in *other*, so
+        merging per-file stats in file order reproduces a sequential run.
+        """
+        self.processed += other.processed
+        self.skipped += other.skipped
+        self.ignored += other.ignored
+        self.cancelled = self.cancelled or other.cancelled
+        self.errors.extend(other.errors)
+        for message in other.warnings:
+            if message not in self.warnings:
+                self.warnings.append(message)
+        self.skipped_details.extend(other.skipped_details)
+        self.ignored_details.extend(other.ignored_details)
+        self.suppressed_ignored_samples += other.suppressed_ignored_samples
+        self.sports_skipped += other.sports_skipped
+        self.patterns_skipped += other.patterns_skipped
+        self.reconcile_checked += other.reconcile_checked
+        self.reconcile_removed += other.reconcile_removed
+        self.entries_scanned += other.entries_scanned
+        self.entries_skipped += other.entries_skipped
+        self.unmatched_skipped += other.unmatched_skipped
+        for target, source in (
+            (self.errors_by_sport, other.errors_by_sport),
+            (self.warnings_by_sport, other.warnings_by_sport),
+            (self.ignored_by_sport, other.ignored_by_sport),
+            (self.processed_by_sport, other.processed_by_sport),
+        ):
+            for key, count in source.items():
+                target[key] = target.get(key, 0) + count
+        self.extra.update(other.extra)
@@ -8,6 +8,7 @@ import requests
 from requests.auth import HTTPBasicAuth
 from requests.exceptions import RequestException
 
+from ..http_clients import get_http_clients
 from .types import NotificationEvent, NotificationTarget
 from .utils import _excerpt_response
 
@@ -19,8 +20,15 @@ class AutoscanTarget(NotificationTarget):
 
     name = "autoscan"
 
-    def __init__(self, config: dict[str, Any], *, destination_dir: Path) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any],
+        *,
+        destination_dir: Path,
+        session: requests.Session | None = None,
+    ) -> None:
         self._destination_dir = destination_dir
+        self._session = session or get_http_clients().session(self.name)
         self._endpoint = self._build_endpoint(config.get("url"), config.get("trigger"))
         self._timeout = self._parse_timeout(config.get("timeout"))
         username = config.get("username")
@@ -106,7 +114,7 @@ class AutoscanTarget(NotificationTarget):
 
         params = [("dir", directory)]
         try:
-            response = requests.post(
+            response = self._session.post(
                 self._endpoint,
                 params=params,
                 auth=self._auth,
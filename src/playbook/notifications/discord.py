@@ -12,6 +12,7 @@ from requests import Response
 from requests.exceptions import RequestException
 
 from ..config import NotificationSettings
+from ..http_clients import get_http_clients
 from .types import NotificationEvent, NotificationTarget
 from .utils import _excerpt_response, _trim, normalize_mention, replace_reason_label, resolve_sport_match
 
@@ -42,10 +43,12 @@ class DiscordTarget(NotificationTarget):
         *,
         settings: NotificationSettings,
         mentions: dict[str, str] | None = None,
+        session: requests.Session | None = None,
     ) -> None:
         self.webhook_url = webhook_url.strip() if isinstance(webhook_url, str) else None
         self._settings = settings
         self._mentions_override = dict(mentions or {})
+        self._session = session or get_http_clients().session(self.name)
 
     def enabled(self) -> bool:
         return bool(self.webhook_url)
@@ -172,7 +175,7 @@ class DiscordTarget(NotificationTarget):
 
         while attempt < max_attempts:
             try:
-                response = requests.request(method, url, json=payload, timeout=10)
+                response = self._session.request(method, url, json=payload, timeout=10)
             except RequestException as exc:
                 LOGGER.warning("Failed to send Discord notification: %s", exc)
                 return None
@@ -0,0 +1,246 @@
+"""Background delivery of notification events.
+
+Each target gets a bounded queue served by its own worker thread, so a slow
+webhook or SMTP server only delays its own deliveries and never the
+processing loop. When a queue is full the target's overflow policy decides
+what happens to the event:
+
+- ``block``: wait for room in the queue (backpressure on the caller)
+- ``drop``: discard the event
+- ``spill``: append the event to a file on disk; spilled events are
+  delivered once the queue has emptied, and left-over spills from a previous
+  process are delivered on the next start
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import logging
+import queue
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from .types import NotificationEvent, NotificationTarget
+
+LOGGER = logging.getLogger(__name__)
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP = "drop"
+OVERFLOW_SPILL = "spill"
+
+PRIORITY_HIGH = "high"
+PRIORITY_NORMAL = "normal"
+
+# Seconds an idle worker waits for an event before checking for spills/close
+_POLL_SECONDS = 0.5
+
+
+def _event_to_json(event: NotificationEvent) -> str:
+    payload = dataclasses.asdict(event)
+    payload["timestamp"] = event.timestamp.isoformat()
+    return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+def _event_from_json(line: str) -> NotificationEvent:
+    payload = json.loads(line)
+    payload["timestamp"] = datetime.fromisoformat(payload["timestamp"])
+    return NotificationEvent(**payload)
+
+
+@dataclasses.dataclass
+class DispatchStats:
+    """Delivery counters for one target."""
+
+    queued: int = 0
+    sent: int = 0
+    failed: int = 0
+    dropped: int = 0
+    spilled: int = 0
+
+
+class TargetWorker:
+    """Bounded queue and worker thread delivering events to one target."""
+
+    def __init__(
+        self,
+        target: NotificationTarget,
+        *,
+        queue_size: int,
+        overflow: str = OVERFLOW_SPILL,
+        priority: str = PRIORITY_NORMAL,
+        spill_path: Path | None = None,
+    ) -> None:
+        if overflow == OVERFLOW_SPILL and spill_path is None:
+            overflow = OVERFLOW_BLOCK
+        # spill_path is also checked for left-over spills when the policy is not "spill"
+        self.target = target
+        self.overflow = overflow
+        self.priority = priority
+        self.spill_path = spill_path
+        self.stats = DispatchStats()
+        self._queue: queue.Queue[NotificationEvent] = queue.Queue(maxsize=max(1, queue_size))
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        # Events accepted but not yet delivered, queued or spilled
+        self._pending = 0
+        self._closed = False
+        self._thread: threading.Thread | None = None
+
+        leftover = self._recover_spill()
+        if leftover:
+            LOGGER.info("Delivering %d spilled notification(s) for %s", leftover, target.name)
+            self._pending = leftover
+            self._ensure_thread()
+
+    def _recover_spill(self) -> int:
+        """Count events a previous process spilled but never delivered.
+
+        A replay interrupted by shutdown is put back in front of the spill.
+        """
+        if self.spill_path is None:
+            return 0
+        replay_path = self.spill_path.with_suffix(".replay")
+        lines: list[str] = []
+        for path in (replay_path, self.spill_path):
+            if path.exists():
+                with path.open(encoding="utf-8") as handle:
+                    lines.extend(line for line in handle if line.strip())
+        if replay_path.exists():
+            self.spill_path.write_text("".join(lines), encoding="utf-8")
+            replay_path.unlink()
+        return len(lines)
+
+    @property
+    def pending(self) -> int:
+        with self._lock:
+            return self._pending
+
+    def submit(self, event: NotificationEvent) -> bool:
+        """Queue *event* for delivery; returns False if it was dropped."""
+        with self._lock:
+            if self._closed:
+                return False
+            self._pending += 1
+            self.stats.queued += 1
+            spill_path = self.spill_path if self.overflow == OVERFLOW_SPILL else None
+            if spill_path is None or not spill_path.exists():
+                try:
+                    self._queue.put_nowait(event)
+                except queue.Full:
+                    pass
+                else:
+                    self._ensure_thread()
+                    return True
+            if spill_path is not None:
+                # Once spilling, keep spilling until the spill is delivered so order is kept
+                self._spill(spill_path, event)
+                self._ensure_thread()
+                return True
+            if self.overflow == OVERFLOW_DROP:
+                self._pending -= 1
+                self.stats.dropped += 1
+                self._idle.notify_all()
+                LOGGER.warning(
+                    "Notification queue for %s is full; dropped event for %s", self.target.name, event.sport_id
+                )
+                return False
+            self._ensure_thread()
+        # Block outside the lock so the worker can make room
+        self._queue.put(event)
+        return True
+
+    def _spill(self, spill_path: Path, event: NotificationEvent) -> None:
+        spill_path.parent.mkdir(parents=True, exist_ok=True)
+        with spill_path.open("a", encoding="utf-8") as handle:
+            handle.write(_event_to_json(event) + "\n")
+        self.stats.spilled += 1
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"playbook-notify-{self.target.name}",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            try:
+                event = self._queue.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                if self._replay_spill():
+                    continue
+                with self._lock:
+                    if self._closed or self._pending == 0:
+                        self._thread = None
+                        return
+                continue
+            self._deliver(event)
+
+    def _deliver(self, event: NotificationEvent) -> None:
+        try:
+            self.target.send(event)
+        except Exception as exc:  # noqa: BLE001 - one failing target must not stop the worker
+            LOGGER.warning("Notification target %s failed: %s", self.target.name, exc)
+            failed = True
+        else:
+            failed = False
+        with self._lock:
+            if failed:
+                self.stats.failed += 1
+            else:
+                self.stats.sent += 1
+            self._pending -= 1
+            if self._pending <= 0:
+                self._idle.notify_all()
+
+    def _replay_spill(self) -> bool:
+        """Deliver spilled events once the queue is empty; returns True if there were any."""
+        with self._lock:
+            if self._closed or self.spill_path is None or not self.spill_path.exists():
+                return False
+            replay_path = self.spill_path.with_suffix(".replay")
+            self.spill_path.replace(replay_path)
+        with replay_path.open(encoding="utf-8") as handle:
+            lines = [line for line in handle if line.strip()]
+        for line in lines:
+            try:
+                event = _event_from_json(line)
+            except (ValueError, TypeError) as exc:
+                LOGGER.warning("Skipping unreadable spilled notification for %s: %s", self.target.name, exc)
+                with self._lock:
+                    self._pending -= 1
+                continue
+            self._deliver(event)
+        replay_path.unlink(missing_ok=True)
+        return True
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every accepted event was delivered; returns False on timeout."""
+        with self._lock:
+            return self._idle.wait_for(lambda: self._pending <= 0, timeout=timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver what is queued (within *timeout*) and stop the worker.
+
+        Events still spilled on disk are delivered by the next process.
+        """
+        self.drain(timeout)
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=_POLL_SECONDS * 2)
+
+    def stats_dict(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                **dataclasses.asdict(self.stats),
+                "pending": self._pending,
+                "priority": self.priority,
+                "overflow": self.overflow,
+            }
@@ -5,10 +5,16 @@ from __future__ import annotations
 import logging
 import os
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
+from ..http_clients import get_http_clients
 from .types import NotificationEvent, NotificationTarget
 
+if TYPE_CHECKING:
+    import requests
+
+    from ..plex_client import PlexClient
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -37,8 +43,16 @@ class PlexScanTarget(NotificationTarget):
 
     name = "plex_scan"
 
-    def __init__(self, config: dict[str, Any], *, destination_dir: Path) -> None:
+    def __init__(
+        self,
+        config: dict[str, Any],
+        *,
+        destination_dir: Path,
+        session: requests.Session | None = None,
+    ) -> None:
         self._destination_dir = destination_dir
+        self._session = session or get_http_clients().session(self.name, retry=True)
+        self._client: PlexClient | None = None
 
         # URL: config value -> custom env var -> default env var
         self._url = self._resolve_value(
@@ -143,6 +157,14 @@ class PlexScanTarget(NotificationTarget):
     def enabled(self) -> bool:
         return bool(self._url and self._token and (self._library_id or self._library_name))
 
+    def _plex_client(self) -> PlexClient:
+        """Return the Plex client, created once on the shared session."""
+        if self._client is None:
+            from ..plex_client import PlexClient
+
+            self._client = PlexClient(self._url, self._token, timeout=self._timeout, session=self._session)
+        return self._client
+
     def _get_library_id(self) -> str | None:
         """Get or resolve the library ID."""
         if self._resolved_library_id:
@@ -157,10 +179,7 @@ class PlexScanTarget(NotificationTarget):
             return None
 
         try:
-            from ..plex_client import PlexClient
-
-            client = PlexClient(self._url, self._token, timeout=self._timeout)
-            libraries = client.list_libraries(type_filter="show")
+            libraries = self._plex_client().list_libraries(type_filter="show")
             for lib in libraries:
                 if lib.title.lower() == self._library_name.lower():
                     self._resolved_library_id = lib.key
@@ -193,10 +212,7 @@ class PlexScanTarget(NotificationTarget):
             return
 
         try:
-            from ..plex_client import PlexClient
-
-            client = PlexClient(self._url, self._token, timeout=self._timeout)
-            client.scan_library(library_id, path=scan_path)
+            self._plex_client().scan_library(library_id, path=scan_path)
             LOGGER.debug(
                 "Plex partial scan triggered for %s: %s",
                 event.sport_id,
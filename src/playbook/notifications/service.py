@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
+import time
 from collections import defaultdict
 from datetime import UTC
 from pathlib import Path
 from typing import Any
 
 from ..config import IntegrationsSettings, NotificationSettings
+from ..http_clients import HttpClientRegistry, get_http_clients
 from .autoscan import AutoscanTarget
 from .discord import DiscordTarget
+from .dispatcher import OVERFLOW_BLOCK, PRIORITY_HIGH, PRIORITY_NORMAL, TargetWorker
 from .email import EmailTarget
 from .plex_scan import PlexScanTarget
 from .slack import SlackTarget
@@ -19,6 +24,15 @@ from .webhook import GenericWebhookTarget
 
 LOGGER = logging.getLogger(__name__)
 
+# Infrastructure targets: never throttled, no summaries, delivered first by default
+_INFRA_TARGETS = {"plex_scan", "autoscan"}
+
+
+def _spill_key(target_type: str, endpoint: Any) -> str:
+    """Return a short stable hash identifying where a target delivers."""
+    raw = json.dumps([target_type, endpoint], sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()[:12]
+
 
 class ScanSummary:
     """Aggregates events from a scan for summary notification."""
@@ -133,15 +147,24 @@ class NotificationService:
         destination_dir: Path,
         enabled: bool = True,
         integrations: IntegrationsSettings | None = None,
+        http_clients: HttpClientRegistry | None = None,
     ) -> None:
         self._settings = settings
         self._enabled = enabled
         self._integrations = integrations or IntegrationsSettings()
+        self._http = http_clients or get_http_clients()
+        # Per-target (priority, overflow) from the target entries
+        self._dispatch_options: dict[int, tuple[str | None, str | None]] = {}
+        # Per-target hash of its endpoint, naming its spill file across restarts
+        self._spill_keys: dict[int, str] = {}
         self._targets = self._build_targets(
             settings.targets,
             cache_dir,
             destination_dir,
         )
+        self._workers = self._build_workers(cache_dir / "notification-spill")
+        # High-priority targets get each event first
+        self._targets.sort(key=lambda target: self._priority(target) != PRIORITY_HIGH)
         self._throttle_map = settings.throttle
         self._daily_sent: dict[tuple[str, str], int] = {}
         self._scan_summary = ScanSummary()
@@ -151,6 +174,106 @@ class NotificationService:
     def enabled(self) -> bool:
         return self._enabled and any(target.enabled() for target in self._targets)
 
+    def http_stats(self) -> dict[str, dict[str, Any]]:
+        """Return latency, connection reuse and error counts per HTTP target."""
+        return self._http.stats()
+
+    def dispatch_stats(self) -> list[dict[str, Any]]:
+        """Return queue and delivery counters per target (empty when sending inline)."""
+        return [{"target": target.name, **worker.stats_dict()} for target, worker in self._workers_in_order()]
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until queued events were delivered, high-priority targets first.
+
+        Returns False if *timeout* seconds passed before every queue drained.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        drained = True
+        for _target, worker in self._workers_in_order():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            drained = worker.drain(remaining) and drained
+        return drained
+
+    def close(self, timeout: float | None = None) -> None:
+        """Deliver queued events (within *timeout*) and stop the target workers."""
+        self.flush(timeout)
+        for _target, worker in self._workers_in_order():
+            worker.close(0)
+
+    def _workers_in_order(self) -> list[tuple[NotificationTarget, TargetWorker]]:
+        return [(target, self._workers[id(target)]) for target in self._targets if id(target) in self._workers]
+
+    def _priority(self, target: NotificationTarget) -> str:
+        priority, _overflow = self._dispatch_options.get(id(target), (None, None))
+        if priority:
+            return priority
+        return PRIORITY_HIGH if target.name in _INFRA_TARGETS else PRIORITY_NORMAL
+
+    def _build_workers(self, spill_dir: Path) -> dict[int, TargetWorker]:
+        """Create a background worker per target, unless events are sent inline."""
+        queue_size = self._settings.queue_size
+        if queue_size <= 0:
+            return {}
+        workers: dict[int, TargetWorker] = {}
+        spill_names: set[str] = set()
+        for target in self._targets:
+            priority = self._priority(target)
+            _priority, overflow = self._dispatch_options.get(id(target), (None, None))
+            if not overflow:
+                # Losing or delaying a library scan is worse than holding up the caller
+                overflow = OVERFLOW_BLOCK if priority == PRIORITY_HIGH else self._settings.overflow
+            key = self._spill_keys.get(id(target)) or _spill_key(target.name, None)
+            name = f"{target.name}-{key}"
+            suffix = 2
+            while name in spill_names:
+                # Identically configured targets each keep their own spill
+                name = f"{target.name}-{key}-{suffix}"
+                suffix += 1
+            spill_names.add(name)
+            workers[id(target)] = TargetWorker(
+                target,
+                queue_size=queue_size,
+                overflow=overflow,
+                priority=priority,
+                spill_path=spill_dir / f"{name}.jsonl",
+            )
+        self._drop_orphaned_spills(spill_dir, spill_names)
+        return workers
+
+    @staticmethod
+    def _drop_orphaned_spills(spill_dir: Path, keep: set[str]) -> None:
+        """Delete spills left by targets that are no longer configured."""
+        if not spill_dir.is_dir():
+            return
+        for path in sorted(spill_dir.iterdir()):
+            if path.suffix not in (".jsonl", ".replay") or path.stem in keep:
+                continue
+            try:
+                with path.open(encoding="utf-8") as handle:
+                    count = sum(1 for line in handle if line.strip())
+                path.unlink()
+            except OSError as exc:
+                LOGGER.warning("Could not remove orphaned notification spill %s: %s", path, exc)
+                continue
+            if count:
+                LOGGER.warning(
+                    "Dropped %d spilled notification(s) in %s; no configured target matches it anymore",
+                    count,
+                    path.name,
+                )
+
+    def _deliver(self, target: NotificationTarget, event: NotificationEvent) -> bool:
+        """Hand *event* to the target's worker, or send it right away without one."""
+        worker = self._workers.get(id(target))
+        if worker is not None:
+            return worker.submit(event)
+        try:
+            target.send(event)
+        except Exception as exc:  # pragma: no cover - defensive logging
+            LOGGER.warning("Notification target %s failed: %s", target.name, exc)
+            return False
+        return True
+
     def notify(self, event: NotificationEvent) -> None:
         if not self.enabled:
             return
@@ -169,8 +292,6 @@ class NotificationService:
 
         # Separate infrastructure targets (plex_scan, autoscan) from user-facing ones.
         # Infrastructure targets always fire — they should never be rate-limited.
-        _INFRA_TARGETS = {"plex_scan", "autoscan"}
-
         daily_limit = self._resolve_throttle(event.sport_id)
         day_key = self._notification_day_key(event)
         sent_today = self._daily_sent.get((event.sport_id, day_key), 0)
@@ -192,11 +313,7 @@ class NotificationService:
             is_infra = target.name in _INFRA_TARGETS
             if throttled and not is_infra:
                 continue
-            try:
-                target.send(event)
-            except Exception as exc:  # pragma: no cover - defensive logging
-                LOGGER.warning("Notification target %s failed: %s", target.name, exc)
-            else:
+            if self._deliver(target, event):
                 successes.append(target.name)
 
         # Only count user-facing dispatches toward the daily limit
@@ -223,6 +340,11 @@ class NotificationService:
         Called at the end of each scan. Only sends if scan_summary is enabled
         and there were actual events during the scan.
         """
+        # Let queued events go out first; the summary counts them
+        drain_timeout = self._settings.drain_timeout
+        if not self.flush(timeout=drain_timeout):
+            LOGGER.warning("Notification queues not drained after %.0fs", drain_timeout)
+
         if not self._scan_summary_enabled:
             self._scan_summary.clear()
             return
@@ -241,8 +363,6 @@ class NotificationService:
         text_summary = self._scan_summary.format_text_summary()
 
         # Infrastructure targets (plex_scan, autoscan) don't need summaries
-        _INFRA_TARGETS = {"plex_scan", "autoscan"}
-
         successes: list[str] = []
         for target in self._targets:
             if not target.enabled() or target.name in _INFRA_TARGETS:
@@ -295,32 +415,42 @@ class NotificationService:
             target_type = entry.get("type", "").lower()
             is_enabled = entry.get("enabled", True)
             target: NotificationTarget | None = None
+            endpoint: Any = None
 
             if target_type == "discord":
                 webhook = self._discord_webhook_from(entry)
                 if webhook:
+                    endpoint = webhook
                     mentions_override = _normalize_mentions_map(entry.get("mentions"))
                     target = DiscordTarget(
                         webhook,
                         settings=self._settings,
                         mentions=mentions_override if mentions_override else None,
+                        session=self._http.session(DiscordTarget.name),
                     )
                 else:
                     LOGGER.warning("Skipped Discord target because webhook_url was not provided.")
             elif target_type == "slack":
                 url = entry.get("webhook_url") or entry.get("url")
                 if url:
-                    target = SlackTarget(url, template=entry.get("template"))
+                    endpoint = url
+                    target = SlackTarget(
+                        url,
+                        template=entry.get("template"),
+                        session=self._http.session(SlackTarget.name),
+                    )
                 else:
                     LOGGER.warning("Skipped Slack target because webhook_url/url was not provided.")
             elif target_type == "webhook":
                 url = entry.get("url")
                 if url:
+                    endpoint = url
                     target = GenericWebhookTarget(
                         url,
                         method=entry.get("method", "POST"),
                         headers=entry.get("headers"),
                         template=entry.get("template"),
+                        session=self._http.session(GenericWebhookTarget.name),
                     )
                 else:
                     LOGGER.warning("Skipped webhook target because url was not provided.")
@@ -330,14 +460,24 @@ class NotificationService:
                 merged_config = self._merge_autoscan_config(entry)
                 url = merged_config.get("url")
                 if url:
-                    target = AutoscanTarget(merged_config, destination_dir=destination_dir)
+                    endpoint = url
+                    target = AutoscanTarget(
+                        merged_config,
+                        destination_dir=destination_dir,
+                        session=self._http.session(AutoscanTarget.name),
+                    )
                 else:
                     LOGGER.warning("Skipped Autoscan target because url was not provided.")
             elif target_type in ("plex_scan", "plex"):
                 has_explicit_plex = True
                 # Merge integrations.plex settings as defaults
                 merged_config = self._merge_plex_scan_config(entry)
-                target = PlexScanTarget(merged_config, destination_dir=destination_dir)
+                endpoint = merged_config.get("url")
+                target = PlexScanTarget(
+                    merged_config,
+                    destination_dir=destination_dir,
+                    session=self._http.session(PlexScanTarget.name, retry=True),
+                )
                 if not target.enabled():
                     LOGGER.warning(
                         "Plex scan target disabled: url/token not found in config or env vars (PLEX_URL, PLEX_TOKEN)"
@@ -345,12 +485,15 @@ class NotificationService:
                     target = None
             elif target_type == "email":
                 target = EmailTarget(entry)
+                endpoint = [target.host, target.recipients]
             else:
                 LOGGER.warning("Unknown notification target type '%s'", target_type or "<missing>")
 
             # Set enabled state and add to list
             if target is not None:
                 target.set_enabled(is_enabled)
+                self._dispatch_options[id(target)] = (entry.get("priority"), entry.get("overflow"))
+                self._spill_keys[id(target)] = _spill_key(target.name, endpoint)
                 targets.append(target)
 
         # Auto-create targets from integrations if not explicitly configured
@@ -425,8 +568,13 @@ class NotificationService:
                 "library_name": plex.library_name,
                 "rewrite": plex.scan_on_activity.rewrite,
             }
-            target = PlexScanTarget(config, destination_dir=destination_dir)
+            target = PlexScanTarget(
+                config,
+                destination_dir=destination_dir,
+                session=self._http.session(PlexScanTarget.name, retry=True),
+            )
             if target.enabled():
+                self._spill_keys[id(target)] = _spill_key(target.name, plex.url)
                 auto_targets.append(target)
                 LOGGER.debug("Auto-created Plex scan target from integrations.plex.scan_on_activity")
             else:
@@ -445,7 +593,12 @@ class NotificationService:
                     "timeout": autoscan.timeout,
                     "rewrite": autoscan.rewrite,
                 }
-                target = AutoscanTarget(config, destination_dir=destination_dir)
+                target = AutoscanTarget(
+                    config,
+                    destination_dir=destination_dir,
+                    session=self._http.session(AutoscanTarget.name),
+                )
+                self._spill_keys[id(target)] = _spill_key(target.name, autoscan.url)
                 auto_targets.append(target)
                 LOGGER.debug("Auto-created Autoscan target from integrations.autoscan")
             else:
@@ -5,6 +5,7 @@ import logging
 import requests
 from requests.exceptions import RequestException
 
+from ..http_clients import get_http_clients
 from .types import NotificationEvent, NotificationTarget
 from .utils import _flatten_event, replace_reason_label
 
@@ -16,9 +17,16 @@ class SlackTarget(NotificationTarget):
 
     name = "slack"
 
-    def __init__(self, webhook_url: str | None, template: str | None = None) -> None:
+    def __init__(
+        self,
+        webhook_url: str | None,
+        template: str | None = None,
+        *,
+        session: requests.Session | None = None,
+    ) -> None:
         self.webhook_url = webhook_url.strip() if isinstance(webhook_url, str) else None
         self.template = template
+        self._session = session or get_http_clients().session(self.name)
 
     def enabled(self) -> bool:
         return bool(self.webhook_url)
@@ -28,7 +36,7 @@ class SlackTarget(NotificationTarget):
             return
         payload = {"text": self._render(event)}
         try:
-            response = requests.post(self.webhook_url, json=payload, timeout=10)
+            response = self._session.post(self.webhook_url, json=payload, timeout=10)
         except RequestException as exc:
             LOGGER.warning("Failed to send Slack notification: %s", exc)
             return
@@ -6,6 +6,7 @@ from typing import Any
 import requests
 from requests.exceptions import RequestException
 
+from ..http_clients import get_http_clients
 from .types import NotificationEvent, NotificationTarget
 from .utils import _flatten_event, _render_template
 
@@ -24,11 +25,13 @@ class GenericWebhookTarget(NotificationTarget):
         method: str = "POST",
         headers: dict[str, str] | None = None,
         template: Any | None = None,
+        session: requests.Session | None = None,
     ) -> None:
         self.url = url.strip() if isinstance(url, str) else None
         self.method = method.upper()
         self.headers = {str(k): str(v) for k, v in (headers or {}).items()}
         self.template = template
+        self._session = session or get_http_clients().session(self.name)
 
     def enabled(self) -> bool:
         return bool(self.url)
@@ -38,7 +41,7 @@ class GenericWebhookTarget(NotificationTarget):
             return
         payload = self._build_payload(event)
         try:
-            response = requests.request(
+            response = self._session.request(
                 self.method,
                 self.url,
                 json=payload,
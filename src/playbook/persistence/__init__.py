@@ -9,10 +9,14 @@ Public API:
 - UnmatchedFileRecord: Record of a file that failed pattern matching
 - UnmatchedFileStore: SQLite-backed store for unmatched file records
 - MatchAttempt: Details of a match attempt against a sport
+- UnmatchedMatchState: Negative-match cache entry of an unmatched file
 - classify_file_category: Classify a file by extension/name
 - get_file_size_safe: Get file size without raising exceptions
 - CacheEntry: A cached metadata entry with TTL and HTTP headers
 - MetadataCacheStore: SQLite-backed cache for API metadata
+- PersistenceWriter: Write-behind queue committing store mutations in groups
+- DirectoryListing: Entries of one source directory as of its last read
+- DirectoryListingStore: SQLite-backed cache of source directory listings
 
 Example:
     from playbook.persistence import ProcessedFileStore, ProcessedFileRecord
@@ -26,6 +30,7 @@ Example:
     ))
 """
 
+from .directory_cache import DirectoryListing, DirectoryListingStore
 from .manual_override_store import ManualOverride, ManualOverrideStore
 from .metadata_cache import CacheEntry, MetadataCacheStore
 from .processed_store import ProcessedFileRecord, ProcessedFileStore
@@ -34,19 +39,25 @@ from .unmatched_store import (
     MatchAttempt,
     UnmatchedFileRecord,
     UnmatchedFileStore,
+    UnmatchedMatchState,
     classify_file_category,
     get_file_size_safe,
 )
+from .writer import PersistenceWriter
 
 __all__ = [
     "CacheEntry",
+    "DirectoryListing",
+    "DirectoryListingStore",
     "ManualOverride",
     "ManualOverrideStore",
     "MetadataCacheStore",
+    "PersistenceWriter",
     "ProcessedFileRecord",
     "ProcessedFileStore",
     "UnmatchedFileRecord",
     "UnmatchedFileStore",
+    "UnmatchedMatchState",
     "MatchAttempt",
     "FileCategory",
     "classify_file_category",
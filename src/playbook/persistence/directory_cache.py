@@ -0,0 +1,157 @@
+"""SQLite-backed cache of source directory listings.
+
+A directory's mtime changes whenever an entry is added, removed or renamed
+in it, so as long as the mtime is unchanged the names it contains are too.
+Discovery keeps the listing of every directory it reads here and, on the
+next scan, reuses the listing of directories whose mtime did not change
+instead of reading them again.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DirectoryListing:
+    """Entries of one directory as of its last read.
+
+    Attributes:
+        mtime_ns: Directory mtime when it was read
+        files: Names of the regular files (symlinks excluded)
+        subdirs: Names of the subdirectories (symlinks excluded)
+    """
+
+    mtime_ns: int
+    files: tuple[str, ...]
+    subdirs: tuple[str, ...]
+
+
+class DirectoryListingStore:
+    """SQLite-backed store for directory listings, grouped by scan root.
+
+    The table lives in the same ``playbook.db`` used by other persistence
+    stores. Listings are read once per scan with :meth:`load` and written
+    back in a single transaction with :meth:`save_changes`.
+    """
+
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Path) -> None:
+        self._db_path = db_path
+        self._local = threading.local()
+        self._init_db()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get or create database connection for the current thread."""
+        if not hasattr(self._local, "connection") or self._local.connection is None:
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._db_path, timeout=10)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = conn
+        return self._local.connection
+
+    def _init_db(self) -> None:
+        """Initialize database schema."""
+        conn = self._get_connection()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS directory_listing_schema_version (
+                version INTEGER PRIMARY KEY
+            )
+        """)
+        row = conn.execute("SELECT version FROM directory_listing_schema_version LIMIT 1").fetchone()
+        current_version = row[0] if row else 0
+        if current_version < self.SCHEMA_VERSION:
+            self._migrate_schema(current_version)
+
+    def _migrate_schema(self, from_version: int) -> None:
+        """Migrate schema from a previous version."""
+        conn = self._get_connection()
+
+        if from_version < 1:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS directory_listings (
+                    root TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    files TEXT NOT NULL,
+                    subdirs TEXT NOT NULL,
+                    PRIMARY KEY (root, path)
+                ) WITHOUT ROWID
+            """)
+
+        conn.execute("DELETE FROM directory_listing_schema_version")
+        conn.execute("INSERT INTO directory_listing_schema_version (version) VALUES (?)", (self.SCHEMA_VERSION,))
+        conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection for the current thread."""
+        if hasattr(self._local, "connection") and self._local.connection is not None:
+            self._local.connection.close()
+            self._local.connection = None
+
+    def load(self, root: str) -> dict[str, DirectoryListing]:
+        """Return the stored listings of the directories under *root*, keyed by path."""
+        conn = self._get_connection()
+        listings: dict[str, DirectoryListing] = {}
+        for path, mtime_ns, files, subdirs in conn.execute(
+            "SELECT path, mtime_ns, files, subdirs FROM directory_listings WHERE root = ?",
+            (root,),
+        ):
+            try:
+                listings[path] = DirectoryListing(mtime_ns, tuple(json.loads(files)), tuple(json.loads(subdirs)))
+            except (TypeError, ValueError):
+                LOGGER.debug("Ignoring malformed directory listing for %s", path)
+        return listings
+
+    def save_changes(
+        self,
+        root: str,
+        listings: Mapping[str, DirectoryListing],
+        removed: Iterable[str] = (),
+    ) -> None:
+        """Store *listings* and forget *removed* directories in one transaction."""
+        conn = self._get_connection()
+        rows = []
+        for path, listing in listings.items():
+            try:
+                # Names that are not valid UTF-8 survive json's \\u escapes but not SQLite TEXT keys
+                path.encode("utf-8")
+            except UnicodeEncodeError:
+                continue
+            rows.append((root, path, listing.mtime_ns, json.dumps(listing.files), json.dumps(listing.subdirs)))
+        with conn:
+            conn.executemany(
+                "DELETE FROM directory_listings WHERE root = ? AND path = ?",
+                [(root, path) for path in removed],
+            )
+            conn.executemany(
+                """
+                INSERT INTO directory_listings (root, path, mtime_ns, files, subdirs)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(root, path) DO UPDATE SET
+                    mtime_ns = excluded.mtime_ns,
+                    files = excluded.files,
+                    subdirs = excluded.subdirs
+                """,
+                rows,
+            )
+
+    def clear(self) -> int:
+        """Delete all stored listings.
+
+        Returns:
+            Number of records deleted
+        """
+        conn = self._get_connection()
+        cursor = conn.execute("DELETE FROM directory_listings")
+        conn.commit()
+        return cursor.rowcount
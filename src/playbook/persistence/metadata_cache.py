@@ -5,15 +5,22 @@ This module provides persistence for caching metadata from external APIs
 - TTL-based expiration
 - HTTP conditional requests (ETag/Last-Modified)
 - Efficient invalidation by prefix (e.g., all UFC seasons)
+
+Content is stored as zlib-compressed compact JSON and decoded at most once
+per process for each stored version of an entry. Each entry also records a
+digest of that JSON, so callers can tell unchanged content apart without
+decoding or re-serializing it.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import sqlite3
 import threading
 import time
+import zlib
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
@@ -21,6 +28,21 @@ from typing import Any
 
 LOGGER = logging.getLogger(__name__)
 
+_COMPRESSION_LEVEL = 6
+
+
+def _encode_content(content: dict[str, Any] | list[Any]) -> tuple[bytes, int, str]:
+    """Serialize *content* for storage; returns the blob, the raw JSON size and its digest."""
+    raw = json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, _COMPRESSION_LEVEL), len(raw), hashlib.sha1(raw).hexdigest()
+
+
+def _decode_content(stored: bytes | str) -> dict[str, Any] | list[Any]:
+    """Decode stored content; plain JSON text from before schema 2 is accepted too."""
+    if isinstance(stored, bytes):
+        return json.loads(zlib.decompress(stored))
+    return json.loads(stored)
+
 
 @dataclass
 class CacheEntry:
@@ -28,11 +50,12 @@ class CacheEntry:
 
     Attributes:
         key: Unique cache key (e.g., "shows/ufc-2025")
-        content: JSON content as a dictionary
+        content: JSON content as a dictionary (shared between callers, do not mutate)
         etag: HTTP ETag header for conditional requests
         last_modified: HTTP Last-Modified header for conditional requests
         fetched_at: When the content was fetched
         expires_at: When the cache entry expires
+        digest: SHA1 of the stored JSON, unchanged as long as the content is
     """
 
     key: str
@@ -41,6 +64,7 @@ class CacheEntry:
     last_modified: str | None
     fetched_at: datetime
     expires_at: datetime
+    digest: str | None = None
 
     @property
     def is_expired(self) -> bool:
@@ -85,7 +109,7 @@ class MetadataCacheStore:
         cache.invalidate_by_prefix("shows/ufc-")  # All UFC shows
     """
 
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 3
 
     def __init__(self, db_path: Path, ttl_hours: int = 2) -> None:
         """Initialize the cache store.
@@ -98,6 +122,12 @@ class MetadataCacheStore:
         self.ttl_hours = ttl_hours
         self._ttl = timedelta(hours=ttl_hours)
         self._local = threading.local()
+        # Decoded content per key, tagged with the fetched_at it was decoded for
+        self._decoded: dict[str, tuple[str, dict[str, Any] | list[Any]]] = {}
+        self._decoded_lock = threading.Lock()
+        self._decode_hits = 0
+        self._decode_misses = 0
+        self._decode_seconds = 0.0
 
         # Ensure parent directory exists
         db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -190,7 +220,7 @@ class MetadataCacheStore:
         row = cursor.fetchone()
         current_version = row[0] if row else 0
 
-        if current_version < self.SCHEMA_VERSION:
+        if current_version < 1:
             # Create or migrate schema
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS metadata_cache (
@@ -209,6 +239,41 @@ class MetadataCacheStore:
                 ON metadata_cache (key)
             """)
 
+        if current_version < 2:
+            # Schema v2: compressed content plus its raw and stored sizes
+            cursor = conn.execute("PRAGMA table_info(metadata_cache)")
+            existing_columns = {row["name"] for row in cursor}
+            if "raw_size" not in existing_columns:
+                conn.execute("ALTER TABLE metadata_cache ADD COLUMN raw_size INTEGER NOT NULL DEFAULT 0")
+            if "stored_size" not in existing_columns:
+                conn.execute("ALTER TABLE metadata_cache ADD COLUMN stored_size INTEGER NOT NULL DEFAULT 0")
+            rows = conn.execute("SELECT key, content FROM metadata_cache WHERE typeof(content) = 'text'").fetchall()
+            for row in rows:
+                try:
+                    blob, raw_size, _ = _encode_content(json.loads(row["content"]))
+                except ValueError:
+                    conn.execute("DELETE FROM metadata_cache WHERE key = ?", (row["key"],))
+                    continue
+                conn.execute(
+                    "UPDATE metadata_cache SET content = ?, raw_size = ?, stored_size = ? WHERE key = ?",
+                    (blob, raw_size, len(blob), row["key"]),
+                )
+
+        if current_version < 3:
+            # Schema v3: digest of the stored JSON
+            cursor = conn.execute("PRAGMA table_info(metadata_cache)")
+            if "digest" not in {row["name"] for row in cursor}:
+                conn.execute("ALTER TABLE metadata_cache ADD COLUMN digest TEXT")
+            rows = conn.execute("SELECT key, content FROM metadata_cache WHERE digest IS NULL").fetchall()
+            for row in rows:
+                try:
+                    _, _, digest = _encode_content(_decode_content(row["content"]))
+                except (ValueError, zlib.error):
+                    conn.execute("DELETE FROM metadata_cache WHERE key = ?", (row["key"],))
+                    continue
+                conn.execute("UPDATE metadata_cache SET digest = ? WHERE key = ?", (digest, row["key"]))
+
+        if current_version < self.SCHEMA_VERSION:
             # Update schema version
             conn.execute("DELETE FROM schema_version")
             conn.execute("INSERT INTO schema_version (version) VALUES (?)", (self.SCHEMA_VERSION,))
@@ -227,7 +292,7 @@ class MetadataCacheStore:
         conn = self._get_connection()
         cursor = conn.execute(
             """
-            SELECT key, content, etag, last_modified, fetched_at, expires_at
+            SELECT key, content, etag, last_modified, fetched_at, expires_at, digest
             FROM metadata_cache
             WHERE key = ?
             """,
@@ -237,20 +302,48 @@ class MetadataCacheStore:
         if row is None:
             return None
 
+        expires_at = datetime.fromisoformat(row["expires_at"])
+        if not include_expired and datetime.now(UTC) > expires_at:
+            return None
+
         entry = CacheEntry(
             key=row["key"],
-            content=json.loads(row["content"]),
+            content=self._decode(row["key"], row["fetched_at"], row["content"]),
             etag=row["etag"],
             last_modified=row["last_modified"],
             fetched_at=datetime.fromisoformat(row["fetched_at"]),
-            expires_at=datetime.fromisoformat(row["expires_at"]),
+            expires_at=expires_at,
+            digest=row["digest"],
         )
-
-        if not include_expired and entry.is_expired:
-            return None
-
         return entry
 
+    def _decode(self, key: str, fetched_at: str, stored: bytes | str) -> dict[str, Any] | list[Any]:
+        """Decode stored content, reusing the result while the entry is unchanged."""
+        with self._decoded_lock:
+            memo = self._decoded.get(key)
+            if memo is not None and memo[0] == fetched_at:
+                self._decode_hits += 1
+                return memo[1]
+        started = time.perf_counter()
+        content = _decode_content(stored)
+        elapsed = time.perf_counter() - started
+        with self._decoded_lock:
+            self._decode_misses += 1
+            self._decode_seconds += elapsed
+            self._decoded[key] = (fetched_at, content)
+        return content
+
+    def _forget(self, key: str | None = None, *, prefix: str | None = None) -> None:
+        """Drop memoized content for *key*, keys under *prefix*, or everything."""
+        with self._decoded_lock:
+            if key is None and prefix is None:
+                self._decoded.clear()
+            elif prefix is not None:
+                for cached_key in [k for k in self._decoded if k.startswith(prefix)]:
+                    del self._decoded[cached_key]
+            else:
+                self._decoded.pop(key, None)
+
     def set(
         self,
         key: str,
@@ -259,7 +352,7 @@ class MetadataCacheStore:
         etag: str | None = None,
         last_modified: str | None = None,
         ttl_hours: int | None = None,
-    ) -> None:
+    ) -> CacheEntry:
         """Store content in the cache.
 
         Args:
@@ -268,31 +361,50 @@ class MetadataCacheStore:
             etag: Optional ETag header from the response
             last_modified: Optional Last-Modified header from the response
             ttl_hours: Override the default TTL for this entry
+
+        Returns:
+            The stored entry
         """
         now = datetime.now(UTC)
         ttl = timedelta(hours=ttl_hours) if ttl_hours is not None else self._ttl
         expires_at = now + ttl
+        blob, raw_size, digest = _encode_content(content)
 
         def _do_set():
             conn = self._get_connection()
             conn.execute(
                 """
                 INSERT OR REPLACE INTO metadata_cache
-                (key, content, etag, last_modified, fetched_at, expires_at)
-                VALUES (?, ?, ?, ?, ?, ?)
+                (key, content, etag, last_modified, fetched_at, expires_at, raw_size, stored_size, digest)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
                 (
                     key,
-                    json.dumps(content, ensure_ascii=False),
+                    blob,
                     etag,
                     last_modified,
                     now.isoformat(),
                     expires_at.isoformat(),
+                    raw_size,
+                    len(blob),
+                    digest,
                 ),
             )
             conn.commit()
 
         self._execute_with_retry(_do_set, description="set")
+        # The caller already holds the decoded form of what was just stored
+        with self._decoded_lock:
+            self._decoded[key] = (now.isoformat(), content)
+        return CacheEntry(
+            key=key,
+            content=content,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=now,
+            expires_at=expires_at,
+            digest=digest,
+        )
 
     def refresh_ttl(self, key: str, ttl_hours: int | None = None) -> bool:
         """Refresh the TTL for an existing entry (e.g., after a 304 response).
@@ -323,6 +435,48 @@ class MetadataCacheStore:
 
         return self._execute_with_retry(_do_refresh, description="refresh_ttl")
 
+    def expiring_keys(self, before: datetime) -> list[str]:
+        """Return keys of entries that expire before *before* (including expired ones).
+
+        Args:
+            before: Expiry cutoff
+
+        Returns:
+            Matching cache keys
+        """
+        conn = self._get_connection()
+        cursor = conn.execute(
+            "SELECT key FROM metadata_cache WHERE expires_at < ? ORDER BY expires_at",
+            (before.isoformat(),),
+        )
+        return [row["key"] for row in cursor.fetchall()]
+
+    def last_fetched_at(self, key: str, *, prefix: str | None = None) -> datetime | None:
+        """Return when *key*, or any entry under *prefix*, last received new content.
+
+        ``fetched_at`` is only written when content is stored, not when a
+        304 refreshes the TTL, so this tells whether cached data changed.
+
+        Args:
+            key: Cache key
+            prefix: Optional key prefix whose entries are considered too
+
+        Returns:
+            Latest fetch time, or None when nothing is cached
+        """
+        conn = self._get_connection()
+        if prefix:
+            # Range scan instead of LIKE so the key index is used
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            cursor = conn.execute(
+                "SELECT MAX(fetched_at) FROM metadata_cache WHERE key = ? OR (key >= ? AND key < ?)",
+                (key, prefix, upper),
+            )
+        else:
+            cursor = conn.execute("SELECT MAX(fetched_at) FROM metadata_cache WHERE key = ?", (key,))
+        value = cursor.fetchone()[0]
+        return datetime.fromisoformat(value) if value else None
+
     def delete(self, key: str) -> bool:
         """Delete a specific cache entry.
 
@@ -339,6 +493,7 @@ class MetadataCacheStore:
             conn.commit()
             return cursor.rowcount > 0
 
+        self._forget(key)
         return self._execute_with_retry(_do_delete, description="delete")
 
     def invalidate_by_prefix(self, prefix: str) -> int:
@@ -360,6 +515,7 @@ class MetadataCacheStore:
             conn.commit()
             return cursor.rowcount
 
+        self._forget(prefix=prefix)
         return self._execute_with_retry(_do_invalidate, description="invalidate")
 
     def invalidate_expired(self) -> int:
@@ -394,6 +550,7 @@ class MetadataCacheStore:
             conn.commit()
             return cursor.rowcount
 
+        self._forget()
         return self._execute_with_retry(_do_clear, description="clear")
 
     def get_stats(self) -> dict[str, Any]:
@@ -423,12 +580,27 @@ class MetadataCacheStore:
         cursor = conn.execute("SELECT COUNT(*) FROM metadata_cache WHERE etag IS NOT NULL")
         with_etag = cursor.fetchone()[0]
 
+        cursor = conn.execute("SELECT COALESCE(SUM(raw_size), 0), COALESCE(SUM(stored_size), 0) FROM metadata_cache")
+        raw_bytes, stored_bytes = cursor.fetchone()
+
+        with self._decoded_lock:
+            decode_hits = self._decode_hits
+            decode_misses = self._decode_misses
+            decode_seconds = self._decode_seconds
+            memoized = len(self._decoded)
+
         return {
             "total_entries": total,
             "fresh_entries": fresh,
             "expired_entries": expired,
             "entries_with_etag": with_etag,
             "ttl_hours": self.ttl_hours,
+            "raw_bytes": raw_bytes,
+            "stored_bytes": stored_bytes,
+            "memoized_entries": memoized,
+            "decode_hits": decode_hits,
+            "decode_misses": decode_misses,
+            "decode_seconds": round(decode_seconds, 6),
         }
 
     def close(self) -> None:
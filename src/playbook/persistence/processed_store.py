@@ -14,11 +14,19 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+from ..utils import existing_paths
+from .writer import WriteBehindStore
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from .writer import PersistenceWriter
 
 LOGGER = logging.getLogger(__name__)
 
+# Most source paths looked up with one IN (...) query; larger lookups read the whole table once instead
+_SOURCE_LOOKUP_LIMIT = 500
+
 # Valid status values for processed files
 ProcessingStatus = Literal["linked", "copied", "symlinked", "skipped", "error"]
 
@@ -72,7 +80,7 @@ class ProcessedFileRecord:
     quality_info: str | None = None
 
 
-class ProcessedFileStore:
+class ProcessedFileStore(WriteBehindStore):
     """SQLite-backed store for processed file records.
 
     This store tracks processed files for GUI visualization and allows
@@ -93,15 +101,17 @@ class ProcessedFileStore:
         ))
     """
 
-    SCHEMA_VERSION = 2
+    SCHEMA_VERSION = 3
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, *, writer: PersistenceWriter | None = None) -> None:
         """Initialize the store with the given database path.
 
         Args:
             db_path: Path to the SQLite database file
+            writer: Optional write-behind queue for the hot-path mutations
         """
         self._db_path = db_path
+        self._writer = writer
         self._local = threading.local()
         self._init_db()
 
@@ -114,6 +124,12 @@ class ProcessedFileStore:
         If corrupted WAL/SHM lock files are detected (e.g. after SIGKILL),
         they are removed and the connection is retried once.
         """
+        writer = self._writer
+        if writer is not None:
+            if writer.is_writer_thread():
+                return writer.connection
+            # Read your own queued writes
+            writer.flush()
         if not hasattr(self._local, "connection") or self._local.connection is None:
             self._db_path.parent.mkdir(parents=True, exist_ok=True)
             try:
@@ -235,6 +251,64 @@ class ProcessedFileStore:
                 ON processed_files(destination_path)
             """)
 
+        if from_version < 3:
+            # Schema v3: Row counts per (sport, show, season, status), kept current
+            # by triggers so overview pages never scan processed_files
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS processed_counters (
+                    sport_id TEXT NOT NULL,
+                    show_id TEXT NOT NULL,
+                    season_index INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (sport_id, show_id, season_index, status)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS processed_counters_ai AFTER INSERT ON processed_files BEGIN
+                    INSERT INTO processed_counters (sport_id, show_id, season_index, status, count)
+                    VALUES (new.sport_id, new.show_id, new.season_index, new.status, 1)
+                    ON CONFLICT (sport_id, show_id, season_index, status) DO UPDATE SET count = count + 1;
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS processed_counters_au
+                AFTER UPDATE OF sport_id, show_id, season_index, status ON processed_files
+                WHEN old.sport_id IS NOT new.sport_id OR old.show_id IS NOT new.show_id
+                    OR old.season_index IS NOT new.season_index OR old.status IS NOT new.status BEGIN
+                    UPDATE processed_counters SET count = count - 1
+                    WHERE sport_id = old.sport_id AND show_id = old.show_id
+                        AND season_index = old.season_index AND status = old.status;
+                    DELETE FROM processed_counters
+                    WHERE sport_id = old.sport_id AND show_id = old.show_id
+                        AND season_index = old.season_index AND status = old.status AND count <= 0;
+                    INSERT INTO processed_counters (sport_id, show_id, season_index, status, count)
+                    VALUES (new.sport_id, new.show_id, new.season_index, new.status, 1)
+                    ON CONFLICT (sport_id, show_id, season_index, status) DO UPDATE SET count = count + 1;
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS processed_counters_ad AFTER DELETE ON processed_files BEGIN
+                    UPDATE processed_counters SET count = count - 1
+                    WHERE sport_id = old.sport_id AND show_id = old.show_id
+                        AND season_index = old.season_index AND status = old.status;
+                    DELETE FROM processed_counters
+                    WHERE sport_id = old.sport_id AND show_id = old.show_id
+                        AND season_index = old.season_index AND status = old.status AND count <= 0;
+                END
+            """)
+            conn.execute("DELETE FROM processed_counters")
+            conn.execute("""
+                INSERT INTO processed_counters (sport_id, show_id, season_index, status, count)
+                SELECT sport_id, show_id, season_index, status, COUNT(*)
+                FROM processed_files
+                GROUP BY sport_id, show_id, season_index, status
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_processed_files_sport_recent
+                ON processed_files(sport_id, processed_at)
+            """)
+
         # Update schema version
         conn.execute("DELETE FROM schema_version")
         conn.execute("INSERT INTO schema_version (version) VALUES (?)", (self.SCHEMA_VERSION,))
@@ -254,6 +328,9 @@ class ProcessedFileStore:
         Args:
             record: The processed file record to store
         """
+        self._write(self._record_processed, record)
+
+    def _record_processed(self, record: ProcessedFileRecord) -> None:
         conn = self._get_connection()
         conn.execute(
             """
@@ -290,7 +367,7 @@ class ProcessedFileStore:
                 record.quality_info,
             ),
         )
-        conn.commit()
+        self._commit(conn)
 
     def _row_to_record(self, row: sqlite3.Row) -> ProcessedFileRecord:
         """Convert a database row to a ProcessedFileRecord."""
@@ -356,6 +433,71 @@ class ProcessedFileStore:
 
         return (False, record.destination_path)
 
+    def check_processed_with_destinations(self, source_paths: Sequence[str]) -> dict[str, tuple[bool, str]]:
+        """Bulk variant of check_processed_with_destination.
+
+        Reads the recorded destinations with a single query (an ``IN (...)``
+        lookup for short lists, one pass over the table for long ones) and
+        checks their existence directory by directory instead of one query
+        and one stat per source.
+
+        Args:
+            source_paths: Source file paths to check
+
+        Returns:
+            Mapping of each recorded source path to ``(destination_exists,
+            destination_path)``; sources not in the store are omitted
+        """
+        destinations = self.get_destinations(source_paths)
+        existing = existing_paths(set(destinations.values()))
+        return {source: (destination in existing, destination) for source, destination in destinations.items()}
+
+    def get_destinations(self, source_paths: Sequence[str]) -> dict[str, str]:
+        """Return the recorded destination path for each known source path.
+
+        Args:
+            source_paths: Source file paths to look up
+
+        Returns:
+            Mapping of source path to destination path for recorded sources
+        """
+        if not source_paths:
+            return {}
+        conn = self._get_connection()
+        if len(source_paths) > _SOURCE_LOOKUP_LIMIT:
+            wanted = set(source_paths)
+            cursor = conn.execute("SELECT source_path, destination_path FROM processed_files")
+            return {row[0]: row[1] for row in cursor if row[0] in wanted}
+
+        placeholders = ",".join("?" * len(source_paths))
+        cursor = conn.execute(
+            f"SELECT source_path, destination_path FROM processed_files WHERE source_path IN ({placeholders})",
+            list(source_paths),
+        )
+        return {row[0]: row[1] for row in cursor}
+
+    def get_destination_slice(self, *, after_id: int = 0, limit: int | None = None) -> list[tuple[int, str, str]]:
+        """Return ``(id, source_path, destination_path)`` of non-error records in id order.
+
+        Args:
+            after_id: Only return records with a larger id
+            limit: Maximum number of rows, or None for all
+
+        Returns:
+            Rows ordered by id
+        """
+        conn = self._get_connection()
+        cursor = conn.execute(
+            """
+            SELECT id, source_path, destination_path FROM processed_files
+            WHERE id > ? AND status != 'error'
+            ORDER BY id
+            LIMIT ?
+            """,
+            (after_id, -1 if limit is None else limit),
+        )
+        return [(row[0], row[1], row[2]) for row in cursor]
+
     def get_by_show(self, show_id: str) -> list[ProcessedFileRecord]:
         """Get all records for a show.
 
@@ -458,6 +600,9 @@ class ProcessedFileStore:
         Returns:
             The processed file record, or None if not found
         """
+        return self._read(self._get_by_destination, destination_path)
+
+    def _get_by_destination(self, destination_path: str) -> ProcessedFileRecord | None:
         conn = self._get_connection()
         cursor = conn.execute(
             "SELECT * FROM processed_files WHERE destination_path = ?",
@@ -478,6 +623,9 @@ class ProcessedFileStore:
         Returns:
             The highest active quality score, or None if not found or not set
         """
+        return self._read(self._get_quality_score, destination_path)
+
+    def _get_quality_score(self, destination_path: str) -> int | None:
         conn = self._get_connection()
         cursor = conn.execute(
             "SELECT MAX(quality_score) as quality_score FROM processed_files "
@@ -505,6 +653,9 @@ class ProcessedFileStore:
         Returns:
             True if a record was updated, False otherwise
         """
+        return self._write(self._update_quality, destination_path, quality_score, quality_info, wait=True)
+
+    def _update_quality(self, destination_path: str, quality_score: int | None, quality_info: str | None) -> bool:
         conn = self._get_connection()
         cursor = conn.execute(
             """
@@ -514,7 +665,7 @@ class ProcessedFileStore:
             """,
             (quality_score, quality_info, destination_path),
         )
-        conn.commit()
+        self._commit(conn)
         return cursor.rowcount > 0
 
     def update_status(self, source_path: str, status: str) -> bool:
@@ -565,6 +716,9 @@ class ProcessedFileStore:
     def get_stats(self) -> dict[str, int]:
         """Get statistics about processed files.
 
+        Served from the counters table, so the cost does not grow with the
+        number of records.
+
         Returns:
             Dictionary with counts:
             - total: Total number of records
@@ -573,24 +727,75 @@ class ProcessedFileStore:
         """
         conn = self._get_connection()
 
-        # Total count
-        cursor = conn.execute("SELECT COUNT(*) as count FROM processed_files")
-        total = cursor.fetchone()["count"]
-
         # By status
-        cursor = conn.execute("SELECT status, COUNT(*) as count FROM processed_files GROUP BY status")
+        cursor = conn.execute("SELECT status, SUM(count) as count FROM processed_counters GROUP BY status")
         by_status = {row["status"]: row["count"] for row in cursor}
 
         # By sport
-        cursor = conn.execute("SELECT sport_id, COUNT(*) as count FROM processed_files GROUP BY sport_id")
+        cursor = conn.execute("SELECT sport_id, SUM(count) as count FROM processed_counters GROUP BY sport_id")
         by_sport = {row["sport_id"]: row["count"] for row in cursor}
 
+        total = sum(by_status.values())
+
         return {
             "total": total,
             "by_status": by_status,
             "by_sport": by_sport,
         }
 
+    def count_by_sport(self, sport_ids: Sequence[str] | None = None) -> dict[str, dict[str, int]]:
+        """Count records per sport and status.
+
+        Args:
+            sport_ids: Only count these sports (all sports when None)
+
+        Returns:
+            Dict mapping sport_id to a dict of status -> count
+        """
+        conn = self._get_connection()
+        params: list = []
+        where_clause = "1=1"
+        if sport_ids is not None:
+            if not sport_ids:
+                return {}
+            where_clause = f"sport_id IN ({','.join('?' * len(sport_ids))})"
+            params.extend(sport_ids)
+        cursor = conn.execute(
+            f"""
+            SELECT sport_id, status, SUM(count) as count
+            FROM processed_counters
+            WHERE {where_clause}
+            GROUP BY sport_id, status
+            """,
+            params,
+        )
+        result: dict[str, dict[str, int]] = {}
+        for row in cursor:
+            result.setdefault(row["sport_id"], {})[row["status"]] = row["count"]
+        return result
+
+    def get_recent_by_sports(self, sport_ids: Sequence[str], limit: int = 10) -> list[ProcessedFileRecord]:
+        """Get the most recently processed records of the given sports.
+
+        Args:
+            sport_ids: Sport identifiers to include
+            limit: Maximum number of records to return
+
+        Returns:
+            List of records, most recent first
+        """
+        conn = self._get_connection()
+        records: list[ProcessedFileRecord] = []
+        # One index seek per sport instead of sorting every record of all of them
+        for sport_id in dict.fromkeys(sport_ids):
+            cursor = conn.execute(
+                "SELECT * FROM processed_files WHERE sport_id = ? ORDER BY processed_at DESC LIMIT ?",
+                (sport_id, limit),
+            )
+            records.extend(self._row_to_record(row) for row in cursor)
+        records.sort(key=lambda record: record.processed_at, reverse=True)
+        return records[:limit]
+
     def delete_by_source(self, source_path: str) -> bool:
         """Delete a record by source path.
 
@@ -600,14 +805,34 @@ class ProcessedFileStore:
         Returns:
             True if a record was deleted, False otherwise
         """
+        return self._write(self._delete_by_source, source_path, wait=True)
+
+    def _delete_by_source(self, source_path: str) -> bool:
         conn = self._get_connection()
         cursor = conn.execute(
             "DELETE FROM processed_files WHERE source_path = ?",
             (source_path,),
         )
-        conn.commit()
+        self._commit(conn)
         return cursor.rowcount > 0
 
+    def delete_by_sources(self, source_paths: Iterable[str]) -> int:
+        """Delete the records of several source paths in one transaction.
+
+        Args:
+            source_paths: Source file paths to delete
+
+        Returns:
+            Number of records deleted
+        """
+        conn = self._get_connection()
+        with conn:
+            cursor = conn.executemany(
+                "DELETE FROM processed_files WHERE source_path = ?",
+                ((source_path,) for source_path in source_paths),
+            )
+        return cursor.rowcount
+
     def remove_by_metadata_changes(
         self,
         changes: dict[str, object],
@@ -678,7 +903,9 @@ class ProcessedFileStore:
         conn.commit()
         return cursor.rowcount
 
-    def delete_old_destination_records(self, destination_path: str, keep_source: str) -> int:
+    def delete_old_destination_records(
+        self, destination_path: str, keep_source: str, *, wait: bool = True
+    ) -> int | None:
         """Mark old records for a destination as superseded, keeping only the specified source active.
 
         This should be called when a file is replaced so superseded records remain
@@ -687,16 +914,21 @@ class ProcessedFileStore:
         Args:
             destination_path: The destination file path
             keep_source: The source path to keep (the new replacement file)
+            wait: Commit now and return the count; when False the update is
+                queued with the writer's next group
 
         Returns:
-            Number of old records marked as superseded
+            Number of old records marked as superseded, None when not waited for
         """
+        return self._write(self._delete_old_destination_records, destination_path, keep_source, wait=wait)
+
+    def _delete_old_destination_records(self, destination_path: str, keep_source: str) -> int:
         conn = self._get_connection()
         cursor = conn.execute(
             "UPDATE processed_files SET status = 'superseded' WHERE destination_path = ? AND source_path != ?",
             (destination_path, keep_source),
         )
-        conn.commit()
+        self._commit(conn)
         return cursor.rowcount
 
     def delete_by_show(self, show_id: str) -> int:
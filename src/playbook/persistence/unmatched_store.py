@@ -16,11 +16,18 @@ from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+from .writer import WriteBehindStore
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
+
+    from .writer import PersistenceWriter
 
 LOGGER = logging.getLogger(__name__)
 
+# Most source paths looked up with one IN (...) query; larger lookups read the whole table once instead
+_SOURCE_LOOKUP_LIMIT = 500
+
 # File category types
 FileCategory = Literal["video", "sample", "metadata", "archive", "other"]
 
@@ -123,6 +130,9 @@ class UnmatchedFileRecord:
         matched_episode: Episode index if manually matched
         matched_at: When the file was manually matched
         hidden: Whether the file is hidden from the UI
+        file_mtime_ns: File mtime when matching was last attempted
+        match_key: Fingerprint of the sport configs and metadata the file was
+            matched against; None means the file is matched again next run
     """
 
     source_path: str
@@ -142,9 +152,28 @@ class UnmatchedFileRecord:
     matched_episode: int | None = None
     matched_at: datetime | None = None
     hidden: bool = False
+    file_mtime_ns: int | None = None
+    match_key: str | None = None
+
+
+@dataclass(frozen=True)
+class UnmatchedMatchState:
+    """What an unmatched file looked like when matching it last failed.
 
+    Attributes:
+        file_size: File size in bytes
+        file_mtime_ns: File mtime in nanoseconds
+        match_key: Fingerprint of the sport configs and metadata that were tried
+        attempted_at: When matching was last attempted
+    """
+
+    file_size: int
+    file_mtime_ns: int
+    match_key: str
+    attempted_at: datetime
 
-class UnmatchedFileStore:
+
+class UnmatchedFileStore(WriteBehindStore):
     """SQLite-backed store for unmatched file records.
 
     This store tracks files that failed pattern matching, allowing users to:
@@ -155,15 +184,17 @@ class UnmatchedFileStore:
     The database uses WAL mode for better concurrency in watch mode.
     """
 
-    SCHEMA_VERSION = 1
+    SCHEMA_VERSION = 3
 
-    def __init__(self, db_path: Path) -> None:
+    def __init__(self, db_path: Path, *, writer: PersistenceWriter | None = None) -> None:
         """Initialize the store with the given database path.
 
         Args:
             db_path: Path to the SQLite database file
+            writer: Optional write-behind queue for the hot-path mutations
         """
         self._db_path = db_path
+        self._writer = writer
         self._local = threading.local()
         self._init_db()
 
@@ -173,6 +204,12 @@ class UnmatchedFileStore:
         If corrupted WAL/SHM lock files are detected (e.g. after SIGKILL),
         they are removed and the connection is retried once.
         """
+        writer = self._writer
+        if writer is not None:
+            if writer.is_writer_thread():
+                return writer.connection
+            # Read your own queued writes
+            writer.flush()
         if not hasattr(self._local, "connection") or self._local.connection is None:
             self._db_path.parent.mkdir(parents=True, exist_ok=True)
             try:
@@ -221,6 +258,11 @@ class UnmatchedFileStore:
         if current_version < self.SCHEMA_VERSION:
             self._migrate_schema(current_version)
 
+        self._fts_enabled = (
+            conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'unmatched_files_fts'").fetchone()
+            is not None
+        )
+
     def _migrate_schema(self, from_version: int) -> None:
         """Migrate schema from a previous version."""
         conn = self._get_connection()
@@ -265,10 +307,110 @@ class UnmatchedFileStore:
                 ON unmatched_files(manually_matched)
             """)
 
+        if from_version < 2:
+            # Attempted sports as indexed rows instead of LIKE over the JSON column
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS unmatched_attempted_sports (
+                    sport_id TEXT NOT NULL,
+                    file_id INTEGER NOT NULL,
+                    PRIMARY KEY (sport_id, file_id)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_unmatched_attempted_sports_file
+                ON unmatched_attempted_sports(file_id)
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS unmatched_files_sports_ai AFTER INSERT ON unmatched_files BEGIN
+                    INSERT OR IGNORE INTO unmatched_attempted_sports (sport_id, file_id)
+                    SELECT value, new.id FROM json_each(new.attempted_sports);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS unmatched_files_sports_au
+                AFTER UPDATE OF attempted_sports ON unmatched_files
+                WHEN old.attempted_sports IS NOT new.attempted_sports BEGIN
+                    DELETE FROM unmatched_attempted_sports WHERE file_id = old.id;
+                    INSERT OR IGNORE INTO unmatched_attempted_sports (sport_id, file_id)
+                    SELECT value, new.id FROM json_each(new.attempted_sports);
+                END
+            """)
+            conn.execute("""
+                CREATE TRIGGER IF NOT EXISTS unmatched_files_sports_ad AFTER DELETE ON unmatched_files BEGIN
+                    DELETE FROM unmatched_attempted_sports WHERE file_id = old.id;
+                END
+            """)
+            conn.execute("""
+                INSERT OR IGNORE INTO unmatched_attempted_sports (sport_id, file_id)
+                SELECT value, unmatched_files.id FROM unmatched_files, json_each(unmatched_files.attempted_sports)
+            """)
+            # Covers the default listing (keyset order) and the category counts
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_unmatched_files_visible_recent
+                ON unmatched_files(hidden, manually_matched, last_seen, source_path)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_unmatched_files_visible_category
+                ON unmatched_files(hidden, manually_matched, file_category)
+            """)
+            self._create_search_index(conn)
+
+        if from_version < 3:
+            # Negative-match cache: files unchanged since a failed attempt are not matched again
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(unmatched_files)")}
+            for column, declaration in (
+                ("file_mtime_ns", "INTEGER"),
+                ("match_key", "TEXT"),
+                ("attempted_at", "TIMESTAMP"),
+            ):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE unmatched_files ADD COLUMN {column} {declaration}")
+
         conn.execute("DELETE FROM unmatched_schema_version")
         conn.execute("INSERT INTO unmatched_schema_version (version) VALUES (?)", (self.SCHEMA_VERSION,))
         conn.commit()
 
+    @staticmethod
+    def _create_search_index(conn: sqlite3.Connection) -> None:
+        """Create the trigram full-text index over filenames and failure summaries.
+
+        SQLite builds without FTS5 or the trigram tokenizer (before 3.34) keep
+        working; searches then fall back to a LIKE scan.
+        """
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS unmatched_files_fts USING fts5(
+                    filename, failure_summary,
+                    content='unmatched_files', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as exc:
+            LOGGER.warning("Full-text search unavailable for unmatched files, using LIKE: %s", exc)
+            return
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS unmatched_files_fts_ai AFTER INSERT ON unmatched_files BEGIN
+                INSERT INTO unmatched_files_fts (rowid, filename, failure_summary)
+                VALUES (new.id, new.filename, new.failure_summary);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS unmatched_files_fts_au
+            AFTER UPDATE OF filename, failure_summary ON unmatched_files
+            WHEN old.filename IS NOT new.filename OR old.failure_summary IS NOT new.failure_summary BEGIN
+                INSERT INTO unmatched_files_fts (unmatched_files_fts, rowid, filename, failure_summary)
+                VALUES ('delete', old.id, old.filename, old.failure_summary);
+                INSERT INTO unmatched_files_fts (rowid, filename, failure_summary)
+                VALUES (new.id, new.filename, new.failure_summary);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS unmatched_files_fts_ad AFTER DELETE ON unmatched_files BEGIN
+                INSERT INTO unmatched_files_fts (unmatched_files_fts, rowid, filename, failure_summary)
+                VALUES ('delete', old.id, old.filename, old.failure_summary);
+            END
+        """)
+        conn.execute("INSERT INTO unmatched_files_fts (unmatched_files_fts) VALUES ('rebuild')")
+
     def close(self) -> None:
         """Close the database connection for the current thread."""
         if hasattr(self._local, "connection") and self._local.connection is not None:
@@ -284,6 +426,9 @@ class UnmatchedFileStore:
         Args:
             record: The unmatched file record to store
         """
+        self._write(self._record_unmatched, record)
+
+    def _record_unmatched(self, record: UnmatchedFileRecord) -> None:
         conn = self._get_connection()
 
         # Serialize complex fields
@@ -310,8 +455,9 @@ class UnmatchedFileStore:
                 file_category, attempted_sports, match_attempts,
                 best_match_sport, best_match_score, failure_summary,
                 manually_matched, matched_show_slug, matched_season,
-                matched_episode, matched_at, hidden
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                matched_episode, matched_at, hidden,
+                file_mtime_ns, match_key, attempted_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ON CONFLICT(source_path) DO UPDATE SET
                 last_seen = excluded.last_seen,
                 file_size = excluded.file_size,
@@ -319,7 +465,10 @@ class UnmatchedFileStore:
                 match_attempts = excluded.match_attempts,
                 best_match_sport = excluded.best_match_sport,
                 best_match_score = excluded.best_match_score,
-                failure_summary = excluded.failure_summary
+                failure_summary = excluded.failure_summary,
+                file_mtime_ns = excluded.file_mtime_ns,
+                match_key = excluded.match_key,
+                attempted_at = excluded.attempted_at
             """,
             (
                 record.source_path,
@@ -339,9 +488,12 @@ class UnmatchedFileStore:
                 record.matched_episode,
                 record.matched_at,
                 1 if record.hidden else 0,
+                record.file_mtime_ns,
+                record.match_key,
+                record.last_seen,
             ),
         )
-        conn.commit()
+        self._commit(conn)
 
     def _row_to_record(self, row: sqlite3.Row) -> UnmatchedFileRecord:
         """Convert a database row to an UnmatchedFileRecord."""
@@ -378,6 +530,8 @@ class UnmatchedFileStore:
             matched_episode=row["matched_episode"],
             matched_at=row["matched_at"],
             hidden=bool(row["hidden"]),
+            file_mtime_ns=row["file_mtime_ns"],
+            match_key=row["match_key"],
         )
 
     def get_by_source(self, source_path: str) -> UnmatchedFileRecord | None:
@@ -397,6 +551,45 @@ class UnmatchedFileStore:
         row = cursor.fetchone()
         return self._row_to_record(row) if row else None
 
+    def _filter_clause(
+        self,
+        *,
+        include_hidden: bool,
+        include_manually_matched: bool,
+        categories: list[FileCategory] | None = None,
+        search_query: str | None = None,
+        sport_filter: str | None = None,
+    ) -> tuple[str, list]:
+        """Build the WHERE clause shared by listing and counting."""
+        conditions = []
+        params: list = []
+
+        if not include_hidden:
+            conditions.append("hidden = 0")
+
+        if not include_manually_matched:
+            conditions.append("manually_matched = 0")
+
+        if categories:
+            placeholders = ",".join("?" * len(categories))
+            conditions.append(f"file_category IN ({placeholders})")
+            params.extend(categories)
+
+        if search_query:
+            # Trigrams need at least three characters; shorter queries scan
+            if self._fts_enabled and len(search_query) >= 3:
+                conditions.append("id IN (SELECT rowid FROM unmatched_files_fts WHERE unmatched_files_fts MATCH ?)")
+                params.append('"' + search_query.replace('"', '""') + '"')
+            else:
+                conditions.append("(filename LIKE ? OR failure_summary LIKE ?)")
+                params.extend([f"%{search_query}%"] * 2)
+
+        if sport_filter:
+            conditions.append("id IN (SELECT file_id FROM unmatched_attempted_sports WHERE sport_id = ?)")
+            params.append(sport_filter)
+
+        return (" AND ".join(conditions) if conditions else "1=1"), params
+
     def get_all(
         self,
         *,
@@ -407,52 +600,46 @@ class UnmatchedFileStore:
         sport_filter: str | None = None,
         limit: int = 500,
         offset: int = 0,
+        after: tuple[datetime, str] | None = None,
     ) -> list[UnmatchedFileRecord]:
-        """Get unmatched files with optional filtering.
+        """Get unmatched files with optional filtering, most recently seen first.
+
+        Prefer ``after`` over ``offset`` for paging: it seeks straight to the
+        next page through the index instead of reading and skipping every
+        earlier row.
 
         Args:
             include_hidden: Include hidden files
             include_manually_matched: Include manually matched files
             categories: Filter by file categories
-            search_query: Filter by filename search
+            search_query: Filter by filename or failure summary substring
             sport_filter: Filter by attempted sport
             limit: Maximum number of records to return
             offset: Number of records to skip
+            after: ``(last_seen, source_path)`` of the last record of the
+                previous page; only records after it are returned
 
         Returns:
             List of unmatched file records
         """
         conn = self._get_connection()
-        conditions = []
-        params: list = []
-
-        if not include_hidden:
-            conditions.append("hidden = 0")
-
-        if not include_manually_matched:
-            conditions.append("manually_matched = 0")
-
-        if categories:
-            placeholders = ",".join("?" * len(categories))
-            conditions.append(f"file_category IN ({placeholders})")
-            params.extend(categories)
-
-        if search_query:
-            conditions.append("filename LIKE ?")
-            params.append(f"%{search_query}%")
-
-        if sport_filter:
-            conditions.append("attempted_sports LIKE ?")
-            params.append(f'%"{sport_filter}"%')
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        where_clause, params = self._filter_clause(
+            include_hidden=include_hidden,
+            include_manually_matched=include_manually_matched,
+            categories=categories,
+            search_query=search_query,
+            sport_filter=sport_filter,
+        )
+        if after is not None:
+            where_clause += " AND (last_seen, source_path) < (?, ?)"
+            params.extend(after)
         params.extend([limit, offset])
 
         cursor = conn.execute(
             f"""
             SELECT * FROM unmatched_files
             WHERE {where_clause}
-            ORDER BY last_seen DESC
+            ORDER BY last_seen DESC, source_path DESC
             LIMIT ? OFFSET ?
             """,
             params,
@@ -474,36 +661,20 @@ class UnmatchedFileStore:
             include_hidden: Include hidden files
             include_manually_matched: Include manually matched files
             categories: Filter by file categories
-            search_query: Filter by filename search
+            search_query: Filter by filename or failure summary substring
             sport_filter: Filter by attempted sport
 
         Returns:
             Number of matching records
         """
         conn = self._get_connection()
-        conditions = []
-        params: list = []
-
-        if not include_hidden:
-            conditions.append("hidden = 0")
-
-        if not include_manually_matched:
-            conditions.append("manually_matched = 0")
-
-        if categories:
-            placeholders = ",".join("?" * len(categories))
-            conditions.append(f"file_category IN ({placeholders})")
-            params.extend(categories)
-
-        if search_query:
-            conditions.append("filename LIKE ?")
-            params.append(f"%{search_query}%")
-
-        if sport_filter:
-            conditions.append("attempted_sports LIKE ?")
-            params.append(f'%"{sport_filter}"%')
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        where_clause, params = self._filter_clause(
+            include_hidden=include_hidden,
+            include_manually_matched=include_manually_matched,
+            categories=categories,
+            search_query=search_query,
+            sport_filter=sport_filter,
+        )
 
         cursor = conn.execute(
             f"SELECT COUNT(*) as count FROM unmatched_files WHERE {where_clause}",
@@ -527,15 +698,10 @@ class UnmatchedFileStore:
             Dictionary mapping category to count
         """
         conn = self._get_connection()
-        conditions = []
-
-        if not include_hidden:
-            conditions.append("hidden = 0")
-
-        if not include_manually_matched:
-            conditions.append("manually_matched = 0")
-
-        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        where_clause, params = self._filter_clause(
+            include_hidden=include_hidden,
+            include_manually_matched=include_manually_matched,
+        )
 
         cursor = conn.execute(
             f"""
@@ -543,7 +709,8 @@ class UnmatchedFileStore:
             FROM unmatched_files
             WHERE {where_clause}
             GROUP BY file_category
-            """
+            """,
+            params,
         )
         return {row["file_category"]: row["count"] for row in cursor}
 
@@ -615,23 +782,96 @@ class UnmatchedFileStore:
         conn.commit()
         return cursor.rowcount > 0
 
-    def delete_by_source(self, source_path: str) -> bool:
+    def delete_by_source(self, source_path: str, *, wait: bool = True) -> bool | None:
         """Delete a record by source path.
 
         Args:
             source_path: The source file path to delete
+            wait: Commit now and report whether a record was deleted; when
+                False the delete is queued with the writer's next group
 
         Returns:
-            True if a record was deleted, False otherwise
+            True if a record was deleted, False otherwise, None when not waited for
         """
+        return self._write(self._delete_by_source, source_path, wait=wait)
+
+    def _delete_by_source(self, source_path: str) -> bool:
         conn = self._get_connection()
         cursor = conn.execute(
             "DELETE FROM unmatched_files WHERE source_path = ?",
             (source_path,),
         )
-        conn.commit()
+        self._commit(conn)
         return cursor.rowcount > 0
 
+    def get_match_states(self, source_paths: Sequence[str]) -> dict[str, UnmatchedMatchState]:
+        """Return the negative-match cache entries of the given source paths.
+
+        Manually matched files and files whose entry was cleared are omitted.
+
+        Args:
+            source_paths: Source file paths to look up
+
+        Returns:
+            Mapping of source path to the state of its last failed attempt
+        """
+        if not source_paths:
+            return {}
+        conn = self._get_connection()
+        query = """
+            SELECT source_path, file_size, file_mtime_ns, match_key, attempted_at
+            FROM unmatched_files
+            WHERE match_key IS NOT NULL AND file_mtime_ns IS NOT NULL AND manually_matched = 0
+        """
+        if len(source_paths) > _SOURCE_LOOKUP_LIMIT:
+            wanted = set(source_paths)
+            rows = [row for row in conn.execute(query) if row[0] in wanted]
+        else:
+            placeholders = ",".join("?" * len(source_paths))
+            rows = conn.execute(f"{query} AND source_path IN ({placeholders})", list(source_paths)).fetchall()
+        return {
+            row[0]: UnmatchedMatchState(
+                file_size=row[1],
+                file_mtime_ns=row[2],
+                match_key=row[3],
+                attempted_at=row[4] or datetime.min,
+            )
+            for row in rows
+        }
+
+    def touch(self, source_paths: Sequence[str], seen_at: datetime) -> None:
+        """Update last_seen of records whose files were seen but not matched again.
+
+        Args:
+            source_paths: Source file paths seen during the scan
+            seen_at: Time of the scan
+        """
+        if source_paths:
+            self._write(self._touch, list(source_paths), seen_at)
+
+    def _touch(self, source_paths: list[str], seen_at: datetime) -> None:
+        conn = self._get_connection()
+        conn.executemany(
+            "UPDATE unmatched_files SET last_seen = ? WHERE source_path = ?",
+            [(seen_at, source_path) for source_path in source_paths],
+        )
+        self._commit(conn)
+
+    def clear_match_keys(self) -> int:
+        """Clear the negative-match cache so every unmatched file is matched again.
+
+        Returns:
+            Number of records updated
+        """
+        result = self._write(self._clear_match_keys, wait=True)
+        return result or 0
+
+    def _clear_match_keys(self) -> int:
+        conn = self._get_connection()
+        cursor = conn.execute("UPDATE unmatched_files SET match_key = NULL WHERE match_key IS NOT NULL")
+        self._commit(conn)
+        return cursor.rowcount
+
     def delete_stale(self, older_than: datetime) -> int:
         """Delete records not seen since the given time.
 
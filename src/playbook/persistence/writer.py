@@ -0,0 +1,301 @@
+"""Write-behind queue with group commit for the SQLite stores.
+
+Committing every mutation on its own costs one fsync per call, several per
+processed file. A PersistenceWriter runs the mutations of the stores attached
+to it on a single background connection and commits them in groups.
+
+Durability contract: a mutation is committed at the latest ``max_delay``
+seconds after it was submitted, after ``max_batch`` mutations, on
+``flush()``, on ``close()`` and at interpreter exit. A crash before that
+loses only the uncommitted group; those files are simply processed again on
+the next run. A commit that fails is rolled back and loses the whole group
+as well: callers waiting on a mutation get the error, fire-and-forget
+mutations are only reported in the log.
+
+Reads stay consistent: per-file lookups of the processing loop run on the
+writer connection with :meth:`PersistenceWriter.read`, which sees queued
+mutations before they are committed. Every other query flushes the writer
+first, so the GUI also reads the processing loop's writes.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import queue
+import sqlite3
+import threading
+import time
+import weakref
+from collections.abc import Callable
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, TypeVar
+
+LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+DEFAULT_MAX_BATCH = 256
+DEFAULT_MAX_DELAY = 0.5
+# Seconds without work after which the writer thread exits (restarted on demand)
+_IDLE_EXIT_SECONDS = 30.0
+
+_STOP = object()
+_WRITERS: weakref.WeakSet[PersistenceWriter] = weakref.WeakSet()
+
+
+class _Flush:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class _Read:
+    def __init__(self, func: Callable[..., Any], args: tuple[Any, ...]) -> None:
+        self.func = func
+        self.args = args
+        self.future: Future[Any] = Future()
+
+
+class PersistenceWriter:
+    """Background writer committing queued store mutations in groups."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_delay: float = DEFAULT_MAX_DELAY,
+    ) -> None:
+        """Initialize the writer (its thread starts with the first mutation).
+
+        Args:
+            db_path: SQLite database shared by the attached stores
+            max_batch: Mutations per transaction before a commit is forced
+            max_delay: Seconds a mutation may wait for its commit
+        """
+        self.db_path = db_path
+        self._max_batch = max(1, max_batch)
+        self._max_delay = max_delay
+        self._queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._connection: sqlite3.Connection | None = None
+        self._submitted = 0
+        # Submitted mutations whose group was committed or rolled back
+        self._settled = 0
+        self._closed = False
+        self.writes = 0
+        self.commits = 0
+        self.lost = 0
+        _WRITERS.add(self)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """Connection of the writer thread; only valid on that thread."""
+        if self._connection is None or not self.is_writer_thread():
+            raise RuntimeError("The writer connection is only available on the writer thread")
+        return self._connection
+
+    def is_writer_thread(self) -> bool:
+        return self._thread is threading.current_thread()
+
+    def submit(self, func: Callable[..., _T], *args: Any) -> Future[_T]:
+        """Queue *func(*args)* to run on the writer connection.
+
+        The returned future resolves once the mutation's group is committed,
+        or fails if the mutation or the commit failed.
+
+        Raises:
+            RuntimeError: If the writer is closed
+        """
+        future: Future[_T] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PersistenceWriter is closed")
+            self._submitted += 1
+            self._queue.put((func, args, future))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="playbook-db-writer", daemon=True)
+                self._thread.start()
+        return future
+
+    def read(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run the query *func(*args)* on the writer connection and return its result.
+
+        The writer connection sees queued mutations before they are committed,
+        so this reads your own writes without forcing a commit.
+
+        Raises:
+            RuntimeError: If the writer is closed
+        """
+        item = _Read(func, args)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("PersistenceWriter is closed")
+            self._queue.put(item)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="playbook-db-writer", daemon=True)
+                self._thread.start()
+        return item.future.result()
+
+    def flush(self) -> None:
+        """Block until every mutation submitted so far is committed."""
+        with self._lock:
+            if self._submitted == self._settled or self._thread is None:
+                return
+            marker = _Flush()
+            self._queue.put(marker)
+        marker.done.wait()
+
+    def close(self) -> None:
+        """Commit pending mutations and stop the writer thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(_STOP)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _run(self) -> None:
+        self._connection = _connect(self.db_path)
+        # (future, result) of the mutations in the open transaction
+        pending: list[tuple[Future[Any], Any]] = []
+        first_pending_at = 0.0
+        try:
+            while True:
+                timeout = _IDLE_EXIT_SECONDS if not pending else first_pending_at + self._max_delay - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=max(0.0, timeout))
+                except queue.Empty:
+                    if pending:
+                        pending = self._commit(pending)
+                        continue
+                    with self._lock:
+                        if self._queue.empty():
+                            # Idle: let the thread go; submit() starts a new one
+                            self._thread = None
+                            return
+                    continue
+
+                if item is _STOP:
+                    self._commit(pending)
+                    return
+                if isinstance(item, _Flush):
+                    pending = self._commit(pending)
+                    item.done.set()
+                    continue
+                if isinstance(item, _Read):
+                    try:
+                        item.future.set_result(item.func(*item.args))
+                    except Exception as exc:
+                        item.future.set_exception(exc)
+                    continue
+
+                func, args, future = item
+                if not pending:
+                    first_pending_at = time.monotonic()
+                result = None
+                if future.set_running_or_notify_cancel():
+                    try:
+                        result = func(*args)
+                    except Exception as exc:
+                        future.set_exception(exc)
+                pending.append((future, result))
+                self.writes += 1
+                if len(pending) >= self._max_batch:
+                    pending = self._commit(pending)
+        finally:
+            self._connection.close()
+            self._connection = None
+
+    def _commit(self, pending: list[tuple[Future[Any], Any]]) -> list[tuple[Future[Any], Any]]:
+        """Commit the open transaction, then resolve the futures of its mutations."""
+        if pending:
+            try:
+                self._connection.commit()
+            except sqlite3.Error as exc:
+                LOGGER.error("Failed to commit %d queued database write(s): %s", len(pending), exc)
+                self._connection.rollback()
+                self.lost += len(pending)
+                for future, _ in pending:
+                    if not future.done():
+                        future.set_exception(exc)
+            else:
+                self.commits += 1
+                for future, result in pending:
+                    if not future.done():
+                        future.set_result(result)
+        with self._lock:
+            self._settled += len(pending)
+        return []
+
+
+class WriteBehindStore:
+    """Mixin routing a store's mutations and hot reads through its writer.
+
+    Stores set ``self._writer`` (or None to write inline) and run mutations
+    with :meth:`_write`, which use :meth:`_commit` instead of committing
+    themselves.
+    """
+
+    _writer: PersistenceWriter | None
+
+    def _write(self, func: Callable[..., _T], *args: Any, wait: bool = False) -> _T | None:
+        """Run a mutation, through the attached writer when there is one.
+
+        Without a writer, or when already on the writer thread, *func* runs
+        inline. Otherwise it is queued; with ``wait`` the call commits the
+        queue and returns the mutation's result, raising if it was lost.
+        """
+        writer = self._writer
+        if writer is None or writer.closed or writer.is_writer_thread():
+            return func(*args)
+        future = writer.submit(func, *args)
+        if wait:
+            writer.flush()
+            return future.result()
+        future.add_done_callback(_log_write_failure)
+        return None
+
+    def _read(self, func: Callable[..., _T], *args: Any) -> _T:
+        """Run a per-file query without committing the writer's queue first.
+
+        The query runs on the writer connection, which already sees the
+        queued mutations. Other reads flush the writer instead.
+        """
+        writer = self._writer
+        if writer is None or writer.closed or writer.is_writer_thread():
+            return func(*args)
+        return writer.read(func, *args)
+
+    def _commit(self, conn: sqlite3.Connection) -> None:
+        """Commit unless the writer thread commits the mutation with its group."""
+        if self._writer is None or not self._writer.is_writer_thread():
+            conn.commit()
+
+
+def _log_write_failure(future: Future[Any]) -> None:
+    exc = future.exception()
+    if exc is not None:
+        LOGGER.error("Queued database write failed: %s", exc)
+
+
+def _connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=10, detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+@atexit.register
+def _close_writers() -> None:  # pragma: no cover - runs at interpreter exit
+    for writer in list(_WRITERS):
+        writer.close()
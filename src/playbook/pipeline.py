@@ -0,0 +1,99 @@
+"""Building blocks for the parallel per-file processing pipeline.
+
+The processor splits each run into three stages: discovery produces the
+ordered list of candidate files, a pool of match workers resolves each file
+against the configured sports, and a single writer stage applies the results
+(linking, persistence, notifications) in discovery order. Matching only reads
+shared metadata, so it can safely run concurrently; every side effect stays on
+the writer so the outcome of a run is identical to a sequential one.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Any
+
+from .models import ProcessingStats, SportFileMatch
+from .persistence import ManualOverride, MatchAttempt
+
+# Number of in-flight files per worker. Bounds memory on very large libraries
+# while keeping workers busy when the writer briefly stalls on I/O.
+PREFETCH_PER_WORKER = 4
+
+
+@dataclass
+class FileMatchOutcome:
+    """Result of the match stage for a single source file.
+
+    Attributes:
+        source_path: File that was examined
+        excluded: True when include/ignore patterns rejected the file
+        is_sample_file: True when the file was identified as a sample
+        override: Manual override to apply instead of pattern matching
+        match: Resolved match, or None when nothing matched
+        captured_groups: Regex groups captured for the match
+        trace_context: Trace record for the matching attempt, if any
+        diagnostics: (severity, message, sport_id) tuples for unmatched files
+        match_attempts: Detailed attempt records for unmatched file tracking
+        stats: Counters recorded while matching, merged by the writer stage
+    """
+
+    source_path: Path
+    excluded: bool = False
+    is_sample_file: bool = False
+    override: ManualOverride | None = None
+    match: SportFileMatch | None = None
+    captured_groups: dict[str, str] = field(default_factory=dict)
+    trace_context: dict[str, Any] | None = None
+    diagnostics: list[tuple[str, str, str | None]] = field(default_factory=list)
+    match_attempts: list[MatchAttempt] = field(default_factory=list)
+    stats: ProcessingStats = field(default_factory=ProcessingStats)
+
+
+def iter_in_order[T, R](
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    workers: int = 1,
+    thread_name_prefix: str = "playbook-worker",
+) -> Iterator[R]:
+    """Apply *func* to each item, yielding results in input order.
+
+    With ``workers <= 1`` the items are processed lazily on the calling
+    thread. Otherwise a bounded window of items is submitted to a thread pool
+    and results are yielded as soon as the next one in order is ready.
+    Closing the iterator early cancels any work that has not started yet.
+
+    Args:
+        func: Function to apply to each item
+        items: Items to process
+        workers: Number of worker threads
+        thread_name_prefix: Prefix for worker thread names
+
+    Yields:
+        ``func(item)`` for each item, in the order of *items*
+    """
+    if workers <= 1:
+        for item in items:
+            yield func(item)
+        return
+
+    iterator = iter(items)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as executor:
+        pending: deque[Future[R]] = deque(
+            executor.submit(func, item) for item in islice(iterator, workers * PREFETCH_PER_WORKER)
+        )
+        try:
+            while pending:
+                result = pending.popleft().result()
+                for item in islice(iterator, 1):
+                    pending.append(executor.submit(func, item))
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
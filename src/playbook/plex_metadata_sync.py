@@ -31,6 +31,7 @@ from typing import Any
 from urllib.parse import urljoin
 
 from .config import AppConfig, SportConfig
+from .http_clients import get_http_clients
 from .metadata import (
     MetadataChangeResult,
     MetadataFingerprintStore,
@@ -607,6 +608,7 @@ class PlexMetadataSync:
                 self.plex_url,
                 self.plex_token,
                 timeout=self.timeout,
+                session=get_http_clients().session("plex_metadata_sync", retry=True),
                 rate_limit_delay=self.rate_limit_delay,
             )
         return self._client
@@ -39,6 +39,7 @@ class ProcessingState:
         stale_records: Map of source key to stale processed file record
         plex_sync_stats: Statistics from Plex sync (if run)
         previous_summary: Previous summary counts for deduplication
+        unmatched_match_key: Match key stored with files that fail to match this run
     """
 
     # Trigger state
@@ -62,6 +63,7 @@ class ProcessingState:
     # Results
     plex_sync_stats: PlexSyncStats | None = None
     previous_summary: tuple[int, int, int] | None = None
+    unmatched_match_key: str | None = None
 
     def reset(self) -> None:
         """Reset state for a new processing run.
@@ -80,4 +82,5 @@ class ProcessingState:
         self.stale_destinations.clear()
         self.stale_records.clear()
         self.plex_sync_stats = None
+        self.unmatched_match_key = None
         # Note: previous_summary intentionally NOT reset (deduplication)
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import dataclasses
+import hashlib
+import json
 import logging
+import os
 import shutil
 import time
 from collections.abc import Iterable, Mapping
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
@@ -12,30 +16,33 @@ from rich.progress import Progress
 
 from .config import AppConfig
 from .destination_builder import build_destination, build_match_context, format_relative_destination
+from .dispatch import DISPATCH_GLOB_EXCLUDED, DISPATCH_PREFILTERED, SportDispatchIndex
 from .file_discovery import (
+    collect_changed_source_files,
     gather_source_files,
-    matches_globs,
-    matches_include_ignore_patterns,
     should_suppress_sample_ignored,
 )
+from .globs import PathFilter
 from .kometa_trigger import build_kometa_trigger
-from .logging_utils import render_fields_block
+from .logging_utils import LazyFieldsBlock
 from .match_handler import handle_match
-from .matcher import PatternRuntime, match_file_to_episode
+from .matcher import PatternRuntime, TeamAliasLookupCache, match_file_to_episode
 from .metadata import MetadataFingerprintStore
-from .metadata_loader import DynamicMetadataLoader, SportRuntime, load_sports
+from .metadata_loader import DynamicMetadataLoader, SportRuntime, SportRuntimeRegistry, load_sports
 from .models import ProcessingStats, SportFileMatch
 from .notifications import NotificationEvent, NotificationService
 from .persistence import (
+    DirectoryListingStore,
     ManualOverrideStore,
     MatchAttempt,
+    PersistenceWriter,
     ProcessedFileRecord,
     ProcessedFileStore,
     UnmatchedFileRecord,
     UnmatchedFileStore,
     classify_file_category,
-    get_file_size_safe,
 )
+from .pipeline import FileMatchOutcome, iter_in_order
 from .plex_metadata_sync import PlexMetadataSync, create_plex_sync_from_config
 from .post_run_triggers import run_plex_sync_if_needed, trigger_kometa_if_needed
 from .processing_state import ProcessingState
@@ -45,6 +52,7 @@ from .run_summary import (
 )
 from .trace_writer import TraceOptions, persist_trace
 from .utils import ensure_directory
+from .version import __version__
 
 LOGGER = logging.getLogger(__name__)
 
@@ -73,9 +81,22 @@ class Processor:
             main_db_path=main_db_path,
             manual_override_db_path=manual_override_db_path,
         )
-        self.processed_store = ProcessedFileStore(main_db_path)
-        self.unmatched_store = UnmatchedFileStore(main_db_path)
+        processing = self.config.settings.processing
+        # Hot-path writes of both stores are grouped into shared transactions
+        self._db_writer = (
+            PersistenceWriter(main_db_path, max_batch=processing.write_batch, max_delay=processing.write_delay)
+            if processing.write_batch > 0
+            else None
+        )
+        self.processed_store = ProcessedFileStore(main_db_path, writer=self._db_writer)
+        self.unmatched_store = UnmatchedFileStore(main_db_path, writer=self._db_writer)
         self.manual_override_store = ManualOverrideStore(manual_override_db_path)
+        # Listings of unchanged source directories are reused by the next full scan
+        self.directory_listing_store = (
+            DirectoryListingStore(main_db_path)
+            if processing.discovery_cache and not self.config.settings.dry_run
+            else None
+        )
         self._migrate_legacy_manual_overrides(legacy_main_db_path)
         self.trace_options = trace_options or TraceOptions()
         settings = self.config.settings
@@ -93,9 +114,16 @@ class Processor:
         self._dynamic_loader = DynamicMetadataLoader(
             settings, settings.cache_dir, metadata_fingerprints=self.metadata_fingerprints
         )
+        # Static sport runtimes kept across runs, revalidated once the metadata TTL passes
+        self._runtime_registry = SportRuntimeRegistry(settings)
 
         # Mutable processing state (reset between runs)
         self._state = ProcessingState()
+        # Team alias lookups per sport, carried over to each run's fresh runtimes
+        self._team_alias_caches: dict[str, TeamAliasLookupCache] = {}
+        self._dispatch: SportDispatchIndex | None = None
+        # Where the next reconciliation slice starts (processed record id)
+        self._reconcile_cursor = 0
         self._enable_notifications = enable_notifications
         self._cancel_requested = False
 
@@ -112,7 +140,8 @@ class Processor:
         settings = new_config.settings
         state_dir = self._resolve_state_dir(new_config)
 
-        # Rebuild notification service with new settings
+        # Rebuild notification service with new settings; the old one hands over its spills
+        self.notification_service.close(timeout=settings.notifications.drain_timeout)
         self.notification_service = NotificationService(
             settings.notifications,
             cache_dir=state_dir,
@@ -124,6 +153,9 @@ class Processor:
         # Rebuild other configurable services
         self._kometa_trigger = build_kometa_trigger(settings.kometa_trigger)
         self._plex_sync = create_plex_sync_from_config(new_config)
+        # Sport definitions may have changed; the next run reloads them
+        self._runtime_registry.close()
+        self._runtime_registry = SportRuntimeRegistry(settings)
 
         LOGGER.info("Reloaded processor services after configuration change")
 
@@ -217,12 +249,12 @@ class Processor:
         self._state.kometa_trigger_needed = value
 
     @staticmethod
-    def _format_log(event: str, fields: Mapping[str, object] | None = None) -> str:
-        return render_fields_block(event, fields or {}, pad_top=True)
+    def _format_log(event: str, fields: Mapping[str, object] | None = None) -> LazyFieldsBlock:
+        return LazyFieldsBlock(event, fields or {}, pad_top=True)
 
     @staticmethod
-    def _format_inline_log(event: str, fields: Mapping[str, object] | None = None) -> str:
-        return render_fields_block(event, fields or {}, pad_top=False)
+    def _format_inline_log(event: str, fields: Mapping[str, object] | None = None) -> LazyFieldsBlock:
+        return LazyFieldsBlock(event, fields or {}, pad_top=False)
 
     def _load_sports(self) -> list[SportRuntime]:
         """Load sports metadata in parallel and track changes.
@@ -237,18 +269,23 @@ class Processor:
             sports=self.config.sports,
             settings=self.config.settings,
             metadata_fingerprints=self.metadata_fingerprints,
+            registry=self._runtime_registry,
         )
 
         # Unpack results into processing state
         self._state.metadata_changed_sports = result.changed_sports
         self._state.metadata_change_map = result.change_map
         self._state.metadata_fetch_stats = result.fetch_stats
+        for runtime in result.runtimes:
+            runtime.team_alias_cache = self._team_alias_caches.setdefault(runtime.sport.id, runtime.team_alias_cache)
+        self._dispatch = SportDispatchIndex(result.runtimes)
 
         return result.runtimes
 
     def clear_metadata_cache(self) -> None:
         """Clear the TVSportsDB metadata cache (both in-memory and SQLite)."""
         self._dynamic_loader.invalidate_cache()
+        self._runtime_registry.clear()
         LOGGER.info(self._format_log("Metadata Cache Cleared", {}))
 
     def clear_processed_cache(self) -> None:
@@ -269,6 +306,15 @@ class Processor:
             )
         )
 
+    def retry_unmatched(self) -> None:
+        """Forget failed match attempts so the next run matches every unmatched file again."""
+        if self.config.settings.dry_run:
+            LOGGER.debug(self._format_log("Dry-Run: Skipping Unmatched Retry Reset", {}))
+            return
+
+        cleared = self.unmatched_store.clear_match_keys()
+        LOGGER.info(self._format_log("Unmatched Files Queued For Retry", {"Records": cleared}))
+
     def clear_manual_overrides(self) -> None:
         """Clear all persisted manual overrides and GUI manual-match markers."""
         if self.config.settings.dry_run:
@@ -345,7 +391,10 @@ class Processor:
             )
 
     def process_all(self) -> ProcessingStats:
-        # Reset state and cancellation flag for new run
+        return self._process_everything(self._start_run())
+
+    def _start_run(self) -> list[SportRuntime]:
+        """Reset the run state and load sports, detecting metadata changes."""
         self._state.reset()
         self.reset_cancel()
         # Clear failed slug cache so newly-added metadata on TVSportsDB is discovered
@@ -361,7 +410,10 @@ class Processor:
                 self._state.metadata_change_map[sport_id] = change
                 sport_name = next((s.name for s in dynamic_sports if s.id == sport_id), sport_id)
                 self._state.metadata_changed_sports.append((sport_id, sport_name))
+        return runtimes
 
+    def _process_everything(self, runtimes: list[SportRuntime]) -> ProcessingStats:
+        """Scan the whole source tree with *runtimes* loaded by :meth:`_start_run`."""
         if self._state.metadata_changed_sports:
             labels = ", ".join(
                 f"{sport_id} ({sport_name})" if sport_name and sport_name != sport_id else sport_id
@@ -388,58 +440,250 @@ class Processor:
         # Layer 1: Reconcile stale DB records (destination deleted from disk)
         from .reconciliation import reconcile_stale_records
 
-        stale_count = reconcile_stale_records(self.processed_store)
-        if stale_count:
-            stats.extra["reconciled_stale"] = stale_count
+        reconciled = reconcile_stale_records(
+            self.processed_store,
+            budget=self.config.settings.processing.reconcile_budget,
+            cursor=self._reconcile_cursor,
+        )
+        self._reconcile_cursor = reconciled.next_cursor
+        stats.reconcile_checked = reconciled.checked
+        stats.reconcile_removed = reconciled.removed
 
         try:
             all_source_files = list(self._gather_source_files(stats))
-            filtered_source_files: list[Path] = []
-            skipped_by_db = 0
-            reprocess_missing_dest = 0
-
-            for source_path in all_source_files:
-                # Database check (unless force_reprocess)
-                if not self.config.settings.force_reprocess:
-                    is_processed, dest_path = self.processed_store.check_processed_with_destination(str(source_path))
-                    if is_processed:
-                        skipped_by_db += 1
-                        LOGGER.debug(
-                            self._format_log(
-                                "Skipping Via Database",
-                                {"Source": source_path, "Destination": dest_path},
-                            )
-                        )
-                        continue
-                    elif dest_path is not None:
-                        # Destination missing - clean up stale record and re-process
-                        reprocess_missing_dest += 1
-                        self.processed_store.delete_by_source(str(source_path))
-                        LOGGER.info(
-                            self._format_log(
-                                "Re-processing (destination missing)",
-                                {"Source": source_path, "Expected": dest_path},
-                            )
-                        )
+            filtered_source_files = self._filter_unprocessed(all_source_files)
+            filtered_source_files = self._skip_known_unmatched(filtered_source_files, runtimes, stats)
+            self._process_files(filtered_source_files, runtimes, stats)
 
-                filtered_source_files.append(source_path)
+            # Prune unmatched records for files that no longer exist on disk.
+            # Any record whose last_seen was not updated during this scan refers
+            # to a file that was renamed, moved, or deleted since the last run.
+            if not self.config.settings.dry_run and not stats.cancelled:
+                pruned = self.unmatched_store.delete_stale(scan_started_at)
+                if pruned:
+                    LOGGER.info(
+                        self._format_log("Unmatched Cleanup", {"Pruned Stale Records": pruned}),
+                    )
 
-            file_count = len(filtered_source_files)
-            if LOGGER.isEnabledFor(logging.DEBUG):
+            self._finish_run(stats, run_started)
+            return stats
+        finally:
+            self._flush_writes()
+            if not self.config.settings.dry_run:
+                self.metadata_fingerprints.save()
+
+    def process_paths(self, paths: Iterable[Path]) -> ProcessingStats:
+        """Process only the given source paths instead of rescanning ``source_dir``.
+
+        Used by the filesystem watcher for incremental runs. Directories are
+        expanded to the files they contain, missing paths and paths outside
+        ``source_dir`` are dropped. Sports are reloaded like in ``process_all``,
+        which is cheap while the runtime registry's entries are fresh, so newly
+        published metadata is used right away. Library-wide maintenance (stale
+        record reconciliation, unmatched pruning) is left to the periodic full
+        scan; when the reload detects changed metadata the run becomes a full
+        scan so the invalidated records are re-processed together.
+
+        Args:
+            paths: Changed file or directory paths reported by the watcher
+
+        Returns:
+            ProcessingStats for the files that were examined
+        """
+        runtimes = self._start_run()
+        if self._state.metadata_changed_sports:
+            LOGGER.debug("Metadata changed since the last run; scanning the whole source tree.")
+            return self._process_everything(runtimes)
+        stats = ProcessingStats()
+        run_started = time.perf_counter()
+
+        try:
+            changed_files = collect_changed_source_files(paths, self.config.settings.source_dir)
+            filtered_source_files = self._filter_unprocessed(changed_files)
+            filtered_source_files = self._skip_known_unmatched(filtered_source_files, runtimes, stats)
+            self._process_files(filtered_source_files, runtimes, stats)
+            self._finish_run(stats, run_started)
+            return stats
+        finally:
+            self._flush_writes()
+            if not self.config.settings.dry_run:
+                self.metadata_fingerprints.save()
+
+    def _flush_writes(self) -> None:
+        """Commit the database writes queued during the run."""
+        if self._db_writer is None:
+            return
+        self._db_writer.flush()
+        LOGGER.debug(
+            self._format_log(
+                "Database Writes",
+                {"Writes": self._db_writer.writes, "Commits": self._db_writer.commits},
+            )
+        )
+
+    def close(self) -> None:
+        """Commit pending database writes, deliver queued notifications and stop the background workers.
+
+        Closing the metadata registry and the dynamic loader stops their
+        TVSportsDB clients, including the cache refresher threads and the
+        season fetch pools.
+        """
+        if self._db_writer is not None:
+            self._db_writer.close()
+        self.notification_service.close(timeout=self.config.settings.notifications.drain_timeout)
+        self._runtime_registry.close()
+        self._dynamic_loader.close()
+
+    def _filter_unprocessed(self, source_files: list[Path]) -> list[Path]:
+        """Drop files already recorded in the processed store with a live destination.
+
+        Records whose destination disappeared are deleted so the source is
+        processed again.
+        """
+        if self.config.settings.force_reprocess:
+            return list(source_files)
+
+        filtered_source_files: list[Path] = []
+        skipped_by_db = 0
+        stale_sources: list[str] = []
+
+        source_keys = [str(source_path) for source_path in source_files]
+        recorded = self.processed_store.check_processed_with_destinations(source_keys)
+        for source_path, source_key in zip(source_files, source_keys, strict=True):
+            is_processed, dest_path = recorded.get(source_key, (False, None))
+            if is_processed:
+                skipped_by_db += 1
                 LOGGER.debug(
                     self._format_log(
-                        "Discovered Candidate Files",
-                        {
-                            "Total": len(all_source_files),
-                            "Skipped (Already Processed)": skipped_by_db,
-                            "Re-processing (Missing Dest)": reprocess_missing_dest,
-                        },
+                        "Skipping Via Database",
+                        {"Source": source_path, "Destination": dest_path},
+                    )
+                )
+                continue
+            elif dest_path is not None:
+                # Destination missing - clean up stale record and re-process
+                stale_sources.append(source_key)
+                LOGGER.info(
+                    self._format_log(
+                        "Re-processing (destination missing)",
+                        {"Source": source_path, "Expected": dest_path},
                     )
                 )
 
-            with Progress(disable=not LOGGER.isEnabledFor(logging.INFO)) as progress:
-                task_id = progress.add_task("Processing", total=file_count)
-                for source_path in filtered_source_files:
+            filtered_source_files.append(source_path)
+
+        if stale_sources:
+            self.processed_store.delete_by_sources(stale_sources)
+        reprocess_missing_dest = len(stale_sources)
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                self._format_log(
+                    "Discovered Candidate Files",
+                    {
+                        "Total": len(source_files),
+                        "Skipped (Already Processed)": skipped_by_db,
+                        "Re-processing (Missing Dest)": reprocess_missing_dest,
+                    },
+                )
+            )
+        return filtered_source_files
+
+    def _unmatched_match_key(self, runtimes: list[SportRuntime]) -> str:
+        """Fingerprint the sport configs and metadata a file is matched against.
+
+        Unmatched files are only matched again once this changes (or their
+        size/mtime does). Dynamic sports have no show until a file names a
+        year, so the stored fingerprints of their resolved slugs stand in.
+        """
+        digest = hashlib.sha256(__version__.encode("utf-8"))
+        for runtime in sorted(runtimes, key=lambda item: item.sport.id):
+            sport = runtime.sport
+            digest.update(json.dumps(dataclasses.asdict(sport), sort_keys=True, default=str).encode("utf-8"))
+            digest.update((runtime.show_fingerprint or "").encode("utf-8"))
+            if runtime.is_dynamic and sport.show_slug_template:
+                prefix = sport.show_slug_template.split("{")[0]
+                for slug in self.metadata_fingerprints.keys_with_prefix(prefix) if prefix else []:
+                    fingerprint = self.metadata_fingerprints.get(slug)
+                    digest.update(f"{slug}={fingerprint.digest if fingerprint else ''}".encode())
+        return digest.hexdigest()
+
+    def _skip_known_unmatched(
+        self,
+        source_files: list[Path],
+        runtimes: list[SportRuntime],
+        stats: ProcessingStats,
+    ) -> list[Path]:
+        """Drop files that failed to match before and did not change since.
+
+        A file is skipped while its size and mtime, the match key of the
+        loaded sports, and its manual override status are unchanged, for at
+        most ``processing.unmatched_recheck_hours``. Its unmatched record is
+        kept alive for the stale-record cleanup.
+        """
+        recheck_hours = self.config.settings.processing.unmatched_recheck_hours
+        if recheck_hours <= 0:
+            self._state.unmatched_match_key = None
+            return source_files
+        match_key = self._unmatched_match_key(runtimes)
+        self._state.unmatched_match_key = match_key
+        if self.config.settings.force_reprocess or not source_files:
+            return source_files
+
+        states = self.unmatched_store.get_match_states([str(source_path) for source_path in source_files])
+        if not states:
+            return source_files
+
+        recheck_before = datetime.now() - timedelta(hours=recheck_hours)
+        remaining: list[Path] = []
+        known: list[str] = []
+        for source_path in source_files:
+            source_key = str(source_path)
+            state = states.get(source_key)
+            if (
+                state is not None
+                and state.match_key == match_key
+                and state.attempted_at >= recheck_before
+                and self._unchanged_since_attempt(source_path, state.file_size, state.file_mtime_ns)
+                and self.manual_override_store.get_override(source_path.name) is None
+            ):
+                known.append(source_key)
+                continue
+            remaining.append(source_path)
+
+        if known:
+            stats.unmatched_skipped += len(known)
+            if not self.config.settings.dry_run:
+                self.unmatched_store.touch(known, datetime.now())
+        return remaining
+
+    @staticmethod
+    def _unchanged_since_attempt(source_path: Path, file_size: int, file_mtime_ns: int) -> bool:
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return False
+        return stat.st_size == file_size and stat.st_mtime_ns == file_mtime_ns
+
+    def _process_files(
+        self,
+        source_files: list[Path],
+        runtimes: list[SportRuntime],
+        stats: ProcessingStats,
+    ) -> None:
+        """Match candidate files on the worker pool and apply the results in order."""
+        file_count = len(source_files)
+        path_filter = self.config.settings.path_filter
+        outcomes = iter_in_order(
+            lambda source_path: self._prepare_file(source_path, runtimes, path_filter),
+            source_files,
+            workers=self.config.settings.processing.workers,
+            thread_name_prefix="playbook-match",
+        )
+        with Progress(disable=not LOGGER.isEnabledFor(logging.INFO)) as progress:
+            task_id = progress.add_task("Processing", total=file_count)
+            try:
+                for outcome in outcomes:
                     # Check for cancellation request
                     if self._cancel_requested:
                         LOGGER.info(
@@ -458,121 +702,222 @@ class Processor:
                     # health-check endpoint) can run without being starved.
                     time.sleep(0)
 
-                    # Apply include/ignore patterns BEFORE matching so that
-                    # excluded files (e.g. samples) never enter the pipeline.
-                    if not matches_include_ignore_patterns(
-                        source_path,
-                        self.config.settings.include_patterns,
-                        self.config.settings.ignore_patterns,
-                    ):
-                        stats.register_ignored(
-                            f"Excluded by include/ignore patterns: {source_path.name}",
-                        )
-                        progress.advance(task_id, 1)
-                        continue
-
-                    is_sample_file = should_suppress_sample_ignored(source_path)
-                    if is_sample_file:
-                        stats.register_ignored(suppressed_reason="sample")
-                        progress.advance(task_id, 1)
-                        continue
-
-                    handled, diagnostics, match_attempts = self._process_single_file(
-                        source_path,
-                        runtimes,
-                        stats,
-                        is_sample_file=is_sample_file,
-                    )
-                    if not handled:
-                        detail = self._format_ignored_detail(source_path, diagnostics)
-                        sport_id = next((sport for _, _, sport in diagnostics if sport), None)
-                        stats.register_ignored(detail, sport_id=sport_id)
-
-                        # Record unmatched file for GUI tracking (skip in dry-run mode)
-                        if not self.config.settings.dry_run:
-                            self._record_unmatched_file(source_path, diagnostics, match_attempts)
+                    self._commit_file(outcome, runtimes, stats)
                     progress.advance(task_id, 1)
+            finally:
+                outcomes.close()
+
+    def _dispatch_index(self, runtimes: list[SportRuntime]) -> SportDispatchIndex:
+        """Return the dispatch index for *runtimes*, rebuilding it if they changed."""
+        index = self._dispatch
+        if index is None or index.runtimes is not runtimes:
+            index = SportDispatchIndex(runtimes)
+            self._dispatch = index
+        return index
+
+    def _prepare_file(
+        self,
+        source_path: Path,
+        runtimes: list[SportRuntime],
+        path_filter: PathFilter,
+    ) -> FileMatchOutcome:
+        """Match stage: resolve a source file without touching the library or stores.
 
-            # Prune unmatched records for files that no longer exist on disk.
-            # Any record whose last_seen was not updated during this scan refers
-            # to a file that was renamed, moved, or deleted since the last run.
-            if not self.config.settings.dry_run and not stats.cancelled:
-                pruned = self.unmatched_store.delete_stale(scan_started_at)
-                if pruned:
-                    LOGGER.info(
-                        self._format_log("Unmatched Cleanup", {"Pruned Stale Records": pruned}),
-                    )
+        Runs on the match worker pool. Anything that links files, writes state
+        or sends notifications is deferred to :meth:`_commit_file`.
+        """
+        # Apply include/ignore patterns BEFORE matching so that
+        # excluded files (e.g. samples) never enter the pipeline.
+        if not path_filter.matches(source_path):
+            return FileMatchOutcome(source_path=source_path, excluded=True)
 
-            summary_counts = (stats.processed, stats.skipped, stats.ignored)
-            summary_changed = summary_counts != self._state.previous_summary
-            should_log_summary = (LOGGER.isEnabledFor(logging.DEBUG) or has_activity(stats)) and summary_changed
-            if should_log_summary:
-                LOGGER.info(
-                    self._format_inline_log(
-                        "Summary",
-                        {
-                            "Processed": stats.processed,
-                            "Skipped": stats.skipped,
-                            "Ignored": stats.ignored,
-                        },
-                    )
+        if should_suppress_sample_ignored(source_path):
+            return FileMatchOutcome(source_path=source_path, is_sample_file=True)
+
+        # Manual overrides bypass pattern matching; the writer stage applies them
+        override = self.manual_override_store.get_override(source_path.name)
+        if override:
+            return FileMatchOutcome(source_path=source_path, override=override)
+
+        return self._match_single_file(source_path, runtimes)
+
+    def _commit_file(
+        self,
+        outcome: FileMatchOutcome,
+        runtimes: list[SportRuntime],
+        stats: ProcessingStats,
+    ) -> None:
+        """Writer stage: apply a match outcome to the library and state stores."""
+        source_path = outcome.source_path
+        if outcome.excluded:
+            stats.register_ignored(
+                f"Excluded by include/ignore patterns: {source_path.name}",
+            )
+            return
+
+        if outcome.is_sample_file:
+            stats.register_ignored(suppressed_reason="sample")
+            return
+
+        if outcome.override is not None:
+            if self._process_override(source_path, outcome.override, runtimes, stats):
+                return
+            # The override could not be applied, fall back to pattern matching
+            outcome = self._match_single_file(source_path, runtimes)
+
+        if self._apply_match_outcome(outcome, stats):
+            return
+
+        detail = self._format_ignored_detail(source_path, outcome.diagnostics)
+        sport_id = next((sport for _, _, sport in outcome.diagnostics if sport), None)
+        stats.register_ignored(detail, sport_id=sport_id)
+
+        # Record unmatched file for GUI tracking (skip in dry-run mode)
+        if not self.config.settings.dry_run:
+            self._record_unmatched_file(source_path, outcome.diagnostics, outcome.match_attempts)
+
+    def _apply_match_outcome(self, outcome: FileMatchOutcome, stats: ProcessingStats) -> bool:
+        """Link a matched file and emit its trace and notification.
+
+        Returns:
+            True if the outcome carried a match, False otherwise
+        """
+        stats.merge(outcome.stats)
+        match = outcome.match
+        if match is None:
+            return False
+
+        event = self._handle_match(match, stats, captured_groups=outcome.captured_groups)
+        trace_context = outcome.trace_context if outcome.trace_context is not None else {}
+        trace_context.setdefault("status", event.action if event else "matched")
+        trace_context["destination"] = str(match.destination_path)
+        trace_context["context"] = match.context
+        trace_path = self._persist_trace(trace_context) if self.trace_options.enabled else None
+        if event:
+            if trace_path is not None:
+                event.trace_path = str(trace_path)
+            self.notification_service.notify(event)
+        # Clean up stale unmatched record if file matched (even if skipped for quality)
+        if not self.config.settings.dry_run:
+            self.unmatched_store.delete_by_source(str(match.source_path), wait=False)
+        return True
+
+    def _finish_run(self, stats: ProcessingStats, run_started: float) -> None:
+        """Log the run summary, fire post-run triggers, and emit the recap."""
+        summary_counts = (stats.processed, stats.skipped, stats.ignored)
+        summary_changed = summary_counts != self._state.previous_summary
+        should_log_summary = (LOGGER.isEnabledFor(logging.DEBUG) or has_activity(stats)) and summary_changed
+        if should_log_summary:
+            LOGGER.info(
+                self._format_inline_log(
+                    "Summary",
+                    {
+                        "Processed": stats.processed,
+                        "Skipped": stats.skipped,
+                        "Ignored": stats.ignored,
+                    },
                 )
-            self._state.previous_summary = summary_counts
-            if stats.errors:
-                for error in stats.errors:
-                    LOGGER.error(
-                        self._format_log(
-                            "Processing Error",
-                            {"Detail": error},
-                        )
+            )
+        self._state.previous_summary = summary_counts
+        if stats.errors:
+            for error in stats.errors:
+                LOGGER.error(
+                    self._format_log(
+                        "Processing Error",
+                        {"Detail": error},
                     )
+                )
 
-            self._trigger_post_run_trigger_if_needed(stats)
-            # Send summary notification if in summary mode
-            self.notification_service.send_summary()
-            duration = time.perf_counter() - run_started
-            self._log_run_recap(stats, duration)
-            return stats
-        finally:
-            if not self.config.settings.dry_run:
-                self.metadata_fingerprints.save()
+        if stats.sports_skipped:
+            LOGGER.debug(
+                self._format_log(
+                    "Sport Dispatch",
+                    {"Sports Skipped": stats.sports_skipped, "Patterns Skipped": stats.patterns_skipped},
+                )
+            )
+        if stats.unmatched_skipped:
+            LOGGER.debug(
+                self._format_log(
+                    "Unmatched Cache",
+                    {"Unchanged Files Not Matched Again": stats.unmatched_skipped},
+                )
+            )
+        if stats.entries_scanned or stats.entries_skipped:
+            LOGGER.debug(
+                self._format_log(
+                    "Source Discovery",
+                    {"Entries Scanned": stats.entries_scanned, "Entries Skipped": stats.entries_skipped},
+                )
+            )
+        if stats.reconcile_checked:
+            LOGGER.debug(
+                self._format_log(
+                    "Reconciliation",
+                    {
+                        "Records Checked": stats.reconcile_checked,
+                        "Stale Removed": stats.reconcile_removed,
+                        "Next Slice After Id": self._reconcile_cursor,
+                    },
+                )
+            )
+        alias_cache_stats = self.team_alias_cache_stats()
+        if alias_cache_stats["hits"] or alias_cache_stats["misses"]:
+            LOGGER.debug(self._format_log("Team Alias Cache", alias_cache_stats))
+
+        self._trigger_post_run_trigger_if_needed(stats)
+        # Send summary notification if in summary mode
+        self.notification_service.send_summary()
+        duration = time.perf_counter() - run_started
+        self._log_run_recap(stats, duration)
+
+    def team_alias_cache_stats(self) -> dict[str, int]:
+        """Return team alias lookup cache counters summed across sports."""
+        totals = {"hits": 0, "misses": 0, "entries": 0}
+        for cache in self._team_alias_caches.values():
+            for key, value in cache.snapshot().items():
+                totals[key] += value
+        return totals
 
     def _gather_source_files(self, stats: ProcessingStats | None = None) -> Iterable[Path]:
         """Discover and yield source files for processing.
 
         Delegates to file_discovery.gather_source_files().
         """
-        return gather_source_files(self.config.settings.source_dir, stats)
+        return gather_source_files(
+            self.config.settings.source_dir,
+            stats,
+            listing_store=self.directory_listing_store,
+            workers=self.config.settings.processing.discovery_workers,
+        )
 
-    def _process_single_file(
+    def _match_single_file(
         self,
         source_path: Path,
         runtimes: list[SportRuntime],
-        stats: ProcessingStats,
         *,
         is_sample_file: bool = False,
-    ) -> tuple[bool, list[tuple[str, str, str | None]], list[MatchAttempt]]:
-        """Process a single file against all matching sports.
+    ) -> FileMatchOutcome:
+        """Match a single file against all sports that accept its extension.
+
+        Only reads shared metadata, so it is safe to call from match workers.
+        Counters are recorded on the outcome's own stats and merged by the
+        writer stage.
 
         Returns:
-            Tuple of (handled, diagnostics, match_attempts):
-            - handled: True if the file was successfully matched
-            - diagnostics: List of (severity, message, sport_id) tuples
-            - match_attempts: Detailed match attempt records for unmatched file tracking
+            FileMatchOutcome with either the resolved match or the diagnostics
+            and match attempts gathered for unmatched file tracking
         """
-        # Check for manual override before pattern matching
-        override = self.manual_override_store.get_override(source_path.name)
-        if override:
-            result = self._process_override(source_path, override, runtimes, stats)
-            if result:
-                return True, [], []
+        outcome = FileMatchOutcome(source_path=source_path, is_sample_file=is_sample_file)
+        stats = outcome.stats
+        ignored_reasons = outcome.diagnostics
+        match_attempts = outcome.match_attempts
 
         suffix = source_path.suffix.lower()
-        matching_runtimes = [runtime for runtime in runtimes if suffix in runtime.extensions]
-        ignored_reasons: list[tuple[str, str, str | None]] = []
-        match_attempts: list[MatchAttempt] = []
+        dispatch = self._dispatch_index(runtimes).dispatch(source_path, source_dir=self.config.settings.source_dir)
+        stats.sports_skipped += dispatch.sports_skipped
+        stats.patterns_skipped += dispatch.patterns_skipped
 
-        if not matching_runtimes:
+        if not dispatch.entries:
             message = f"No configured sport accepts extension '{suffix or '<no extension>'}'"
             ignored_reasons.append(("ignored", message, None))
             LOGGER.debug(
@@ -584,9 +929,9 @@ class Processor:
                     },
                 )
             )
-            return False, ignored_reasons, match_attempts
+            return outcome
 
-        for runtime in matching_runtimes:
+        for runtime, verdict in dispatch.entries:
             # Always create trace_context for unmatched file tracking
             trace_context: dict[str, Any] = {
                 "filename": str(source_path),
@@ -594,7 +939,24 @@ class Processor:
                 "sport_name": runtime.sport.name,
                 "source_name": source_path.name,
             }
-            if not matches_globs(source_path, runtime.sport, source_dir=self.config.settings.source_dir):
+            if verdict == DISPATCH_PREFILTERED:
+                # None of the sport's pattern keywords occur in the name and it
+                # cannot match structurally; report it like a regex miss.
+                ignored_reasons.append(("ignored", "Did not match any configured patterns", runtime.sport.id))
+                match_attempts.append(
+                    MatchAttempt(
+                        sport_id=runtime.sport.id,
+                        sport_name=runtime.sport.name,
+                        pattern_description=None,
+                        status="prefiltered",
+                        failure_reason="No pattern keyword found in filename",
+                    )
+                )
+                if self.trace_options.enabled:
+                    trace_context.update({"status": "prefiltered", "reason": "No pattern keyword found in filename"})
+                    self._persist_trace(trace_context)
+                continue
+            if verdict == DISPATCH_GLOB_EXCLUDED:
                 patterns = runtime.sport.source_globs or ["*"]
                 message = f"Excluded by source_globs {patterns}"
                 ignored_reasons.append(("ignored", message, runtime.sport.id))
@@ -643,6 +1005,8 @@ class Processor:
                 suppress_warnings=is_sample_file,
                 metadata_loader=self._dynamic_loader.get_show_for_year if runtime.is_dynamic else None,
                 relative_path=rel_path,
+                team_alias_cache=runtime.team_alias_cache,
+                show_fingerprint=runtime.show_fingerprint,
             )
             trace_context["diagnostics"] = [
                 {"severity": severity, "message": message} for severity, message in detection_messages
@@ -676,13 +1040,14 @@ class Processor:
                         trace_context["error"] = str(exc)
                         trace_context["destination_context"] = context
                         self._persist_trace(trace_context)
-                    return False, [("error", message)]
+                    ignored_reasons.append(("error", message, runtime.sport.id))
+                    return outcome
 
                 context["destination_path"] = str(destination)
                 context["destination_dir"] = str(destination.parent)
                 context["source_path"] = str(source_path)
 
-                match = SportFileMatch(
+                outcome.match = SportFileMatch(
                     source_path=source_path,
                     destination_path=destination,
                     show=effective_show,
@@ -692,20 +1057,13 @@ class Processor:
                     context=context,
                     sport=runtime.sport,
                 )
-
-                event = self._handle_match(match, stats, captured_groups=groups)
-                trace_context.setdefault("status", event.action if event else "matched")
-                trace_context["destination"] = str(destination)
-                trace_context["context"] = context
-                trace_path = self._persist_trace(trace_context) if self.trace_options.enabled else None
-                if event:
-                    if trace_path is not None:
-                        event.trace_path = str(trace_path)
-                    self.notification_service.notify(event)
-                # Clean up stale unmatched record if file matched (even if skipped for quality)
-                if not self.config.settings.dry_run:
-                    self.unmatched_store.delete_by_source(str(source_path))
-                return True, [], []
+                outcome.captured_groups = groups
+                outcome.trace_context = trace_context
+                # Drop attempts from sports that did not match; they only
+                # matter for unmatched file tracking.
+                outcome.diagnostics = []
+                outcome.match_attempts = []
+                return outcome
 
             if not detection_messages:
                 detection_messages.append(("ignored", "No matching pattern resolved to an episode"))
@@ -766,7 +1124,7 @@ class Processor:
             if self.trace_options.enabled:
                 self._persist_trace(trace_context)
 
-        return False, ignored_reasons, match_attempts
+        return outcome
 
     def _process_override(
         self,
@@ -889,7 +1247,7 @@ class Processor:
 
         # Clean up unmatched record
         if not self.config.settings.dry_run:
-            self.unmatched_store.delete_by_source(str(source_path))
+            self.unmatched_store.delete_by_source(str(source_path), wait=False)
 
         LOGGER.info(
             self._format_log(
@@ -1014,11 +1372,11 @@ class Processor:
             if not settings.dry_run and event:
                 self._record_processed_file(match, event, quality_info, quality_score)
                 # Remove from unmatched store if it was previously there
-                self.unmatched_store.delete_by_source(str(match.source_path))
+                self.unmatched_store.delete_by_source(str(match.source_path), wait=False)
                 # Clean up old records if this was a replacement
                 if event.replaced:
                     self.processed_store.delete_old_destination_records(
-                        str(match.destination_path), str(match.source_path)
+                        str(match.destination_path), str(match.source_path), wait=False
                     )
 
         return event
@@ -1085,18 +1443,27 @@ class Processor:
                     if norm_match:
                         failure_summary += f" (tried: '{norm_match.group(1)}')"
 
+        try:
+            file_stat = os.stat(source_path)
+        except OSError:
+            file_size, file_mtime_ns = 0, None
+        else:
+            file_size, file_mtime_ns = file_stat.st_size, file_stat.st_mtime_ns
+
         record = UnmatchedFileRecord(
             source_path=str(source_path),
             filename=source_path.name,
             first_seen=now,
             last_seen=now,
-            file_size=get_file_size_safe(source_path),
+            file_size=file_size,
             file_category=classify_file_category(source_path.name),
             attempted_sports=attempted_sports,
             match_attempts=match_attempts,
             best_match_sport=best_match_sport,
             best_match_score=best_match_score,
             failure_summary=failure_summary[:500],  # Limit length
+            file_mtime_ns=file_mtime_ns,
+            match_key=self._state.unmatched_match_key,
         )
         self.unmatched_store.record_unmatched(record)
 
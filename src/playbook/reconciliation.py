@@ -8,35 +8,68 @@ loop to clean up stale records and detect orphan destination files.
 from __future__ import annotations
 
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .utils import existing_paths
+
 if TYPE_CHECKING:
     from .persistence import ProcessedFileRecord, ProcessedFileStore
 
 LOGGER = logging.getLogger(__name__)
 
 
-def reconcile_stale_records(processed_store: ProcessedFileStore) -> int:
+@dataclass
+class ReconcileResult:
+    """Outcome of one reconciliation pass.
+
+    Attributes:
+        checked: Records whose destination was checked
+        removed: Stale records deleted
+        next_cursor: Record id to resume after on the next pass; 0 once the
+            pass reached the end of the table
+    """
+
+    checked: int = 0
+    removed: int = 0
+    next_cursor: int = 0
+
+
+def reconcile_stale_records(
+    processed_store: ProcessedFileStore,
+    *,
+    budget: int = 0,
+    cursor: int = 0,
+) -> ReconcileResult:
     """Remove DB records whose destination files no longer exist on disk.
 
     When a destination file is deleted (manually, by Plex, or by a bug),
     the DB record becomes stale. Removing it allows the source file to
     re-enter the processing pipeline on the next run.
 
+    With a *budget* each pass checks one slice of the table, starting after
+    *cursor*, so a large library is covered over several runs instead of
+    stat-ing every destination every run. Destinations are checked
+    directory by directory and stale records are deleted in one transaction.
+
+    Args:
+        processed_store: Store holding the processed records
+        budget: Maximum records to check in this pass (0 checks all)
+        cursor: ``next_cursor`` of the previous pass
+
     Returns:
-        Number of stale records removed.
+        ReconcileResult with the records checked and removed.
     """
-    stale_sources: list[str] = []
-
-    for record in processed_store.iter_all():
-        if record.status == "error":
-            continue
-        if not Path(record.destination_path).exists():
-            stale_sources.append(record.source_path)
+    rows = processed_store.get_destination_slice(after_id=cursor, limit=budget or None)
+    result = ReconcileResult(checked=len(rows))
+    if budget and len(rows) == budget:
+        result.next_cursor = rows[-1][0]
 
-    for source_path in stale_sources:
-        processed_store.delete_by_source(source_path)
+    existing = existing_paths({destination for _row_id, _source, destination in rows})
+    stale_sources = [source for _row_id, source, destination in rows if destination not in existing]
+    if stale_sources:
+        result.removed = processed_store.delete_by_sources(stale_sources)
 
     if stale_sources:
         LOGGER.info(
@@ -48,7 +81,7 @@ def reconcile_stale_records(processed_store: ProcessedFileStore) -> int:
         if len(stale_sources) > 5:
             LOGGER.debug("  ... and %d more", len(stale_sources) - 5)
 
-    return len(stale_sources)
+    return result
 
 
 def detect_destination_mismatch(
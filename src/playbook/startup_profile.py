@@ -0,0 +1,146 @@
+"""Import-time profile behind ``playbook --profile-startup``.
+
+Each stage is imported in a fresh interpreter started with ``-X importtime``
+so the numbers are those of a cold CLI start, not of the already warmed-up
+current process. The CLI itself is measured first; every other stage is
+measured on top of it and only counts the modules it adds.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass
+
+from rich.console import Console
+from rich.table import Table
+
+_MARKER = "playbook-startup-profile-marker"
+
+# (label, module, when the CLI imports it)
+STARTUP_STAGES: tuple[tuple[str, str, str], ...] = (
+    ("Command line", "playbook.cli", "every command"),
+    ("Config validation", "playbook.validation", "validate-config"),
+    ("Processing pipeline", "playbook.processor", "run"),
+    ("File watcher", "playbook.watcher", "run with the watcher enabled"),
+    ("Kubernetes client", "kubernetes.client", "Kometa trigger in kubernetes mode"),
+)
+
+
+@dataclass(frozen=True)
+class ImportTiming:
+    """One ``-X importtime`` entry.
+
+    Attributes:
+        module: Imported module name
+        self_us: Time spent in the module itself, in microseconds
+        cumulative_us: Time including the modules it imported, in microseconds
+        depth: Nesting level; 0 for modules imported by the measured statement
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> list[ImportTiming]:
+    """Parse the ``-X importtime`` lines of *output*, ignoring everything else."""
+    timings: list[ImportTiming] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:") :].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # the header line
+        name_field = parts[2][1:]
+        module = name_field.strip()
+        timings.append(
+            ImportTiming(
+                module=module,
+                self_us=int(parts[0]),
+                cumulative_us=int(parts[1]),
+                depth=(len(name_field) - len(name_field.lstrip())) // 2,
+            )
+        )
+    return timings
+
+
+def _run_importtime(statement: str) -> str | None:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    return completed.stderr if completed.returncode == 0 else None
+
+
+def measure_imports(module: str, *, after: str | None = None) -> list[ImportTiming]:
+    """Return the imports *module* causes in a fresh interpreter.
+
+    Args:
+        module: Module to import
+        after: Module imported first; its imports are not counted
+
+    Returns:
+        Import timings in the order Python reports them, or an empty list if
+        the module could not be imported
+    """
+    # Interpreter start-up imports (site, encodings) are reported before the marker
+    prelude = f"import sys, {after}" if after else "import sys"
+    statement = f"{prelude}; sys.stderr.write({_MARKER!r} + '\\n'); import {module}"
+    output = _run_importtime(statement)
+    if output is None:
+        return []
+    return parse_importtime(output.partition(_MARKER)[2])
+
+
+def total_ms(timings: list[ImportTiming]) -> float:
+    """Return the time spent in *timings*, in milliseconds."""
+    return sum(timing.cumulative_us for timing in timings if timing.depth == 0) / 1000
+
+
+def _package(module: str) -> str:
+    parts = module.split(".")
+    # Playbook's own modules are reported individually, third-party ones per package
+    return ".".join(parts[:2]) if parts[0] == "playbook" else parts[0]
+
+
+def slowest_packages(timings: list[ImportTiming], limit: int = 10) -> list[tuple[str, float]]:
+    """Return the *limit* packages with the largest own import time, in milliseconds."""
+    per_package: dict[str, int] = defaultdict(int)
+    for timing in timings:
+        per_package[_package(timing.module)] += timing.self_us
+    ranked = sorted(per_package.items(), key=lambda item: item[1], reverse=True)
+    return [(package, micros / 1000) for package, micros in ranked[:limit]]
+
+
+def print_startup_profile(console: Console, *, limit: int = 10) -> None:
+    """Measure the startup stages and print where the time goes."""
+    cli_label, cli_module, cli_usage = STARTUP_STAGES[0]
+    cli_timings = measure_imports(cli_module)
+
+    stages = Table(title="Startup Import Time", title_justify="left")
+    stages.add_column("Stage")
+    stages.add_column("Module")
+    stages.add_column("Import Time", justify="right")
+    stages.add_column("Loaded For")
+    stages.add_row(cli_label, cli_module, f"{total_ms(cli_timings):.1f} ms", cli_usage)
+    for label, module, usage in STARTUP_STAGES[1:]:
+        timings = measure_imports(module, after=cli_module)
+        duration = f"+{total_ms(timings):.1f} ms" if timings else "unavailable"
+        stages.add_row(label, module, duration, usage)
+    console.print(stages)
+
+    modules = Table(title=f"Slowest Imports Of {cli_module}", title_justify="left")
+    modules.add_column("Package")
+    modules.add_column("Own Time", justify="right")
+    for package, duration in slowest_packages(cli_timings, limit):
+        modules.add_row(package, f"{duration:.1f} ms")
+    console.print(modules)
@@ -68,6 +68,7 @@ class TVSportsDBAdapter:
                 "url_poster": response.url_poster,
                 "aliases": response.aliases,
             },
+            content_digest=response.content_digest,
         )
 
     def to_episode(self, response: EpisodeResponse, index: int) -> Episode:
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+import threading
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from ..persistence import CacheEntry, MetadataCacheStore
 
@@ -33,6 +35,54 @@ class TVSportsDBCache:
         # Store database in cache_dir/metadata.db
         db_path = cache_dir / "metadata.db"
         self._store = MetadataCacheStore(db_path, ttl_hours=ttl_hours)
+        # Validated response models per key, tagged with the entry's fetched_at
+        self._models: dict[str, tuple[datetime, Any]] = {}
+        self._models_lock = threading.Lock()
+        self._model_hits = 0
+        self._model_misses = 0
+
+    def _remember(self, entry: CacheEntry, model: Any) -> None:
+        with self._models_lock:
+            self._models[entry.key] = (entry.fetched_at, model)
+
+    def _validated(self, entry: CacheEntry, model_type: type) -> Any:
+        """Validate *entry* as *model_type*, once per stored version of the entry."""
+        with self._models_lock:
+            memo = self._models.get(entry.key)
+            if memo is not None and memo[0] == entry.fetched_at and isinstance(memo[1], model_type):
+                self._model_hits += 1
+                return memo[1]
+        model = model_type.model_validate(entry.content)
+        with self._models_lock:
+            self._model_misses += 1
+            self._models[entry.key] = (entry.fetched_at, model)
+        return model
+
+    def parse_show(self, entry: CacheEntry) -> ShowResponse:
+        """Return the show stored in *entry*, validating it only once per process.
+
+        The show and its seasons are shallow copies, so callers may replace
+        attributes (e.g. a season's episodes) without affecting the memo.
+
+        Raises:
+            pydantic.ValidationError: If the content is not a valid show
+        """
+        from .models import ShowResponse
+
+        show = self._validated(entry, ShowResponse)
+        return show.model_copy(update={"seasons": [season.model_copy() for season in show.seasons]})
+
+    def parse_season(self, entry: CacheEntry) -> SeasonResponse:
+        """Return the season stored in *entry*, validating it only once per process.
+
+        The season carries the entry's ``content_digest``.
+
+        Raises:
+            pydantic.ValidationError: If the content is not a valid season
+        """
+        from .models import SeasonResponse
+
+        return self._validated(entry, SeasonResponse).model_copy(update={"content_digest": entry.digest})
 
     def _make_key(self, category: str, identifier: str) -> str:
         """Build a cache key from category and identifier."""
@@ -49,15 +99,13 @@ class TVSportsDBCache:
         Returns:
             ShowResponse if cached and not expired, else None
         """
-        from .models import ShowResponse
-
         key = self._make_key("shows", slug)
         entry = self._store.get(key)
         if entry is None:
             return None
 
         try:
-            return ShowResponse.model_validate(entry.content)
+            return self.parse_show(entry)
         except Exception as exc:
             LOGGER.debug("Failed to parse cached show %s: %s", slug, exc)
             return None
@@ -95,12 +143,13 @@ class TVSportsDBCache:
             last_modified: Optional Last-Modified from HTTP response
         """
         key = self._make_key("shows", slug)
-        self._store.set(
+        entry = self._store.set(
             key,
             show.model_dump(mode="json"),
             etag=etag,
             last_modified=last_modified,
         )
+        self._remember(entry, show.model_copy(update={"seasons": [season.model_copy() for season in show.seasons]}))
 
     def refresh_show_ttl(self, slug: str) -> bool:
         """Refresh the TTL for a show (e.g., after a 304 response).
@@ -114,6 +163,51 @@ class TVSportsDBCache:
         key = self._make_key("shows", slug)
         return self._store.refresh_ttl(key)
 
+    def refresh_entry_ttl(self, entry: CacheEntry) -> bool:
+        """Refresh the TTL of an entry returned by one of the ``get_*_entry`` methods.
+
+        Args:
+            entry: Raw cache entry
+
+        Returns:
+            True if entry was found and updated
+        """
+        return self._store.refresh_ttl(entry.key)
+
+    def show_fetched_at(self, slug: str) -> datetime | None:
+        """Return when the show or any of its seasons last received new content.
+
+        Args:
+            slug: Show slug
+
+        Returns:
+            Latest fetch time, or None if nothing is cached for the show
+        """
+        return self._store.last_fetched_at(
+            self._make_key("shows", slug),
+            prefix=self._make_key("seasons", f"{slug}_s"),
+        )
+
+    def expiring_entries(self, within: timedelta) -> list[tuple[str, int | None]]:
+        """List cached shows and seasons that expire within *within*.
+
+        Args:
+            within: How far ahead to look (already expired entries are included)
+
+        Returns:
+            ``(slug, season_number)`` pairs, with None for show entries
+        """
+        entries: list[tuple[str, int | None]] = []
+        for key in self._store.expiring_keys(datetime.now(UTC) + within):
+            category, _, identifier = key.partition("/")
+            if category == "shows":
+                entries.append((identifier, None))
+            elif category == "seasons":
+                slug, _, number = identifier.rpartition("_s")
+                if slug and number.isdigit():
+                    entries.append((slug, int(number)))
+        return entries
+
     # --- Season methods ---
 
     def get_season(self, show_slug: str, season_number: int) -> SeasonResponse | None:
@@ -126,15 +220,13 @@ class TVSportsDBCache:
         Returns:
             SeasonResponse if cached and not expired, else None
         """
-        from .models import SeasonResponse
-
         key = self._make_key("seasons", f"{show_slug}_s{season_number}")
         entry = self._store.get(key)
         if entry is None:
             return None
 
         try:
-            return SeasonResponse.model_validate(entry.content)
+            return self.parse_season(entry)
         except Exception as exc:
             LOGGER.debug("Failed to parse cached season %s/%d: %s", show_slug, season_number, exc)
             return None
@@ -168,7 +260,7 @@ class TVSportsDBCache:
         etag: str | None = None,
         last_modified: str | None = None,
     ) -> None:
-        """Save season to cache.
+        """Save season to cache and set its ``content_digest``.
 
         Args:
             show_slug: Show slug
@@ -178,12 +270,14 @@ class TVSportsDBCache:
             last_modified: Optional Last-Modified from HTTP response
         """
         key = self._make_key("seasons", f"{show_slug}_s{season_number}")
-        self._store.set(
+        entry = self._store.set(
             key,
             season.model_dump(mode="json"),
             etag=etag,
             last_modified=last_modified,
         )
+        season.content_digest = entry.digest
+        self._remember(entry, season.model_copy())
 
     def refresh_season_ttl(self, show_slug: str, season_number: int) -> bool:
         """Refresh the TTL for a season.
@@ -299,7 +393,11 @@ class TVSportsDBCache:
         Returns:
             Dictionary with cache statistics
         """
-        return self._store.get_stats()
+        stats = self._store.get_stats()
+        with self._models_lock:
+            stats["model_hits"] = self._model_hits
+            stats["model_misses"] = self._model_misses
+        return stats
 
     def close(self) -> None:
         """Close the cache store."""
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
 
 import httpx
 
@@ -17,9 +20,10 @@ from .models import (
     ShowResponse,
     TeamAliasResponse,
 )
+from .refresher import CacheRefresher
 
 if TYPE_CHECKING:
-    pass
+    from ..persistence import CacheEntry
 
 LOGGER = logging.getLogger(__name__)
 
@@ -28,6 +32,10 @@ API_BASE_URL = "https://api.tvsportsdb.com/api/v1"
 
 MAX_RETRIES = 3
 RETRY_BACKOFF = 1.0
+# Seasons of one show are fetched (or revalidated) concurrently over the shared connection pool
+SEASON_FETCH_WORKERS = 8
+
+_T = TypeVar("_T")
 
 
 class TVSportsDBError(Exception):
@@ -46,6 +54,14 @@ class TVSportsDBClient:
 
     The client uses HTTP conditional requests (ETag/If-None-Match) to
     efficiently check for updates without re-downloading unchanged data.
+    Season requests of a show run concurrently on a bounded pool; a 429
+    response pauses every request of the client until its Retry-After
+    has passed.
+
+    With ``serve_stale`` the client never blocks on revalidation: expired
+    entries are returned as-is and refreshed by a background CacheRefresher,
+    which also keeps the entries of served shows from expiring. Only
+    entries missing from the cache are fetched inline.
     """
 
     def __init__(
@@ -53,6 +69,9 @@ class TVSportsDBClient:
         cache_dir: Path,
         ttl_hours: int = 2,
         timeout: float = 30.0,
+        *,
+        max_workers: int = SEASON_FETCH_WORKERS,
+        serve_stale: bool = False,
     ) -> None:
         """Initialize the client.
 
@@ -60,11 +79,59 @@ class TVSportsDBClient:
             cache_dir: Directory for caching responses
             ttl_hours: Cache time-to-live in hours (default reduced to 2)
             timeout: HTTP request timeout in seconds
+            max_workers: Maximum concurrent season requests per show
+            serve_stale: Answer from expired entries and revalidate them in
+                the background
         """
         self.base_url = API_BASE_URL
         self.cache = TVSportsDBCache(cache_dir / "tvsportsdb", ttl_hours)
         self._client = httpx.Client(timeout=timeout, follow_redirects=True)
         self._owns_client = True
+        self._max_workers = max(1, max_workers)
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limited_until = 0.0  # time.monotonic() before which no request is sent
+        self._refresher = CacheRefresher(self) if serve_stale else None
+
+    def _map_seasons(self, func: Callable[[int], _T], numbers: Sequence[int]) -> Iterator[tuple[int, Future[_T]]]:
+        """Run *func* for every season number on the shared pool.
+
+        Yields ``(number, future)`` pairs in the order of *numbers*.
+        """
+        if len(numbers) <= 1 or self._max_workers == 1:
+            for number in numbers:
+                future: Future[_T] = Future()
+                try:
+                    future.set_result(func(number))
+                except Exception as exc:
+                    future.set_exception(exc)
+                yield number, future
+            return
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="tvsportsdb")
+            executor = self._executor
+        futures = [(number, executor.submit(func, number)) for number in numbers]
+        yield from futures
+
+    def _wait_for_rate_limit(self) -> None:
+        """Block while a Retry-After received by any request is pending."""
+        with self._rate_limit_lock:
+            delay = self._rate_limited_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def _rate_limited(self, response: httpx.Response, default: float) -> float:
+        """Record a 429 response and return how long to wait before retrying."""
+        try:
+            retry_after = int(response.headers.get("Retry-After", default))
+        except (TypeError, ValueError):
+            # HTTP-date form or garbage: fall back to the backoff delay
+            retry_after = int(default)
+        with self._rate_limit_lock:
+            self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + retry_after)
+        return retry_after
 
     def _request(
         self,
@@ -104,7 +171,11 @@ class TVSportsDBClient:
         if headers:
             kwargs["headers"] = headers
 
+        waited = False
         for attempt in range(MAX_RETRIES):
+            if not waited:
+                self._wait_for_rate_limit()
+            waited = False
             try:
                 response = self._client.request(method, url, **kwargs)
 
@@ -116,10 +187,11 @@ class TVSportsDBClient:
                 if response.status_code == 404:
                     raise TVSportsDBNotFoundError(f"Resource not found: {path}")
                 if response.status_code == 429:
-                    # Rate limited - wait and retry
-                    retry_after = int(response.headers.get("Retry-After", backoff))
+                    # Rate limited - wait and retry; concurrent requests wait too
+                    retry_after = self._rate_limited(response, backoff)
                     LOGGER.warning("Rate limited, waiting %d seconds", retry_after)
                     time.sleep(retry_after)
+                    waited = True
                     backoff = min(backoff * 2, 30.0)
                     continue
                 response.raise_for_status()
@@ -165,12 +237,19 @@ class TVSportsDBClient:
         # Check cache first (including expired entries for conditional requests)
         cached_entry = self.cache.get_show_entry(slug, include_expired=True)
         show: ShowResponse | None = None
+        if self._refresher is not None:
+            self._refresher.track(slug)
 
         if cached_entry is not None:
             if cached_entry.is_fresh:
                 # Cache is still valid for show structure
                 LOGGER.debug("Using cached show (fresh): %s", slug)
-                show = ShowResponse.model_validate(cached_entry.content)
+                show = self.cache.parse_show(cached_entry)
+            elif self._refresher is not None:
+                # Stale-while-revalidate: answer now, refresh in the background
+                LOGGER.debug("Using cached show (stale, refresh queued): %s", slug)
+                self._refresher.request(slug)
+                show = self.cache.parse_show(cached_entry)
             else:
                 # Cache expired - try conditional request
                 LOGGER.debug("Cache expired, checking for updates: %s", slug)
@@ -185,7 +264,7 @@ class TVSportsDBClient:
                     # 304 Not Modified - show structure unchanged
                     LOGGER.debug("Show structure unchanged (304): %s", slug)
                     self.cache.refresh_show_ttl(slug)
-                    show = ShowResponse.model_validate(cached_entry.content)
+                    show = self.cache.parse_show(cached_entry)
                 else:
                     LOGGER.debug("Fetched fresh show data: %s", slug)
                     show = ShowResponse.model_validate(response.json())
@@ -207,15 +286,158 @@ class TVSportsDBClient:
         # own ETag and TTL, so get_season() will efficiently return cached data
         # when episodes haven't changed, but fetch fresh data when they have.
         if include_episodes:
-            for season in show.seasons:
+            # List positions per season number; a show may list a number twice,
+            # and every entry gets the episodes of its season endpoint
+            positions: dict[int, list[int]] = {}
+            for position, season in enumerate(show.seasons):
+                positions.setdefault(season.number, []).append(position)
+            for number, future in self._map_seasons(lambda number: self.get_season(slug, number), list(positions)):
                 try:
-                    season_detail = self.get_season(slug, season.number)
-                    season.episodes = season_detail.episodes
+                    season = future.result()
                 except TVSportsDBError as exc:
-                    LOGGER.warning("Failed to fetch episodes for %s season %d: %s", slug, season.number, exc)
+                    LOGGER.warning("Failed to fetch episodes for %s season %d: %s", slug, number, exc)
+                else:
+                    for position in positions[number]:
+                        show.seasons[position].episodes = list(season.episodes)
+                        show.seasons[position].content_digest = season.content_digest
 
         return show
 
+    def revalidate_show(self, slug: str) -> bool:
+        """Revalidate a cached show and its seasons without parsing them.
+
+        Fresh cache entries are trusted as-is. Expired entries are checked
+        with conditional requests: a 304 refreshes the TTL, a changed
+        response is stored. With ``serve_stale`` expired entries are queued
+        for the background refresher instead and count as unchanged until it
+        has stored new content. Callers holding an already-adapted show use
+        this to learn whether it must be rebuilt.
+
+        Args:
+            slug: Show slug
+
+        Returns:
+            True when any entry changed or is missing, False when the cached
+            show and every cached season are unchanged
+
+        Raises:
+            TVSportsDBNotFoundError: If the show no longer exists
+            TVSportsDBError: On API errors
+        """
+        show_entry = self.cache.get_show_entry(slug, include_expired=True)
+        if show_entry is None:
+            return True
+        if self._refresher is not None:
+            self._refresher.track(slug)
+        if not show_entry.is_fresh:
+            if self._refresher is not None:
+                self._refresher.request(slug)
+            elif self._revalidate_entry(f"/shows/{slug}", show_entry, self._store_show(slug)):
+                # The season list may differ; the caller reloads the whole show
+                return True
+
+        changed = False
+        content = show_entry.content if isinstance(show_entry.content, dict) else {}
+        expired: dict[int, CacheEntry] = {}
+        for season in content.get("seasons") or []:
+            number = season.get("number") if isinstance(season, dict) else None
+            if number is None:
+                continue
+            season_entry = self.cache.get_season_entry(slug, number, include_expired=True)
+            if season_entry is None:
+                changed = True
+            elif season_entry.is_fresh:
+                continue
+            elif self._refresher is not None:
+                self._refresher.request(slug, number)
+            else:
+                expired[number] = season_entry
+
+        def revalidate_season(number: int) -> bool:
+            return self._revalidate_entry(
+                f"/shows/{slug}/seasons/{number}", expired[number], self._store_season(slug, number)
+            )
+
+        for _number, future in self._map_seasons(revalidate_season, list(expired)):
+            changed = future.result() or changed
+        return changed
+
+    def refresh_show_entry(self, slug: str) -> bool:
+        """Revalidate the cached show entry now, even if it is still fresh.
+
+        Args:
+            slug: Show slug
+
+        Returns:
+            True when new content was stored
+
+        Raises:
+            TVSportsDBNotFoundError: If the show no longer exists
+            TVSportsDBError: On API errors
+        """
+        return self._revalidate_entry(
+            f"/shows/{slug}", self.cache.get_show_entry(slug, include_expired=True), self._store_show(slug)
+        )
+
+    def refresh_season_entry(self, slug: str, number: int) -> bool:
+        """Revalidate the cached season entry now, even if it is still fresh.
+
+        Args:
+            slug: Show slug
+            number: Season number
+
+        Returns:
+            True when new content was stored
+
+        Raises:
+            TVSportsDBNotFoundError: If the season no longer exists
+            TVSportsDBError: On API errors
+        """
+        return self._revalidate_entry(
+            f"/shows/{slug}/seasons/{number}",
+            self.cache.get_season_entry(slug, number, include_expired=True),
+            self._store_season(slug, number),
+        )
+
+    def _revalidate_entry(self, path: str, entry: CacheEntry | None, store: Callable[[httpx.Response], None]) -> bool:
+        """Send a conditional request for *entry*; store and report new content."""
+        if entry is None:
+            store(self._request("GET", path))
+            return True
+        response = self._request("GET", path, etag=entry.etag, last_modified=entry.last_modified)
+        if response is None:
+            self.cache.refresh_entry_ttl(entry)
+            return False
+        store(response)
+        return True
+
+    def _store_show(self, slug: str) -> Callable[[httpx.Response], None]:
+        from .models import ShowResponse
+
+        def store(response: httpx.Response) -> None:
+            self.cache.save_show(
+                slug,
+                ShowResponse.model_validate(response.json()),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+
+        return store
+
+    def _store_season(self, slug: str, number: int) -> Callable[[httpx.Response], None]:
+        from .models import SeasonResponse
+
+        def store(response: httpx.Response) -> None:
+            self.cache.save_season(
+                slug,
+                number,
+                SeasonResponse.model_validate(response.json()),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+
+        return store
+
     def get_season(self, slug: str, number: int) -> SeasonResponse:
         """Fetch season with episodes.
 
@@ -241,7 +463,13 @@ class TVSportsDBClient:
             if cached_entry.is_fresh:
                 # Cache is still valid
                 LOGGER.debug("Using cached season (fresh): %s/season/%d", slug, number)
-                return SeasonResponse.model_validate(cached_entry.content)
+                return self.cache.parse_season(cached_entry)
+
+            if self._refresher is not None:
+                # Stale-while-revalidate: answer now, refresh in the background
+                LOGGER.debug("Using cached season (stale, refresh queued): %s/season/%d", slug, number)
+                self._refresher.request(slug, number)
+                return self.cache.parse_season(cached_entry)
 
             # Cache expired - try conditional request
             LOGGER.debug("Cache expired, checking for updates: %s/season/%d", slug, number)
@@ -256,7 +484,7 @@ class TVSportsDBClient:
                 # 304 Not Modified - refresh TTL and use cached data
                 LOGGER.debug("Content unchanged (304), refreshing TTL: %s/season/%d", slug, number)
                 self.cache.refresh_season_ttl(slug, number)
-                return SeasonResponse.model_validate(cached_entry.content)
+                return self.cache.parse_season(cached_entry)
         else:
             # No cached entry - make fresh request
             response = self._request("GET", f"/shows/{slug}/seasons/{number}")
@@ -369,7 +597,13 @@ class TVSportsDBClient:
             self.cache.invalidate_all()
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client, the season fetch pool and the background refresher."""
+        if self._refresher is not None:
+            self._refresher.stop()
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
         if self._owns_client:
             self._client.close()
         self.cache.close()
@@ -36,6 +36,8 @@ class SeasonResponse(BaseModel):
     url_poster: str | None = None
     aliases: list[str] = Field(default_factory=list)
     episodes: list[EpisodeResponse] = Field(default_factory=list)
+    # Digest of the cache entry this season was stored as; not part of the payload
+    content_digest: str | None = Field(default=None, exclude=True)
 
 
 class ShowResponse(BaseModel):
@@ -0,0 +1,128 @@
+"""Background revalidation of cached TVSportsDB responses.
+
+With stale-while-revalidate enabled, TVSportsDBClient answers from an expired
+cache entry immediately and queues the entry here instead of blocking on a
+conditional request. The refresher also revalidates entries of the shows its
+client has served shortly before they expire, so processing runs rarely see
+an expired entry at all.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import TVSportsDBClient
+
+LOGGER = logging.getLogger(__name__)
+
+# How often tracked shows are checked for entries nearing expiry
+REFRESH_INTERVAL_SECONDS = 60.0
+# Entries are revalidated once this fraction of the TTL is left
+REFRESH_LEAD_FRACTION = 0.1
+
+
+class CacheRefresher:
+    """Daemon thread revalidating a client's show and season cache entries."""
+
+    def __init__(
+        self,
+        client: TVSportsDBClient,
+        *,
+        interval: float = REFRESH_INTERVAL_SECONDS,
+        lead: timedelta | None = None,
+    ) -> None:
+        """Initialize the refresher (the thread starts on first use).
+
+        Args:
+            client: Client whose cache and HTTP connection are used
+            interval: Seconds between scans for entries nearing expiry
+            lead: Remaining lifetime below which an entry is revalidated
+                (defaults to a tenth of the cache TTL)
+        """
+        self._client = client
+        self._interval = interval
+        self._lead = lead if lead is not None else timedelta(hours=client.cache.ttl_hours * REFRESH_LEAD_FRACTION)
+        self._tracked: set[str] = set()
+        self._pending: set[tuple[str, int | None]] = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def track(self, slug: str) -> None:
+        """Keep the entries of *slug* fresh from now on."""
+        with self._lock:
+            if slug in self._tracked:
+                return
+            self._tracked.add(slug)
+        self._ensure_started()
+
+    def request(self, slug: str, season: int | None = None) -> None:
+        """Queue one show (``season`` None) or season entry for revalidation."""
+        with self._lock:
+            self._tracked.add(slug)
+            self._pending.add((slug, season))
+        self._ensure_started()
+        self._wake.set()
+
+    def refresh_pending(self) -> int:
+        """Revalidate queued and soon-to-expire entries in the calling thread.
+
+        Returns:
+            Number of entries that received new content
+        """
+        with self._lock:
+            due = set(self._pending)
+            self._pending.clear()
+            tracked = set(self._tracked)
+        if tracked:
+            due.update(entry for entry in self._client.cache.expiring_entries(self._lead) if entry[0] in tracked)
+
+        changed = 0
+        # Shows before their seasons, so a changed season list is seen first
+        for slug, season in sorted(due, key=lambda entry: (entry[0], entry[1] is not None, entry[1] or 0)):
+            if self._stopping.is_set():
+                break
+            try:
+                if season is None:
+                    updated = self._client.refresh_show_entry(slug)
+                else:
+                    updated = self._client.refresh_season_entry(slug, season)
+            except Exception as exc:
+                # The stale entry keeps being served; the next scan retries it
+                LOGGER.debug("Background refresh failed for %s season %s: %s", slug, season, exc)
+                continue
+            changed += int(updated)
+        if changed:
+            LOGGER.debug("Background refresh stored %d changed cache entries", changed)
+        return changed
+
+    def stop(self) -> None:
+        """Stop the thread and wait for an in-flight refresh to finish."""
+        self._stopping.set()
+        self._wake.set()
+        thread, self._thread = self._thread, None
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._thread is not None or self._stopping.is_set():
+                return
+            self._thread = threading.Thread(target=self._run, name="tvsportsdb-refresher", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self._interval)
+            self._wake.clear()
+            if self._stopping.is_set():
+                break
+            try:
+                self.refresh_pending()
+            except Exception:  # pragma: no cover - defensive, keeps the thread alive
+                LOGGER.exception("Background metadata refresh failed")
@@ -8,6 +8,7 @@ import re
 import shutil
 import string
 import unicodedata
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
@@ -122,6 +123,41 @@ def hash_file(path: Path, chunk_size: int = 65536) -> str:
     return digest.hexdigest()
 
 
+# Directories holding fewer of the checked paths are stat'ed per path instead of listed
+_EXISTING_PATHS_SCAN_THRESHOLD = 8
+
+
+def existing_paths(paths: Iterable[str]) -> set[str]:
+    """Return the subset of *paths* that exist, like ``os.path.exists`` per path.
+
+    Paths sharing a directory are answered from one ``os.scandir`` listing
+    rather than one stat each. Names missing from a listing and symlinks are
+    confirmed with ``os.path.exists`` so the result matches it exactly.
+    """
+    by_directory: dict[str, list[str]] = {}
+    for path in paths:
+        by_directory.setdefault(os.path.dirname(path), []).append(path)
+
+    found: set[str] = set()
+    for directory, members in by_directory.items():
+        if len(members) < _EXISTING_PATHS_SCAN_THRESHOLD:
+            found.update(path for path in members if os.path.exists(path))
+            continue
+        try:
+            with os.scandir(directory or ".") as entries:
+                listing = {entry.name: entry.is_symlink() for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        except OSError:
+            found.update(path for path in members if os.path.exists(path))
+            continue
+        for path in members:
+            is_symlink = listing.get(os.path.basename(path))
+            if is_symlink is False or os.path.exists(path):
+                found.add(path)
+    return found
+
+
 @dataclass
 class LinkResult:
     created: bool
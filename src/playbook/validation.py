@@ -61,6 +61,9 @@ CONFIG_SCHEMA: dict[str, Any] = {
                     "type": "object",
                     "properties": {
                         "scan_summary": {"type": "boolean"},
+                        "queue_size": {"type": "integer", "minimum": 0},
+                        "overflow": {"type": "string", "enum": ["block", "drop", "spill"]},
+                        "drain_timeout": {"type": ["number", "integer"], "minimum": 0},
                     },
                     "additionalProperties": True,
                 },
@@ -91,6 +94,19 @@ CONFIG_SCHEMA: dict[str, Any] = {
                     },
                     "additionalProperties": True,
                 },
+                "processing": {
+                    "type": "object",
+                    "properties": {
+                        "workers": {"type": "integer", "minimum": 1},
+                        "reconcile_budget": {"type": "integer", "minimum": 0},
+                        "write_batch": {"type": "integer", "minimum": 0},
+                        "write_delay": {"type": ["number", "integer"], "minimum": 0},
+                        "discovery_workers": {"type": "integer", "minimum": 1},
+                        "discovery_cache": {"type": "boolean"},
+                        "unmatched_recheck_hours": {"type": ["number", "integer"], "minimum": 0},
+                    },
+                    "additionalProperties": True,
+                },
                 "kometa_trigger": {
                     "type": "object",
                     "properties": {
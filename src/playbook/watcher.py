@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import fnmatch
 import logging
 import threading
 import time
-from collections.abc import Sequence
+from collections.abc import Collection, Sequence
 from pathlib import Path
 from queue import Empty, Queue
 from typing import TYPE_CHECKING
 
 from .config import WatcherSettings
+from .globs import compile_path_filter
 
 if TYPE_CHECKING:  # pragma: no cover
     from .processor import Processor
@@ -34,6 +34,7 @@ class _FileChangeHandler(FileSystemEventHandler):  # type: ignore[misc]
         self._queue = queue
         self._include = list(include)
         self._ignore = list(ignore)
+        self._filter = compile_path_filter(self._include, self._ignore)
         self.suppressed = False
 
     def on_created(self, event) -> None:  # type: ignore[override]
@@ -59,16 +60,7 @@ class _FileChangeHandler(FileSystemEventHandler):  # type: ignore[misc]
         self._queue.put(path)
 
     def _matches(self, path: Path) -> bool:
-        target = str(path)
-        filename = path.name
-        if self._include and not any(
-            fnmatch.fnmatch(filename, pattern) or fnmatch.fnmatch(target, pattern) for pattern in self._include
-        ):
-            return False
-        return not (
-            self._ignore
-            and any(fnmatch.fnmatch(filename, pattern) or fnmatch.fnmatch(target, pattern) for pattern in self._ignore)
-        )
+        return self._filter.matches(path)
 
 
 class FileWatcherLoop:
@@ -99,6 +91,9 @@ class FileWatcherLoop:
             self._observer.schedule(self._handler, str(root), recursive=True)
         self._paused = False
         self._pause_lock = threading.Lock()
+        # The first run after startup is a full scan so files that arrived
+        # while Playbook was down are picked up; later runs are incremental.
+        self._full_scan_done = False
 
     @property
     def paused(self) -> bool:
@@ -150,7 +145,7 @@ class FileWatcherLoop:
 
                 if next_reconcile is not None and now >= next_reconcile:
                     LOGGER.debug("Filesystem watcher reconcile triggered; running a full scan.")
-                    self._run_guarded(self._processor.process_all)
+                    self._run_full_scan()
                     next_reconcile = time.monotonic() + reconcile_interval
         finally:
             self._observer.stop()
@@ -163,34 +158,57 @@ class FileWatcherLoop:
             len(pending),
             f" near {sample}" if sample else "",
         )
+        if not self._full_scan_done:
+            self._run_full_scan()
+            return
+        changed = sorted(pending)
+        self._run_guarded(lambda: self._processor.process_paths(changed), processed=pending)
+
+    def _run_full_scan(self) -> None:
+        """Rescan the whole source tree and reconcile the processed database."""
         self._run_guarded(self._processor.process_all)
+        self._full_scan_done = True
 
-    def _run_guarded(self, func):
+    def _run_guarded(self, func, processed: Collection[Path] | None = None):
         """Run a processor function with event suppression to prevent self-triggering loops.
 
         During processing, the scanner reads files/directories which generates
         inotify events. Without suppression, these events would re-trigger
         processing in an infinite loop.
+
+        Args:
+            func: Processor function to run
+            processed: Paths the run covers; ``None`` for a full scan, which
+                covers every queued event
         """
         self._handler.suppressed = True
         try:
             func()
         finally:
             self._handler.suppressed = False
-            # Drain any events that snuck in during the suppression window
-            self._drain_queue()
+            self._drain_queue(processed)
 
-    def _drain_queue(self) -> None:
-        """Discard all pending events from the queue."""
+    def _drain_queue(self, processed: Collection[Path] | None = None) -> None:
+        """Discard queued events for paths the last run already handled.
+
+        Events for other paths were queued before the run started and have not
+        been processed yet, so they are put back for the next run.
+        """
         drained = 0
+        kept: list[Path] = []
         while True:
             try:
-                self._queue.get_nowait()
-                drained += 1
+                path = self._queue.get_nowait()
             except Empty:
                 break
+            if processed is None or path in processed:
+                drained += 1
+            else:
+                kept.append(path)
+        for path in kept:
+            self._queue.put(path)
         if drained:
-            LOGGER.debug("Drained %d self-triggered filesystem events after processing run", drained)
+            LOGGER.debug("Drained %d already processed filesystem events after processing run", drained)
 
     def _resolve_roots(self) -> list[Path]:
         roots = self._settings.paths or []
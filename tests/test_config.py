@@ -340,3 +340,126 @@ def test_notifications_mentions_mapping(tmp_path) -> None:
 
     config = load_config(config_path)
     assert config.settings.notifications.mentions == {"demo": "<@&42>", "default": "@here"}
+
+
+def test_processing_workers_setting(tmp_path) -> None:
+    config_path = tmp_path / "playbook.yaml"
+    write_yaml(
+        config_path,
+        f"""
+        settings:
+          source_dir: "{tmp_path / "source"}"
+          destination_dir: "{tmp_path / "dest"}"
+          cache_dir: "{tmp_path / "cache"}"
+          processing:
+            workers: 4
+            reconcile_budget: 0
+
+        sports:
+          - id: demo
+            show_slug: demo
+        """,
+    )
+
+    config = load_config(config_path)
+    assert config.settings.processing.workers == 4
+    assert config.settings.processing.reconcile_budget == 0
+
+
+def test_processing_workers_must_be_positive(tmp_path) -> None:
+    config_path = tmp_path / "playbook.yaml"
+    write_yaml(
+        config_path,
+        f"""
+        settings:
+          source_dir: "{tmp_path / "source"}"
+          destination_dir: "{tmp_path / "dest"}"
+          cache_dir: "{tmp_path / "cache"}"
+          processing:
+            workers: 0
+
+        sports:
+          - id: demo
+            show_slug: demo
+        """,
+    )
+
+    with pytest.raises(ValueError, match="processing.workers"):
+        load_config(config_path)
+
+
+def test_notification_queue_settings(tmp_path) -> None:
+    config_path = tmp_path / "playbook.yaml"
+    write_yaml(
+        config_path,
+        f"""
+        settings:
+          source_dir: "{tmp_path / "source"}"
+          destination_dir: "{tmp_path / "dest"}"
+          cache_dir: "{tmp_path / "cache"}"
+          notifications:
+            queue_size: 10
+            overflow: Drop
+            drain_timeout: 5
+            targets:
+              - type: discord
+                webhook_url: https://discord.test/webhook
+                priority: HIGH
+
+        sports:
+          - id: demo
+            show_slug: demo
+        """,
+    )
+
+    notifications = load_config(config_path).settings.notifications
+    assert notifications.queue_size == 10
+    assert notifications.overflow == "drop"
+    assert notifications.drain_timeout == 5.0
+    assert notifications.targets[0]["priority"] == "high"
+
+
+def test_notification_overflow_must_be_known(tmp_path) -> None:
+    config_path = tmp_path / "playbook.yaml"
+    write_yaml(
+        config_path,
+        f"""
+        settings:
+          source_dir: "{tmp_path / "source"}"
+          destination_dir: "{tmp_path / "dest"}"
+          cache_dir: "{tmp_path / "cache"}"
+          notifications:
+            overflow: discard
+
+        sports:
+          - id: demo
+            show_slug: demo
+        """,
+    )
+
+    with pytest.raises(ValueError, match="notifications.overflow"):
+        load_config(config_path)
+
+
+def test_processing_discovery_settings(tmp_path) -> None:
+    config_path = tmp_path / "playbook.yaml"
+    write_yaml(
+        config_path,
+        f"""
+        settings:
+          source_dir: "{tmp_path / "source"}"
+          destination_dir: "{tmp_path / "dest"}"
+          cache_dir: "{tmp_path / "cache"}"
+          processing:
+            discovery_workers: 8
+            discovery_cache: false
+
+        sports:
+          - id: demo
+            show_slug: demo
+        """,
+    )
+
+    processing = load_config(config_path).settings.processing
+    assert processing.discovery_workers == 8
+    assert processing.discovery_cache is False
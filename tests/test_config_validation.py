@@ -49,3 +49,15 @@ def test_validation_rejects_invalid_watcher_block() -> None:
 
     report = validate_config_data(config)
     assert any(issue.path == "settings.file_watcher.paths" for issue in report.errors)
+
+
+def test_validation_rejects_invalid_processing_workers() -> None:
+    config = {
+        "settings": {"processing": {"workers": 0}},
+        "sports": [
+            {"id": "demo", "show_slug": "demo"},
+        ],
+    }
+
+    report = validate_config_data(config)
+    assert any(issue.path == "settings.processing.workers" for issue in report.errors)
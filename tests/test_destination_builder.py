@@ -637,7 +637,6 @@ class TestBuildDestination:
         pattern_runtime = PatternRuntime(
             config=pattern_config,
             regex=pattern_config.compiled_regex(),
-            session_lookup=Mock(),  # Mock the session lookup as it's not needed for this test
         )
 
         # Create mock runtime (SportRuntime)
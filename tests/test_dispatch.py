@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from playbook.config import PatternConfig, SportConfig
+from playbook.dispatch import (
+    DISPATCH_CANDIDATE,
+    DISPATCH_GLOB_EXCLUDED,
+    DISPATCH_PREFILTERED,
+    SportDispatchIndex,
+    required_keyword,
+)
+from playbook.matcher import compile_patterns
+from playbook.metadata_loader import SportRuntime
+from playbook.models import Show
+
+
+def _runtime(sport_id: str, regex: str, *, globs: list[str] | None = None, show: Show | None = None) -> SportRuntime:
+    sport = SportConfig(
+        id=sport_id,
+        name=sport_id,
+        show_slug=sport_id,
+        patterns=[PatternConfig(regex=regex)],
+        source_globs=globs or [],
+    )
+    return SportRuntime(sport=sport, show=show, patterns=compile_patterns(sport), extensions={".mkv"})
+
+
+class TestRequiredKeyword:
+    def test_takes_longest_mandatory_literal_run(self) -> None:
+        assert required_keyword(r"(?i)^Formula\.?1\.(?P<year>\d{4})") == "formula"
+
+    def test_ignores_optional_and_alternative_literals(self) -> None:
+        assert required_keyword(r"(?:Formula|MotoGP)\.(?P<round>\d+)") is None
+        # Alternatives sharing a prefix still require that prefix
+        assert required_keyword(r"(?:MotoGP|Moto2)\.(?P<round>\d+)") == "moto"
+        assert required_keyword(r"(?:Grand\.Prix)?\.\d+") is None
+
+    def test_descends_into_groups_and_required_repeats(self) -> None:
+        assert required_keyword(r"^(?P<league>UFC)[ ._-]+(?:Fight\.Night)+") == "fight.night"
+
+    def test_invalid_regex_is_not_filtered(self) -> None:
+        assert required_keyword(r"(unclosed") is None
+
+
+class TestSportDispatchIndex:
+    def test_prefilters_sports_without_keyword(self) -> None:
+        f1 = _runtime("f1", r"(?i)^Formula1\.(?P<round>\d+)")
+        motogp = _runtime("motogp", r"(?i)^MotoGP\.(?P<round>\d+)")
+        index = SportDispatchIndex([f1, motogp])
+
+        result = index.dispatch(Path("/data/Formula1.05.Race.mkv"))
+
+        assert result.entries == [(f1, DISPATCH_CANDIDATE), (motogp, DISPATCH_PREFILTERED)]
+        assert (result.sports_skipped, result.patterns_skipped) == (1, 1)
+
+    def test_glob_excluded_runtimes_are_reported_in_order(self) -> None:
+        ufc = _runtime("ufc", r"(?i)^UFC\.(?P<event>\d+)", globs=["UFC*"])
+        nba = _runtime("nba", r"(?i)^NBA\.(?P<date>\d+)", globs=["NBA*"])
+        index = SportDispatchIndex([ufc, nba])
+
+        result = index.dispatch(Path("UFC.300.mkv"))
+
+        assert result.entries == [(ufc, DISPATCH_CANDIDATE), (nba, DISPATCH_GLOB_EXCLUDED)]
+
+    def test_team_matchups_stay_candidates_for_structured_matching(self) -> None:
+        show = Show(key="nhl", title="NHL", summary=None, seasons=[])
+        nhl = _runtime("nhl", r"(?i)^NHL-(?P<date>\d+)", show=show)
+        index = SportDispatchIndex([nhl])
+
+        result = index.dispatch(Path("Boston Bruins vs Toronto Maple Leafs 2024 10 12.mkv"))
+
+        assert result.entries == [(nhl, DISPATCH_CANDIDATE)]
+
+    def test_unknown_extension_has_no_entries(self) -> None:
+        index = SportDispatchIndex([_runtime("f1", r"Formula1")])
+        assert index.dispatch(Path("Formula1.nfo")).entries == []
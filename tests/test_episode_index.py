@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import datetime as dt
+
+from playbook.matcher.date_utils import dates_within_proximity
+from playbook.matcher.episode_index import SeasonEpisodeIndex, get_episode_index
+from playbook.matcher.episode_selector import _tokens_match
+from playbook.models import Episode, Season
+from playbook.utils import normalize_token
+
+
+def _make_season() -> Season:
+    teams = ["Boston Bruins", "Toronto Maple Leafs", "Montreal Canadiens", "Ottawa Senators", "Buffalo Sabres"]
+    episodes: list[Episode] = []
+    start = dt.date(2024, 10, 1)
+    for index in range(1, 121):
+        away = teams[index % len(teams)]
+        home = teams[(index * 3 + 1) % len(teams)]
+        episodes.append(
+            Episode(
+                title=f"{away} vs {home}",
+                summary=None,
+                originally_available=start + dt.timedelta(days=index // 3),
+                index=index,
+                display_number=index + 1000 if index % 7 == 0 else None,
+                aliases=[f"{home} at {away}"] if index % 2 else [],
+            )
+        )
+    episodes.append(Episode(title="Race", summary=None, originally_available=None, index=500))
+    episodes.append(Episode(title="Race 2", summary=None, originally_available=None, index=501, aliases=["Sprint"]))
+    return Season(key="2024", title="2024-25", summary=None, index=1, episodes=episodes)
+
+
+def _linear_matches(season: Season, token: str) -> list[Episode]:
+    matches = []
+    for episode in season.episodes:
+        if _tokens_match(normalize_token(episode.title), token):
+            matches.append(episode)
+            continue
+        if any(_tokens_match(normalize_token(alias), token) for alias in episode.aliases):
+            matches.append(episode)
+    return matches
+
+
+class TestSeasonEpisodeIndex:
+    """The index must return exactly what the linear scans it replaces did."""
+
+    def test_find_matching_equals_linear_scan(self) -> None:
+        season = _make_season()
+        index = SeasonEpisodeIndex(season)
+        tokens = [
+            "bostonbruinsvstorontomapleleafs",
+            "bostonbruins",
+            "torontomapleleafsatbostonbruins",
+            "race",
+            "race2",
+            "race2web",
+            "racex264",
+            "raec",
+            "sprint",
+            "sprnt",
+            "b",
+            "",
+        ]
+        for token in tokens:
+            assert index.find_matching(token, _tokens_match) == _linear_matches(season, token), token
+
+    def test_first_with_title_returns_first_in_season_order(self) -> None:
+        season = _make_season()
+        index = SeasonEpisodeIndex(season)
+        expected = next(ep for ep in season.episodes if normalize_token(ep.title) == "race2")
+        assert index.first_with_title("race2") is expected
+        assert index.first_with_title("missing") is None
+
+    def test_episodes_for_number_matches_index_or_display_number(self) -> None:
+        season = _make_season()
+        index = SeasonEpisodeIndex(season)
+        for number in (7, 1007, 500, 9999):
+            expected = [ep for ep in season.episodes if ep.index == number or ep.display_number == number]
+            assert index.episodes_for_number(number) == expected
+
+    def test_episodes_near_equals_linear_scan(self) -> None:
+        season = _make_season()
+        index = SeasonEpisodeIndex(season)
+        target = dt.date(2024, 10, 11)
+        expected = [
+            (ep, abs((target - ep.originally_available).days))
+            for ep in season.episodes
+            if ep.originally_available is not None and dates_within_proximity(target, ep.originally_available)
+        ]
+        assert index.episodes_near(target) == expected
+
+    def test_get_episode_index_is_memoized_per_season(self) -> None:
+        season = _make_season()
+        assert get_episode_index(season) is get_episode_index(season)
+        assert get_episode_index(_make_season()) is not get_episode_index(season)
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import os
+import shutil
 from pathlib import Path
 from unittest.mock import Mock
 
 from playbook.config import SportConfig
 from playbook.file_discovery import (
     SAMPLE_FILENAME_PATTERN,
+    collect_changed_source_files,
     gather_source_files,
     matches_globs,
     should_suppress_sample_ignored,
     skip_reason_for_source_file,
 )
 from playbook.models import ProcessingStats
+from playbook.persistence import DirectoryListingStore
 
 
 class TestSampleFilenamePattern:
@@ -437,3 +441,141 @@ class TestGatherSourceFiles:
         assert regular2 in result
         assert resource_fork not in result
         assert symlink not in result
+
+
+class TestCollectChangedSourceFiles:
+    """Test the collect_changed_source_files function."""
+
+    def test_returns_existing_files(self, tmp_path) -> None:
+        """Test that changed regular files are returned sorted."""
+        (tmp_path / "b.mkv").write_text("b")
+        (tmp_path / "a.mkv").write_text("a")
+
+        result = collect_changed_source_files([tmp_path / "b.mkv", tmp_path / "a.mkv"], tmp_path)
+
+        assert result == [tmp_path / "a.mkv", tmp_path / "b.mkv"]
+
+    def test_drops_missing_and_outside_paths(self, tmp_path) -> None:
+        """Test that deleted files and files outside source_dir are skipped."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        outside = tmp_path / "outside.mkv"
+        outside.write_text("x")
+
+        result = collect_changed_source_files([source_dir / "gone.mkv", outside], source_dir)
+
+        assert result == []
+
+    def test_expands_directories(self, tmp_path) -> None:
+        """Test that a changed directory contributes every file beneath it."""
+        release = tmp_path / "release"
+        (release / "sub").mkdir(parents=True)
+        (release / "video.mkv").write_text("v")
+        (release / "sub" / "extra.mkv").write_text("e")
+        (release / "._video.mkv").write_text("fork")
+
+        result = collect_changed_source_files([release, release / "video.mkv"], tmp_path)
+
+        assert result == [release / "sub" / "extra.mkv", release / "video.mkv"]
+
+    def test_applies_source_skip_rules(self, tmp_path) -> None:
+        """Test that symlinks and resource forks are skipped like in a full scan."""
+        real = tmp_path / "real.mkv"
+        real.write_text("r")
+        fork = tmp_path / "._real.mkv"
+        fork.write_text("f")
+        link = tmp_path / "link.mkv"
+        link.symlink_to(real)
+
+        result = collect_changed_source_files([real, fork, link], tmp_path)
+
+        assert result == [real]
+
+
+def _age_directories(root: Path, seconds: int = 60) -> None:
+    """Move directory mtimes into the past so their listings are trusted by the cache."""
+    for directory in [root, *(path for path in root.rglob("*") if path.is_dir())]:
+        stat = directory.stat()
+        os.utime(directory, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestDirectoryListingCache:
+    """Test gather_source_files with a directory listing store."""
+
+    def _build_tree(self, root: Path) -> list[Path]:
+        files = []
+        for show in ("show_a", "show_b"):
+            for season in ("s1", "s2"):
+                directory = root / show / season
+                directory.mkdir(parents=True)
+                for index in range(3):
+                    path = directory / f"episode{index}.mkv"
+                    path.write_text("content")
+                    files.append(path)
+        return files
+
+    def test_unchanged_directories_are_not_read_again(self, tmp_path) -> None:
+        source = tmp_path / "source"
+        files = self._build_tree(source)
+        _age_directories(source)
+        store = DirectoryListingStore(tmp_path / "playbook.db")
+
+        first = ProcessingStats()
+        assert sorted(gather_source_files(source, first, listing_store=store)) == sorted(files)
+        assert first.entries_scanned == 18
+        assert first.entries_skipped == 0
+
+        second = ProcessingStats()
+        assert sorted(gather_source_files(source, second, listing_store=store)) == sorted(files)
+        assert second.entries_scanned == 0
+        assert second.entries_skipped == 18
+
+    def test_changed_directory_is_read_again(self, tmp_path) -> None:
+        source = tmp_path / "source"
+        files = self._build_tree(source)
+        _age_directories(source)
+        store = DirectoryListingStore(tmp_path / "playbook.db")
+        list(gather_source_files(source, listing_store=store))
+
+        added = source / "show_b" / "s2" / "episode9.mkv"
+        added.write_text("content")
+        (source / "show_a" / "s1" / "episode0.mkv").unlink()
+        stats = ProcessingStats()
+        result = list(gather_source_files(source, stats, listing_store=store))
+
+        assert sorted(result) == sorted([*files[1:], added])
+        # Only the two modified season folders were listed
+        assert stats.entries_scanned == 6
+        assert stats.entries_skipped == 12
+
+    def test_recently_modified_directories_are_not_cached(self, tmp_path) -> None:
+        source = tmp_path / "source"
+        self._build_tree(source)
+        store = DirectoryListingStore(tmp_path / "playbook.db")
+
+        list(gather_source_files(source, listing_store=store))
+
+        assert store.load(str(source)) == {}
+
+    def test_removed_directories_are_forgotten(self, tmp_path) -> None:
+        source = tmp_path / "source"
+        self._build_tree(source)
+        _age_directories(source)
+        store = DirectoryListingStore(tmp_path / "playbook.db")
+        list(gather_source_files(source, listing_store=store))
+
+        shutil.rmtree(source / "show_b")
+        list(gather_source_files(source, listing_store=store))
+
+        assert not any("show_b" in path for path in store.load(str(source)))
+
+    def test_parallel_walk_matches_sequential_order(self, tmp_path) -> None:
+        source = tmp_path / "source"
+        self._build_tree(source)
+        (source / "root.mkv").write_text("content")
+
+        sequential = list(gather_source_files(source))
+        parallel = list(gather_source_files(source, workers=4))
+
+        assert parallel == sequential
+        assert len(parallel) == 13
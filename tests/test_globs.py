@@ -0,0 +1,66 @@
+"""Tests for compiled glob matchers."""
+
+from __future__ import annotations
+
+from fnmatch import fnmatch
+from pathlib import Path
+
+from playbook.config import Settings, SportConfig
+from playbook.globs import compile_glob_patterns, compile_path_filter, compile_source_globs
+
+_PATTERNS = ["*.mkv", "*.part", "*/temp/*", "Formula1.*", "*[Ss]ample*", "F1.202?.R0[1-5]*", "file.[!m]*"]
+_PATHS = [
+    Path("/downloads/Formula1.2024.Round01.mkv"),
+    Path("/downloads/temp/Formula1.2024.Round01.mkv"),
+    Path("/downloads/video.part"),
+    Path("/downloads/F1.2024.R03.Race.mp4"),
+    Path("/downloads/F1.2024.R07.Race.mp4"),
+    Path("/downloads/show.Sample.mkv"),
+    Path("/downloads/file.txt"),
+    Path("/downloads/file.mp4"),
+    Path("/downloads/[weird] name.ts"),
+]
+
+
+def _fnmatch_filter(path: Path, include: list[str], ignore: list[str]) -> bool:
+    filename, target = path.name, str(path)
+    if include and not any(fnmatch(filename, pattern) or fnmatch(target, pattern) for pattern in include):
+        return False
+    return not (ignore and any(fnmatch(filename, pattern) or fnmatch(target, pattern) for pattern in ignore))
+
+
+class TestCompiledGlobs:
+    """Tests for the glob compiler."""
+
+    def test_combined_regex_matches_like_fnmatch(self) -> None:
+        compiled = compile_glob_patterns(_PATTERNS)
+
+        assert compiled is not None
+        assert compile_glob_patterns([]) is None
+        for path in _PATHS:
+            expected = any(fnmatch(path.name, pattern) for pattern in _PATTERNS)
+            assert bool(compiled.match(path.name)) is expected, path
+
+    def test_path_filter_matches_like_fnmatch(self) -> None:
+        for include, ignore in (
+            ([], []),
+            (["*.mkv", "*.mp4"], []),
+            ([], ["*.part", "*/temp/*"]),
+            (["*.mkv", "F1.*"], ["*[Ss]ample*", "*/temp/*"]),
+        ):
+            path_filter = compile_path_filter(include, ignore)
+            for path in _PATHS:
+                assert path_filter.matches(path) is _fnmatch_filter(path, include, ignore), (include, ignore, path)
+
+    def test_matchers_are_shared_by_pattern_content(self, tmp_path) -> None:
+        settings = Settings(source_dir=tmp_path, destination_dir=tmp_path, cache_dir=tmp_path)
+        settings.ignore_patterns = ["*.part"]
+
+        assert settings.path_filter is compile_path_filter([], ("*.part",))
+        settings.ignore_patterns.append("*.tmp")
+        assert not settings.path_filter.matches(Path("/downloads/video.tmp"))
+
+        variant_2024 = SportConfig(id="f1_2024", name="F1", source_globs=["*.mkv"])
+        variant_2025 = SportConfig(id="f1_2025", name="F1", source_globs=["*.mkv"])
+        assert variant_2024.glob_matcher is variant_2025.glob_matcher
+        assert variant_2024.glob_matcher is compile_source_globs(["*.mkv"])
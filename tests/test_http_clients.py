@@ -0,0 +1,154 @@
+"""Tests for the shared HTTP client registry."""
+
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from playbook.config import NotificationSettings
+from playbook.http_clients import HttpClientRegistry, get_http_clients
+from playbook.notifications import NotificationEvent, NotificationService
+from playbook.notifications.plex_scan import PlexScanTarget
+from playbook.plex_client import DEFAULT_RETRIES
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    posts = 0
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        type(self).posts += 1
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(503)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        status = 404 if self.path == "/missing" else 200
+        body = b"ok"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestHttpClientRegistry:
+    """Tests for HttpClientRegistry."""
+
+    def test_sessions_are_shared_per_target(self) -> None:
+        registry = HttpClientRegistry()
+        slack = registry.session("slack")
+
+        assert registry.session("slack") is slack
+        assert registry.session("discord") is not slack
+        assert registry.session("discord").get_adapter("https://x.test") is slack.get_adapter("https://y.test")
+        assert get_http_clients() is get_http_clients()
+
+    def test_connections_are_kept_alive_and_metered(self, server_url) -> None:
+        registry = HttpClientRegistry()
+        session = registry.session("webhook")
+
+        for _ in range(3):
+            assert session.get(f"{server_url}/ok", timeout=5).status_code == 200
+        assert registry.session("autoscan").get(f"{server_url}/missing", timeout=5).status_code == 404
+        registry.close()
+
+        stats = registry.stats()
+        assert stats["webhook"]["requests"] == 3
+        assert stats["webhook"]["new_connections"] == 1
+        assert stats["webhook"]["reused_connections"] == 2
+        assert stats["webhook"]["errors"] == 0
+        assert stats["webhook"]["avg_latency_ms"] > 0
+        # The other target reuses the same per-host pool
+        assert stats["autoscan"] == {
+            "requests": 1,
+            "errors": 1,
+            "new_connections": 0,
+            "reused_connections": 1,
+            "avg_latency_ms": stats["autoscan"]["avg_latency_ms"],
+        }
+
+    def test_only_plex_sessions_retry(self, server_url) -> None:
+        registry = HttpClientRegistry()
+        webhook = registry.session("webhook")
+        plex = registry.session("plex_scan", retry=True)
+
+        _Handler.posts = 0
+        assert webhook.post(f"{server_url}/hook", json={"text": "hi"}, timeout=5).status_code == 503
+        # A retried POST would deliver the message again
+        assert _Handler.posts == 1
+
+        webhook_adapter = webhook.get_adapter(server_url)
+        plex_adapter = plex.get_adapter(server_url)
+        assert webhook_adapter.max_retries.total == 0
+        assert plex_adapter.max_retries.total == DEFAULT_RETRIES
+        assert plex_adapter.poolmanager is webhook_adapter.poolmanager
+
+    def test_service_targets_use_registry_sessions(self, tmp_path, monkeypatch) -> None:
+        class _Response:
+            status_code = 204
+            text = ""
+            headers: dict[str, str] = {}
+
+        monkeypatch.setattr("requests.Session.request", lambda self, method, url, **kwargs: _Response())
+        registry = HttpClientRegistry()
+        service = NotificationService(
+            NotificationSettings(
+                targets=[
+                    {"type": "discord", "webhook_url": "https://discord.test/webhook"},
+                    {"type": "slack", "webhook_url": "https://slack.test/webhook"},
+                ]
+            ),
+            cache_dir=tmp_path,
+            destination_dir=tmp_path,
+            http_clients=registry,
+        )
+
+        service.notify(
+            NotificationEvent(
+                sport_id="demo",
+                sport_name="Demo Sport",
+                show_title="Demo Series",
+                season="Season 1",
+                session="Qualifying",
+                episode="Qualifying",
+                summary=None,
+                destination="Demo.mkv",
+                source="source.mkv",
+                action="link",
+                link_mode="hardlink",
+                event_type="new",
+            )
+        )
+        service.flush()
+
+        stats = service.http_stats()
+        assert stats["discord"]["requests"] == 1
+        assert stats["slack"]["requests"] == 1
+
+    def test_plex_scan_reuses_its_client(self, tmp_path) -> None:
+        registry = HttpClientRegistry()
+        target = PlexScanTarget(
+            {"url": "http://plex.test:32400", "token": "token", "library_id": "1"},
+            destination_dir=tmp_path,
+            session=registry.session("plex_scan"),
+        )
+
+        client = target._plex_client()
+        assert target._plex_client() is client
+        assert client.session is registry.session("plex_scan")
@@ -1,6 +1,14 @@
 from __future__ import annotations
 
+import logging
+import time
+from pathlib import Path
+
+import pytest
+
 from playbook.logging_utils import (
+    LazyFieldsBlock,
+    LazyMessage,
     LogBlockBuilder,
     _coerce_items,
     _stringify,
@@ -626,3 +634,75 @@ class TestRenderSectionBlock:
 
         # Verify they appear in order
         assert first_idx < second_idx < third_idx
+
+
+class TestLazyLogMessages:
+    """Tests for LazyFieldsBlock and LazyMessage."""
+
+    def test_lazy_block_renders_like_render_fields_block(self):
+        fields = {"Source": "file.mkv", "Destination": "Show/Season 01/Show - S01E01.mkv"}
+        assert str(LazyFieldsBlock("Processing Details", fields)) == render_fields_block("Processing Details", fields)
+        assert str(LazyFieldsBlock("Summary", fields, pad_top=False)) == render_fields_block(
+            "Summary", fields, pad_top=False
+        )
+
+    def test_disabled_level_never_renders(self, caplog, monkeypatch):
+        calls: list[str] = []
+        monkeypatch.setattr(
+            "playbook.logging_utils.render_fields_block",
+            lambda title, fields, *, pad_top=True: calls.append(title) or title,
+        )
+        logger = logging.getLogger("playbook.tests.lazy")
+
+        with caplog.at_level(logging.INFO, logger=logger.name):
+            logger.debug(LazyFieldsBlock("Hidden", {"Key": "value"}))
+            logger.debug(LazyMessage(calls.append, "hidden message"))
+            logger.info(LazyFieldsBlock("Shown", {"Key": "value"}))
+
+        assert calls == ["Shown"]
+        assert [record.getMessage() for record in caplog.records] == ["Shown"]
+
+    def test_rendered_text_is_cached(self):
+        calls: list[int] = []
+        message = LazyMessage(lambda: calls.append(1) or "rendered")
+
+        assert str(message) == "rendered"
+        assert str(message) == "rendered"
+        assert calls == [1]
+
+
+@pytest.mark.benchmark
+class TestLazyLogBenchmark:
+    """Benchmark of per-file debug logging with DEBUG disabled.
+
+    Run explicitly with:
+        pytest -m benchmark tests/test_logging_utils.py -s
+    """
+
+    def test_disabled_debug_blocks_cost_nothing(self):
+        logger = logging.getLogger("playbook.tests.lazy_benchmark")
+        logger.setLevel(logging.INFO)
+        source = Path("/downloads/Formula.1.2024.Round03.Australia.Qualifying.1080p.WEB-DL.mkv")
+        destination = Path("/library/Formula 1 2024/03 Australia/Formula 1 - S2024E15 - Qualifying.mkv")
+        iterations = 2000
+
+        def per_file(block) -> None:
+            # The debug blocks a matched, already-linked file goes through
+            logger.debug(block("Skipping Existing Destination", {"Destination": destination, "Source": source}))
+            logger.debug(block("Ignoring File For Sport", {"Source": source.name, "Sport": "f1", "Reason": "glob"}))
+            logger.debug(block("Quality Upgrade", {"Destination": destination, "Source": source, "Score": 120}))
+
+        def measure(block) -> float:
+            started = time.perf_counter()
+            for _ in range(iterations):
+                per_file(block)
+            return (time.perf_counter() - started) / iterations
+
+        try:
+            eager = measure(render_fields_block)
+            lazy = measure(LazyFieldsBlock)
+        finally:
+            logger.setLevel(logging.NOTSET)
+
+        print(f"\nPer-file debug logging at INFO: eager {eager * 1e6:.1f}us, lazy {lazy * 1e6:.1f}us")
+        assert lazy * 3 < eager
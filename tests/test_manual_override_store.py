@@ -117,7 +117,7 @@ class TestProcessorOverride:
         return store, show, season, episode
 
     def test_override_found_processes_file(self, tmp_path: Path) -> None:
-        """When an override matches, _process_single_file should return True without pattern matching."""
+        """When an override matches, _process_override should return True without pattern matching."""
         from playbook.models import ProcessingStats
 
         override_data = {
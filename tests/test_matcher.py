@@ -2046,6 +2046,138 @@ def test_generic_session_lookup_resolves_common_terms() -> None:
     assert lookup.get_direct(normalize_token("Sprint")) == "Sprint"
 
 
+def test_session_lookup_cache_reuses_index_until_metadata_changes() -> None:
+    from playbook.matcher.session_resolver import SessionLookupCache
+
+    pattern = PatternConfig(regex=r"(?i)^.*\.(?P<session>.+)\.mkv$")
+    episode = Episode(title="Grand Prix", summary=None, originally_available=None, index=1)
+    season = Season(key="2025", title="2025 Season", summary=None, index=1, episodes=[episode])
+    cache = SessionLookupCache()
+
+    first = cache.get(pattern, season, "demo")
+    assert cache.get(pattern, season, "demo") is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Refreshed metadata produces new Season objects, which must not reuse the old index
+    refreshed = Season(key="2025", title="2025 Season", summary=None, index=1, episodes=[episode])
+    assert cache.get(pattern, refreshed, "demo") is not first
+
+    cache.invalidate("demo")
+    assert len(cache) == 0
+    cache.get(pattern, refreshed, "demo")
+    assert cache.misses == 3
+
+
+def test_session_lookup_cache_drops_entries_of_collected_objects() -> None:
+    import gc
+
+    from playbook.matcher.session_resolver import SessionLookupCache
+
+    pattern = PatternConfig(regex=r"(?i)^.*\.(?P<session>.+)\.mkv$")
+    episode = Episode(title="Grand Prix", summary=None, originally_available=None, index=1)
+    cache = SessionLookupCache()
+
+    season = Season(key="2025", title="2025 Season", summary=None, index=1, episodes=[episode])
+    cache.get(pattern, season, "demo")
+    del season
+    gc.collect()
+    assert len(cache) == 0
+
+    season = Season(key="2025", title="2025 Season", summary=None, index=1, episodes=[episode])
+    cache.get(pattern, season, "demo")
+    del pattern
+    gc.collect()
+    assert len(cache) == 0
+
+
+def test_match_file_to_episode_builds_session_lookup_once_per_season(monkeypatch) -> None:
+    from playbook.matcher import session_resolver
+
+    cache = session_resolver.SessionLookupCache()
+    monkeypatch.setattr(session_resolver, "SESSION_LOOKUP_CACHE", cache)
+
+    pattern = PatternConfig(
+        regex=r"(?i)^Demo\.Round(?P<round>\d{2})\.(?P<session>Race|Practice|Qualifying)\.mkv$",
+        season_selector=SeasonSelector(mode="round", group="round"),
+        episode_selector=EpisodeSelector(group="session"),
+    )
+    sport = SportConfig(id="demo", name="Demo", show_slug="demo", patterns=[pattern])
+    episodes = [
+        Episode(title=title, summary=None, originally_available=None, index=index)
+        for index, title in enumerate(("Practice", "Qualifying", "Race"), start=1)
+    ]
+    season = Season(key="01", title="Round 1", summary=None, index=1, episodes=episodes, round_number=1)
+    show = Show(key="demo", title="Demo", summary=None, seasons=[season])
+    patterns = compile_patterns(sport)
+
+    for session in ("Practice", "Qualifying", "Race") * 10:
+        result = match_file_to_episode(f"Demo.Round01.{session}.mkv", sport, show, patterns)
+        assert result is not None
+        assert result["episode"].title == session
+
+    assert cache.misses == 1
+    assert cache.hits == 29
+
+
+def test_pattern_screen_reports_candidate_patterns_in_one_scan() -> None:
+    from playbook.matcher import PatternScreen
+
+    sport = build_sport(
+        [
+            PatternConfig(regex=r"(?i)^Formula\.?1\.(?P<year>\d{4})\.Round(?P<round>\d+)"),
+            PatternConfig(regex=r"(?i)^MotoGP\.(?P<year>\d{4})"),
+            PatternConfig(regex=r"(?i)(?P<round>\d+)[._-](?P<session>\w+)"),
+            PatternConfig(regex=r"(?i)^(?P<league>moto)/Show", match_relative_path=True),
+            # Back-references depend on group numbering and are never combined
+            PatternConfig(regex=r"(?i)^(?P<tag>[a-z]+)\.(?P=tag)"),
+        ]
+    )
+    screen = compile_patterns(sport).screen
+    assert isinstance(screen, PatternScreen)
+    assert screen.screened_patterns == 4
+
+    # Nothing matches: only the unscreenable pattern remains
+    assert screen.candidates("Nothing.Here.mkv") == (False, False, False, False, True)
+    # Anchored patterns ahead of the first match are ruled out; later ones still run
+    assert screen.candidates("MotoGP.2025.Round01.mkv", "x/MotoGP.2025.Round01.mkv") == (False, True, True, False, True)
+    assert screen.candidates("01.Formula1.2025.Round01.mkv") == (False, False, True, True, True)
+    # Relative-path patterns are screened against the relative path
+    assert screen.candidates("x.mkv", "Moto/Show/x.mkv") == (False, False, False, True, True)
+
+
+def test_pattern_screen_keeps_trace_records_and_priority() -> None:
+    sport = build_sport(
+        [
+            PatternConfig(regex=r"(?i)^Formula\.?1\.(?P<session>\w+)", description="formula"),
+            PatternConfig(regex=r"(?i)^MotoGP\.(?P<session>\w+)", description="motogp"),
+            PatternConfig(
+                regex=r"(?i)^(?P<round>\d+)[._-]*(?P<session>[A-Z0-9]+)",
+                season_selector=SeasonSelector(mode="round", group="round"),
+                description="round",
+            ),
+        ]
+    )
+    show, _season = build_show()
+    screened = compile_patterns(sport)
+    unscreened = list(screened)
+
+    for filename in ("01.fp1.release.mkv", "MotoGP.Race.mkv", "Formula1.Race.mkv"):
+        screened_trace: dict = {}
+        unscreened_trace: dict = {}
+        screened_result = match_file_to_episode(filename, sport, show, screened, trace=screened_trace)
+        unscreened_result = match_file_to_episode(filename, sport, show, unscreened, trace=unscreened_trace)
+        assert screened_trace == unscreened_trace
+        assert (screened_result is None) == (unscreened_result is None)
+
+    trace: dict = {}
+    match_file_to_episode("01.fp1.release.mkv", sport, show, screened, trace=trace)
+    assert [(attempt["pattern"], attempt["status"]) for attempt in trace["attempts"]] == [
+        ("formula", "regex-no-match"),
+        ("motogp", "regex-no-match"),
+        ("round", "matched"),
+    ]
+
+
 class TestGenericSessionAliasNormalization:
     """Tests for session alias normalization handling various input formats."""
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from datetime import date
 
 from playbook.metadata import (
@@ -283,6 +284,55 @@ class TestComputeShowFingerprint:
         # At least one episode hash should differ
         assert any(s1_episodes_1.get(k) != s1_episodes_2.get(k) for k in ep1_keys)
 
+    def test_unchanged_cached_seasons_reuse_hashes(self) -> None:
+        """Test that seasons built from the same cached payload are not re-hashed."""
+        show1 = self._make_show()
+        show1.seasons[0].content_digest = "digest-1"
+        fp1 = compute_show_fingerprint(show1, "test-show")
+        assert fp1.season_sources == {"s1": "digest-1:1:1:1"}
+
+        # Same payload: hashes come from the cached fingerprint, not the episodes
+        show2 = self._make_show()
+        show2.seasons[0].content_digest = "digest-1"
+        show2.seasons[0].episodes[0].title = "Not hashed"
+        show2.metadata["id"] = 2
+        fp2 = compute_show_fingerprint(show2, "test-show", cached_fingerprint=fp1)
+        assert fp2 is not fp1
+        assert fp2.season_hashes == fp1.season_hashes
+        assert fp2.episode_hashes == fp1.episode_hashes
+
+        # Refreshed payload: the season is hashed again
+        show2.seasons[0].content_digest = "digest-2"
+        fp3 = compute_show_fingerprint(show2, "test-show", cached_fingerprint=fp1)
+        assert fp3.episode_hashes["s1"] != fp1.episode_hashes["s1"]
+        assert fp3.season_sources == {"s1": "digest-2:1:1:1"}
+
+    def test_refreshed_season_bypasses_content_hash_fast_path(self) -> None:
+        """Test that a new season payload is noticed even if the show metadata is unchanged."""
+        show1 = self._make_show()
+        show1.seasons[0].content_digest = "digest-1"
+        fp1 = compute_show_fingerprint(show1, "test-show")
+
+        show2 = self._make_show()
+        show2.seasons[0].content_digest = "digest-2"
+        show2.seasons[0].episodes[1].title = "Renamed"
+        fp2 = compute_show_fingerprint(show2, "test-show", cached_fingerprint=fp1)
+
+        assert fp2.digest != fp1.digest
+
+    def test_season_override_invalidates_source(self) -> None:
+        """Test that a season override changes the source even with the same payload."""
+        show1 = self._make_show()
+        show1.seasons[0].content_digest = "digest-1"
+        fp1 = compute_show_fingerprint(show1, "test-show")
+
+        show2 = self._make_show()
+        show2.seasons[0].content_digest = "digest-1"
+        show2.seasons[0].round_number = 5
+        fp2 = compute_show_fingerprint(show2, "test-show", cached_fingerprint=fp1)
+
+        assert fp2.season_hashes != fp1.season_hashes
+
 
 class TestMetadataChangeResult:
     """Tests for MetadataChangeResult dataclass."""
@@ -347,3 +397,97 @@ class TestMetadataFingerprintStoreKeysWithPrefix:
         assert sorted(store.keys_with_prefix("motogp-")) == ["motogp-2025", "motogp-2026"]
         assert store.keys_with_prefix("ufc") == ["ufc"]
         assert store.keys_with_prefix("nfl") == []
+
+
+class TestMetadataFingerprintStoreSqlite:
+    """Tests for the table-based storage behind MetadataFingerprintStore."""
+
+    def _fingerprint(self, digest: str, episode_hash: str = "eh1") -> ShowFingerprint:
+        return ShowFingerprint(
+            digest=digest,
+            season_hashes={"s1": "h1", "s2": "h2"},
+            episode_hashes={"s1": {"e1": episode_hash, "e2": "eh2"}, "s2": {}},
+            content_hash=f"content-{digest}",
+        )
+
+    def test_round_trip_preserves_structure(self, tmp_path) -> None:
+        store = MetadataFingerprintStore(tmp_path)
+        store.update("show", self._fingerprint("abc"))
+        store.save()
+
+        loaded = MetadataFingerprintStore(tmp_path).get("show")
+        assert loaded == self._fingerprint("abc")
+
+    def test_season_sources_persisted(self, tmp_path) -> None:
+        store = MetadataFingerprintStore(tmp_path)
+        store.update("show", self._fingerprint("abc"))
+        store.save()
+
+        # Only the sources are new: the fingerprint is still rewritten
+        fingerprint = self._fingerprint("abc")
+        fingerprint.season_sources = {"s1": "digest:1:1:1"}
+        assert not store.update("show", fingerprint).updated
+        store.save()
+
+        loaded = MetadataFingerprintStore(tmp_path).get("show")
+        assert loaded.season_sources == {"s1": "digest:1:1:1"}
+        assert ShowFingerprint.from_dict(loaded.to_dict()) == loaded
+
+    def test_save_writes_only_changed_rows(self, tmp_path) -> None:
+        store = MetadataFingerprintStore(tmp_path)
+        store.update("show", self._fingerprint("abc"))
+        store.update("other", self._fingerprint("xyz"))
+        store.save()
+
+        store.update("show", self._fingerprint("def", episode_hash="changed"))
+        conn = store._connect(create=False)
+        changes_before = conn.total_changes
+        store.save()
+        # Show row, the changed episode; untouched show "other" is not rewritten
+        assert conn.total_changes - changes_before == 2
+
+        reopened = MetadataFingerprintStore(tmp_path)
+        assert reopened.get("show").episode_hashes["s1"]["e1"] == "changed"
+        assert reopened.get("other") == self._fingerprint("xyz")
+
+    def test_remove_deletes_rows(self, tmp_path) -> None:
+        store = MetadataFingerprintStore(tmp_path)
+        store.update("show", self._fingerprint("abc"))
+        store.save()
+        store.remove("show")
+        store.save()
+
+        reopened = MetadataFingerprintStore(tmp_path)
+        assert reopened.get("show") is None
+        assert reopened.keys_with_prefix("sh") == []
+
+    def test_namespaces_share_database_separately(self, tmp_path) -> None:
+        processor_store = MetadataFingerprintStore(tmp_path)
+        plex_store = MetadataFingerprintStore(tmp_path, filename="plex-metadata-hashes.json")
+        processor_store.update("show", self._fingerprint("abc"))
+        plex_store.update("show", self._fingerprint("def"))
+        processor_store.save()
+        plex_store.save()
+
+        assert processor_store.db_path == plex_store.db_path
+        assert MetadataFingerprintStore(tmp_path).get("show").digest == "abc"
+        assert MetadataFingerprintStore(tmp_path, filename="plex-metadata-hashes.json").get("show").digest == "def"
+
+    def test_imports_legacy_json_once(self, tmp_path) -> None:
+        legacy = tmp_path / "state" / "metadata-digests.json"
+        legacy.parent.mkdir(parents=True)
+        legacy.write_text(json.dumps({"show": self._fingerprint("abc").to_dict(), "old": "digest-only"}))
+
+        # Read before anything was saved (e.g. dry run): served from the JSON file, no database created
+        store = MetadataFingerprintStore(tmp_path)
+        assert store.get("show") == self._fingerprint("abc")
+        assert not store.db_path.exists()
+
+        store.update("new", self._fingerprint("xyz"))
+        store.save()
+        legacy.unlink()
+
+        reopened = MetadataFingerprintStore(tmp_path)
+        assert reopened.get("show") == self._fingerprint("abc")
+        assert reopened.get("old").digest == "digest-only"
+        assert sorted(reopened.keys_with_prefix("")) == ["new", "old", "show"]
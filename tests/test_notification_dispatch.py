@@ -0,0 +1,204 @@
+"""Tests for background notification delivery."""
+
+from __future__ import annotations
+
+import datetime as dt
+import threading
+import time
+
+from playbook.config import NotificationSettings
+from playbook.notifications import NotificationEvent, NotificationService
+from playbook.notifications.dispatcher import TargetWorker
+from playbook.notifications.types import NotificationTarget
+
+
+def _build_event(destination: str = "Demo.mkv") -> NotificationEvent:
+    return NotificationEvent(
+        sport_id="demo",
+        sport_name="Demo Sport",
+        show_title="Demo Series",
+        season="Season 1",
+        session="Qualifying",
+        episode="Qualifying",
+        summary=None,
+        destination=destination,
+        source="source.mkv",
+        action="link",
+        link_mode="hardlink",
+        timestamp=dt.datetime(2024, 5, 1, 12, tzinfo=dt.UTC),
+        event_type="new",
+    )
+
+
+class _RecordingTarget(NotificationTarget):
+    name = "recording"
+
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.gate = gate
+        self.received: list[str] = []
+
+    def enabled(self) -> bool:
+        return True
+
+    def send(self, event: NotificationEvent) -> None:
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        self.received.append(event.destination)
+
+
+class TestTargetWorker:
+    """Tests for TargetWorker."""
+
+    def test_slow_target_does_not_block_submit(self) -> None:
+        gate = threading.Event()
+        target = _RecordingTarget(gate)
+        worker = TargetWorker(target, queue_size=10)
+
+        started = time.perf_counter()
+        for index in range(5):
+            assert worker.submit(_build_event(f"{index}.mkv"))
+        assert time.perf_counter() - started < 1
+        assert worker.pending == 5
+
+        gate.set()
+        assert worker.drain(timeout=5)
+        assert target.received == [f"{index}.mkv" for index in range(5)]
+        assert worker.stats_dict()["sent"] == 5
+        worker.close(timeout=1)
+
+    def test_drop_when_queue_is_full(self) -> None:
+        gate = threading.Event()
+        target = _RecordingTarget(gate)
+        worker = TargetWorker(target, queue_size=1, overflow="drop")
+
+        results = [worker.submit(_build_event(f"{index}.mkv")) for index in range(5)]
+        gate.set()
+        assert worker.drain(timeout=5)
+
+        assert results.count(False) == worker.stats.dropped
+        assert worker.stats.dropped >= 3
+        assert len(target.received) == worker.stats.sent
+        worker.close(timeout=1)
+
+    def test_spill_keeps_order_and_survives_restart(self, tmp_path) -> None:
+        spill_path = tmp_path / "spill" / "00-recording.jsonl"
+        gate = threading.Event()
+        worker = TargetWorker(_RecordingTarget(gate), queue_size=1, overflow="spill", spill_path=spill_path)
+
+        for index in range(5):
+            assert worker.submit(_build_event(f"{index}.mkv"))
+        assert worker.stats.spilled >= 3
+        assert spill_path.exists()
+        # Shut down before anything is delivered; the spill stays on disk
+        worker.close(timeout=0)
+        gate.set()
+
+        target = _RecordingTarget()
+        restarted = TargetWorker(target, queue_size=1, overflow="spill", spill_path=spill_path)
+        assert restarted.pending == worker.stats.spilled
+        assert restarted.drain(timeout=5)
+        spilled = [f"{index}.mkv" for index in range(5 - worker.stats.spilled, 5)]
+        assert target.received == spilled
+        assert not spill_path.exists()
+        restarted.close(timeout=1)
+
+    def test_spilled_events_follow_queued_events(self, tmp_path) -> None:
+        spill_path = tmp_path / "00-recording.jsonl"
+        gate = threading.Event()
+        target = _RecordingTarget(gate)
+        worker = TargetWorker(target, queue_size=2, overflow="spill", spill_path=spill_path)
+
+        for index in range(6):
+            worker.submit(_build_event(f"{index}.mkv"))
+        gate.set()
+
+        assert worker.drain(timeout=5)
+        assert target.received == [f"{index}.mkv" for index in range(6)]
+        worker.close(timeout=1)
+
+
+class TestServiceDispatch:
+    """Tests for NotificationService delivering through workers."""
+
+    def _service(self, tmp_path, **settings) -> NotificationService:
+        return NotificationService(
+            NotificationSettings(
+                targets=[{"type": "discord", "webhook_url": "https://discord.test/webhook"}], **settings
+            ),
+            cache_dir=tmp_path,
+            destination_dir=tmp_path,
+        )
+
+    def test_summary_waits_for_queued_events(self, tmp_path, monkeypatch) -> None:
+        class _Response:
+            status_code = 204
+            text = ""
+            headers: dict[str, str] = {}
+
+        sent: list[str] = []
+
+        def fake_request(self, method, url, json=None, **kwargs):
+            time.sleep(0.05)
+            sent.append("summary" if "Scan" in str(json) else "event")
+            return _Response()
+
+        monkeypatch.setattr("requests.Session.request", fake_request)
+        service = self._service(tmp_path)
+
+        service.notify(_build_event("a.mkv"))
+        service.notify(_build_event("b.mkv"))
+        service.send_summary()
+
+        assert sent[:2] == ["event", "event"]
+        stats = service.dispatch_stats()
+        assert stats[0]["target"] == "discord"
+        assert stats[0]["sent"] == 2
+        assert stats[0]["pending"] == 0
+        service.close(timeout=1)
+
+    def test_zero_queue_size_sends_inline(self, tmp_path, monkeypatch) -> None:
+        calls: list[str] = []
+
+        class _Response:
+            status_code = 204
+            text = ""
+            headers: dict[str, str] = {}
+
+        def fake_request(self, method, url, **kwargs):
+            calls.append(threading.current_thread().name)
+            return _Response()
+
+        monkeypatch.setattr("requests.Session.request", fake_request)
+        service = self._service(tmp_path, queue_size=0)
+
+        service.notify(_build_event())
+
+        assert calls == [threading.current_thread().name]
+        assert service.dispatch_stats() == []
+
+    def test_spill_follows_target_config_not_position(self, tmp_path) -> None:
+        first = {"type": "webhook", "url": "https://hooks.test/first"}
+        second = {"type": "webhook", "url": "https://hooks.test/second"}
+
+        def spill_paths(targets):
+            service = NotificationService(
+                NotificationSettings(targets=targets), cache_dir=tmp_path, destination_dir=tmp_path
+            )
+            paths = [worker.spill_path for _target, worker in service._workers_in_order()]
+            service.close(timeout=1)
+            return paths
+
+        first_path, second_path = spill_paths([first, second])
+        assert first_path != second_path
+        assert spill_paths([second, first]) == [second_path, first_path]
+
+    def test_orphaned_spills_are_dropped(self, tmp_path) -> None:
+        spill_dir = tmp_path / "notification-spill"
+        spill_dir.mkdir()
+        orphan = spill_dir / "webhook-000000000000.jsonl"
+        orphan.write_text('{"destination": "old.mkv"}\n', encoding="utf-8")
+
+        service = self._service(tmp_path)
+        service.close(timeout=1)
+
+        assert not orphan.exists()
@@ -46,6 +46,14 @@ def _build_event(
     )
 
 
+def _patch_requests(monkeypatch, fake) -> None:
+    """Route requests made through the shared HTTP sessions to *fake*."""
+    monkeypatch.setattr(
+        "requests.Session.request",
+        lambda self, method, url, **kwargs: fake(method, url, **kwargs),
+    )
+
+
 _DEFAULT_TARGET = {"type": "discord", "webhook_url": "https://discord.test/webhook"}
 
 
@@ -66,9 +74,10 @@ def test_notification_service_sends_discord_message(tmp_path, monkeypatch) -> No
         calls.append({"method": method, "url": url, "json": json})
         return FakeResponse(204)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     service.notify(_build_event())
+    service.flush()
 
     assert len(calls) == 1
     request = calls[0]
@@ -104,9 +113,10 @@ def test_notification_service_mentions_opt_in_roles(tmp_path, monkeypatch) -> No
         calls.append({"method": method, "url": url, "json": json})
         return FakeResponse(204)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     service.notify(_build_event())
+    service.flush()
 
     payload = calls[0]["json"]
     assert payload["content"].startswith("<@&42> [NEW] Demo Sport: Qualifying")
@@ -131,9 +141,10 @@ def test_bare_role_id_auto_wrapped_in_mention_format(tmp_path, monkeypatch) -> N
         calls.append({"method": method, "url": url, "json": json})
         return FakeResponse(204)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     service.notify(_build_event())
+    service.flush()
 
     payload = calls[0]["json"]
     # Should have been auto-wrapped from "123456789" to "<@&123456789>"
@@ -174,11 +185,12 @@ def test_notification_service_mentions_handle_variant_ids(tmp_path, monkeypatch)
         calls.append({"method": method, "url": url, "json": json})
         return FakeResponse(204)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     event = _build_event()
     event.sport_id = "premier_league_2025_26"
     service.notify(event)
+    service.flush()
 
     payload = calls[0]["json"]
     assert payload["content"].startswith("<@&123> [NEW]")
@@ -202,11 +214,12 @@ def test_notification_service_mentions_support_wildcards(tmp_path, monkeypatch)
         calls.append({"method": method, "url": url, "json": json})
         return FakeResponse(204)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     event = _build_event()
     event.sport_id = "formula1_2025"
     service.notify(event)
+    service.flush()
 
     payload = calls[0]["json"]
     assert payload["content"].startswith("<@&999> [NEW]")
@@ -290,7 +303,7 @@ def test_notification_service_throttle_limits_notifications_per_day(tmp_path, mo
         calls.append({"method": method, "url": url, "json": json})
         return FakeResponse(204)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     first = _build_event()
     first.timestamp = dt.datetime(2026, 3, 6, 9, 0, tzinfo=dt.UTC)
@@ -298,7 +311,9 @@ def test_notification_service_throttle_limits_notifications_per_day(tmp_path, mo
     second.timestamp = dt.datetime(2026, 3, 6, 10, 0, tzinfo=dt.UTC)
 
     service.notify(first)
+    service.flush()
     service.notify(second)
+    service.flush()
 
     assert len(calls) == 1
 
@@ -321,7 +336,7 @@ def test_notification_service_throttle_resets_next_day(tmp_path, monkeypatch) ->
         calls.append({"method": method, "url": url, "json": json})
         return FakeResponse(204)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     first = _build_event()
     first.timestamp = dt.datetime(2026, 3, 6, 9, 0, tzinfo=dt.UTC)
@@ -329,7 +344,9 @@ def test_notification_service_throttle_resets_next_day(tmp_path, monkeypatch) ->
     second.timestamp = dt.datetime(2026, 3, 7, 9, 0, tzinfo=dt.UTC)
 
     service.notify(first)
+    service.flush()
     service.notify(second)
+    service.flush()
 
     assert len(calls) == 2
 
@@ -352,9 +369,10 @@ def test_discord_target_reads_webhook_from_env(tmp_path, monkeypatch) -> None:
         calls.append({"url": url, "json": json})
         return FakeResponse(204)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     service.notify(_build_event())
+    service.flush()
 
     assert calls and calls[0]["url"] == "https://discord.test/env"
 
@@ -374,9 +392,10 @@ def test_discord_target_skips_when_env_missing(tmp_path, monkeypatch) -> None:
     def fake_request(method, url, json=None, timeout=None, headers=None):
         raise AssertionError("Request should not be sent when env var is missing")
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     service.notify(_build_event())
+    service.flush()
 
 
 def test_discord_targets_support_per_target_mentions(tmp_path, monkeypatch) -> None:
@@ -407,9 +426,10 @@ def test_discord_targets_support_per_target_mentions(tmp_path, monkeypatch) -> N
         calls.append({"url": url, "json": json})
         return FakeResponse(204)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     service.notify(_build_event())
+    service.flush()
 
     by_url = {call["url"]: call["json"]["content"] for call in calls}
     assert by_url["https://discord.test/a"].startswith("<@&1>")
@@ -438,10 +458,11 @@ def test_notification_service_handles_rate_limiting(tmp_path, monkeypatch) -> No
         request_calls.append(method)
         return responses.pop(0)
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
     monkeypatch.setattr("playbook.notifications.discord.time.sleep", lambda seconds: sleep_calls.append(seconds))
 
     service.notify(_build_event())
+    service.flush()
 
     assert request_calls == ["POST", "POST"]
     assert sleep_calls and sleep_calls[0] >= 1.0
@@ -461,8 +482,9 @@ def test_notification_service_skips_non_new_events(tmp_path, monkeypatch) -> Non
     def fake_request(method, url, json=None, timeout=None, headers=None):
         raise AssertionError("Request should not be sent")
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
     service.notify(_build_event(event_type="refresh"))
+    service.flush()
 
 
 def test_autoscan_target_posts_manual_trigger(tmp_path, monkeypatch) -> None:
@@ -490,7 +512,7 @@ def test_autoscan_target_posts_manual_trigger(tmp_path, monkeypatch) -> None:
 
     calls: list[dict[str, Any]] = []
 
-    def fake_post(url, params=None, auth=None, timeout=None, verify=None):
+    def fake_post(method, url, params=None, auth=None, timeout=None, verify=None, **_kwargs):
         calls.append({"url": url, "params": params, "auth": auth, "timeout": timeout, "verify": verify})
 
         class _Response:
@@ -499,13 +521,14 @@ def test_autoscan_target_posts_manual_trigger(tmp_path, monkeypatch) -> None:
 
         return _Response()
 
-    monkeypatch.setattr("playbook.notifications.autoscan.requests.post", fake_post)
+    _patch_requests(monkeypatch, fake_post)
 
     destination_file = Path(rewrite_from) / "Show" / "Episode.mkv"
     event = _build_event(
         match_details={"destination_path": str(destination_file)},
     )
     service.notify(event)
+    service.flush()
 
     assert len(calls) == 1
     request = calls[0]
@@ -531,7 +554,8 @@ def test_disabled_target_does_not_send_notifications(tmp_path, monkeypatch) -> N
     def fake_request(method, url, json=None, timeout=None, headers=None):
         raise AssertionError("Request should not be sent when target is disabled")
 
-    monkeypatch.setattr("playbook.notifications.discord.requests.request", fake_request)
+    _patch_requests(monkeypatch, fake_request)
 
     # Should not raise because target is disabled
     service.notify(_build_event())
+    service.flush()
@@ -182,3 +182,120 @@ def test_pattern_samples(sample: PatternSample) -> None:
             assert result["episode"].title == expectation.expect_episode, (
                 f"{sample.description}: '{expectation.value}' matched {result['episode'].title!r}, expected {expectation.expect_episode!r}"
             )
+
+
+def test_dispatch_prefilter_keeps_every_matching_sport() -> None:
+    from playbook.dispatch import DISPATCH_CANDIDATE, SportDispatchIndex
+    from playbook.metadata_loader import SportRuntime
+
+    runtimes = [
+        SportRuntime(
+            sport=sample.sport,
+            show=sample.show,
+            patterns=compile_patterns(sample.sport),
+            extensions={ext.lower() for ext in sample.sport.source_extensions},
+        )
+        for sample in SAMPLES
+    ]
+    index = SportDispatchIndex(runtimes)
+    filenames = [expectation.value for sample in SAMPLES for expectation in sample.filenames]
+
+    for filename in filenames:
+        verdicts = {id(runtime): verdict for runtime, verdict in index.dispatch(Path(filename)).entries}
+        for runtime in runtimes:
+            # The processor only matches files whose extension the sport accepts
+            if Path(filename).suffix.lower() not in runtime.extensions:
+                continue
+            if match_file_to_episode(filename, runtime.sport, runtime.show, runtime.patterns) is None:
+                continue
+            assert verdicts.get(id(runtime)) == DISPATCH_CANDIDATE, (
+                f"{runtime.sport.id} matches {filename!r} but was not dispatched"
+            )
+
+
+@pytest.mark.benchmark
+def test_pattern_screen_benchmark_against_samples() -> None:
+    """Benchmark the combined pattern screen over every sample filename and sport.
+
+    Each filename is matched against every sample sport twice: with the
+    screened list from ``compile_patterns`` and with a plain copy that runs
+    every pattern regex. Results and trace records must be identical.
+
+    Run explicitly with:
+        pytest -m benchmark tests/test_pattern_samples.py -s
+    """
+    import time
+    from itertools import compress
+
+    sports = [(sample.sport, sample.show, compile_patterns(sample.sport)) for sample in SAMPLES]
+    filenames = [expectation.value for sample in SAMPLES for expectation in sample.filenames]
+
+    total_patterns = 0
+    screened_out = 0
+    for filename in filenames:
+        for sport, show, patterns in sports:
+            total_patterns += len(patterns)
+            candidates = patterns.screen.candidates(filename, filename)
+            if candidates is not None:
+                screened_out += candidates.count(False)
+                # A screened-out pattern must never match on its own
+                for pattern, candidate in zip(patterns, candidates, strict=True):
+                    assert candidate or not pattern.regex.search(filename), (
+                        f"{sport.id}: {pattern.config.regex!r} screened out for {filename!r}"
+                    )
+
+            screened_trace: dict = {}
+            plain_trace: dict = {}
+            screened = match_file_to_episode(
+                filename, sport, show, patterns, relative_path=filename, trace=screened_trace
+            )
+            plain = match_file_to_episode(
+                filename, sport, show, list(patterns), relative_path=filename, trace=plain_trace
+            )
+            assert screened_trace == plain_trace, f"{sport.id}: trace differs for {filename!r}"
+            assert (screened or {}).get("episode") is (plain or {}).get("episode")
+
+    def best_of(run) -> float:
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            run()
+            timings.append(time.perf_counter() - start)
+        return min(timings) * 1000
+
+    def search_every_pattern() -> None:
+        for filename in filenames:
+            for _sport, _show, patterns in sports:
+                for pattern in patterns:
+                    pattern.regex.search(filename)
+
+    def search_screened_patterns() -> None:
+        for filename in filenames:
+            for _sport, _show, patterns in sports:
+                for pattern in compress(patterns, patterns.screen.candidates(filename, filename)):
+                    pattern.regex.search(filename)
+
+    def match_regex_stage(screened: bool) -> None:
+        pattern_lists = [patterns if screened else list(patterns) for _sport, _show, patterns in sports]
+        for filename in filenames:
+            for (sport, _show, _patterns), pattern_list in zip(sports, pattern_lists, strict=True):
+                # A show of None skips structured matching
+                match_file_to_episode(filename, sport, None, pattern_list, relative_path=filename)
+
+    plain_search = best_of(search_every_pattern)
+    screened_search = best_of(search_screened_patterns)
+    plain_match = best_of(lambda: match_regex_stage(False))
+    screened_match = best_of(lambda: match_regex_stage(True))
+
+    print(f"\n{'=' * 60}")
+    print("PATTERN SCREEN BENCHMARK:")
+    print(f"{'=' * 60}")
+    print(f"Filenames x sports: {len(filenames)} x {len(sports)}")
+    print(f"Pattern regex searches avoided: {screened_out}/{total_patterns}")
+    print(f"Pattern selection, every regex:   {plain_search:.1f} ms")
+    print(f"Pattern selection, screened:      {screened_search:.1f} ms")
+    print(f"match_file_to_episode, unscreened: {plain_match:.1f} ms")
+    print(f"match_file_to_episode, screened:   {screened_match:.1f} ms")
+    print(f"{'=' * 60}\n")
+
+    assert screened_out > total_patterns // 2
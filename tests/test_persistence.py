@@ -1,11 +1,18 @@
 """Tests for persistence layer."""
 
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from playbook.persistence import ProcessedFileRecord, ProcessedFileStore
+from playbook.persistence import (
+    PersistenceWriter,
+    ProcessedFileRecord,
+    ProcessedFileStore,
+    UnmatchedFileRecord,
+    UnmatchedFileStore,
+)
 
 
 @pytest.fixture
@@ -475,6 +482,39 @@ class TestProcessedFileStore:
         assert is_processed is False
         assert dest_path == "/dest/nonexistent/Race.mkv"
 
+    def test_check_processed_with_destinations_bulk(self, store: ProcessedFileStore, tmp_path: Path) -> None:
+        """Bulk check reports existing and missing destinations and omits unknown sources."""
+        dest_file = tmp_path / "dest" / "F1" / "Race.mkv"
+        dest_file.parent.mkdir(parents=True, exist_ok=True)
+        dest_file.write_text("test content")
+        for source, destination in (("/source/race.mkv", str(dest_file)), ("/source/gone.mkv", "/dest/gone.mkv")):
+            store.record_processed(
+                ProcessedFileRecord(
+                    source_path=source,
+                    destination_path=destination,
+                    sport_id="f1",
+                    show_id="formula-1-2024",
+                    season_index=0,
+                    episode_index=5,
+                    processed_at=datetime.now(),
+                    status="linked",
+                )
+            )
+
+        sources = ["/source/race.mkv", "/source/gone.mkv", "/source/new.mkv"]
+        expected = {
+            "/source/race.mkv": (True, str(dest_file)),
+            "/source/gone.mkv": (False, "/dest/gone.mkv"),
+        }
+        assert store.check_processed_with_destinations(sources) == expected
+        # Long lists read the whole table once instead of chunked lookups
+        padded = sources + [f"/source/other-{index}.mkv" for index in range(600)]
+        assert store.check_processed_with_destinations(padded) == expected
+
+        assert store.delete_by_sources(["/source/gone.mkv", "/source/new.mkv"]) == 1
+        assert store.get_by_source("/source/gone.mkv") is None
+        assert store.get_by_source("/source/race.mkv") is not None
+
     def test_remove_by_metadata_changes_removes_affected_sport(self, store: ProcessedFileStore) -> None:
         """Test that remove_by_metadata_changes removes all records for a sport with changes."""
         # Add records for multiple sports
@@ -544,6 +584,72 @@ class TestProcessedFileStore:
         # Record should still exist
         assert store.get_by_source("/source/f1/race.mkv") is not None
 
+    def test_counters_follow_writes(self, store: ProcessedFileStore) -> None:
+        """Test that per-sport counts stay in step with inserts, updates and deletes."""
+        for index, (sport_id, season, status) in enumerate(
+            [("f1", 1, "linked"), ("f1", 1, "error"), ("f1", 2, "linked"), ("nba", 1, "copied")]
+        ):
+            store.record_processed(
+                ProcessedFileRecord(
+                    source_path=f"/source/{index}.mkv",
+                    destination_path=f"/dest/{index}.mkv",
+                    sport_id=sport_id,
+                    show_id=f"{sport_id}-2024",
+                    season_index=season,
+                    episode_index=index,
+                    processed_at=datetime(2024, 3, 15, 10, index),
+                    status=status,
+                )
+            )
+
+        assert store.count_by_sport() == {"f1": {"linked": 2, "error": 1}, "nba": {"copied": 1}}
+        assert store.count_by_sport(["nba"]) == {"nba": {"copied": 1}}
+
+        store.update_status("/source/1.mkv", "linked")
+        store.delete_by_source("/source/2.mkv")
+        assert store.count_by_sport(["f1"]) == {"f1": {"linked": 2}}
+        assert store.get_stats()["total"] == 3
+
+        store.clear()
+        assert store.count_by_sport() == {}
+        assert store.get_stats()["total"] == 0
+
+    def test_counters_backfilled_on_upgrade(self, tmp_path: Path, sample_record: ProcessedFileRecord) -> None:
+        """Test that records written before schema version 3 are counted."""
+        db_path = tmp_path / "v2.db"
+        store = ProcessedFileStore(db_path)
+        store.record_processed(sample_record)
+        conn = store._get_connection()
+        conn.execute("DROP TABLE processed_counters")
+        for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.execute("UPDATE schema_version SET version = 2")
+        conn.commit()
+        store.close()
+
+        upgraded = ProcessedFileStore(db_path)
+        assert upgraded.count_by_sport() == {"f1": {"linked": 1}}
+        upgraded.close()
+
+    def test_get_recent_by_sports(self, store: ProcessedFileStore) -> None:
+        """Test that recent records are merged across sports, newest first."""
+        for index, sport_id in enumerate(["f1", "nba", "f1", "nhl", "nba"]):
+            store.record_processed(
+                ProcessedFileRecord(
+                    source_path=f"/source/{index}.mkv",
+                    destination_path=f"/dest/{index}.mkv",
+                    sport_id=sport_id,
+                    show_id=sport_id,
+                    season_index=0,
+                    episode_index=index,
+                    processed_at=datetime(2024, 3, 15, 10, index),
+                )
+            )
+
+        recent = store.get_recent_by_sports(["f1", "nba"], limit=3)
+        assert [record.source_path for record in recent] == ["/source/4.mkv", "/source/2.mkv", "/source/1.mkv"]
+        assert store.get_recent_by_sports([]) == []
+
 
 class TestMetadataCacheStore:
     """Tests for the MetadataCacheStore class."""
@@ -693,3 +799,216 @@ class TestMetadataCacheStore:
         assert stats["total_entries"] == 2
         assert stats["entries_with_etag"] == 1
         assert stats["ttl_hours"] == 1
+
+    def test_content_stored_compressed(self, cache) -> None:
+        """Test that content is stored as a compressed blob with its sizes."""
+        content = {"episodes": [{"title": f"Episode {index}"} for index in range(50)]}
+        cache.set("seasons/test-show_s1", content)
+
+        row = cache._get_connection().execute("SELECT content, raw_size, stored_size FROM metadata_cache").fetchone()
+        assert isinstance(row["content"], bytes)
+        assert row["stored_size"] == len(row["content"]) < row["raw_size"]
+        stats = cache.get_stats()
+        assert stats["raw_bytes"] == row["raw_size"]
+        assert stats["stored_bytes"] == row["stored_size"]
+
+    def test_migrates_text_content(self, tmp_path: Path) -> None:
+        """Test that JSON text written before schema version 2 is compressed on upgrade."""
+        import json
+        import sqlite3
+
+        from playbook.persistence import MetadataCacheStore
+
+        db_path = tmp_path / "metadata.db"
+        conn = sqlite3.connect(db_path)
+        conn.executescript(
+            """
+            CREATE TABLE schema_version (version INTEGER PRIMARY KEY);
+            INSERT INTO schema_version (version) VALUES (1);
+            CREATE TABLE metadata_cache (
+                key TEXT PRIMARY KEY,
+                content TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL
+            );
+            """
+        )
+        conn.execute(
+            "INSERT INTO metadata_cache VALUES (?, ?, NULL, NULL, ?, ?)",
+            (
+                "shows/legacy",
+                json.dumps({"title": "Legacy"}, indent=2),
+                "2024-01-01T00:00:00+00:00",
+                "2999-01-01T00:00:00+00:00",
+            ),
+        )
+        conn.commit()
+        conn.close()
+
+        store = MetadataCacheStore(db_path, ttl_hours=1)
+        assert store.get("shows/legacy").content == {"title": "Legacy"}
+        assert isinstance(store._get_connection().execute("SELECT content FROM metadata_cache").fetchone()[0], bytes)
+        assert store.get("shows/legacy").digest
+        store.close()
+
+    def test_digest_follows_content(self, cache) -> None:
+        """Test that entries record a digest that changes only with their content."""
+        first = cache.set("shows/test-show", {"title": "v1"}, etag='"a"')
+        assert cache.get("shows/test-show").digest == first.digest
+
+        assert cache.set("shows/test-show", {"title": "v1"}, etag='"b"').digest == first.digest
+        assert cache.set("shows/test-show", {"title": "v2"}).digest != first.digest
+
+    def test_decoded_once_per_version(self, cache) -> None:
+        """Test that unchanged entries are decoded only once."""
+        cache.set("shows/test-show", {"title": "v1"})
+        cache._forget()
+
+        assert cache.get("shows/test-show").content == {"title": "v1"}
+        assert cache.get("shows/test-show").content == {"title": "v1"}
+        assert cache.get_stats()["decode_misses"] == 1
+
+        cache.set("shows/test-show", {"title": "v2"})
+        assert cache.get("shows/test-show").content == {"title": "v2"}
+        assert cache.get_stats()["decode_misses"] == 1
+
+
+class TestPersistenceWriter:
+    """Tests for the write-behind PersistenceWriter."""
+
+    def test_groups_writes_and_reads_them_back(self, tmp_path: Path, sample_record: ProcessedFileRecord) -> None:
+        db_path = tmp_path / "test.db"
+        writer = PersistenceWriter(db_path, max_batch=100, max_delay=60)
+        store = ProcessedFileStore(db_path, writer=writer)
+        unmatched = UnmatchedFileStore(db_path, writer=writer)
+        try:
+            for index in range(10):
+                store.record_processed(
+                    ProcessedFileRecord(
+                        source_path=f"/source/{index}.mkv",
+                        destination_path=f"/dest/{index}.mkv",
+                        sport_id="f1",
+                        show_id="formula-1-2024",
+                        season_index=0,
+                        episode_index=index,
+                        processed_at=datetime(2024, 3, 15),
+                    )
+                )
+            unmatched.record_unmatched(
+                UnmatchedFileRecord(
+                    source_path="/source/extra.mkv",
+                    filename="extra.mkv",
+                    first_seen=datetime(2024, 3, 15),
+                    last_seen=datetime(2024, 3, 15),
+                    file_size=0,
+                    file_category="video",
+                )
+            )
+
+            # Reads flush the queue first, so the writes are visible immediately
+            assert store.get_stats()["total"] == 10
+            assert unmatched.get_by_source("/source/extra.mkv") is not None
+            assert writer.writes == 11
+            assert writer.commits == 1
+        finally:
+            writer.close()
+
+    def test_unwaited_deletes_join_the_group(self, tmp_path: Path) -> None:
+        db_path = tmp_path / "test.db"
+        writer = PersistenceWriter(db_path, max_batch=256, max_delay=60)
+        store = ProcessedFileStore(db_path, writer=writer)
+        unmatched = UnmatchedFileStore(db_path, writer=writer)
+        try:
+            for index in range(20):
+                store.record_processed(
+                    ProcessedFileRecord(
+                        source_path=f"/source/{index}.mkv",
+                        destination_path="/dest/episode.mkv",
+                        sport_id="f1",
+                        show_id="formula-1-2024",
+                        season_index=0,
+                        episode_index=1,
+                        processed_at=datetime(2024, 3, 15),
+                    )
+                )
+                assert unmatched.delete_by_source(f"/source/{index}.mkv", wait=False) is None
+                store.delete_old_destination_records("/dest/episode.mkv", f"/source/{index}.mkv", wait=False)
+            assert writer.commits == 0
+
+            writer.flush()
+            assert writer.writes == 60
+            assert writer.commits == 1
+            statuses = [record.status for record in store.get_by_sport("f1")]
+            assert statuses.count("superseded") == 19
+        finally:
+            writer.close()
+
+    def test_per_file_reads_see_queued_writes_without_committing(
+        self, tmp_path: Path, sample_record: ProcessedFileRecord
+    ) -> None:
+        db_path = tmp_path / "test.db"
+        writer = PersistenceWriter(db_path, max_batch=100, max_delay=60)
+        store = ProcessedFileStore(db_path, writer=writer)
+        try:
+            sample_record.quality_score = 75
+            store.record_processed(sample_record)
+
+            assert store.get_by_destination(sample_record.destination_path) is not None
+            assert store.get_quality_score(sample_record.destination_path) == 75
+            assert writer.commits == 0
+        finally:
+            writer.close()
+
+    def test_failed_commit_fails_its_mutations(self, tmp_path: Path) -> None:
+        writer = PersistenceWriter(tmp_path / "test.db", max_batch=100, max_delay=60)
+
+        def create_tables() -> None:
+            conn = writer.connection
+            conn.execute("PRAGMA foreign_keys=ON")
+            conn.execute("CREATE TABLE parent (id INTEGER PRIMARY KEY)")
+            conn.execute("CREATE TABLE child (parent_id INTEGER REFERENCES parent(id) DEFERRABLE INITIALLY DEFERRED)")
+
+        try:
+            writer.submit(create_tables)
+            writer.flush()
+            # The deferred foreign key is only checked, and fails, on commit
+            orphan = writer.submit(lambda: writer.connection.execute("INSERT INTO child VALUES (1)").rowcount)
+            writer.flush()
+
+            with pytest.raises(sqlite3.IntegrityError):
+                orphan.result()
+            assert writer.lost == 1
+        finally:
+            writer.close()
+
+    def test_close_commits_pending_writes(self, tmp_path: Path, sample_record: ProcessedFileRecord) -> None:
+        db_path = tmp_path / "test.db"
+        writer = PersistenceWriter(db_path, max_batch=100, max_delay=60)
+        ProcessedFileStore(db_path, writer=writer).record_processed(sample_record)
+        writer.close()
+
+        reopened = ProcessedFileStore(db_path)
+        assert reopened.get_by_source(sample_record.source_path) is not None
+
+    def test_waited_mutations_return_results(self, tmp_path: Path, sample_record: ProcessedFileRecord) -> None:
+        db_path = tmp_path / "test.db"
+        writer = PersistenceWriter(db_path)
+        store = ProcessedFileStore(db_path, writer=writer)
+        try:
+            store.record_processed(sample_record)
+            assert store.update_quality(sample_record.destination_path, 80, None) is True
+            assert store.delete_by_source(sample_record.source_path) is True
+            assert store.delete_by_source(sample_record.source_path) is False
+        finally:
+            writer.close()
+
+    def test_writes_after_close_run_inline(self, tmp_path: Path, sample_record: ProcessedFileRecord) -> None:
+        db_path = tmp_path / "test.db"
+        writer = PersistenceWriter(db_path)
+        store = ProcessedFileStore(db_path, writer=writer)
+        writer.close()
+
+        store.record_processed(sample_record)
+        assert ProcessedFileStore(db_path).get_by_source(sample_record.source_path) is not None
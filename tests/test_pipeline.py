@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from playbook.pipeline import iter_in_order
+
+
+def test_iter_in_order_inline_when_single_worker() -> None:
+    threads = []
+
+    def work(item: int) -> int:
+        threads.append(threading.current_thread())
+        return item * 2
+
+    assert list(iter_in_order(work, [1, 2, 3], workers=1)) == [2, 4, 6]
+    assert set(threads) == {threading.current_thread()}
+
+
+def test_iter_in_order_preserves_input_order() -> None:
+    def work(item: int) -> int:
+        # Later items finish first so completion order differs from input order
+        time.sleep(0.001 * (20 - item))
+        return item
+
+    items = list(range(20))
+    assert list(iter_in_order(work, items, workers=4)) == items
+
+
+def test_iter_in_order_stops_submitting_when_closed() -> None:
+    started = []
+
+    def work(item: int) -> int:
+        started.append(item)
+        return item
+
+    results = iter_in_order(work, range(1000), workers=2)
+    assert next(results) == 0
+    results.close()
+    assert len(started) < 1000
@@ -17,6 +17,7 @@ from playbook.metadata_loader import MetadataLoadResult
 from playbook.models import Episode, ProcessingStats, Season, Show
 from playbook.processor import Processor
 from playbook.run_summary import extract_error_context, summarize_plex_errors
+from playbook.tvsportsdb.client import TVSportsDBError
 
 
 def _make_show(title: str = "Demo Series", episode_title: str = "Race", episode_number: int = 1) -> Show:
@@ -538,6 +539,97 @@ def test_watcher_ignore_patterns_do_not_create_unmatched_records(tmp_path, monke
     assert processor.unmatched_store.get_count() == 0
 
 
+def _run_demo_library(tmp_path, monkeypatch, *, workers: int) -> tuple[Processor, ProcessingStats]:
+    settings = Settings(
+        source_dir=tmp_path / "source",
+        destination_dir=tmp_path / "dest",
+        cache_dir=tmp_path / "cache",
+        dry_run=False,
+    )
+    settings.processing.workers = workers
+    settings.ignore_patterns = ["*.tmp"]
+    settings.source_dir.mkdir(parents=True)
+    settings.destination_dir.mkdir(parents=True)
+    settings.cache_dir.mkdir(parents=True)
+
+    for name in (
+        "demo.r01.qualifying.mkv",
+        "demo.r05.qualifying.mkv",
+        "demo.r07.qualifying.mkv",
+        "unrelated.release.mkv",
+        "download.part.tmp",
+        "notes.txt",
+    ):
+        (settings.source_dir / name).write_bytes(b"video")
+
+    pattern = PatternConfig(
+        regex=r"(?i)^demo\.r(?P<round>\d{2})\.(?P<session>qualifying)\.mkv$",
+    )
+    sport = SportConfig(id="demo", name="Demo", show_slug="demo-show", patterns=[pattern])
+    config = AppConfig(settings=settings, sports=[sport])
+    show = _make_show(episode_title="Qualifying")
+
+    def mock_load_sports(*args, **kwargs):
+        from playbook.matcher import compile_patterns
+        from playbook.metadata_loader import SportRuntime
+
+        runtime = SportRuntime(
+            sport=sport,
+            show=show,
+            patterns=compile_patterns(sport),
+            extensions={".mkv"},
+        )
+        return MetadataLoadResult(
+            runtimes=[runtime],
+            changed_sports=[],
+            change_map={},
+            fetch_stats=MetadataFetchStatistics(),
+        )
+
+    monkeypatch.setattr("playbook.processor.load_sports", mock_load_sports)
+
+    processor = Processor(config, enable_notifications=False)
+    return processor, processor.process_all()
+
+
+def test_parallel_workers_match_sequential_results(tmp_path, monkeypatch) -> None:
+    sequential_processor, sequential = _run_demo_library(tmp_path / "sequential", monkeypatch, workers=1)
+    parallel_processor, parallel = _run_demo_library(tmp_path / "parallel", monkeypatch, workers=4)
+
+    assert sequential.processed == parallel.processed == 1
+    assert (sequential.skipped, sequential.ignored) == (parallel.skipped, parallel.ignored)
+    assert sequential.warnings == parallel.warnings
+    assert sequential.errors == parallel.errors
+    assert sequential.ignored_by_sport == parallel.ignored_by_sport
+    assert sequential.warnings_by_sport == parallel.warnings_by_sport
+    assert [detail.split(" ", 1)[0] for detail in sequential.ignored_details] == [
+        detail.split(" ", 1)[0] for detail in parallel.ignored_details
+    ]
+    assert parallel_processor.unmatched_store.get_count() == sequential_processor.unmatched_store.get_count() == 4
+    assert any((tmp_path / "parallel" / "dest").rglob("*.mkv"))
+
+
+def test_unchanged_unmatched_files_are_not_matched_again(tmp_path, monkeypatch) -> None:
+    processor, first = _run_demo_library(tmp_path, monkeypatch, workers=1)
+    assert first.unmatched_skipped == 0
+    assert processor.unmatched_store.get_count() == 4
+
+    second = processor.process_all()
+    assert second.unmatched_skipped == 4
+    assert second.ignored == 1  # Only the file excluded by ignore_patterns
+    # Skipped files keep their records alive through the stale cleanup
+    assert processor.unmatched_store.get_count() == 4
+
+    (tmp_path / "source" / "notes.txt").write_bytes(b"longer video")
+    third = processor.process_all()
+    assert third.unmatched_skipped == 3
+
+    processor.retry_unmatched()
+    fourth = processor.process_all()
+    assert fourth.unmatched_skipped == 0
+    assert fourth.ignored == 5
+
+
 class TestSummarizePlexErrors:
     """Tests for run_summary.summarize_plex_errors."""
 
@@ -840,3 +932,205 @@ def test_content_hash_determinism() -> None:
     assert fingerprint3.content_hash != fingerprint1.content_hash, (
         "Different metadata should produce different content_hash"
     )
+
+
+def test_process_paths_only_handles_changed_files(tmp_path, monkeypatch) -> None:
+    settings = Settings(
+        source_dir=tmp_path / "source",
+        destination_dir=tmp_path / "dest",
+        cache_dir=tmp_path / "cache",
+        dry_run=True,
+    )
+    settings.source_dir.mkdir(parents=True)
+    settings.destination_dir.mkdir(parents=True)
+    settings.cache_dir.mkdir(parents=True)
+
+    existing_file = settings.source_dir / "demo.r02.qualifying.mkv"
+    existing_file.write_bytes(b"video")
+    changed_file = settings.source_dir / "demo.r01.qualifying.mkv"
+    changed_file.write_bytes(b"video")
+
+    pattern = PatternConfig(
+        regex=r"(?i)^demo\.r(?P<round>\d{2})\.(?P<session>qualifying)\.mkv$",
+    )
+    sport = SportConfig(id="demo", name="Demo", show_slug="demo-show", patterns=[pattern])
+    config = AppConfig(settings=settings, sports=[sport])
+    show = _make_show(episode_title="Qualifying")
+    load_calls = []
+
+    def mock_load_sports(*args, **kwargs):
+        from playbook.matcher import compile_patterns
+        from playbook.metadata_loader import SportRuntime
+
+        load_calls.append(1)
+        runtime = SportRuntime(
+            sport=sport,
+            show=show,
+            patterns=compile_patterns(sport),
+            extensions={".mkv"},
+        )
+        return MetadataLoadResult(
+            runtimes=[runtime],
+            changed_sports=[],
+            change_map={},
+            fetch_stats=MetadataFetchStatistics(),
+        )
+
+    monkeypatch.setattr("playbook.processor.load_sports", mock_load_sports)
+    reconcile_calls = []
+    monkeypatch.setattr(
+        "playbook.reconciliation.reconcile_stale_records",
+        lambda store: reconcile_calls.append(store) or 0,
+    )
+
+    processor = Processor(config, enable_notifications=False)
+    processed = []
+    original = processor._prepare_file
+
+    def tracking_prepare_file(source_path, *args, **kwargs):
+        processed.append(source_path)
+        return original(source_path, *args, **kwargs)
+
+    monkeypatch.setattr(processor, "_prepare_file", tracking_prepare_file)
+
+    stats = processor.process_paths([changed_file, settings.source_dir / "deleted.mkv"])
+    assert processed == [changed_file]
+    assert stats.processed == 1
+    assert reconcile_calls == []
+    assert len(load_calls) == 1
+
+    # Every incremental run reloads sports and retries failed dynamic slugs
+    processed.clear()
+    monkeypatch.setattr(processor._dynamic_loader, "clear_failed_slugs", lambda: load_calls.append("cleared"))
+    processor.process_paths([existing_file])
+    assert processed == [existing_file]
+    assert load_calls == [1, "cleared", 1]
+
+
+def test_process_paths_scans_everything_after_metadata_change(tmp_path, monkeypatch) -> None:
+    settings = Settings(
+        source_dir=tmp_path / "source",
+        destination_dir=tmp_path / "dest",
+        cache_dir=tmp_path / "cache",
+        dry_run=True,
+    )
+    for directory in (settings.source_dir, settings.destination_dir, settings.cache_dir):
+        directory.mkdir(parents=True)
+    config = AppConfig(settings=settings, sports=[])
+    changed = [("demo", "Demo")]
+    monkeypatch.setattr(
+        "playbook.processor.load_sports",
+        lambda *args, **kwargs: MetadataLoadResult(
+            runtimes=[],
+            changed_sports=list(changed),
+            change_map={},
+            fetch_stats=MetadataFetchStatistics(),
+        ),
+    )
+    processor = Processor(config, enable_notifications=False)
+    full_scans = []
+    monkeypatch.setattr(processor, "_gather_source_files", lambda stats: full_scans.append(1) or [])
+
+    processor.process_paths([settings.source_dir / "new.mkv"])
+    assert full_scans == [1]
+
+    changed.clear()
+    processor.process_paths([settings.source_dir / "new.mkv"])
+    assert full_scans == [1]
+
+
+def test_runtime_registry_reuses_runtimes_across_loads(tmp_path, monkeypatch) -> None:
+    from unittest.mock import MagicMock
+
+    from playbook.metadata_loader import SportRuntimeRegistry, load_sports
+
+    settings = Settings(
+        source_dir=tmp_path / "source",
+        destination_dir=tmp_path / "dest",
+        cache_dir=tmp_path / "cache",
+    )
+    pattern = PatternConfig(regex=r"(?i)^demo\.r(?P<round>\d{2})\.(?P<session>qualifying)\.mkv$")
+    sport = SportConfig(id="demo", name="Demo", show_slug="demo-show", patterns=[pattern])
+
+    client = MagicMock()
+    client.cache.show_fetched_at.return_value = None
+    monkeypatch.setattr("playbook.metadata_loader.TVSportsDBClient", MagicMock(return_value=client))
+    shows = [_make_show(episode_title="Qualifying")]
+    loads: list[str] = []
+
+    def fake_load_show(_client, _adapter, sport_config, _stats):
+        loads.append(sport_config.id)
+        return shows[-1]
+
+    monkeypatch.setattr("playbook.metadata_loader._load_show_from_api", fake_load_show)
+    registry = SportRuntimeRegistry(settings)
+
+    def load() -> MetadataLoadResult:
+        return load_sports([sport], settings, None, registry=registry)
+
+    def expire() -> None:
+        registry._entries["demo"].validated_at -= settings.tvsportsdb.ttl_hours * 3600 + 1
+
+    first = load().runtimes[0]
+    assert loads == ["demo"]
+
+    # Within the TTL the runtime is reused without touching the API
+    second = load()
+    assert second.runtimes[0] is first
+    assert loads == ["demo"]
+    assert second.fetch_stats.cache_hits == 1
+    client.revalidate_show.assert_not_called()
+
+    # Past the TTL an unchanged show is revalidated, not reloaded
+    expire()
+    client.revalidate_show.return_value = False
+    assert load().runtimes[0] is first
+    assert loads == ["demo"]
+
+    # Changed cache entries reload the show but keep the runtime when its fingerprint is unchanged
+    expire()
+    client.revalidate_show.return_value = True
+    assert load().runtimes[0] is first
+    assert loads == ["demo", "demo"]
+
+    # A different show is rebuilt
+    expire()
+    shows.append(_make_show(episode_title="Race"))
+    rebuilt = load().runtimes[0]
+    assert rebuilt is not first
+    assert rebuilt.show is shows[-1]
+
+    # Content refreshed in the background is picked up before the TTL passes
+    from datetime import UTC, datetime
+
+    client.cache.show_fetched_at.return_value = datetime.now(UTC)
+    assert load().runtimes[0] is rebuilt
+    assert loads == ["demo", "demo", "demo", "demo"]
+    client.cache.show_fetched_at.return_value = None
+
+    # API failures keep serving the last known runtime
+    expire()
+    client.revalidate_show.side_effect = TVSportsDBError("offline")
+    stale = load()
+    assert stale.runtimes[0] is rebuilt
+    assert stale.fetch_stats.stale_used == 1
+
+    # Disabled sports are dropped from the registry
+    sport.enabled = False
+    assert load().runtimes == []
+    assert len(registry) == 0
+
+
+def test_close_stops_metadata_clients(tmp_path) -> None:
+    processor = _make_processor(tmp_path)
+    registry_client = processor._runtime_registry.client
+    dynamic_client = processor._dynamic_loader._get_client()
+
+    processor.close()
+
+    assert processor._runtime_registry._client is None
+    assert processor._dynamic_loader._client is None
+    assert registry_client._client.is_closed
+    assert dynamic_client._client.is_closed
+    # One-shot runs would exit before a background revalidation finishes
+    assert registry_client._refresher is None
@@ -44,45 +44,67 @@ class TestReconcileStaleRecords:
         existing_dest.touch()
         missing_dest = tmp_path / "gone.mkv"
 
-        rec_ok = _make_record(source_path="/src/a.mkv", destination_path=str(existing_dest))
-        rec_stale = _make_record(source_path="/src/b.mkv", destination_path=str(missing_dest))
-
-        store = MagicMock()
-        store.iter_all.return_value = [rec_ok, rec_stale]
-
-        removed = reconcile_stale_records(store)
-
-        assert removed == 1
-        store.delete_by_source.assert_called_once_with("/src/b.mkv")
-
-    def test_skips_error_records(self, tmp_path):
-        missing_dest = tmp_path / "gone.mkv"
-        rec_error = _make_record(
-            source_path="/src/err.mkv",
-            destination_path=str(missing_dest),
-            status="error",
-        )
-
         store = MagicMock()
-        store.iter_all.return_value = [rec_error]
+        store.get_destination_slice.return_value = [
+            (1, "/src/a.mkv", str(existing_dest)),
+            (2, "/src/b.mkv", str(missing_dest)),
+        ]
+        store.delete_by_sources.return_value = 1
 
-        removed = reconcile_stale_records(store)
+        result = reconcile_stale_records(store)
 
-        assert removed == 0
-        store.delete_by_source.assert_not_called()
+        assert (result.checked, result.removed, result.next_cursor) == (2, 1, 0)
+        store.get_destination_slice.assert_called_once_with(after_id=0, limit=None)
+        store.delete_by_sources.assert_called_once_with(["/src/b.mkv"])
 
     def test_no_stale_records(self, tmp_path):
         dest = tmp_path / "file.mkv"
         dest.touch()
-        rec = _make_record(destination_path=str(dest))
 
         store = MagicMock()
-        store.iter_all.return_value = [rec]
-
-        removed = reconcile_stale_records(store)
-
-        assert removed == 0
-        store.delete_by_source.assert_not_called()
+        store.get_destination_slice.return_value = [(1, "/src/file.mkv", str(dest))]
+
+        result = reconcile_stale_records(store)
+
+        assert result.removed == 0
+        store.delete_by_sources.assert_not_called()
+
+    def test_budget_walks_the_table_in_slices(self, tmp_path):
+        from datetime import datetime
+
+        from playbook.persistence import ProcessedFileRecord, ProcessedFileStore
+
+        store = ProcessedFileStore(tmp_path / "playbook.db")
+        for index in range(5):
+            destination = tmp_path / f"dest-{index}.mkv"
+            if index != 3:
+                destination.touch()
+            store.record_processed(
+                ProcessedFileRecord(
+                    source_path=f"/src/{index}.mkv",
+                    destination_path=str(destination),
+                    sport_id="f1",
+                    show_id="f1",
+                    season_index=1,
+                    episode_index=index,
+                    processed_at=datetime.now(),
+                    status="error" if index == 4 else "linked",
+                )
+            )
+
+        first = reconcile_stale_records(store, budget=2)
+        assert (first.checked, first.removed) == (2, 0)
+        assert first.next_cursor > 0
+
+        second = reconcile_stale_records(store, budget=2, cursor=first.next_cursor)
+        assert (second.checked, second.removed) == (2, 1)
+        assert store.get_by_source("/src/3.mkv") is None
+
+        # Error records are never checked; the walk then restarts from the beginning
+        third = reconcile_stale_records(store, budget=2, cursor=second.next_cursor)
+        assert (third.checked, third.next_cursor) == (0, 0)
+        assert store.get_by_source("/src/4.mkv") is not None
+        store.close()
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,81 @@
+"""Import-time budget and startup profile tests."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from playbook import cli
+from playbook.startup_profile import measure_imports, parse_importtime, slowest_packages, total_ms
+
+# Dependencies that only some commands need; importing the CLI must not load them
+_DEFERRED_MODULES = {
+    "playbook.cli": ("kubernetes", "watchdog", "jsonschema", "httpx", "pydantic", "playbook.processor"),
+    "playbook": ("playbook.processor", "playbook.metadata_loader"),
+    "playbook.processor": ("kubernetes", "watchdog", "jsonschema"),
+}
+
+# Cold `import playbook.cli` took ~900ms before heavy imports were deferred and ~200ms after
+_CLI_IMPORT_BUDGET_MS = 500
+
+
+def _loaded_modules(module: str) -> set[str]:
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(path for path in sys.path if path)
+    completed = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print('\\n'.join(sys.modules))"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return set(completed.stdout.split())
+
+
+@pytest.mark.parametrize("module", sorted(_DEFERRED_MODULES))
+def test_heavy_dependencies_are_imported_on_demand(module: str) -> None:
+    loaded = _loaded_modules(module)
+
+    assert module in loaded
+    assert not [name for name in _DEFERRED_MODULES[module] if name in loaded]
+
+
+@pytest.mark.benchmark
+def test_cli_import_time_stays_within_budget() -> None:
+    # Wall-clock timing; deselected by default since loaded machines vary too much
+    best = min(total_ms(measure_imports("playbook.cli")) for _ in range(3))
+
+    assert 0 < best < _CLI_IMPORT_BUDGET_MS
+
+
+def test_parse_importtime_reads_nesting_and_times() -> None:
+    output = "\n".join(
+        [
+            "import time: self [us] | cumulative | imported package",
+            "import time:       120 |        120 |     yaml.error",
+            "import time:       300 |        420 |   yaml",
+            "import time:        80 |        500 | playbook.utils",
+            "unrelated stderr line",
+        ]
+    )
+
+    timings = parse_importtime(output)
+
+    assert [(timing.module, timing.depth) for timing in timings] == [
+        ("yaml.error", 2),
+        ("yaml", 1),
+        ("playbook.utils", 0),
+    ]
+    assert total_ms(timings) == 0.5
+    assert slowest_packages(timings) == [("yaml", 0.42), ("playbook.utils", 0.08)]
+
+
+def test_profile_startup_flag_prints_profile_and_exits(monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr("playbook.startup_profile.print_startup_profile", lambda console: calls.append(console))
+
+    assert cli.main(("--profile-startup",)) == 0
+    assert calls == [cli.CONSOLE]
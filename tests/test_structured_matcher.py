@@ -497,3 +497,51 @@ def test_structured_match_with_provider_plus_and_trailing_date_tokens() -> None:
     result = match_file_to_episode(filename, sport, show, patterns=[])
     assert result is not None
     assert result["episode"].title == "Chicago Blackhawks vs Los Angeles Kings"
+
+
+def test_team_alias_cache_reuses_lookup_across_files_and_reloads() -> None:
+    from playbook.matcher import TeamAliasLookupCache
+
+    sport = _sport("nhl", alias_map="nhl")
+
+    def build_show() -> Show:
+        season = _season(
+            "nhl-week-7",
+            "Week 7",
+            [
+                _episode(
+                    "New Jersey Devils vs Philadelphia Flyers",
+                    dt.date(2025, 11, 22),
+                    aliases=["NJD vs PHI"],
+                    index=1,
+                )
+            ],
+        )
+        return _show("NHL 2025-26", [season])
+
+    cache = TeamAliasLookupCache()
+    show = build_show()
+    for _ in range(3):
+        result = match_file_to_episode(
+            "NHL-2025-11-22_NJD@PHI.mkv",
+            sport,
+            show,
+            patterns=[],
+            team_alias_cache=cache,
+            show_fingerprint="digest-1",
+        )
+        assert result is not None
+        assert result["episode"].title == "New Jersey Devils vs Philadelphia Flyers"
+    assert (cache.hits, cache.misses) == (2, 1)
+
+    # A reloaded show with the same fingerprint reuses the lookup...
+    match_file_to_episode(
+        "NHL-2025-11-22_NJD@PHI.mkv", sport, build_show(), [], team_alias_cache=cache, show_fingerprint="digest-1"
+    )
+    assert cache.misses == 1
+    # ...while changed metadata rebuilds it
+    match_file_to_episode(
+        "NHL-2025-11-22_NJD@PHI.mkv", sport, build_show(), [], team_alias_cache=cache, show_fingerprint="digest-2"
+    )
+    assert cache.misses == 2
+    assert cache.snapshot() == {"hits": 3, "misses": 2, "entries": 1}
@@ -274,3 +274,93 @@ class TestTVSportsDBCache:
         assert len(retrieved.seasons[0].episodes) == 2
         assert len(retrieved.seasons[1].episodes) == 2
         assert retrieved.seasons[0].episodes[0].aliases == ["E1"]
+
+    def test_show_fetched_at_tracks_content_changes_only(self, tmp_path) -> None:
+        """TTL refreshes keep the fetch time; stored content of the show or a season advances it."""
+        cache = TVSportsDBCache(tmp_path / "cache", ttl_hours=12)
+        assert cache.show_fetched_at("test-show") is None
+
+        cache.save_show("test-show", ShowResponse(id=1, slug="test-show", title="Test", sort_title="Test"))
+        cache.save_show("test-show-2", ShowResponse(id=2, slug="test-show-2", title="Other", sort_title="Other"))
+        first = cache.show_fetched_at("test-show")
+        assert first is not None
+
+        cache.refresh_show_ttl("test-show")
+        assert cache.show_fetched_at("test-show") == first
+
+        season = SeasonResponse(id=1, show_id=1, number=1, title="S1", sort_title="S1")
+        cache.save_season("test-show", 1, season)
+        assert cache.show_fetched_at("test-show") > first
+
+    def test_expiring_entries_lists_shows_and_seasons(self, tmp_path) -> None:
+        """Entries expiring within the window are reported as (slug, season) pairs."""
+        cache = TVSportsDBCache(tmp_path / "cache", ttl_hours=1)
+        cache.save_show("test-show", ShowResponse(id=1, slug="test-show", title="Test", sort_title="Test"))
+        cache.save_season("test-show", 2, SeasonResponse(id=1, show_id=1, number=2, title="S2", sort_title="S2"))
+        cache.save_team_aliases("nfl", [])
+
+        assert cache.expiring_entries(timedelta(minutes=30)) == []
+        assert sorted(cache.expiring_entries(timedelta(hours=2)), key=str) == [("test-show", 2), ("test-show", None)]
+
+    def test_unchanged_entries_are_validated_once(self, tmp_path) -> None:
+        """Test that repeated reads reuse the validated model until the entry changes."""
+        cache = TVSportsDBCache(tmp_path / "cache", ttl_hours=12)
+        season = SeasonResponse(
+            id=10,
+            show_id=1,
+            number=1,
+            title="Season 1",
+            sort_title="Season 1",
+            episodes=[EpisodeResponse(id=100, season_id=10, number=1, title="Ep1")],
+        )
+        cache.save_season("test-show", 1, season)
+
+        # A new cache instance (new process) decodes and validates once
+        reopened = TVSportsDBCache(tmp_path / "cache", ttl_hours=12)
+        for _ in range(3):
+            assert reopened.get_season("test-show", 1).episodes[0].title == "Ep1"
+        stats = reopened.get_stats()
+        assert stats["decode_misses"] == 1
+        assert stats["decode_hits"] == 2
+        assert stats["model_misses"] == 1
+        assert stats["model_hits"] == 2
+        assert 0 < stats["stored_bytes"]
+
+        season.episodes.append(EpisodeResponse(id=101, season_id=10, number=2, title="Ep2"))
+        reopened.save_season("test-show", 1, season)
+        assert len(reopened.get_season("test-show", 1).episodes) == 2
+
+    def test_seasons_carry_content_digest(self, tmp_path) -> None:
+        """Test that stored and cached seasons report the digest of their cache entry."""
+        cache = TVSportsDBCache(tmp_path / "cache", ttl_hours=12)
+        season = SeasonResponse(id=10, show_id=1, number=1, title="Season 1", sort_title="Season 1")
+        cache.save_season("test-show", 1, season)
+
+        assert season.content_digest
+        assert "content_digest" not in season.model_dump()
+        reopened = TVSportsDBCache(tmp_path / "cache", ttl_hours=12)
+        assert reopened.get_season("test-show", 1).content_digest == season.content_digest
+
+        season.episodes.append(EpisodeResponse(id=100, season_id=10, number=1, title="Ep1"))
+        digest = season.content_digest
+        cache.save_season("test-show", 1, season)
+        assert cache.get_season("test-show", 1).content_digest not in (None, digest)
+
+    def test_parsed_show_copies_do_not_share_seasons(self, tmp_path) -> None:
+        """Test that replacing a season's episodes does not leak into later reads."""
+        cache = TVSportsDBCache(tmp_path / "cache", ttl_hours=12)
+        cache.save_show(
+            "test-show",
+            ShowResponse(
+                id=1,
+                slug="test-show",
+                title="Test",
+                sort_title="Test",
+                seasons=[SeasonResponse(id=10, show_id=1, number=1, title="S1", sort_title="S1")],
+            ),
+        )
+
+        first = cache.get_show("test-show")
+        first.seasons[0].episodes = [EpisodeResponse(id=100, season_id=10, number=1, title="Ep1")]
+
+        assert cache.get_show("test-show").seasons[0].episodes == []
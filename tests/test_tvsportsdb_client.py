@@ -296,6 +296,200 @@ class TestTVSportsDBClient:
 
         mock_httpx_client.close.assert_called_once()
 
+    def _cache_show_with_season(self, client, *, expire: tuple[str, ...] = ()) -> None:
+        from datetime import UTC, datetime, timedelta
+
+        from playbook.tvsportsdb.models import SeasonResponse, ShowResponse
+
+        season = SeasonResponse(id=10, show_id=1, number=1, title="S1", sort_title="S1")
+        show = ShowResponse(id=1, slug="test", title="Test", sort_title="Test", seasons=[season])
+        client.cache.save_show("test", show, etag='"show-v1"')
+        client.cache.save_season("test", 1, season, etag='"season-v1"')
+        conn = client.cache._store._get_connection()
+        for key in expire:
+            conn.execute(
+                "UPDATE metadata_cache SET expires_at = ? WHERE key = ?",
+                ((datetime.now(UTC) - timedelta(hours=1)).isoformat(), key),
+            )
+        conn.commit()
+
+    def test_revalidate_show_fresh_cache_makes_no_request(self, client, mock_httpx_client) -> None:
+        """Fresh show and season entries are trusted without any HTTP request."""
+        self._cache_show_with_season(client)
+
+        assert client.revalidate_show("test") is False
+        mock_httpx_client.request.assert_not_called()
+
+    def test_revalidate_show_not_modified_refreshes_ttl(self, client, mock_httpx_client) -> None:
+        """Expired entries answered with 304 are unchanged and become fresh again."""
+        self._cache_show_with_season(client, expire=("shows/test", "seasons/test_s1"))
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        mock_httpx_client.request.return_value = not_modified
+
+        assert client.revalidate_show("test") is False
+        assert mock_httpx_client.request.call_count == 2
+        assert mock_httpx_client.request.call_args.kwargs["headers"]["If-None-Match"] == '"season-v1"'
+        assert client.cache.get_show_entry("test").is_fresh
+        assert client.cache.get_season_entry("test", 1).is_fresh
+
+    def test_revalidate_show_reports_changed_season(self, client, mock_httpx_client) -> None:
+        """A season answered with new content is stored and reported as changed."""
+        self._cache_show_with_season(client, expire=("seasons/test_s1",))
+        changed = MagicMock()
+        changed.status_code = 200
+        changed.headers = {"ETag": '"season-v2"'}
+        changed.json.return_value = {
+            "id": 10,
+            "show_id": 1,
+            "number": 1,
+            "title": "S1",
+            "sort_title": "S1",
+            "episodes": [{"id": 100, "season_id": 10, "number": 1, "title": "Race"}],
+        }
+        mock_httpx_client.request.return_value = changed
+
+        assert client.revalidate_show("test") is True
+        assert mock_httpx_client.request.call_count == 1
+        assert client.cache.get_season("test", 1).episodes[0].title == "Race"
+
+    def test_revalidate_show_missing_entry_is_changed(self, client, mock_httpx_client) -> None:
+        """A show that was never cached must be loaded."""
+        assert client.revalidate_show("unknown") is True
+        mock_httpx_client.request.assert_not_called()
+
+    def test_get_show_fetches_seasons_concurrently(self, client, mock_httpx_client) -> None:
+        """Season requests overlap and each season receives its own episodes."""
+        import threading
+        import time
+
+        numbers = [1, 2, 3, 4]
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def respond(method, url, **kwargs):
+            nonlocal active, peak
+            response = MagicMock(status_code=200, headers={})
+            if "/seasons/" not in url:
+                response.json.return_value = {
+                    "id": 1,
+                    "slug": "test",
+                    "title": "Test",
+                    "sort_title": "Test",
+                    "seasons": [
+                        {"id": n, "show_id": 1, "number": n, "title": f"S{n}", "sort_title": f"S{n}"} for n in numbers
+                    ],
+                }
+                return response
+            number = int(url.rsplit("/", 1)[1])
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.05)
+            with lock:
+                active -= 1
+            response.json.return_value = {
+                "id": number,
+                "show_id": 1,
+                "number": number,
+                "title": f"S{number}",
+                "sort_title": f"S{number}",
+                "episodes": [{"id": 100 + number, "season_id": number, "number": 1, "title": f"Episode {number}"}],
+            }
+            return response
+
+        mock_httpx_client.request.side_effect = respond
+
+        show = client.get_show("test", include_episodes=True)
+
+        assert [season.episodes[0].title for season in show.seasons] == [f"Episode {n}" for n in numbers]
+        assert peak > 1
+        client.close()
+
+    def test_get_show_fills_duplicate_season_numbers(self, client, mock_httpx_client) -> None:
+        """Seasons sharing a number each keep their list position and receive episodes."""
+        requested: list[str] = []
+
+        def respond(method, url, **kwargs):
+            requested.append(url)
+            response = MagicMock(status_code=200, headers={})
+            if "/seasons/" not in url:
+                response.json.return_value = {
+                    "id": 1,
+                    "slug": "test",
+                    "title": "Test",
+                    "sort_title": "Test",
+                    "seasons": [
+                        {"id": 1, "show_id": 1, "number": 1, "title": "A", "sort_title": "A"},
+                        {"id": 2, "show_id": 1, "number": 1, "title": "B", "sort_title": "B"},
+                        {"id": 3, "show_id": 1, "number": 2, "title": "C", "sort_title": "C"},
+                    ],
+                }
+                return response
+            number = int(url.rsplit("/", 1)[1])
+            response.json.return_value = {
+                "id": number,
+                "show_id": 1,
+                "number": number,
+                "title": f"S{number}",
+                "sort_title": f"S{number}",
+                "episodes": [{"id": 100 + number, "season_id": number, "number": 1, "title": f"Episode {number}"}],
+            }
+            return response
+
+        mock_httpx_client.request.side_effect = respond
+
+        show = client.get_show("test", include_episodes=True)
+
+        assert [season.title for season in show.seasons] == ["A", "B", "C"]
+        assert [season.episodes[0].title for season in show.seasons] == ["Episode 1", "Episode 1", "Episode 2"]
+        assert sum("/seasons/" in url for url in requested) == 2
+        client.close()
+
+    @patch("playbook.tvsportsdb.client.time.sleep")
+    def test_rate_limit_pauses_other_requests(self, mock_sleep, client, mock_httpx_client) -> None:
+        """A Retry-After seen by one request delays the next request of the client."""
+        rate_limited = MagicMock(status_code=429, headers={"Retry-After": "5"})
+        client._rate_limited(rate_limited, 1.0)
+        mock_httpx_client.request.return_value = MagicMock(status_code=304)
+
+        client._request("GET", "/shows/test/seasons/1", etag='"v1"')
+
+        mock_sleep.assert_called_once()
+        assert 4 < mock_sleep.call_args.args[0] <= 5
+
+    def test_serve_stale_returns_cached_data_and_refreshes_in_background(self, tmp_path, mock_httpx_client) -> None:
+        """Expired entries are answered at once; only the refresher thread talks to the API."""
+        import threading
+        import time
+
+        client = TVSportsDBClient(cache_dir=tmp_path, ttl_hours=12, serve_stale=True)
+        self._cache_show_with_season(client, expire=("shows/test", "seasons/test_s1"))
+        callers: list[str] = []
+
+        def respond(method, url, **kwargs):
+            callers.append(threading.current_thread().name)
+            return MagicMock(status_code=304)
+
+        mock_httpx_client.request.side_effect = respond
+
+        show = client.get_show("test", include_episodes=True)
+        assert show.title == "Test"
+        assert client.revalidate_show("test") is False
+
+        deadline = time.monotonic() + 5
+        while (
+            not client.cache.get_season_entry("test", 1, include_expired=True).is_fresh and time.monotonic() < deadline
+        ):
+            time.sleep(0.01)
+        client.close()
+
+        assert client.cache.get_show_entry("test").is_fresh
+        assert client.cache.get_season_entry("test", 1).is_fresh
+        assert callers
+        assert set(callers) == {"tvsportsdb-refresher"}
+
     def test_uses_hardcoded_api_url(self, tmp_path) -> None:
         """Test that client uses the hardcoded API URL."""
         from playbook.tvsportsdb.client import API_BASE_URL
@@ -567,3 +567,140 @@ class TestUnmatchedFileStore:
         assert retrieved is not None
         assert retrieved.filename == sample_record.filename
         store2.close()
+
+    def test_keyset_pagination(self, store):
+        """Test paging with the (last_seen, source_path) cursor."""
+        now = datetime.now()
+
+        for i in range(25):
+            store.record_unmatched(
+                UnmatchedFileRecord(
+                    source_path=f"/source/file{i:02d}.mkv",
+                    filename=f"file{i:02d}.mkv",
+                    first_seen=now,
+                    # Pairs share a timestamp so the source_path tie-break is exercised
+                    last_seen=now + timedelta(seconds=i // 2),
+                    file_size=1000,
+                    file_category="video",
+                )
+            )
+
+        seen: list[str] = []
+        after = None
+        while True:
+            page = store.get_all(limit=10, after=after)
+            if not page:
+                break
+            seen.extend(record.source_path for record in page)
+            after = (page[-1].last_seen, page[-1].source_path)
+
+        assert len(seen) == 25
+        assert seen == [record.source_path for record in store.get_all(limit=100)]
+
+    def test_search_matches_failure_summary_and_tracks_updates(self, store, sample_record):
+        """Test full-text search over failure summaries, kept current on upsert."""
+        sample_record.failure_summary = "No pattern matched the session name"
+        store.record_unmatched(sample_record)
+        assert store.get_count(search_query="session name") == 1
+
+        sample_record.failure_summary = "Episode not found"
+        store.record_unmatched(sample_record)
+        assert store.get_count(search_query="session name") == 0
+        assert store.get_count(search_query="EPISODE") == 1
+
+        # Queries shorter than a trigram still work
+        assert store.get_count(search_query=sample_record.filename[:2]) == 1
+
+        store.delete_by_source(sample_record.source_path)
+        assert store.get_count(search_query="Episode") == 0
+
+    def test_sport_filter_follows_attempted_sports(self, store, sample_record):
+        """Test that the attempted sports index follows record updates and deletes."""
+        sample_record.attempted_sports = ["f1", "motogp"]
+        store.record_unmatched(sample_record)
+        assert store.get_count(sport_filter="motogp") == 1
+
+        sample_record.attempted_sports = ["f1"]
+        store.record_unmatched(sample_record)
+        assert store.get_count(sport_filter="motogp") == 0
+        assert store.get_count(sport_filter="f1") == 1
+
+        store.clear()
+        assert store.get_count(sport_filter="f1") == 0
+
+    def test_migrates_version_1_database(self, tmp_path, sample_record):
+        """Test that existing rows are indexed when upgrading from schema version 1."""
+        db_path = tmp_path / "v1.db"
+        sample_record.attempted_sports = ["f1"]
+        store = UnmatchedFileStore(db_path)
+        store.record_unmatched(sample_record)
+        conn = store._get_connection()
+        conn.execute("DROP TABLE unmatched_files_fts")
+        conn.execute("DROP TABLE unmatched_attempted_sports")
+        for (name,) in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'").fetchall():
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.execute("UPDATE unmatched_schema_version SET version = 1")
+        conn.commit()
+        store.close()
+
+        upgraded = UnmatchedFileStore(db_path)
+        assert upgraded.get_count(search_query=sample_record.filename[2:8]) == 1
+        assert upgraded.get_count(sport_filter="f1") == 1
+        upgraded.close()
+
+    def test_match_states_and_retry(self, store, sample_record):
+        """Test the negative-match cache entries and clearing them for a retry."""
+        sample_record.file_mtime_ns = 1_700_000_000_000_000_000
+        sample_record.match_key = "key-1"
+        store.record_unmatched(sample_record)
+        other = UnmatchedFileRecord(
+            source_path="/source/notes.txt",
+            filename="notes.txt",
+            first_seen=sample_record.first_seen,
+            last_seen=sample_record.last_seen,
+            file_size=10,
+            file_category="metadata",
+        )
+        store.record_unmatched(other)
+
+        states = store.get_match_states([sample_record.source_path, other.source_path, "/source/missing.mkv"])
+        assert list(states) == [sample_record.source_path]
+        state = states[sample_record.source_path]
+        assert (state.file_size, state.file_mtime_ns, state.match_key) == (
+            5_000_000_000,
+            1_700_000_000_000_000_000,
+            "key-1",
+        )
+        assert state.attempted_at == sample_record.last_seen
+
+        later = sample_record.last_seen + timedelta(hours=1)
+        store.touch([sample_record.source_path], later)
+        retrieved = store.get_by_source(sample_record.source_path)
+        assert retrieved.last_seen == later
+        # Seeing the file again is not a new attempt
+        assert store.get_match_states([sample_record.source_path])[sample_record.source_path].attempted_at == (
+            sample_record.last_seen
+        )
+
+        assert store.clear_match_keys() == 1
+        assert store.get_match_states([sample_record.source_path]) == {}
+        assert store.get_count() == 2
+
+    def test_match_states_large_lookup(self, store, sample_record):
+        """Test that lookups beyond one IN (...) query return the same states."""
+        sample_record.file_mtime_ns = 1
+        sample_record.match_key = "key-1"
+        store.record_unmatched(sample_record)
+
+        paths = [f"/source/missing-{index}.mkv" for index in range(600)] + [sample_record.source_path]
+        assert list(store.get_match_states(paths)) == [sample_record.source_path]
+        assert store.get_match_states([]) == {}
+
+    def test_match_states_skip_manually_matched(self, store, sample_record):
+        """Test that manually matched files are never skipped as known unmatched."""
+        sample_record.file_mtime_ns = 1
+        sample_record.match_key = "key-1"
+        store.record_unmatched(sample_record)
+        store.mark_manually_matched(sample_record.source_path, "formula-1-2024", 1, 2)
+
+        assert store.get_match_states([sample_record.source_path]) == {}
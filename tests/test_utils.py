@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import os
+
 import pytest
 
 from playbook.utils import (
     clear_normalize_cache,
     env_bool,
     env_list,
+    existing_paths,
     get_normalize_cache_info,
     hash_file,
     hash_text,
@@ -79,6 +82,30 @@ def test_link_file_creates_destination_and_detects_existing(tmp_path) -> None:
     assert second.reason == "destination-exists"
 
 
+def test_existing_paths_matches_os_path_exists(tmp_path) -> None:
+    season = tmp_path / "Season 01"
+    season.mkdir()
+    present = [season / f"Episode {index}.mkv" for index in range(10)]
+    for path in present:
+        path.write_bytes(b"")
+    (season / "Broken.mkv").symlink_to(tmp_path / "missing-target.mkv")
+    (season / "Linked.mkv").symlink_to(present[0])
+    lone = tmp_path / "Other" / "Single.mkv"
+    lone.parent.mkdir()
+    lone.write_bytes(b"")
+
+    candidates = [str(path) for path in present] + [
+        str(season / "Broken.mkv"),
+        str(season / "Linked.mkv"),
+        str(season / "Gone.mkv"),
+        str(lone),
+        str(tmp_path / "Missing Dir" / "Episode.mkv"),
+    ]
+
+    assert existing_paths(candidates) == {path for path in candidates if os.path.exists(path)}
+    assert str(season / "Broken.mkv") not in existing_paths(candidates)
+
+
 class TestParseEnvBool:
     @pytest.mark.parametrize("value", ["true", "True", "TRUE", "1", "yes", "YES", "on", "ON"])
     def test_parses_truthy_values(self, value: str) -> None:
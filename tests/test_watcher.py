@@ -979,8 +979,8 @@ class TestFileWatcherLoopResolveRoots:
 class TestFileWatcherLoopRunProcessor:
     """Tests for FileWatcherLoop._run_processor method."""
 
-    def test_calls_processor_process_all(self, mock_processor, watcher_settings, mock_observer):
-        """Test that _run_processor calls processor.process_all()."""
+    def test_first_run_is_full_scan(self, mock_processor, watcher_settings, mock_observer):
+        """Test that the first _run_processor call runs a full process_all() scan."""
         with patch("playbook.watcher.Observer", return_value=mock_observer):
             loop = FileWatcherLoop(mock_processor, watcher_settings)
 
@@ -990,33 +990,65 @@ class TestFileWatcherLoopRunProcessor:
             # Call _run_processor
             loop._run_processor(pending)
 
-            # Verify processor.process_all() was called
+            # Verify processor.process_all() was called instead of an incremental run
             mock_processor.process_all.assert_called_once()
+            mock_processor.process_paths.assert_not_called()
 
-    def test_calls_processor_process_all_with_empty_set(self, mock_processor, watcher_settings, mock_observer):
-        """Test that _run_processor calls processor.process_all() even with empty pending set."""
+    def test_calls_process_paths_after_full_scan(self, mock_processor, watcher_settings, mock_observer):
+        """Test that later runs only process the pending paths."""
         with patch("playbook.watcher.Observer", return_value=mock_observer):
             loop = FileWatcherLoop(mock_processor, watcher_settings)
+            loop._run_processor(set())
+            mock_processor.process_all.reset_mock()
+
+            pending = {Path("/path/to/file2.mp4"), Path("/path/to/file1.mkv")}
+            loop._run_processor(pending)
 
-            # Call _run_processor with empty set
+            mock_processor.process_all.assert_not_called()
+            mock_processor.process_paths.assert_called_once_with(
+                [Path("/path/to/file1.mkv"), Path("/path/to/file2.mp4")]
+            )
+
+    def test_incremental_run_keeps_unprocessed_events(self, mock_processor, watcher_settings, mock_observer):
+        """Test that events for paths outside the processed batch survive the post-run drain."""
+        with patch("playbook.watcher.Observer", return_value=mock_observer):
+            loop = FileWatcherLoop(mock_processor, watcher_settings)
             loop._run_processor(set())
 
-            # Verify processor.process_all() was still called
-            mock_processor.process_all.assert_called_once()
+            processed = Path("/path/to/file1.mkv")
+            waiting = Path("/path/to/file2.mkv")
+            loop._queue.put(processed)
+            loop._queue.put(waiting)
+            loop._run_processor({processed})
 
-    def test_calls_processor_process_all_with_single_file(self, mock_processor, watcher_settings, mock_observer):
-        """Test that _run_processor calls processor.process_all() with single file."""
+            assert loop._queue.get_nowait() == waiting
+            assert loop._queue.empty()
+
+    def test_full_scan_drains_every_event(self, mock_processor, watcher_settings, mock_observer):
+        """Test that a full scan discards every queued event since it covered the whole tree."""
         with patch("playbook.watcher.Observer", return_value=mock_observer):
             loop = FileWatcherLoop(mock_processor, watcher_settings)
+            loop._queue.put(Path("/path/to/file1.mkv"))
+            loop._queue.put(Path("/path/to/file2.mkv"))
 
-            # Create a set with single path
-            pending = {Path("/path/to/file.mkv")}
+            loop._run_processor({Path("/path/to/file1.mkv")})
 
-            # Call _run_processor
-            loop._run_processor(pending)
+            assert loop._queue.empty()
 
-            # Verify processor.process_all() was called
-            mock_processor.process_all.assert_called_once()
+    def test_failed_full_scan_is_retried(self, mock_processor, watcher_settings, mock_observer):
+        """Test that an initial full scan that raises is attempted again on the next run."""
+        with patch("playbook.watcher.Observer", return_value=mock_observer):
+            loop = FileWatcherLoop(mock_processor, watcher_settings)
+            mock_processor.process_all.side_effect = RuntimeError("boom")
+
+            with pytest.raises(RuntimeError):
+                loop._run_processor({Path("/path/to/file.mkv")})
+
+            mock_processor.process_all.side_effect = None
+            loop._run_processor({Path("/path/to/file.mkv")})
+
+            assert mock_processor.process_all.call_count == 2
+            mock_processor.process_paths.assert_not_called()
 
     def test_logs_detected_changes_with_single_file(self, mock_processor, watcher_settings, mock_observer, caplog):
         """Test that _run_processor logs the number of changes for a single file."""
@@ -1216,15 +1248,17 @@ class TestFileWatcherLoopRunProcessor:
                 assert alpha_pos < beta_pos < zebra_pos
 
     def test_processor_called_regardless_of_pending_count(self, mock_processor, watcher_settings, mock_observer):
-        """Test that processor.process_all() is called regardless of pending count."""
+        """Test that processor.process_paths() is called once per run regardless of pending count."""
         with patch("playbook.watcher.Observer", return_value=mock_observer):
             loop = FileWatcherLoop(mock_processor, watcher_settings)
+            loop._run_processor(set())
 
             # Test with various pending set sizes
             for count in [0, 1, 5, 100]:
-                mock_processor.process_all.reset_mock()
+                mock_processor.process_paths.reset_mock()
                 pending = {Path(f"/videos/file{i}.mkv") for i in range(count)}
                 loop._run_processor(pending)
 
-                # Verify process_all was called exactly once
-                mock_processor.process_all.assert_called_once()
+                # Verify process_paths was called exactly once with every pending path
+                mock_processor.process_paths.assert_called_once()
+                assert set(mock_processor.process_paths.call_args.args[0]) == pending